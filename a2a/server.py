@@ -9,6 +9,7 @@ import os
 import sys
 import asyncio
 from pathlib import Path
+from typing import Optional
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse, Response
@@ -27,6 +28,7 @@ from core.postgres_repository import PostgresRepository
 from core.similarity_finder import SimilarityFinder
 from core.integration_service import IntegrationService
 from core.database import init_db, close_db, get_db, DatabaseManager
+from core.embeddings import get_embedding_cache_stats
 
 # Configure root logger to capture all loggers (including skills)
 logging.basicConfig(
@@ -108,6 +110,7 @@ for skill in activity_skills.get_skills():
     registry.register(skill)
 
 # Register architectural compliance skills
+arch_compliance_skills = None
 try:
     arch_compliance_skills = ArchitecturalComplianceSkills()
     for skill in arch_compliance_skills.get_skills():
@@ -121,24 +124,9 @@ try:
     from a2a.skills.component_sensibility import ComponentSensibilitySkills
     from core.component_analyzer import VectorCacheManager
 
-    # Try to initialize VectorCacheManager with PostgreSQL
-    # If PostgreSQL is not available, log warning but continue with graceful degradation
-    postgres_url = os.environ.get("DATABASE_URL", "postgresql://localhost/devnexus")
-    try:
-        vector_manager = VectorCacheManager(postgres_url)
-        logger.info("PostgreSQL backend initialized for component sensibility")
-    except Exception as db_error:
-        logger.warning(f"PostgreSQL not available for component sensibility: {db_error}. Skills will work with degraded functionality (no vector caching).")
-        # Create a mock vector manager that doesn't require PostgreSQL
-        class MockVectorCacheManager:
-            def __init__(self, url):
-                self.postgres_url = url
-                self.vector_cache = {}
-            def get_or_create_vector(self, component):
-                return None
-            def find_similar(self, component, top_k=5, min_similarity=0.5):
-                return []
-        vector_manager = MockVectorCacheManager(postgres_url)
+    # VectorCacheManager shares the asyncpg pool of db_manager; while PostgreSQL
+    # is unavailable its lookups return empty results (no vector caching)
+    vector_manager = VectorCacheManager(db_manager)
 
     # Initialize Anthropic client for pattern extraction
     anthropic_client = None
@@ -281,6 +269,8 @@ async def initialize_database_background():
             if health.get("pgvector_version"):
                 print(f"[BACKGROUND] ✓ pgvector v{health['pgvector_version']} available")
             print("[BACKGROUND] ✓ PostgresRepository ready")
+            if await postgres_repo.start_invalidation_listener():
+                print(f"[BACKGROUND] ✓ Listening for KB invalidations on '{postgres_repo.invalidation_channel}'")
         else:
             print(f"[BACKGROUND] ⚠ PostgreSQL health check failed: {health}")
             print("[BACKGROUND] Will retry on next request")
@@ -313,6 +303,7 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     try:
+        await postgres_repo.stop_invalidation_listener()
         await db_manager.disconnect()
         print("✓ Database connections closed")
     except Exception as e:
@@ -442,13 +433,47 @@ async def health_check():
         health_data["database"] = db_health
         health_data["database_type"] = "postgresql"
         health_data["pgvector_enabled"] = db_health.get("pgvector_version") is not None
+        health_data["kb_snapshot"] = postgres_repo.snapshot_status()
     else:
         health_data["database"] = "disabled"
         health_data["database_type"] = "json"
 
+    if arch_compliance_skills is not None:
+        health_data["architectural_validator"] = {
+            **arch_compliance_skills.validator.cache_stats(),
+            "standards": arch_compliance_skills.validator.standards.stats(),
+        }
+
     return health_data
 
 
+@app.get("/metrics")
+async def metrics(request: Request, limit: Optional[int] = None):
+    """
+    Per-statement database metrics (call/row counts, p50/p95/p99 latency)
+    and embedding cache counters
+
+    Requires A2A authentication: statement labels include SQL text.
+    """
+    if not verify_a2a_auth(request.headers.get("Authorization"), auth_config):
+        return JSONResponse(
+            status_code=401,
+            content={
+                "error": "Authentication required",
+                "message": "Metrics require A2A authentication"
+            }
+        )
+
+    if not db_manager.enabled:
+        return {"database": "disabled", "embedding_cache": get_embedding_cache_stats()}
+
+    return {
+        "database": db_manager.get_query_metrics(limit=limit),
+        "kb_snapshot": postgres_repo.snapshot_status(),
+        "embedding_cache": get_embedding_cache_stats()
+    }
+
+
 @app.get("/")
 async def root():
     """
@@ -464,7 +489,8 @@ async def root():
             "execute": "/a2a/execute",
             "cancel": "/a2a/cancel",
             "agent_card": "/.well-known/agent.json",
-            "health": "/health"
+            "health": "/health",
+            "metrics": "/metrics"
         },
         "skills_registered": len(registry),
         "skills": registry.get_skill_ids()
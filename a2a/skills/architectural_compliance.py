@@ -5,6 +5,7 @@ A2A skills for validating repositories against architectural standards.
 Provides comprehensive compliance checking with scoring and recommendations.
 """
 
+import asyncio
 import logging
 import os
 from typing import Dict, List, Any, Optional
@@ -12,11 +13,14 @@ from github import Github
 
 from a2a.skills.base import BaseSkill, SkillGroup
 from core.standards_loader import StandardsLoader
-from core.architectural_validator import ArchitecturalValidator
+from core.architectural_validator import ArchitecturalValidator, ValidationReport
 from core.compliance_integration import ComplianceIntegrationService
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on repositories validated at a time by one batch request
+MAX_BATCH_WORKERS = 32
+
 
 class ValidateRepositoryArchitectureSkill(BaseSkill):
     """
@@ -71,6 +75,28 @@ class ValidateRepositoryArchitectureSkill(BaseSkill):
                     "type": "boolean",
                     "default": True,
                     "description": "Include actionable improvement recommendations in response"
+                },
+                "scanner_backend": {
+                    "type": "string",
+                    "enum": ["api", "clone"],
+                    "description": "Optional: How the repository is read. 'api' uses the GitHub API, 'clone' a shallow git clone or local checkout (far fewer API calls, falls back to 'api' on failure). Defaults to the server setting."
+                },
+                "changed_paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional: Paths changed since the repository was last validated. Only the checks these paths can affect are re-run; other results are reused from the last report (full validation if there is none)."
+                },
+                "base_commit": {
+                    "type": "string",
+                    "description": "Optional: With head_commit, instead of changed_paths: the SHA (full or at least 7 characters) of the commit last validated, as recorded in scan_metadata.commit. Changed paths are taken from the GitHub compare API; validates fully if the last report validated another commit."
+                },
+                "head_commit": {
+                    "type": "string",
+                    "description": "Optional: Commit SHA, branch or tag to validate (default: the default branch). The repository is read at this commit."
+                },
+                "previous_report": {
+                    "type": "object",
+                    "description": "Optional: With changed_paths or base_commit and head_commit, the output of an earlier full validation to update (its categories and scan_metadata). Defaults to the last full validation of the repository held by this server, which a restart or another instance may not have."
                 }
             },
             "required": ["repository"]
@@ -83,6 +109,14 @@ class ValidateRepositoryArchitectureSkill(BaseSkill):
                 "input": {"repository": "patelmm79/dev-nexus"},
                 "description": "Full validation of dev-nexus repository against all standards"
             },
+            {
+                "input": {
+                    "repository": "patelmm79/dev-nexus",
+                    "base_commit": "3f2a1c9",
+                    "head_commit": "main"
+                },
+                "description": "Incremental re-validation after a push, re-running only checks affected by the changed files"
+            },
             {
                 "input": {
                     "repository": "patelmm79/dev-nexus",
@@ -113,11 +147,31 @@ class ValidateRepositoryArchitectureSkill(BaseSkill):
             scope = input_data.get("validation_scope")
             include_recommendations = input_data.get("include_recommendations", True)
             notify_agents = input_data.get("notify_agents", True)
+            backend = input_data.get("scanner_backend")
 
             logger.info(f"Validating repository: {repo_name}")
 
+            changed_paths = input_data.get("changed_paths")
+            base_commit = input_data.get("base_commit")
+            head_commit = input_data.get("head_commit")
+
             # Run validation
-            report = self.validator.validate_repository(repo_name, scope=scope)
+            if changed_paths is not None or (base_commit and head_commit):
+                previous = None
+                if input_data.get("previous_report"):
+                    try:
+                        previous = ValidationReport.from_dict(input_data["previous_report"])
+                    except (KeyError, TypeError, AttributeError) as e:
+                        return {
+                            "success": False,
+                            "error": f"Invalid previous_report: {e}"
+                        }
+                report = self.validator.validate_incremental(
+                    repo_name, previous=previous, changed_paths=changed_paths,
+                    base=base_commit, head=head_commit, backend=backend
+                )
+            else:
+                report = self.validator.validate_repository(repo_name, scope=scope, backend=backend, ref=head_commit)
 
             # Convert report to dictionary
             result = {
@@ -131,6 +185,7 @@ class ValidateRepositoryArchitectureSkill(BaseSkill):
                         "compliance_score": cat_result.compliance_score,
                         "passed": cat_result.passed,
                         "checks_performed": cat_result.checks_performed,
+                        "duration_ms": cat_result.duration_ms,
                         "violations": [
                             {
                                 "severity": v.severity,
@@ -140,7 +195,8 @@ class ValidateRepositoryArchitectureSkill(BaseSkill):
                                 "file_path": v.file_path
                             }
                             for v in cat_result.violations
-                        ]
+                        ],
+                        **({"error": cat_result.error} if cat_result.error else {})
                     }
                     for cat_name, cat_result in report.categories.items()
                 },
@@ -154,7 +210,8 @@ class ValidateRepositoryArchitectureSkill(BaseSkill):
                         "file_path": v.file_path
                     }
                     for v in report.critical_violations
-                ]
+                ],
+                "scan_metadata": report.scan_metadata
             }
 
             if include_recommendations:
@@ -180,6 +237,214 @@ class ValidateRepositoryArchitectureSkill(BaseSkill):
             }
 
 
+class ValidateRepositoriesSkill(BaseSkill):
+    """
+    Batch validation of many repositories (e.g. a whole organization)
+
+    Validates repositories in a bounded worker pool sharing one scanner
+    cache and one set of loaded standards. Returns one row per repository
+    in completion order plus an aggregate compliance summary with
+    per-repository latency statistics.
+
+    The skill is unauthenticated, so a request is rejected when it would
+    validate more than max_repositories (ARCH_VALIDATOR_MAX_REPOSITORIES,
+    default 100) and max_workers is clamped to MAX_BATCH_WORKERS.
+    """
+
+    def __init__(self, validator: ArchitecturalValidator, max_repositories: Optional[int] = None):
+        """
+        Initialize skill with validator
+
+        Args:
+            validator: Shared ArchitecturalValidator
+            max_repositories: Most repositories one request may validate
+                              (defaults to ARCH_VALIDATOR_MAX_REPOSITORIES env var, 100)
+        """
+        self.validator = validator
+        self.max_repositories = max_repositories or int(os.getenv("ARCH_VALIDATOR_MAX_REPOSITORIES", "100"))
+
+    @property
+    def skill_id(self) -> str:
+        return "validate_repositories"
+
+    @property
+    def skill_name(self) -> str:
+        return "Validate Repositories"
+
+    @property
+    def skill_description(self) -> str:
+        return "Validate many repositories (a list, or every repository of an organization) against architectural standards in one call. Returns per-repository scores in completion order and an organization-wide compliance summary with latency statistics."
+
+    @property
+    def tags(self) -> List[str]:
+        return ["architecture", "standards", "validation", "compliance", "batch", "organization"]
+
+    @property
+    def requires_authentication(self) -> bool:
+        return False
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "repositories": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Repository names in format 'owner/repo'. Required unless 'organization' is given."
+                },
+                "organization": {
+                    "type": "string",
+                    "description": "Validate every repository of this GitHub organization or user (archived repositories and forks are skipped)"
+                },
+                "validation_scope": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional: Specific standards to validate. If omitted, validates all standards."
+                },
+                "scanner_backend": {
+                    "type": "string",
+                    "enum": ["api", "clone"],
+                    "description": "Optional: How repositories are read (see validate_repository_architecture). Defaults to the server setting."
+                },
+                "max_workers": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": MAX_BATCH_WORKERS,
+                    "description": f"Optional: Repositories validated at a time (at most {MAX_BATCH_WORKERS}). Defaults to the server setting."
+                },
+                "max_repositories": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Optional: Fail instead of validating more than this many repositories. Defaults to, and cannot exceed, the server limit (100 unless configured)."
+                },
+                "include_details": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Include per-category results and violations for each repository"
+                }
+            }
+        }
+
+    @property
+    def examples(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "input": {"organization": "my-org"},
+                "description": "Compliance sweep of every active repository in my-org"
+            },
+            {
+                "input": {
+                    "repositories": ["patelmm79/dev-nexus", "my-org/my-service"],
+                    "validation_scope": ["license", "documentation"],
+                    "include_details": True
+                },
+                "description": "License and documentation checks of two repositories with full violation details"
+            }
+        ]
+
+    async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute skill: validate repositories"""
+        try:
+            repositories = input_data.get("repositories") or []
+            organization = input_data.get("organization")
+            if not repositories and not organization:
+                return {
+                    "success": False,
+                    "error": "Missing required parameter: 'repositories' or 'organization'"
+                }
+
+            max_workers = input_data.get("max_workers")
+            max_repositories = input_data.get("max_repositories") or self.max_repositories
+            for name, value in (("max_workers", max_workers), ("max_repositories", max_repositories)):
+                if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+                    return {
+                        "success": False,
+                        "error": f"'{name}' must be a positive integer"
+                    }
+            if max_workers is not None:
+                max_workers = min(max_workers, MAX_BATCH_WORKERS)
+            max_repositories = min(max_repositories, self.max_repositories)
+
+            if organization and not repositories:
+                repositories = await asyncio.to_thread(
+                    self.validator.list_organization_repositories, organization
+                )
+            if len(repositories) > max_repositories:
+                return {
+                    "success": False,
+                    "error": (
+                        f"{len(repositories)} repositories exceed the limit of {max_repositories} per request; "
+                        "pass a shorter 'repositories' list"
+                    ),
+                    "repositories": len(repositories),
+                    "max_repositories": max_repositories
+                }
+
+            include_details = input_data.get("include_details", False)
+            logger.info(f"Validating {len(repositories)} repositories")
+
+            # Validation blocks on network I/O; keep the event loop free
+            batch = await asyncio.to_thread(
+                self.validator.validate_repositories,
+                repositories,
+                scope=input_data.get("validation_scope"),
+                backend=input_data.get("scanner_backend"),
+                max_workers=max_workers,
+                organization=organization
+            )
+
+            results = []
+            for report in batch.reports:
+                row = {
+                    "repository": report.repository,
+                    "overall_compliance_score": report.overall_compliance_score,
+                    "compliance_grade": report.compliance_grade,
+                    "summary": report.summary,
+                    "duration_ms": report.scan_metadata.get("scan_duration_ms"),
+                    "github_api_calls": report.scan_metadata.get("github_api_calls"),
+                }
+                if any(v.rule_id == "scan_error" for v in report.critical_violations):
+                    row["error"] = report.critical_violations[0].message
+                if include_details:
+                    row["categories"] = {
+                        cat_name: {
+                            "compliance_score": cat_result.compliance_score,
+                            "passed": cat_result.passed,
+                            "violations": [
+                                {
+                                    "severity": v.severity,
+                                    "rule_id": v.rule_id,
+                                    "message": v.message,
+                                    "file_path": v.file_path
+                                }
+                                for v in cat_result.violations
+                            ]
+                        }
+                        for cat_name, cat_result in report.categories.items()
+                    }
+                results.append(row)
+
+            logger.info(
+                f"Batch validation complete: {batch.summary['repositories']} repositories, "
+                f"average score {batch.summary['average_compliance_score']}"
+            )
+            return {
+                "success": True,
+                "organization": organization,
+                "summary": batch.summary,
+                "results": results
+            }
+
+        except Exception as e:
+            logger.error(f"Batch validation error: {e}", exc_info=True)
+            return {
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }
+
+
 class CheckSpecificStandardSkill(BaseSkill):
     """
     Check repository against a specific architectural standard
@@ -236,6 +501,11 @@ class CheckSpecificStandardSkill(BaseSkill):
                         "containerization"
                     ],
                     "description": "The standard category to check"
+                },
+                "scanner_backend": {
+                    "type": "string",
+                    "enum": ["api", "clone"],
+                    "description": "Optional: How the repository is read. 'api' uses the GitHub API, 'clone' a shallow git clone or local checkout (far fewer API calls, falls back to 'api' on failure). Defaults to the server setting."
                 }
             },
             "required": ["repository", "standard_category"]
@@ -275,7 +545,9 @@ class CheckSpecificStandardSkill(BaseSkill):
             logger.info(f"Checking {category} standard for {repo_name}")
 
             # Run scoped validation
-            report = self.validator.validate_repository(repo_name, scope=[category])
+            report = self.validator.validate_repository(
+                repo_name, scope=[category], backend=input_data.get("scanner_backend")
+            )
 
             # Extract category result
             if category not in report.categories:
@@ -445,10 +717,11 @@ class ArchitecturalComplianceSkills(SkillGroup):
     """
     Skill group for architectural compliance validation
 
-    Provides three complementary skills:
+    Provides four complementary skills:
     1. validate_repository_architecture - Full validation with all standards
-    2. check_specific_standard - Focused validation on single standard
-    3. suggest_improvements - Prioritized improvement recommendations
+    2. validate_repositories - Batch validation of many repositories or an organization
+    3. check_specific_standard - Focused validation on single standard
+    4. suggest_improvements - Prioritized improvement recommendations
 
     Integrates with external A2A agents:
     - dependency-orchestrator: Notifies of compliance violations affecting dependencies
@@ -493,11 +766,13 @@ class ArchitecturalComplianceSkills(SkillGroup):
         validate_skill = ValidateRepositoryArchitectureSkill(self.validator)
         validate_skill.integration_service = self.integration_service
 
+        batch_skill = ValidateRepositoriesSkill(self.validator)
         check_skill = CheckSpecificStandardSkill(self.validator)
         suggest_skill = SuggestImprovementsSkill(self.validator)
 
         return [
             validate_skill,
+            batch_skill,
             check_skill,
             suggest_skill,
         ]
@@ -6,10 +6,12 @@ Provides architectural sensibility analysis - identifying components that would
 better used in a different project or as central shared infrastructure.
 """
 
-import logging
 import os
+import logging
 import json
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator, Tuple
 from datetime import datetime
 from uuid import uuid4
 
@@ -17,7 +19,10 @@ import anthropic
 from github import Github
 
 from a2a.skills.base import BaseSkill, SkillGroup
-from core.component_analyzer import ComponentScanner, VectorCacheManager, CentralityCalculator
+from core.component_analyzer import (
+    ComponentScanner, VectorCacheManager, CentralityCalculator, group_similar_components
+)
+from core.component_pipeline import ComponentPipeline
 from core.postgres_repository import PostgresRepository
 from core.pattern_extractor import PatternExtractor
 from schemas.knowledge_base_v2 import ConsolidationRecommendation, Component
@@ -159,36 +164,36 @@ class DetectMisplacedComponentsSkill(BaseSkill):
                     "summary": "No components found matching criteria"
                 }
 
-            # Find similar components for each
+            # Find similar components for all of them in one batched KNN query
             misplaced_components = []
+            try:
+                similar_by_id = await self.vector_manager.find_similar_batch(
+                    components_to_analyze,
+                    top_k=top_k,
+                    min_similarity=min_similarity
+                )
+            except Exception as e:
+                logger.debug(f"Error finding similar components: {e}")
+                similar_by_id = {}
 
             for component in components_to_analyze:
-                try:
-                    similar = self.vector_manager.find_similar(
-                        component,
-                        top_k=top_k,
-                        min_similarity=min_similarity
-                    )
-
-                    if similar:
-                        # Filter by diverged status if needed
-                        if not include_diverged:
-                            similar = [s for s in similar if s.get("type") != "diverged"]
-
-                        if similar:
-                            misplaced_components.append({
-                                "component_id": component.component_id,
-                                "component_name": component.name,
-                                "component_type": component.component_type,
-                                "current_location": component.repository,
-                                "current_files": component.files,
-                                "similar_components": similar,
-                                "similar_count": len(similar),
-                                "potential_consolidation": True
-                            })
-
-                except Exception as e:
-                    logger.debug(f"Error finding similar components for {component.name}: {e}")
+                similar = similar_by_id.get(component.component_id, [])
+
+                # Filter by diverged status if needed
+                if not include_diverged:
+                    similar = [s for s in similar if s.get("type") != "diverged"]
+
+                if similar:
+                    misplaced_components.append({
+                        "component_id": component.component_id,
+                        "component_name": component.name,
+                        "component_type": component.component_type,
+                        "current_location": component.repository,
+                        "current_files": component.files,
+                        "similar_components": similar,
+                        "similar_count": len(similar),
+                        "potential_consolidation": True
+                    })
 
             # Analyze canonical locations
             calculator = CentralityCalculator(kb.model_dump())
@@ -226,6 +231,7 @@ class DetectMisplacedComponentsSkill(BaseSkill):
                 "components_analyzed": len(components_to_analyze),
                 "misplaced_components_found": len(misplaced_components),
                 "misplaced_components": misplaced_components[:10],  # Top 10 recommendations
+                "similarity_groups": group_similar_components(similar_by_id)[:10],
                 "analysis_timestamp": datetime.now().isoformat()
             }
 
@@ -705,8 +711,15 @@ class ScanRepositoryComponentsSkill(BaseSkill):
     Triggers component detection, vectorization, and centrality analysis
     for a single repository on-demand. Useful for triggering component analysis
     from the frontend Repositories tab.
+
+    Components come from a local checkout under REPOS_PATH when there is one
+    (streamed from ComponentScanner), else from Claude pattern extraction,
+    else from the knowledge base. They are vectorized and saved in batches.
     """
 
+    # Code files sent to Claude for pattern extraction
+    MAX_ANALYZED_FILES = 20
+
     def __init__(
         self,
         postgres_repo: PostgresRepository,
@@ -793,147 +806,28 @@ class ScanRepositoryComponentsSkill(BaseSkill):
                 }
 
             repo_data = kb.repositories[repository]
-            logger.info(f"Scanning components in {repository} using pattern extraction")
-
-            components = []
-
-            # If pattern extractor is available, fetch repo code and extract patterns
-            if self.pattern_extractor and self.github_client:
-                try:
-                    owner, repo = repository.split("/")
-                    logger.info(f"[SCAN] Starting pattern extraction for {repository}")
-
-                    logger.info(f"[SCAN] Fetching GitHub repository object for {owner}/{repo}")
-                    gh_repo = self.github_client.get_user(owner).get_repo(repo)
-                    logger.info(f"[SCAN] Successfully retrieved GitHub repository object")
-
-                    # Fetch main branch content
-                    logger.info(f"[SCAN] Starting file collection from repository root")
-                    start_collect = datetime.now()
-
-                    # Collect code files
-                    code_files = {}
-                    self._collect_code_files(gh_repo, "", code_files)
-
-                    collect_duration = (datetime.now() - start_collect).total_seconds()
-                    logger.info(f"[SCAN] File collection completed in {collect_duration:.2f}s. Found {len(code_files)} code files")
-
-                    if code_files:
-                        # Prepare changes dict for pattern extractor
-                        logger.info(f"[SCAN] Preparing file list for Claude analysis (limiting to 20 files)")
-                        files_changed = []
-                        for filepath, content in list(code_files.items())[:20]:  # Limit to first 20 files
-                            files_changed.append({
-                                "path": filepath,
-                                "change_type": "modified",
-                                "diff": content[:2000]  # Limit content size
-                            })
-
-                        logger.info(f"[SCAN] Prepared {len(files_changed)} files for analysis")
-
-                        if files_changed:
-                            logger.info(f"[SCAN] Fetching repository commits for commit SHA")
-                            try:
-                                commit_sha = gh_repo.get_commits()[0].sha if gh_repo.get_commits() else "unknown"
-                                logger.info(f"[SCAN] Got commit SHA: {commit_sha}")
-                            except Exception as e:
-                                logger.warning(f"[SCAN] Could not fetch commits: {e}, using 'unknown'")
-                                commit_sha = "unknown"
-
-                            changes = {
-                                "commit_sha": commit_sha,
-                                "commit_message": f"Repository analysis for {repository}",
-                                "author": "system",
-                                "timestamp": datetime.now().isoformat(),
-                                "files_changed": files_changed
-                            }
-
-                            # Extract patterns using Claude
-                            logger.info(f"[SCAN] Starting Claude pattern extraction for {len(files_changed)} files")
-                            start_claude = datetime.now()
-                            pattern_entry = self.pattern_extractor.extract_patterns_with_llm(
-                                changes,
-                                repository
-                            )
-                            claude_duration = (datetime.now() - start_claude).total_seconds()
-                            logger.info(f"[SCAN] Claude analysis completed in {claude_duration:.2f}s")
-
-                            # Convert reusable_components to Component objects
-                            logger.info(f"[SCAN] Converting {len(pattern_entry.reusable_components)} detected components to Component objects")
-                            for i, reusable_comp in enumerate(pattern_entry.reusable_components):
-                                logger.debug(f"[SCAN] Processing component {i+1}: {reusable_comp.name}")
-                                component = Component(
-                                    component_id=f"{repository}-{reusable_comp.name}-{i}",
-                                    name=reusable_comp.name,
-                                    component_type="infrastructure" if "util" in reusable_comp.name.lower() else "api_client",
-                                    repository=repository,
-                                    files=reusable_comp.files or [],
-                                    language=reusable_comp.language or "python",
-                                    api_signature=reusable_comp.api_contract,
-                                    imports=[],
-                                    keywords=pattern_entry.keywords,
-                                    description=reusable_comp.description,
-                                    lines_of_code=0,
-                                    cyclomatic_complexity=None,
-                                    public_methods=[],
-                                    first_seen=datetime.now(),
-                                    sync_status="original"
-                                )
-                                components.append(component)
-                            logger.info(f"[SCAN] Component conversion completed: {len(components)} components ready for vectorization")
-                    else:
-                        logger.warning(f"[SCAN] No code files found in {repository}")
-
-                except Exception as e:
-                    logger.warning(f"[SCAN] Pattern extraction failed: {type(e).__name__}: {e}. Using existing components from KB.", exc_info=True)
-                    components = repo_data.components if hasattr(repo_data, 'components') and repo_data.components else []
+            local_path = self._local_checkout(repository)
+
+            if local_path is not None:
+                # Stream AST-scanned components straight into the pipeline
+                logger.info(f"[SCAN] Scanning local checkout of {repository} at {local_path}")
+                components = ComponentScanner().aiter_repository(str(local_path), repository)
+                source = "local_checkout"
+            elif self.pattern_extractor and self.github_client:
+                logger.info(f"Scanning components in {repository} using pattern extraction")
+                components = self._extract_components_with_llm(repository, repo_data)
+                source = "pattern_extraction"
             else:
                 # Fallback: use pre-scanned components from KB
                 logger.info("Pattern extractor not available, using pre-scanned components from KB")
                 components = repo_data.components if hasattr(repo_data, 'components') and repo_data.components else []
+                source = "knowledge_base"
 
-            logger.info(f"[SCAN] Found {len(components)} components in {repository}")
-
-            # Generate vectors for each component if vector manager available
-            logger.info(f"[SCAN] Starting vectorization of {len(components)} components")
-            start_vectorize = datetime.now()
-            vectors_generated = 0
-            for i, component in enumerate(components):
-                try:
-                    logger.debug(f"[SCAN] Vectorizing component {i+1}/{len(components)}: {component.name}")
-                    vector = self.vector_manager.get_or_create_vector(component)
-                    if vector:
-                        vectors_generated += 1
-                        logger.debug(f"[SCAN] Successfully vectorized {component.name}")
-                    else:
-                        logger.debug(f"[SCAN] No vector returned for {component.name}")
-                except Exception as e:
-                    logger.warning(f"[SCAN] Could not vectorize {component.name}: {type(e).__name__}: {e}")
-
-            vectorize_duration = (datetime.now() - start_vectorize).total_seconds()
-            logger.info(f"[SCAN] Vectorization completed in {vectorize_duration:.2f}s. Generated {vectors_generated} vectors")
-
-            # Update KB with components
-            repo_data.components = components
+            # Vectorize and save batch by batch, keeping only a summary of each component
+            summaries = []
 
-            # Save components to PostgreSQL
-            logger.info(f"[SCAN] Saving {len(components)} components to database")
-            try:
-                success = await self.postgres_repo.add_or_update_components(repository, components)
-                if success:
-                    logger.info(f"[SCAN] Components saved successfully")
-                else:
-                    logger.warning(f"[SCAN] Component save returned False")
-            except Exception as e:
-                logger.warning(f"[SCAN] Could not save components: {type(e).__name__}: {e}")
-
-            return {
-                "success": True,
-                "repository": repository,
-                "components_found": len(components),
-                "vectors_generated": vectors_generated,
-                "pattern_extraction": "enabled" if self.pattern_extractor else "disabled",
-                "components": [
+            def record_batch(batch: List[Component], report: Dict[str, Any]) -> None:
+                summaries.extend(
                     {
                         "name": c.name,
                         "type": c.component_type,
@@ -942,8 +836,27 @@ class ScanRepositoryComponentsSkill(BaseSkill):
                         "methods": len(c.public_methods),
                         "description": c.description
                     }
-                    for c in components
-                ]
+                    for c in batch
+                )
+                logger.info(
+                    f"[SCAN] {repository}: {report['components']} components processed, "
+                    f"{report['vectors']} vectors"
+                )
+
+            pipeline = ComponentPipeline(self.postgres_repo, self.vector_manager, progress=record_batch)
+            report = await pipeline.run(repository, components)
+            if report["saved"] is None:
+                logger.warning(f"[SCAN] Could not save components for {repository}")
+
+            return {
+                "success": True,
+                "repository": repository,
+                "components_found": report["components"],
+                "vectors_generated": report["vectors"],
+                "pattern_extraction": "enabled" if self.pattern_extractor else "disabled",
+                "source": source,
+                "batches": report["batches"],
+                "components": summaries
             }
 
         except Exception as e:
@@ -953,8 +866,103 @@ class ScanRepositoryComponentsSkill(BaseSkill):
                 "error": str(e)
             }
 
-    def _collect_code_files(self, gh_repo, path: str, code_files: Dict[str, str], max_depth: int = 3, depth: int = 0):
-        """Recursively collect code files from GitHub repository"""
+    @staticmethod
+    def _local_checkout(repository: str) -> Optional[Path]:
+        """Checkout of the repository under REPOS_PATH, if there is one"""
+        repos_base = os.getenv("REPOS_PATH")
+        if not repos_base:
+            return None
+        repo_path = Path(repos_base) / repository.split("/")[-1]
+        return repo_path if repo_path.is_dir() else None
+
+    def _extract_components_with_llm(self, repository: str, repo_data: Any) -> List[Component]:
+        """Detect components in the first code files of a repository with Claude"""
+        components = []
+        try:
+            owner, repo = repository.split("/")
+            logger.info(f"[SCAN] Starting pattern extraction for {repository}")
+
+            logger.info(f"[SCAN] Fetching GitHub repository object for {owner}/{repo}")
+            gh_repo = self.github_client.get_user(owner).get_repo(repo)
+            logger.info(f"[SCAN] Successfully retrieved GitHub repository object")
+
+            # Only the first files are analyzed, so stop downloading once they are in
+            logger.info(f"[SCAN] Collecting up to {self.MAX_ANALYZED_FILES} code files from repository root")
+            start_collect = datetime.now()
+            files_changed = [
+                {
+                    "path": filepath,
+                    "change_type": "modified",
+                    "diff": content[:2000]  # Limit content size
+                }
+                for filepath, content in islice(self._iter_code_files(gh_repo, ""), self.MAX_ANALYZED_FILES)
+            ]
+
+            collect_duration = (datetime.now() - start_collect).total_seconds()
+            logger.info(f"[SCAN] File collection completed in {collect_duration:.2f}s. Prepared {len(files_changed)} files for analysis")
+
+            if not files_changed:
+                logger.warning(f"[SCAN] No code files found in {repository}")
+                return components
+
+            logger.info(f"[SCAN] Fetching repository commits for commit SHA")
+            try:
+                commit_sha = gh_repo.get_commits()[0].sha if gh_repo.get_commits() else "unknown"
+                logger.info(f"[SCAN] Got commit SHA: {commit_sha}")
+            except Exception as e:
+                logger.warning(f"[SCAN] Could not fetch commits: {e}, using 'unknown'")
+                commit_sha = "unknown"
+
+            changes = {
+                "commit_sha": commit_sha,
+                "commit_message": f"Repository analysis for {repository}",
+                "author": "system",
+                "timestamp": datetime.now().isoformat(),
+                "files_changed": files_changed
+            }
+
+            # Extract patterns using Claude
+            logger.info(f"[SCAN] Starting Claude pattern extraction for {len(files_changed)} files")
+            start_claude = datetime.now()
+            pattern_entry = self.pattern_extractor.extract_patterns_with_llm(
+                changes,
+                repository
+            )
+            claude_duration = (datetime.now() - start_claude).total_seconds()
+            logger.info(f"[SCAN] Claude analysis completed in {claude_duration:.2f}s")
+
+            # Convert reusable_components to Component objects
+            logger.info(f"[SCAN] Converting {len(pattern_entry.reusable_components)} detected components to Component objects")
+            for i, reusable_comp in enumerate(pattern_entry.reusable_components):
+                logger.debug(f"[SCAN] Processing component {i+1}: {reusable_comp.name}")
+                component = Component(
+                    component_id=f"{repository}-{reusable_comp.name}-{i}",
+                    name=reusable_comp.name,
+                    component_type="infrastructure" if "util" in reusable_comp.name.lower() else "api_client",
+                    repository=repository,
+                    files=reusable_comp.files or [],
+                    language=reusable_comp.language or "python",
+                    api_signature=reusable_comp.api_contract,
+                    imports=[],
+                    keywords=pattern_entry.keywords,
+                    description=reusable_comp.description,
+                    lines_of_code=0,
+                    cyclomatic_complexity=None,
+                    public_methods=[],
+                    first_seen=datetime.now(),
+                    sync_status="original"
+                )
+                components.append(component)
+            logger.info(f"[SCAN] Component conversion completed: {len(components)} components ready for vectorization")
+
+        except Exception as e:
+            logger.warning(f"[SCAN] Pattern extraction failed: {type(e).__name__}: {e}. Using existing components from KB.", exc_info=True)
+            components = repo_data.components if hasattr(repo_data, 'components') and repo_data.components else []
+
+        return components
+
+    def _iter_code_files(self, gh_repo, path: str, max_depth: int = 3, depth: int = 0) -> Iterator[Tuple[str, str]]:
+        """Yield (path, content) of code files in a GitHub repository, depth first, downloading lazily"""
         if depth > max_depth:
             logger.debug(f"[SCAN] Reached max depth ({max_depth}) at path: {path}")
             return
@@ -962,35 +970,31 @@ class ScanRepositoryComponentsSkill(BaseSkill):
         try:
             logger.debug(f"[SCAN] Reading directory at depth {depth}: {path or '(root)'}")
             contents = gh_repo.get_contents(path) if path else gh_repo.get_contents("")
-
-            if isinstance(contents, list):
-                logger.debug(f"[SCAN] Found {len(contents)} items in {path or '(root)'}")
-                files_in_dir = 0
-                dirs_in_dir = 0
-
-                for content in contents:
-                    # Skip common non-code directories
-                    if any(skip in content.path for skip in [".git", "node_modules", ".pytest", "__pycache__", "venv", ".github"]):
-                        logger.debug(f"[SCAN] Skipping directory: {content.path}")
-                        continue
-
-                    if content.type == "file":
-                        # Collect Python, JS, TS files
-                        if any(content.path.endswith(ext) for ext in [".py", ".js", ".ts", ".go", ".java"]):
-                            try:
-                                logger.debug(f"[SCAN] Downloading file: {content.path}")
-                                code_files[content.path] = content.decoded_content.decode("utf-8", errors="ignore")
-                                files_in_dir += 1
-                            except Exception as e:
-                                logger.warning(f"[SCAN] Could not decode {content.path}: {type(e).__name__}: {e}")
-                    elif content.type == "dir":
-                        logger.debug(f"[SCAN] Recursing into directory: {content.path}")
-                        dirs_in_dir += 1
-                        self._collect_code_files(gh_repo, content.path, code_files, max_depth, depth + 1)
-
-                logger.debug(f"[SCAN] Completed reading {path or '(root)'}: {files_in_dir} files, {dirs_in_dir} subdirs. Total collected so far: {len(code_files)}")
         except Exception as e:
             logger.warning(f"[SCAN] Could not read directory {path or '(root)'}: {type(e).__name__}: {e}")
+            return
+
+        if not isinstance(contents, list):
+            return
+
+        logger.debug(f"[SCAN] Found {len(contents)} items in {path or '(root)'}")
+        for content in contents:
+            # Skip common non-code directories
+            if any(skip in content.path for skip in [".git", "node_modules", ".pytest", "__pycache__", "venv", ".github"]):
+                logger.debug(f"[SCAN] Skipping directory: {content.path}")
+                continue
+
+            if content.type == "file":
+                # Collect Python, JS, TS files
+                if any(content.path.endswith(ext) for ext in [".py", ".js", ".ts", ".go", ".java"]):
+                    try:
+                        logger.debug(f"[SCAN] Downloading file: {content.path}")
+                        yield content.path, content.decoded_content.decode("utf-8", errors="ignore")
+                    except Exception as e:
+                        logger.warning(f"[SCAN] Could not decode {content.path}: {type(e).__name__}: {e}")
+            elif content.type == "dir":
+                logger.debug(f"[SCAN] Recursing into directory: {content.path}")
+                yield from self._iter_code_files(gh_repo, content.path, max_depth, depth + 1)
 
 
 class ComponentSensibilitySkills(SkillGroup):
@@ -1030,25 +1034,17 @@ class ComponentSensibilitySkills(SkillGroup):
         self.anthropic_client = anthropic_client
         self.github_client = github_client
 
-        # Initialize vector cache manager if not provided
+        # Share the repository's connection pool; lookups degrade to empty
+        # results while the pool is not connected
         if vector_manager is None:
-            postgres_url = os.environ.get("DATABASE_URL", "postgresql://localhost/devnexus")
-            try:
-                vector_manager = VectorCacheManager(postgres_url)
-            except Exception as e:
-                logger.warning(f"Vector manager not available: {e}")
-                # Create mock vector manager for graceful degradation
-                class MockVectorCacheManager:
-                    def __init__(self, url):
-                        self.postgres_url = url
-                    def get_or_create_vector(self, component):
-                        return None
-                    def find_similar(self, component, top_k=5, min_similarity=0.5):
-                        return []
-                vector_manager = MockVectorCacheManager(postgres_url)
+            vector_manager = VectorCacheManager(getattr(postgres_repo, "db", None))
 
         self.vector_manager = vector_manager
 
+        # Drop cached vectors when a repository's components are rewritten
+        if hasattr(vector_manager, "invalidate_components") and hasattr(postgres_repo, "on_components_changed"):
+            postgres_repo.on_components_changed(vector_manager.invalidate_components)
+
         # Get integration service if available
         self.integration_service = None
         try:
@@ -1,18 +1,36 @@
 """
 Architectural Validator
 
-GitHub API-based repository validation against architectural standards.
-Uses pure API access (no filesystem operations, no git cloning).
+Repository validation against architectural standards.
+
+Repositories are read through a scanner backend:
+- "api": GitHub Contents API (RepositoryScanner), no local state
+- "clone": shallow blob-less git clone or local checkout (LocalCloneScanner),
+  one fetch per repository instead of one API request per directory and file
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Set
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Any, Set, Tuple, NamedTuple, Iterable, Iterator, Callable
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import base64
+import json
 import logging
+import os
 import re
+import subprocess
+import tempfile
+import threading
+import time
 import yaml
 from github import Github, GithubException
+from github.GithubObject import NotSet
 
+from core.rule_plan import RuleCompiler, compile_pattern, section_pattern, yaml_field_exists
+from core.scanner_cache import ScannerCache
 from core.standards_loader import ParsedStandard, ValidationRule
 
 logger = logging.getLogger(__name__)
@@ -29,10 +47,11 @@ class FileInfo:
 
 @dataclass
 class RepoStructure:
-    """Repository structure scanned via GitHub API"""
+    """Repository structure read by a scanner backend"""
     repository: str
     files: Dict[str, FileInfo] = field(default_factory=dict)  # path -> FileInfo
     directories: Set[str] = field(default_factory=set)
+    commit: Optional[str] = None  # commit SHA read, None for a working tree
 
 
 @dataclass
@@ -55,6 +74,8 @@ class CategoryResult:
     violations: List[Violation] = field(default_factory=list)
     checks_performed: int = 0
     compliance_score: float = 1.0
+    duration_ms: float = 0.0
+    error: Optional[str] = None  # set when the category could not be validated
 
 
 @dataclass
@@ -69,75 +90,357 @@ class ValidationReport:
     recommendations: List[Dict[str, Any]]
     scan_metadata: Dict[str, Any]
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValidationReport":
+        """
+        Rebuild a report from its JSON form, as returned by the
+        validate_repository_architecture skill
+
+        Only what validate_incremental needs is required: the categories
+        (with their violations) and scan_metadata.
+
+        Raises:
+            KeyError: If a category or violation misses a required field
+        """
+        categories = {
+            name: CategoryResult(
+                category=name,
+                passed=result["passed"],
+                violations=[
+                    Violation(
+                        severity=v["severity"],
+                        rule_id=v["rule_id"],
+                        category=name,
+                        message=v["message"],
+                        recommendation=v.get("recommendation", ""),
+                        file_path=v.get("file_path"),
+                    )
+                    for v in result.get("violations", [])
+                ],
+                checks_performed=result.get("checks_performed", 0),
+                compliance_score=result["compliance_score"],
+                duration_ms=result.get("duration_ms", 0.0),
+                error=result.get("error"),
+            )
+            for name, result in data.get("categories", {}).items()
+        }
+        return cls(
+            repository=data.get("repository", ""),
+            overall_compliance_score=data.get("overall_compliance_score", 0.0),
+            compliance_grade=data.get("compliance_grade", ""),
+            summary=data.get("summary", {}),
+            categories=categories,
+            critical_violations=[
+                v for result in categories.values() for v in result.violations if v.severity == "critical"
+            ],
+            recommendations=data.get("recommendations", []),
+            scan_metadata=data.get("scan_metadata", {}),
+        )
+
+
+@dataclass
+class BatchValidationReport:
+    """Validation reports of several repositories with an aggregate summary"""
+    reports: List[ValidationReport]  # in completion order
+    summary: Dict[str, Any]
+    organization: Optional[str] = None
+
+
+class CachedTree(NamedTuple):
+    """Repository structure as cached by RepositoryScanner"""
+    structure: RepoStructure
+    branch: Optional[str]  # default branch, None until looked up
+    etag: Optional[str]  # of the commit request for ref
+    fetched_at: float
+    ref: Optional[str] = None  # ref scanned, None for the default branch
+
+    def encode(self) -> Dict[str, Any]:
+        """JSON-compatible form for the scanner cache's disk tier"""
+        return {
+            "branch": self.branch,
+            "etag": self.etag,
+            "fetched_at": self.fetched_at,
+            "ref": self.ref,
+            "commit": self.structure.commit,
+            "files": {path: [info.size, info.sha] for path, info in self.structure.files.items()},
+            "directories": sorted(self.structure.directories),
+        }
+
+    @classmethod
+    def decode(cls, repo_name: str, data: Dict[str, Any]) -> "CachedTree":
+        """Rebuild from encode() output"""
+        structure = RepoStructure(
+            repository=repo_name,
+            files={
+                path: FileInfo(path=path, type="file", size=size, sha=sha)
+                for path, (size, sha) in data["files"].items()
+            },
+            directories=set(data["directories"]),
+            commit=data.get("commit"),
+        )
+        return cls(structure, data["branch"], data["etag"], data["fetched_at"], data.get("ref"))
+
+    def size(self) -> int:
+        """Approximate bytes held in memory"""
+        return 200 * len(self.structure.files) + 100 * len(self.structure.directories) + sum(
+            len(path) for path in self.structure.files
+        )
+
+
+class PinnedStructures:
+    """
+    Structures scanners serve reads from while a validation runs
+
+    A validation pins the structure it scanned, so its file reads see that
+    commit even if the cached structure is evicted or replaced by another
+    scan meanwhile. Nested pins of one repository stack; the innermost wins.
+    """
+
+    def __init__(self):
+        self._pinned: Dict[str, List[RepoStructure]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def pin(self, repo_name: str, structure: RepoStructure) -> Iterator[RepoStructure]:
+        """Serve reads of a repository from a structure until the block exits"""
+        with self._lock:
+            self._pinned.setdefault(repo_name, []).append(structure)
+        try:
+            yield structure
+        finally:
+            with self._lock:
+                stack = self._pinned[repo_name]
+                stack.remove(structure)
+                if not stack:
+                    del self._pinned[repo_name]
+
+    def get(self, repo_name: str) -> Optional[RepoStructure]:
+        """Innermost pinned structure of a repository, if any"""
+        with self._lock:
+            stack = self._pinned.get(repo_name)
+            return stack[-1] if stack else None
+
 
 class RepositoryScanner:
     """
     Scan repository structure using GitHub API (no git clone)
 
     Uses PyGithub to fetch repository structure and file contents.
-    Caches file content to minimize API calls.
+    The head commit of the scanned ref is looked up with a conditional
+    request, so an unchanged repository costs a 304 that does not count
+    against the rate limit; a new commit's structure comes from one recursive
+    Git Trees request. File contents are cached by blob SHA, so files
+    unchanged between validations (or commits) are never fetched twice. Both live in a bounded ScannerCache, optionally backed by
+    a SQLite file shared across processes.
     """
 
-    def __init__(self, github_client: Github):
+    def __init__(self, github_client: Github, cache: Optional[ScannerCache] = None):
         """
         Initialize scanner
 
         Args:
             github_client: PyGithub Github client instance
+            cache: Scanner cache (defaults to ScannerCache.from_env())
         """
         self.github = github_client
-        self._file_cache: Dict[str, Optional[str]] = {}
-        self._structure_cache: Dict[str, RepoStructure] = {}
-
-    def scan_repository_structure(self, repo_name: str) -> RepoStructure:
+        self.cache = cache if cache is not None else ScannerCache.from_env()
+        # Rate-limited GitHub API requests made so far, and conditional
+        # requests answered with 304 Not Modified (free)
+        self.api_calls = 0
+        self.not_modified = 0
+        # repo -> rate-limited API calls made for it
+        self._repo_api_calls: Dict[str, int] = {}
+        self._counter_lock = threading.Lock()
+        self._pinned = PinnedStructures()
+
+    def scan_repository_structure(
+        self,
+        repo_name: str,
+        refresh: bool = False,
+        ref: Optional[str] = None
+    ) -> RepoStructure:
         """
         Scan repository structure using GitHub API
 
+        File reads (get_file_content, file_exists, prefetch) are served from
+        the pinned structure (see pinned), else the structure scanned last,
+        so scanning at a ref switches them to it.
+
         Args:
             repo_name: Repository name in format 'owner/repo'
+            refresh: Revalidate the cached structure even if it is younger
+                     than the cache TTL
+            ref: Commit SHA, branch or tag to read (default: the default branch)
 
         Returns:
-            RepoStructure with all files and directories
+            RepoStructure with all files and directories, and the commit read
 
         Raises:
-            GithubException: If repository not found or API error occurs
+            GithubException: If repository or ref not found or API error occurs
         """
+        cached = self._cached_tree(repo_name)
+        same_ref = cached is not None and cached.ref == ref
+
         # Check cache first
-        if repo_name in self._structure_cache:
+        if same_ref and not refresh and time.time() - cached.fetched_at < self.cache.ttl:
             logger.debug(f"Using cached structure for {repo_name}")
-            return self._structure_cache[repo_name]
+            return cached.structure
 
         try:
-            repo = self.github.get_repo(repo_name)
-            structure = RepoStructure(repository=repo_name)
-
-            # Recursively traverse repository tree
-            self._traverse_tree(repo, "", structure)
+            branch = cached.branch if cached is not None else None
+            if ref is None and branch is None:
+                branch = self._get_repo(repo_name).default_branch
+
+            try:
+                status, headers, data = self._request(
+                    repo_name,
+                    f"/repos/{repo_name}/commits/{quote(ref or branch, safe='')}",
+                    etag=cached.etag if same_ref else None
+                )
+            except GithubException as e:
+                if e.status != 409:
+                    raise
+                # 409: repository is empty
+                status, headers, data = 409, {}, None
+
+            commit = data["sha"] if data is not None else None
+            if status == 304:
+                logger.debug(f"Structure of {repo_name} not modified")
+                tree = cached._replace(fetched_at=time.time())
+            elif cached is not None and commit is not None and cached.structure.commit == commit:
+                # Same commit reached through another ref
+                tree = cached._replace(etag=headers.get("etag"), fetched_at=time.time(), ref=ref)
+            else:
+                structure = RepoStructure(repository=repo_name, commit=commit)
+                if commit is not None:
+                    self._read_git_tree(repo_name, commit, structure)
+                tree = CachedTree(structure, branch, headers.get("etag"), time.time(), ref)
+                logger.info(
+                    f"Scanned {repo_name} at {(commit or 'empty')[:12]}: "
+                    f"{len(structure.files)} files, {len(structure.directories)} directories"
+                )
 
             # Cache result
-            self._structure_cache[repo_name] = structure
-            logger.info(f"Scanned {repo_name}: {len(structure.files)} files, {len(structure.directories)} directories")
-
-            return structure
+            self.cache.put(f"tree:{repo_name}", tree, tree.size(), encoded=tree.encode())
+            return tree.structure
         except GithubException as e:
             logger.error(f"Failed to scan {repo_name}: {e}")
             raise
 
+    def _read_git_tree(self, repo_name: str, commit: str, structure: RepoStructure) -> None:
+        """Populate a structure from the recursive Git tree of a commit"""
+        _, _, data = self._request(
+            repo_name,
+            f"/repos/{repo_name}/git/trees/{commit}",
+            parameters={"recursive": "1"}
+        )
+        if data.get("truncated"):
+            # Too many entries for one response, walk directory by directory instead
+            logger.warning(f"Git tree of {repo_name} is truncated, traversing directories")
+            self._traverse_tree(self._get_repo(repo_name), "", structure, ref=commit)
+            return
+
+        for element in data.get("tree", []):
+            if element["type"] == "tree":
+                structure.directories.add(element["path"])
+            elif element["type"] == "blob":
+                structure.files[element["path"]] = FileInfo(
+                    path=element["path"], type="file", size=element.get("size"), sha=element["sha"]
+                )
+
+    def _count(self, counter: str, repo_name: str) -> None:
+        """Increment a request counter (scans may run in several threads)"""
+        with self._counter_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            if counter == "api_calls":
+                self._repo_api_calls[repo_name] = self._repo_api_calls.get(repo_name, 0) + 1
+
+    def api_calls_for(self, repo_name: str) -> int:
+        """Rate-limited API calls made so far for one repository"""
+        with self._counter_lock:
+            return self._repo_api_calls.get(repo_name, 0)
+
+    def _cached_tree(self, repo_name: str) -> Optional[CachedTree]:
+        """Cached structure of a repository, if any"""
+        return self.cache.get(f"tree:{repo_name}", decode=lambda data: CachedTree.decode(repo_name, data))
+
+    def pinned(self, repo_name: str, structure: RepoStructure):
+        """
+        Context manager serving file reads of a repository from a scanned structure
+
+        Reads inside the block do not depend on the structure staying in the
+        scanner cache, which may evict it or replace it with another ref's.
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            structure: Structure returned by scan_repository_structure
+        """
+        return self._pinned.pin(repo_name, structure)
+
+    def _structure(self, repo_name: str) -> Optional[RepoStructure]:
+        """Structure file reads are served from: pinned, else cached, else None"""
+        structure = self._pinned.get(repo_name)
+        if structure is not None:
+            return structure
+        cached = self._cached_tree(repo_name)
+        return cached.structure if cached is not None else None
+
+    def _get_repo(self, repo_name: str):
+        """PyGithub Repository object"""
+        self._count("api_calls", repo_name)
+        return self.github.get_repo(repo_name)
+
+    def _request(
+        self,
+        repo_name: str,
+        url: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        etag: Optional[str] = None
+    ) -> Tuple[int, Dict[str, Any], Any]:
+        """
+        GET a REST API path, conditionally if an ETag is given
+
+        Returns:
+            (status, lowercase response headers, decoded JSON body or None for 304)
+
+        Raises:
+            GithubException: On error status codes
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        status, response_headers, output = self.github.requester.requestJson(
+            "GET", url, parameters=parameters, headers=headers
+        )
+        response_headers = {key.lower(): value for key, value in (response_headers or {}).items()}
+        if status == 304:
+            self._count("not_modified", repo_name)
+            return status, response_headers, None
+
+        self._count("api_calls", repo_name)
+        data = json.loads(output) if output else None
+        if status >= 400:
+            raise GithubException(status, data, response_headers)
+        return status, response_headers, data
+
     def _traverse_tree(
         self,
         repo,
         path: str,
         structure: RepoStructure,
-        depth: int = 0
+        depth: int = 0,
+        ref: Optional[str] = None
     ) -> None:
         """
         Recursively traverse repository tree via GitHub API
 
+        Only used when the recursive Git tree is truncated (one request per
+        directory).
+
         Args:
             repo: PyGithub Repository object
             path: Current path (empty for root)
             structure: RepoStructure to populate
             depth: Current recursion depth (limit to prevent infinite loops)
+            ref: Commit to read (default: the default branch)
         """
         # Limit recursion depth to avoid excessive API calls
         if depth > 20:
@@ -145,7 +448,8 @@ class RepositoryScanner:
             return
 
         try:
-            contents = repo.get_contents(path if path else "")
+            self._count("api_calls", structure.repository)
+            contents = repo.get_contents(path if path else "", ref=ref or NotSet)
 
             # Handle both single file and list of contents
             if not isinstance(contents, list):
@@ -162,7 +466,7 @@ class RepositoryScanner:
                 if item.type == "dir":
                     structure.directories.add(item.path)
                     # Recursively scan subdirectory
-                    self._traverse_tree(repo, item.path, structure, depth + 1)
+                    self._traverse_tree(repo, item.path, structure, depth + 1, ref)
                 else:
                     structure.files[item.path] = file_info
 
@@ -176,6 +480,10 @@ class RepositoryScanner:
         """
         Get file content via GitHub API with caching
 
+        Files of a scanned repository are looked up in its structure and
+        fetched as blobs by SHA; missing files cost no request. Unscanned
+        repositories are read by path from the default branch.
+
         Args:
             repo_name: Repository name in format 'owner/repo'
             filepath: Path to file in repository
@@ -186,40 +494,138 @@ class RepositoryScanner:
         Raises:
             GithubException: If repository not found
         """
-        cache_key = f"{repo_name}:{filepath}"
+        structure = self._structure(repo_name)
+        if structure is not None:
+            file_info = structure.files.get(filepath.strip("/"))
+            if file_info is None or not file_info.sha:
+                logger.debug(f"File not found: {filepath} in {repo_name}")
+                return None
+            return self._get_blob(repo_name, file_info.sha, filepath)
+
+        cache_key = f"path:{repo_name}:{filepath}"
 
         # Check cache first
-        if cache_key in self._file_cache:
-            return self._file_cache[cache_key]
+        cached_content = self.cache.get(cache_key)
+        if cached_content is not None:
+            return cached_content["content"]
 
         try:
-            repo = self.github.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
+            self._count("api_calls", repo_name)
             file_obj = repo.get_contents(filepath)
 
             # Only decode if it's a file (not a directory)
             if file_obj.type == "file":
                 content = file_obj.decoded_content.decode('utf-8', errors='ignore')
-                self._file_cache[cache_key] = content
                 logger.debug(f"Fetched {filepath} from {repo_name}")
-                return content
             else:
-                self._file_cache[cache_key] = None
-                return None
+                content = None
 
         except GithubException as e:
             if e.status == 404:
                 logger.debug(f"File not found: {filepath} in {repo_name}")
-                self._file_cache[cache_key] = None
-                return None
             else:
                 logger.warning(f"Error fetching {filepath}: {e}")
-                self._file_cache[cache_key] = None
-                return None
+            content = None
+
+        self.cache.put(cache_key, {"content": content}, len(content or ""), ttl=self.cache.ttl)
+        return content
+
+    def _get_blob(self, repo_name: str, sha: str, filepath: str) -> Optional[str]:
+        """Blob content by SHA from the cache or the API, None on error"""
+        content = self.cache.get(f"blob:{sha}")
+        if content is not None:
+            return content
+
+        try:
+            _, _, blob = self._request(repo_name, f"/repos/{repo_name}/git/blobs/{sha}")
+        except GithubException as e:
+            logger.warning(f"Error fetching {filepath}: {e}")
+            return None
+
+        if blob.get("encoding") == "base64":
+            data = base64.b64decode(blob["content"])
+        else:
+            data = blob["content"].encode("utf-8")
+        content = data.decode("utf-8", errors="ignore")
+        logger.debug(f"Fetched {filepath} ({sha[:12]}) from {repo_name}")
+
+        self.cache.put(f"blob:{sha}", content, len(content))
+        return content
+
+    def prefetch(self, repo_name: str, paths: Iterable[str], max_workers: int = 8) -> int:
+        """
+        Fetch the contents of several files into the cache in parallel
+
+        Paths that are not in the scanned structure, and blobs already
+        cached, cost no request.
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            paths: Files about to be read
+            max_workers: Concurrent requests
+
+        Returns:
+            Number of files whose blob was requested
+        """
+        structure = self._structure(repo_name)
+        if structure is None:
+            return 0
+
+        # blob SHA -> path, so files with identical content are fetched once
+        wanted: Dict[str, str] = {}
+        for path in paths:
+            file_info = structure.files.get(path.strip("/"))
+            if file_info is not None and file_info.sha:
+                wanted.setdefault(file_info.sha, file_info.path)
+        if not wanted:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(wanted))) as pool:
+            list(pool.map(lambda item: self._get_blob(repo_name, *item), wanted.items()))
+        return len(wanted)
+
+    def changed_paths(self, repo_name: str, base: str, head: str) -> Optional[Set[str]]:
+        """
+        Paths changed between two commits, from one Compare API request
+
+        Renamed files contribute both their old and new path.
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            base: Base commit SHA, branch or tag
+            head: Head commit SHA, branch or tag
+
+        Returns:
+            Set of changed paths, or None if the comparison lists too many
+            files to be complete (300 or more)
+
+        Raises:
+            GithubException: If either commit is not found
+        """
+        _, _, data = self._request(
+            repo_name,
+            f"/repos/{repo_name}/compare/{quote(base, safe='')}...{quote(head, safe='')}",
+            parameters={"per_page": "300"}
+        )
+        files = data.get("files", [])
+        if len(files) >= 300:
+            logger.info(f"{base}...{head} of {repo_name} changes {len(files)}+ files, list may be incomplete")
+            return None
+
+        paths: Set[str] = set()
+        for changed in files:
+            paths.add(changed["filename"])
+            if changed.get("previous_filename"):
+                paths.add(changed["previous_filename"])
+        return paths
 
     def file_exists(self, repo_name: str, filepath: str) -> bool:
         """
         Check if file exists in repository
 
+        Answered from the structure when the repository has been scanned.
+
         Args:
             repo_name: Repository name
             filepath: Path to file
@@ -227,19 +633,377 @@ class RepositoryScanner:
         Returns:
             True if file exists, False otherwise
         """
+        structure = self._structure(repo_name)
+        if structure is not None:
+            path = filepath.strip("/")
+            return path in structure.files or path in structure.directories
+
         try:
-            repo = self.github.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
+            self._count("api_calls", repo_name)
             repo.get_contents(filepath)
             return True
         except GithubException:
             return False
 
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get request and cache counters
+
+        Returns:
+            Dictionary with rate-limited API calls, 304 responses and the
+            scanner cache's counters
+        """
+        return {
+            "github_api_calls": self.api_calls,
+            "not_modified": self.not_modified,
+            "cache": self.cache.stats(),
+        }
+
     def clear_cache(self) -> None:
-        """Clear file content cache (useful for testing or memory management)"""
-        self._file_cache.clear()
+        """Clear the in-memory cache tier (useful for testing or memory management)"""
+        self.cache.clear()
+        logger.debug("Cleared scanner cache")
+
+
+class LocalCloneScanner:
+    """
+    Scan repositories from a local git tree instead of the GitHub API
+
+    Serves the RepositoryScanner interface from an existing checkout under
+    checkout_root, or else from a shallow, blob-less bare clone kept under
+    clone_dir. The clone fetches only the head commit and its trees, so the
+    structure scan costs one fetch; git fetches file contents lazily when they
+    are first read. Clones are reused and refreshed with a shallow fetch
+    whenever a repository's structure is scanned again. Contents read from a
+    clone are cached by blob SHA in a ScannerCache, which ArchitecturalValidator
+    shares with its RepositoryScanner; checkouts are read from disk directly.
+    """
+
+    def __init__(
+        self,
+        clone_dir: Optional[str] = None,
+        checkout_root: Optional[str] = None,
+        url_template: Optional[str] = None,
+        token: Optional[str] = None,
+        timeout: Optional[float] = None,
+        cache: Optional[ScannerCache] = None
+    ):
+        """
+        Initialize scanner (no git commands run until a repository is scanned)
+
+        Args:
+            clone_dir: Directory clones are kept in (defaults to ARCH_VALIDATOR_CLONE_DIR
+                       env var, else a temporary directory)
+            checkout_root: Directory of existing checkouts, read in place when one
+                           exists as <checkout_root>/<owner>/<repo> or
+                           <checkout_root>/<repo> (defaults to REPOS_PATH env var)
+            url_template: Clone URL with a {repo} placeholder (defaults to
+                          ARCH_VALIDATOR_CLONE_URL env var, else GitHub over HTTPS)
+            token: Token for private repositories over HTTPS (defaults to GITHUB_TOKEN env var)
+            timeout: Seconds a git command may take (defaults to
+                     ARCH_VALIDATOR_GIT_TIMEOUT env var, 120)
+            cache: Cache for contents read from clones (defaults to ScannerCache.from_env())
+        """
+        self.clone_dir = clone_dir or os.getenv("ARCH_VALIDATOR_CLONE_DIR")
+        self.checkout_root = checkout_root if checkout_root is not None else os.getenv("REPOS_PATH")
+        self.url_template = url_template or os.getenv(
+            "ARCH_VALIDATOR_CLONE_URL", "https://github.com/{repo}.git"
+        )
+        self.token = token if token is not None else os.getenv("GITHUB_TOKEN")
+        self.timeout = timeout or float(os.getenv("ARCH_VALIDATOR_GIT_TIMEOUT", "120"))
+
+        self.cache = cache if cache is not None else ScannerCache.from_env()
+        self._structure_cache: Dict[str, RepoStructure] = {}
+        # repo_name -> (local path, commit); commit is None for a checkout read in place
+        self._sources: Dict[str, Tuple[str, Optional[str]]] = {}
+        # repo_name -> ref of the cached structure, None for the default branch
+        self._refs: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._repo_locks: Dict[str, threading.Lock] = {}
+        self._pinned = PinnedStructures()
+
+    def scan_repository_structure(
+        self,
+        repo_name: str,
+        refresh: bool = False,
+        ref: Optional[str] = None
+    ) -> RepoStructure:
+        """
+        Scan repository structure from the local tree
+
+        File reads are served from the pinned structure (see pinned), else
+        the structure scanned last, so scanning at a ref switches them to it.
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            refresh: Re-read the checkout, or fetch the current head, even if
+                     the structure is cached
+            ref: Commit SHA, branch or tag to read (default: the remote's
+                 head); always read from a clone, never from a checkout
+
+        Returns:
+            RepoStructure with all files and directories (blob SHAs for clones,
+            sizes for checkouts)
+
+        Raises:
+            RuntimeError: If the repository cannot be cloned or fetched
+        """
+        with self._repo_lock(repo_name):
+            if not refresh and repo_name in self._structure_cache and self._refs.get(repo_name) == ref:
+                logger.debug(f"Using cached structure for {repo_name}")
+                return self._structure_cache[repo_name]
+
+            checkout = self._find_checkout(repo_name) if ref is None else None
+            if checkout is not None:
+                structure = self._walk_checkout(repo_name, checkout)
+                self._sources[repo_name] = (checkout, None)
+                source = f"checkout {checkout}"
+            else:
+                clone, commit = self._fetch(repo_name, ref)
+                structure = self._read_tree(repo_name, clone, commit)
+                self._sources[repo_name] = (clone, commit)
+                source = f"clone at {commit[:12]}"
+
+            self._structure_cache[repo_name] = structure
+            self._refs[repo_name] = ref
+            logger.info(
+                f"Scanned {repo_name} from {source}: "
+                f"{len(structure.files)} files, {len(structure.directories)} directories"
+            )
+            return structure
+
+    def get_file_content(self, repo_name: str, filepath: str) -> Optional[str]:
+        """
+        Get file content from the local tree
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            filepath: Path to file in repository
+
+        Returns:
+            File content as string, or None if file not found
+        """
+        structure = self._current_structure(repo_name)
+        file_info = structure.files.get(filepath.strip("/"))
+        if file_info is None:
+            logger.debug(f"File not found: {filepath} in {repo_name}")
+            return None
+
+        root, commit = self._sources[repo_name]
+        if commit is not None:
+            content = self.cache.get(f"blob:{file_info.sha}")
+            if content is not None:
+                return content
+
+        try:
+            if commit is None:
+                with open(os.path.join(root, file_info.path), "rb") as f:
+                    data = f.read()
+            else:
+                data = self._git(root, "cat-file", "blob", file_info.sha).stdout
+            content = data.decode("utf-8", errors="ignore")
+        except (OSError, RuntimeError, subprocess.SubprocessError) as e:
+            logger.warning(f"Error reading {filepath} of {repo_name}: {e}")
+            return None
+
+        if commit is not None:
+            self.cache.put(f"blob:{file_info.sha}", content, len(content))
+        return content
+
+    def prefetch(self, repo_name: str, paths: Iterable[str], max_workers: int = 8) -> int:
+        """
+        Fetch the blobs of several files from the remote in one request
+
+        Contents are read back with a single `git cat-file --batch` and cached.
+        Checkouts need no prefetch.
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            paths: Files about to be read
+            max_workers: Unused, for interface compatibility with RepositoryScanner
+
+        Returns:
+            Number of blobs fetched
+        """
+        structure = self._current_structure(repo_name)
+        root, commit = self._sources[repo_name]
+        if commit is None:
+            return 0
+
+        shas = set()
+        for path in paths:
+            file_info = structure.files.get(path.strip("/"))
+            if file_info is not None and self.cache.get(f"blob:{file_info.sha}") is None:
+                shas.add(file_info.sha)
+        if not shas:
+            return 0
+
+        try:
+            self._git(root, "fetch", "--quiet", "--no-tags", "--no-write-fetch-head",
+                      "--filter=blob:none", "origin", *sorted(shas))
+            output = self._git(root, "cat-file", "--batch", stdin="\n".join(sorted(shas)).encode() + b"\n").stdout
+        except (RuntimeError, subprocess.SubprocessError) as e:
+            # Contents are still fetched one by one when read
+            logger.warning(f"Could not prefetch {len(shas)} blobs of {repo_name}: {e}")
+            return 0
+
+        # Output: "<sha> <type> <size>\n<content>\n" per object
+        position = 0
+        while position < len(output):
+            header_end = output.index(b"\n", position)
+            header = output[position:header_end].decode().split()
+            position = header_end + 1
+            if len(header) != 3:
+                continue  # "<sha> missing"
+            size = int(header[2])
+            content = output[position:position + size].decode("utf-8", errors="ignore")
+            position += size + 1
+            self.cache.put(f"blob:{header[0]}", content, len(content))
+        return len(shas)
+
+    def file_exists(self, repo_name: str, filepath: str) -> bool:
+        """
+        Check if file or directory exists in repository
+
+        Args:
+            repo_name: Repository name
+            filepath: Path to file
+
+        Returns:
+            True if file exists, False otherwise
+        """
+        try:
+            structure = self._current_structure(repo_name)
+        except Exception as e:
+            logger.warning(f"Could not scan {repo_name}: {e}")
+            return False
+        path = filepath.strip("/")
+        return path in structure.files or path in structure.directories
+
+    def clear_cache(self) -> None:
+        """Clear cached structures and contents; clones are kept and refreshed on the next scan"""
+        self.cache.clear()
         self._structure_cache.clear()
+        self._sources.clear()
+        self._refs.clear()
         logger.debug("Cleared scanner cache")
 
+    def pinned(self, repo_name: str, structure: RepoStructure):
+        """
+        Context manager serving file reads of a repository from a scanned structure
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            structure: Structure returned by scan_repository_structure
+        """
+        return self._pinned.pin(repo_name, structure)
+
+    def _current_structure(self, repo_name: str) -> RepoStructure:
+        """Pinned structure, else the one scanned last (at any ref), scanning the default head if none"""
+        structure = self._pinned.get(repo_name) or self._structure_cache.get(repo_name)
+        return structure if structure is not None else self.scan_repository_structure(repo_name)
+
+    def _repo_lock(self, repo_name: str) -> threading.Lock:
+        """Lock serializing scans of one repository"""
+        with self._lock:
+            return self._repo_locks.setdefault(repo_name, threading.Lock())
+
+    def _find_checkout(self, repo_name: str) -> Optional[str]:
+        """Existing checkout of the repository under checkout_root, if there is one"""
+        if not self.checkout_root:
+            return None
+        for candidate in (repo_name, repo_name.split("/")[-1]):
+            path = os.path.join(self.checkout_root, *candidate.split("/"))
+            if os.path.isdir(path):
+                return path
+        return None
+
+    def _walk_checkout(self, repo_name: str, root: str) -> RepoStructure:
+        """Build the structure of a checkout from its working tree"""
+        structure = RepoStructure(repository=repo_name)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if name != ".git"]
+            relative = os.path.relpath(dirpath, root)
+            prefix = "" if relative == "." else relative.replace(os.sep, "/") + "/"
+
+            for name in dirnames:
+                structure.directories.add(prefix + name)
+            for name in filenames:
+                try:
+                    size = os.stat(os.path.join(dirpath, name)).st_size
+                except OSError:
+                    size = None
+                structure.files[prefix + name] = FileInfo(path=prefix + name, type="file", size=size)
+        return structure
+
+    def _fetch(self, repo_name: str, ref: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Clone the repository, or refresh an existing clone, without file contents
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            ref: Commit SHA, branch or tag to fetch (default: the remote's HEAD)
+
+        Returns:
+            (clone directory, fetched commit SHA)
+        """
+        if not self.clone_dir:
+            with self._lock:
+                if not self.clone_dir:
+                    self.clone_dir = tempfile.mkdtemp(prefix="arch-validator-clones-")
+
+        clone = os.path.join(self.clone_dir, repo_name.replace("/", "__"))
+        if not os.path.isdir(clone):
+            os.makedirs(self.clone_dir, exist_ok=True)
+            self._git(None, "init", "--quiet", "--bare", clone)
+            self._git(clone, "remote", "add", "origin", self.url_template.format(repo=repo_name))
+
+        self._git(clone, "fetch", "--quiet", "--depth", "1", "--filter=blob:none", "--no-tags", "origin", ref or "HEAD")
+        commit = self._git(clone, "rev-parse", "FETCH_HEAD^{commit}").stdout.decode().strip()
+        return clone, commit
+
+    def _read_tree(self, repo_name: str, clone: str, commit: str) -> RepoStructure:
+        """Build the structure of a commit from its trees (no blobs needed)"""
+        structure = RepoStructure(repository=repo_name, commit=commit)
+        output = self._git(clone, "ls-tree", "-r", "-t", "-z", commit).stdout.decode("utf-8", errors="replace")
+
+        for entry in output.split("\0"):
+            if not entry:
+                continue
+            meta, path = entry.split("\t", 1)
+            _, object_type, sha = meta.split()
+            if object_type == "tree":
+                structure.directories.add(path)
+            elif object_type == "blob":
+                structure.files[path] = FileInfo(path=path, type="file", sha=sha)
+        return structure
+
+    def _git(self, cwd: Optional[str], *args: str, stdin: Optional[bytes] = None) -> subprocess.CompletedProcess:
+        """
+        Run a git command
+
+        Raises:
+            RuntimeError: If git exits with an error
+        """
+        env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+        if self.token and self.url_template.startswith("https://"):
+            # Passed through the environment so the token never appears in the command line
+            credentials = base64.b64encode(f"x-access-token:{self.token}".encode()).decode()
+            env.update(
+                GIT_CONFIG_COUNT="1",
+                GIT_CONFIG_KEY_0="http.extraHeader",
+                GIT_CONFIG_VALUE_0=f"Authorization: Basic {credentials}",
+            )
+
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, env=env, input=stdin, capture_output=True, timeout=self.timeout
+        )
+        if result.returncode != 0:
+            message = result.stderr.decode(errors="replace").strip()
+            raise RuntimeError(f"git {args[0]} failed: {message}")
+        return result
+
 
 class ValidationUtils:
     """Shared validation utilities used by category validators"""
@@ -257,7 +1021,7 @@ class ValidationUtils:
             True if pattern found, False otherwise
         """
         try:
-            return bool(re.search(pattern, content, re.IGNORECASE | re.MULTILINE))
+            return compile_pattern(pattern).search(content) is not None
         except re.error as e:
             logger.warning(f"Invalid regex pattern: {pattern}: {e}")
             return False
@@ -274,8 +1038,7 @@ class ValidationUtils:
         Returns:
             True if section found, False otherwise
         """
-        pattern = rf"^#+\s+{re.escape(section_title)}"
-        return bool(re.search(pattern, content, re.MULTILINE))
+        return section_pattern(section_title).search(content) is not None
 
     @staticmethod
     def check_yaml_field(yaml_content: str, field_path: str) -> bool:
@@ -290,29 +1053,7 @@ class ValidationUtils:
             True if field exists, False otherwise
         """
         try:
-            data = yaml.safe_load(yaml_content)
-            if not isinstance(data, dict):
-                return False
-
-            keys = field_path.split(".")
-            current = data
-
-            for key in keys:
-                if isinstance(current, dict) and key in current:
-                    current = current[key]
-                elif isinstance(current, list):
-                    try:
-                        idx = int(key)
-                        if 0 <= idx < len(current):
-                            current = current[idx]
-                        else:
-                            return False
-                    except ValueError:
-                        return False
-                else:
-                    return False
-
-            return True
+            return yaml_field_exists(yaml.safe_load(yaml_content), field_path)
         except yaml.YAMLError as e:
             logger.warning(f"Invalid YAML: {e}")
             return False
@@ -378,6 +1119,12 @@ class ValidationUtils:
 class CategoryValidator(ABC):
     """Base class for category-specific validators"""
 
+    # Files whose contents validate() reads, prefetched in concurrent mode
+    files: Tuple[str, ...] = ()
+    # Every path whose existence or contents validate() checks; incremental
+    # validation reruns the category only when one of them changes
+    paths: Tuple[str, ...] = ()
+
     def __init__(self, scanner: RepositoryScanner):
         """
         Initialize validator
@@ -439,18 +1186,53 @@ class ArchitecturalValidator:
     Coordinates category validators and generates comprehensive reports.
     """
 
-    def __init__(self, github_client: Github, standards_loader):
+    def __init__(
+        self,
+        github_client: Github,
+        standards_loader,
+        clone_scanner: Optional[LocalCloneScanner] = None,
+        default_backend: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        max_baselines: Optional[int] = None
+    ):
         """
         Initialize validator
 
         Args:
             github_client: PyGithub Github client
             standards_loader: StandardsLoader instance
+            clone_scanner: Scanner for the "clone" backend (created if not provided)
+            default_backend: Scanner backend used when validate_repository is not
+                             given one (defaults to ARCH_VALIDATOR_BACKEND env var, "api")
+            max_workers: Threads for prefetching and running categories concurrently
+                         (defaults to ARCH_VALIDATOR_WORKERS env var, 8; 1 runs them
+                         sequentially)
+            max_baselines: Repositories whose last full report is kept for
+                           validate_incremental, least recently used dropped
+                           first (defaults to ARCH_VALIDATOR_MAX_BASELINES env var, 1000)
         """
         self.github = github_client
         self.standards = standards_loader
         self.scanner = RepositoryScanner(github_client)
+        self.scanners: Dict[str, Any] = {
+            "api": self.scanner,
+            "clone": clone_scanner or LocalCloneScanner(cache=self.scanner.cache),
+        }
+        self.default_backend = default_backend or os.getenv("ARCH_VALIDATOR_BACKEND", "api")
+        if self.default_backend not in self.scanners:
+            raise ValueError(f"Unknown scanner backend: {self.default_backend}")
+        self.max_workers = max_workers or int(os.getenv("ARCH_VALIDATOR_WORKERS", "8"))
+        # Compiled rules of standards without a dedicated validator
+        self.rule_compiler = RuleCompiler()
+        # repo -> most recent successful full-scope report, the baseline of
+        # validate_incremental (LRU bounded by max_baselines)
+        self.last_reports: "OrderedDict[str, ValidationReport]" = OrderedDict()
+        self.max_baselines = max_baselines or int(os.getenv("ARCH_VALIDATOR_MAX_BASELINES", "1000"))
+        self._baselines_lock = threading.Lock()
+
         self.validators: Dict[str, CategoryValidator] = {}
+        # backend -> validators bound to that backend's scanner
+        self._backend_validators: Dict[str, Dict[str, CategoryValidator]] = {}
 
         # Register validators for each standard category
         self._register_validators()
@@ -459,6 +1241,11 @@ class ArchitecturalValidator:
 
     def _register_validators(self) -> None:
         """Register category-specific validators"""
+        self.validators = self._create_validators(self.scanner)
+        self._backend_validators = {"api": self.validators}
+
+    def _create_validators(self, scanner: Any) -> Dict[str, CategoryValidator]:
+        """Create category-specific validators reading through a scanner"""
         # Import validators here to avoid circular imports
         from core.category_validators import (
             LicenseValidator,
@@ -473,90 +1260,657 @@ class ArchitecturalValidator:
             ContainerizationValidator,
         )
 
-        self.validators = {
-            "license": LicenseValidator(self.scanner),
-            "documentation": DocumentationValidator(self.scanner),
-            "terraform_init": TerraformInitValidator(self.scanner),
-            "multi_env": MultiEnvValidator(self.scanner),
-            "terraform_state": TerraformStateValidator(self.scanner),
-            "disaster_recovery": DisasterRecoveryValidator(self.scanner),
-            "deployment": DeploymentValidator(self.scanner),
-            "postgresql": PostgreSQLValidator(self.scanner),
-            "ci_cd": CICDValidator(self.scanner),
-            "containerization": ContainerizationValidator(self.scanner),
+        return {
+            "license": LicenseValidator(scanner),
+            "documentation": DocumentationValidator(scanner),
+            "terraform_init": TerraformInitValidator(scanner),
+            "multi_env": MultiEnvValidator(scanner),
+            "terraform_state": TerraformStateValidator(scanner),
+            "disaster_recovery": DisasterRecoveryValidator(scanner),
+            "deployment": DeploymentValidator(scanner),
+            "postgresql": PostgreSQLValidator(scanner),
+            "ci_cd": CICDValidator(scanner),
+            "containerization": ContainerizationValidator(scanner),
         }
 
+    def _validators_for(self, backend: str) -> Dict[str, CategoryValidator]:
+        """Category validators of a scanner backend, created on first use"""
+        if backend not in self._backend_validators:
+            self._backend_validators[backend] = self._create_validators(self.scanners[backend])
+        return self._backend_validators[backend]
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get scanner request and cache counters
+
+        Returns:
+            Dictionary with GitHub API calls, 304 responses, scanner cache
+            hit rates (see RepositoryScanner.stats) and rule plan cache counters
+        """
+        return {**self.scanner.stats(), "rule_plans": self.rule_compiler.stats()}
+
     def validate_repository(
         self,
         repo_name: str,
-        scope: Optional[List[str]] = None
+        scope: Optional[List[str]] = None,
+        backend: Optional[str] = None,
+        concurrent: Optional[bool] = None,
+        ref: Optional[str] = None
     ) -> ValidationReport:
         """
         Validate repository against architectural standards
 
+        In concurrent mode the files read by all selected categories are
+        prefetched in one parallel batch, then the categories run in a thread
+        pool against the warm cache. Each CategoryResult carries its duration.
+
         Args:
             repo_name: Repository name in format 'owner/repo'
             scope: Optional list of standard categories to check (default: all)
+            backend: Scanner backend, "api" or "clone" (default: default_backend).
+                     A failed clone falls back to the API.
+            concurrent: Prefetch and run categories concurrently (default: when
+                        max_workers > 1)
+            ref: Commit SHA, branch or tag to validate (default: the default branch)
+
+        Returns:
+            ValidationReport with detailed results; scan_metadata["commit"] is
+            the commit validated (None for a local checkout)
+
+        Raises:
+            ValueError: If the backend is unknown
+        """
+        backend = self._resolve_backend(backend)
+        return self._validate(repo_name, self._select_standards(scope), backend, concurrent, ref)
+
+    def _resolve_backend(self, backend: Optional[str]) -> str:
+        """Requested scanner backend, or the default; ValueError if unknown"""
+        backend = backend or self.default_backend
+        if backend not in self.scanners:
+            raise ValueError(f"Unknown scanner backend: {backend}")
+        return backend
+
+    def _select_standards(self, scope: Optional[List[str]]) -> List[Tuple[str, ParsedStandard]]:
+        """(category, standard) pairs to check, all loaded standards if no scope"""
+        standards_to_check = scope or self.standards.list_categories()
+        selected: List[Tuple[str, ParsedStandard]] = []
+        for category in standards_to_check:
+            std = self.standards.get_standard(category)
+            if not std:
+                logger.warning(f"Standard not found: {category}")
+                continue
+            selected.append((category, std))
+        return selected
+
+    def _validate(
+        self,
+        repo_name: str,
+        selected: List[Tuple[str, ParsedStandard]],
+        backend: str,
+        concurrent: Optional[bool],
+        ref: Optional[str] = None
+    ) -> ValidationReport:
+        """Validate a repository against already selected standards"""
+        logger.info(f"Starting validation of {repo_name} ({backend} backend)")
+        started = time.perf_counter()
+        api_calls_before = self.scanner.api_calls_for(repo_name)
+
+        try:
+            repo_structure, backend = self._scan(repo_name, backend, ref)
+            with self.scanners[backend].pinned(repo_name, repo_structure):
+                outcomes, prefetched, prefetch_ms = self._run_categories(
+                    repo_name, repo_structure, selected, backend, concurrent
+                )
+            results = {category: result for (category, _), result in zip(selected, outcomes)}
+
+            # Generate report
+            scan_metadata = {
+                "files_scanned": len(repo_structure.files),
+                "scan_duration_ms": round((time.perf_counter() - started) * 1000),
+                "github_api_calls": self.scanner.api_calls_for(repo_name) - api_calls_before,
+                "scanner_backend": backend,
+                "commit": repo_structure.commit,
+                "concurrent": self._is_concurrent(concurrent),
+                "prefetched_files": prefetched,
+                "prefetch_ms": prefetch_ms,
+                "standard_hashes": {category: std.content_hash for category, std in selected},
+            }
+            report = self._report_from_results(repo_name, results, scan_metadata)
+            self._record_baseline(report, selected)
+            return report
+
+        except Exception as e:
+            logger.error(f"Validation failed for {repo_name}: {e}")
+            # Return error report
+            return self._error_report(repo_name, str(e), started, api_calls_before)
+
+    def validate_incremental(
+        self,
+        repo_name: str,
+        previous: Optional[ValidationReport] = None,
+        changed_paths: Optional[Iterable[str]] = None,
+        base: Optional[str] = None,
+        head: Optional[str] = None,
+        backend: Optional[str] = None,
+        concurrent: Optional[bool] = None
+    ) -> ValidationReport:
+        """
+        Revalidate only what a set of changed paths can affect
+
+        Categories with a dedicated validator are rerun when any path they
+        check (CategoryValidator.paths) changed. For other standards only
+        the rules targeting changed files are re-evaluated. Everything else,
+        including violations, is carried over from the previous report.
+        Categories whose standard changed since the previous report, that
+        the previous report lacks, or that failed to validate in it are
+        rerun in full. Falls back to a full validation when there is no
+        usable previous report, the previous report did not validate base,
+        or the change set cannot be determined.
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            previous: Report to update (default: the last full-scope report
+                      produced for the repository by this validator)
+            changed_paths: Paths changed since the previous report
+            base: Commit SHA (full or abbreviated) the previous report
+                  validated (with head, instead of changed_paths; compared
+                  through the GitHub API with the commit scanned at head)
+            head: Commit SHA, branch or tag to validate now (default: the
+                  default branch)
+            backend: Scanner backend, "api" or "clone" (default: default_backend)
+            concurrent: Prefetch and run rerun categories concurrently
+
+        Returns:
+            ValidationReport; scan_metadata lists the revalidated and reused
+            categories
+
+        Raises:
+            ValueError: If neither changed_paths nor base and head are given,
+                        or the backend is unknown
+        """
+        backend = self._resolve_backend(backend)
+        if changed_paths is None and not (base and head):
+            raise ValueError("Either changed_paths or base and head commits are required")
+
+        previous = previous or self.last_report(repo_name)
+        if previous is None or not previous.categories:
+            logger.info(f"No previous report for {repo_name}, validating fully")
+            return self.validate_repository(repo_name, backend=backend, concurrent=concurrent, ref=head)
+
+        if changed_paths is None and not self._validated(previous, base):
+            logger.info(
+                f"Previous report of {repo_name} validated {previous.scan_metadata.get('commit')}, "
+                f"not {base}; validating fully"
+            )
+            return self.validate_repository(repo_name, backend=backend, concurrent=concurrent, ref=head)
+
+        started = time.perf_counter()
+        api_calls_before = self.scanner.api_calls_for(repo_name)
+        # Every loaded standard: categories missing from the previous report are rerun
+        selected = self._select_standards(None)
+        previous_hashes = previous.scan_metadata.get("standard_hashes", {})
+
+        try:
+            repo_structure, backend = self._scan(repo_name, backend, head)
+            validators = self._validators_for(backend)
+
+            if changed_paths is not None:
+                changed = {path.strip("/") for path in changed_paths}
+            else:
+                # Compare with the commit actually scanned, not whatever head resolves to now
+                scanned = repo_structure.commit or head
+                try:
+                    changed = self.scanner.changed_paths(repo_name, base, scanned)
+                except GithubException as e:
+                    logger.warning(f"Could not compare {base}...{scanned} of {repo_name}: {e}")
+                    changed = None
+                if changed is None:
+                    return self.validate_repository(repo_name, backend=backend, concurrent=concurrent, ref=head)
+            logger.info(f"Incremental validation of {repo_name}: {len(changed)} changed paths ({backend} backend)")
+
+            with self.scanners[backend].pinned(repo_name, repo_structure):
+                results: Dict[str, CategoryResult] = {}
+                rerun: List[Tuple[str, ParsedStandard]] = []
+                revalidated: List[str] = []
+                for category, std in selected:
+                    last = previous.categories.get(category)
+                    if last is None or last.error or previous_hashes.get(category) != std.content_hash:
+                        # New, previously failed to validate, or standard changed
+                        rerun.append((category, std))
+                    elif category in validators:
+                        if self._affected(changed, validators[category].paths):
+                            rerun.append((category, std))
+                        else:
+                            results[category] = replace(last, duration_ms=0.0)
+                    else:
+                        plan = self.rule_compiler.plan_for(std)
+                        paths = {path for path in plan.files if self._affected(changed, (path,))}
+                        if paths:
+                            results[category] = self._revalidate_rules(repo_name, std, paths, last, backend)
+                            revalidated.append(category)
+                        else:
+                            results[category] = replace(last, duration_ms=0.0)
+
+                outcomes, prefetched, prefetch_ms = self._run_categories(
+                    repo_name, repo_structure, rerun, backend, concurrent
+                )
+                results.update({category: result for (category, _), result in zip(rerun, outcomes)})
+                revalidated.extend(category for category, _ in rerun)
+
+            scan_metadata = {
+                "files_scanned": len(repo_structure.files),
+                "scan_duration_ms": round((time.perf_counter() - started) * 1000),
+                "github_api_calls": self.scanner.api_calls_for(repo_name) - api_calls_before,
+                "scanner_backend": backend,
+                "commit": repo_structure.commit,
+                "concurrent": self._is_concurrent(concurrent),
+                "prefetched_files": prefetched,
+                "prefetch_ms": prefetch_ms,
+                "standard_hashes": {category: std.content_hash for category, std in selected},
+                "incremental": True,
+                "changed_paths": len(changed),
+                "revalidated_categories": [c for c, _ in selected if c in revalidated],
+                "reused_categories": [c for c, _ in selected if c not in revalidated],
+            }
+            report = self._report_from_results(
+                repo_name, {category: results[category] for category, _ in selected}, scan_metadata
+            )
+            self._record_baseline(report, selected)
+            return report
+
+        except Exception as e:
+            logger.error(f"Incremental validation failed for {repo_name}: {e}")
+            return self._error_report(repo_name, str(e), started, api_calls_before)
+
+    def last_report(self, repo_name: str) -> Optional[ValidationReport]:
+        """Last full-scope report of a repository, the default baseline of validate_incremental"""
+        with self._baselines_lock:
+            report = self.last_reports.get(repo_name)
+            if report is not None:
+                self.last_reports.move_to_end(repo_name)
+            return report
+
+    def _record_baseline(self, report: ValidationReport, selected: List[Tuple[str, ParsedStandard]]) -> None:
+        """Keep a report as the repository's baseline if it covers every loaded standard"""
+        if not {category for category, _ in selected} >= set(self.standards.list_categories()):
+            return
+        with self._baselines_lock:
+            self.last_reports[report.repository] = report
+            self.last_reports.move_to_end(report.repository)
+            while len(self.last_reports) > self.max_baselines:
+                self.last_reports.popitem(last=False)
+
+    @staticmethod
+    def _validated(report: ValidationReport, commit: str) -> bool:
+        """Whether a report validated a commit, given by its full or abbreviated SHA"""
+        validated = report.scan_metadata.get("commit")
+        return bool(validated) and len(commit) >= 7 and validated.startswith(commit.lower())
+
+    @staticmethod
+    def _affected(changed: Set[str], watched: Iterable[str]) -> bool:
+        """Whether a changed path is, or is inside, one of the watched paths"""
+        for path in watched:
+            path = path.strip("/")
+            if path in changed or any(candidate.startswith(path + "/") for candidate in changed):
+                return True
+        return False
+
+    def _revalidate_rules(
+        self,
+        repo_name: str,
+        standard: ParsedStandard,
+        paths: Set[str],
+        previous: CategoryResult,
+        backend: str
+    ) -> CategoryResult:
+        """Re-evaluate a standard's rules on some files, keeping the previous outcome of the rest"""
+        started = time.perf_counter()
+        plan = self.rule_compiler.plan_for(standard)
+        outcomes = plan.evaluate(repo_name, self.scanners[backend], paths=paths)
+        previous_violations = {v.rule_id: v for v in previous.violations}
+
+        violations = []
+        for rule, passed in zip(standard.validation_rules, outcomes):
+            if passed is None:
+                if rule.rule_id in previous_violations:
+                    violations.append(previous_violations[rule.rule_id])
+            elif not passed:
+                violations.append(self._rule_violation(rule, standard.category))
+
+        checks_performed = len(standard.validation_rules)
+        return CategoryResult(
+            category=standard.category,
+            passed=len(violations) == 0,
+            violations=violations,
+            checks_performed=checks_performed,
+            compliance_score=ValidationUtils.calculate_compliance_score(checks_performed, violations),
+            duration_ms=round((time.perf_counter() - started) * 1000, 1)
+        )
+
+    def _scan(self, repo_name: str, backend: str, ref: Optional[str] = None) -> Tuple[RepoStructure, str]:
+        """
+        Scan the current repository structure at ref; unchanged file contents stay cached
 
         Returns:
-            ValidationReport with detailed results
+            (structure, backend actually used: a failed clone falls back to the API)
+        """
+        try:
+            return self.scanners[backend].scan_repository_structure(repo_name, refresh=True, ref=ref), backend
+        except Exception as e:
+            if backend == "api":
+                raise
+            logger.warning(f"{backend} scan of {repo_name} failed, falling back to GitHub API: {e}")
+            return self.scanner.scan_repository_structure(repo_name, refresh=True, ref=ref), "api"
+
+    def _is_concurrent(self, concurrent: Optional[bool]) -> bool:
+        return self.max_workers > 1 if concurrent is None else bool(concurrent)
+
+    def _run_categories(
+        self,
+        repo_name: str,
+        repo_structure: RepoStructure,
+        selected: List[Tuple[str, ParsedStandard]],
+        backend: str,
+        concurrent: Optional[bool]
+    ) -> Tuple[List[CategoryResult], int, float]:
         """
-        logger.info(f"Starting validation of {repo_name}")
+        Run the selected categories, concurrently after a prefetch if requested
 
+        Returns:
+            (results in selected order, files prefetched, prefetch milliseconds)
+        """
+        if not (self._is_concurrent(concurrent) and selected):
+            outcomes = [
+                self._run_category(repo_name, repo_structure, category, std, backend)
+                for category, std in selected
+            ]
+            return outcomes, 0, 0.0
+
+        prefetch_started = time.perf_counter()
+        prefetched = self.scanners[backend].prefetch(
+            repo_name, self._files_to_prefetch(selected, backend), max_workers=self.max_workers
+        )
+        prefetch_ms = round((time.perf_counter() - prefetch_started) * 1000, 1)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(selected))) as pool:
+            outcomes = list(pool.map(
+                lambda item: self._run_category(repo_name, repo_structure, item[0], item[1], backend),
+                selected
+            ))
+        return outcomes, prefetched, prefetch_ms
+
+    def _report_from_results(
+        self,
+        repo_name: str,
+        results: Dict[str, CategoryResult],
+        scan_metadata: Dict[str, Any]
+    ) -> ValidationReport:
+        """Generate a report from category results"""
+        total_checks = sum(result.checks_performed for result in results.values())
+        all_violations = [v for result in results.values() for v in result.violations]
+        return self._generate_report(repo_name, results, total_checks, all_violations, scan_metadata)
+
+    def _error_report(self, repo_name: str, error: str, started: float, api_calls_before: int) -> ValidationReport:
+        """Error report carrying the duration and API calls of the failed attempt"""
+        report = self._generate_error_report(repo_name, error)
+        report.scan_metadata.update({
+            "scan_duration_ms": round((time.perf_counter() - started) * 1000),
+            "github_api_calls": self.scanner.api_calls_for(repo_name) - api_calls_before,
+        })
+        return report
+
+    def list_organization_repositories(
+        self,
+        organization: str,
+        include_archived: bool = False,
+        include_forks: bool = False
+    ) -> List[str]:
+        """
+        List the repositories of a GitHub organization (or user)
+
+        Args:
+            organization: Organization or user login
+            include_archived: Include archived repositories
+            include_forks: Include forks
+
+        Returns:
+            Repository names in format 'owner/repo'
+
+        Raises:
+            GithubException: If the organization or user is not found
+        """
         try:
-            # Scan repository structure
-            repo_structure = self.scanner.scan_repository_structure(repo_name)
+            owner = self.github.get_organization(organization)
+        except GithubException as e:
+            if e.status != 404:
+                raise
+            owner = self.github.get_user(organization)
 
-            # Determine which standards to check
-            standards_to_check = scope or self.standards.list_categories()
+        return [
+            repo.full_name for repo in owner.get_repos()
+            if (include_archived or not repo.archived) and (include_forks or not repo.fork)
+        ]
+
+    def iter_validate_repositories(
+        self,
+        repositories: Iterable[str],
+        scope: Optional[List[str]] = None,
+        backend: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        concurrent: Optional[bool] = None
+    ) -> Iterator[ValidationReport]:
+        """
+        Validate several repositories in a worker pool, yielding reports as they complete
 
-            # Run validators
-            results: Dict[str, CategoryResult] = {}
-            total_checks = 0
-            all_violations: List[Violation] = []
+        Standards are selected once for the batch, and every worker reads
+        through the same scanners and cache. A repository that fails yields
+        an error report rather than stopping the batch. Closing the iterator
+        early cancels repositories that have not started.
 
-            for category in standards_to_check:
-                std = self.standards.get_standard(category)
-                if not std:
-                    logger.warning(f"Standard not found: {category}")
-                    continue
+        Args:
+            repositories: Repository names in format 'owner/repo' (duplicates
+                          are validated once)
+            scope: Optional list of standard categories to check (default: all)
+            backend: Scanner backend, "api" or "clone" (default: default_backend)
+            max_workers: Repositories validated at a time (defaults to
+                         ARCH_VALIDATOR_BATCH_WORKERS env var, 4)
+            concurrent: Prefetch and run each repository's categories
+                        concurrently (default: when max_workers > 1)
+
+        Yields:
+            ValidationReport per repository, in completion order
+
+        Raises:
+            ValueError: If the backend is unknown
+        """
+        backend = self._resolve_backend(backend)
+        selected = self._select_standards(scope)
+        repositories = list(dict.fromkeys(repositories))
+        if not repositories:
+            return
+        workers = max_workers or int(os.getenv("ARCH_VALIDATOR_BATCH_WORKERS", "4"))
+
+        pool = ThreadPoolExecutor(max_workers=min(workers, len(repositories)))
+        try:
+            futures = [
+                pool.submit(self._validate, repo_name, selected, backend, concurrent)
+                for repo_name in repositories
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def validate_repositories(
+        self,
+        repositories: Iterable[str],
+        scope: Optional[List[str]] = None,
+        backend: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        concurrent: Optional[bool] = None,
+        on_report: Optional[Callable[[ValidationReport], Any]] = None,
+        organization: Optional[str] = None
+    ) -> BatchValidationReport:
+        """
+        Validate several repositories and summarize the results
 
-                # Use category-specific validator or generic validator
+        Args:
+            repositories: Repository names in format 'owner/repo'
+            scope: Optional list of standard categories to check (default: all)
+            backend: Scanner backend, "api" or "clone" (default: default_backend)
+            max_workers: Repositories validated at a time (see iter_validate_repositories)
+            concurrent: Run each repository's categories concurrently
+            on_report: Called with each report as soon as it completes
+            organization: Organization the repositories belong to (reported only)
+
+        Returns:
+            BatchValidationReport with the reports in completion order and an
+            aggregate summary (see summarize_reports)
+
+        Raises:
+            ValueError: If the backend is unknown
+        """
+        started = time.perf_counter()
+        api_calls_before = self.scanner.api_calls
+        reports: List[ValidationReport] = []
+
+        for report in self.iter_validate_repositories(repositories, scope, backend, max_workers, concurrent):
+            reports.append(report)
+            if on_report is not None:
                 try:
-                    result = self._validate_category(repo_name, repo_structure, std)
-                    results[category] = result
-                    total_checks += result.checks_performed
-                    all_violations.extend(result.violations)
+                    on_report(report)
                 except Exception as e:
-                    logger.error(f"Error validating {category}: {e}")
-                    results[category] = CategoryResult(
-                        category=category,
-                        passed=False,
-                        violations=[],
-                        checks_performed=0,
-                        compliance_score=0.0
-                    )
+                    logger.warning(f"Batch validation callback failed for {report.repository}: {e}")
+
+        summary = self.summarize_reports(reports)
+        summary["wall_time_ms"] = round((time.perf_counter() - started) * 1000)
+        summary["github_api_calls"] = self.scanner.api_calls - api_calls_before
+        summary["scanner_cache_hit_rate"] = self.scanner.cache.stats()["hit_rate"]
+        logger.info(
+            f"Validated {summary['repositories']} repositories in {summary['wall_time_ms']}ms: "
+            f"average score {summary['average_compliance_score']}, {summary['failed']} failed"
+        )
+        return BatchValidationReport(reports=reports, summary=summary, organization=organization)
 
-            # Generate report
-            return self._generate_report(repo_name, results, total_checks, all_violations)
+    @staticmethod
+    def summarize_reports(reports: List[ValidationReport]) -> Dict[str, Any]:
+        """
+        Aggregate compliance and latency over several validation reports
+
+        Args:
+            reports: Validation reports, one per repository
+
+        Returns:
+            Dictionary with repository counts, average/min/max compliance
+            score, grade distribution, per-category pass rates, violation
+            totals by severity, most frequent rule violations, the least
+            compliant repositories and per-repository latency percentiles
+        """
+        def scan_failed(report: ValidationReport) -> bool:
+            return any(v.rule_id == "scan_error" for v in report.critical_violations)
+
+        failed = [r for r in reports if scan_failed(r)]
+        validated = [r for r in reports if not scan_failed(r)]
+        scores = [r.overall_compliance_score for r in validated]
+
+        category_runs: Counter = Counter()
+        category_passes: Counter = Counter()
+        rule_violations: Counter = Counter()
+        violation_totals: Counter = Counter()
+        for report in validated:
+            for category, result in report.categories.items():
+                category_runs[category] += 1
+                category_passes[category] += result.passed
+                rule_violations.update(v.rule_id for v in result.violations)
+            for severity in ("critical", "high", "medium", "low"):
+                violation_totals[severity] += report.summary.get(f"{severity}_violations", 0)
+
+        latencies = sorted(r.scan_metadata.get("scan_duration_ms", 0) for r in reports)
+
+        def percentile(fraction: float) -> float:
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] if latencies else 0
+
+        return {
+            "repositories": len(reports),
+            "validated": len(validated),
+            "failed": len(failed),
+            "failed_repositories": [r.repository for r in failed],
+            "average_compliance_score": round(sum(scores) / len(scores), 3) if scores else 0.0,
+            "min_compliance_score": min(scores) if scores else 0.0,
+            "max_compliance_score": max(scores) if scores else 0.0,
+            "grade_distribution": dict(sorted(Counter(r.compliance_grade for r in validated).items())),
+            "category_pass_rates": {
+                category: round(category_passes[category] / runs, 3)
+                for category, runs in category_runs.items()
+            },
+            "violations": {severity: violation_totals[severity] for severity in ("critical", "high", "medium", "low")},
+            "most_common_violations": [
+                {"rule_id": rule_id, "repositories": count}
+                for rule_id, count in rule_violations.most_common(10)
+            ],
+            "least_compliant": [
+                {"repository": r.repository, "compliance_score": r.overall_compliance_score}
+                for r in sorted(validated, key=lambda r: r.overall_compliance_score)[:10]
+            ],
+            "latency_ms": {
+                "min": latencies[0] if latencies else 0,
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": latencies[-1] if latencies else 0,
+                "mean": round(sum(latencies) / len(latencies), 1) if latencies else 0,
+            },
+        }
+
+    def _files_to_prefetch(self, selected: List[Tuple[str, ParsedStandard]], backend: str) -> Set[str]:
+        """Union of the files whose contents the selected categories read"""
+        validators = self._validators_for(backend)
+        paths: Set[str] = set()
+        for _, std in selected:
+            if std.category in validators:
+                paths.update(validators[std.category].files)
+            else:
+                paths.update(self.rule_compiler.plan_for(std).content_paths)
+        return paths
 
+    def _run_category(
+        self,
+        repo_name: str,
+        repo_structure: RepoStructure,
+        category: str,
+        standard: ParsedStandard,
+        backend: str
+    ) -> CategoryResult:
+        """Validate one category, timing it and turning errors into a failed result"""
+        started = time.perf_counter()
+        try:
+            # Use category-specific validator or generic validator
+            result = self._validate_category(repo_name, repo_structure, standard, backend)
         except Exception as e:
-            logger.error(f"Validation failed for {repo_name}: {e}")
-            # Return error report
-            return self._generate_error_report(repo_name, str(e))
+            logger.error(f"Error validating {category}: {e}")
+            result = CategoryResult(
+                category=category,
+                passed=False,
+                violations=[],
+                checks_performed=0,
+                compliance_score=0.0,
+                error=str(e)
+            )
+        result.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        return result
 
     def _validate_category(
         self,
         repo_name: str,
         repo_structure: RepoStructure,
-        standard: ParsedStandard
+        standard: ParsedStandard,
+        backend: str = "api"
     ) -> CategoryResult:
         """Validate single category using registered validator"""
         category = standard.category
+        validators = self._validators_for(backend)
 
         # Use category-specific validator if available
-        if category in self.validators:
-            validator = self.validators[category]
+        if category in validators:
+            validator = validators[category]
             return validator.validate(repo_name, repo_structure, standard)
 
         # Fallback to generic validation
@@ -564,16 +1918,11 @@ class ArchitecturalValidator:
         violations = []
         checks_performed = len(standard.validation_rules)
 
-        for rule in standard.validation_rules:
-            if not self._check_rule(repo_name, rule):
-                violations.append(Violation(
-                    severity=rule.severity,
-                    rule_id=rule.rule_id,
-                    category=standard.category,
-                    message=rule.description,
-                    recommendation=rule.recommendation,
-                    file_path=rule.check_params.get("path")
-                ))
+        plan = self.rule_compiler.plan_for(standard)
+        outcomes = plan.evaluate(repo_name, self.scanners[backend])
+        for rule, passed in zip(standard.validation_rules, outcomes):
+            if not passed:
+                violations.append(self._rule_violation(rule, standard.category))
 
         compliance_score = ValidationUtils.calculate_compliance_score(checks_performed, violations)
 
@@ -585,62 +1934,25 @@ class ArchitecturalValidator:
             compliance_score=compliance_score
         )
 
-    def _check_rule(self, repo_name: str, rule: ValidationRule) -> bool:
-        """Check if a validation rule passes"""
-        check_type = rule.check_type
-        params = rule.check_params
-
-        try:
-            if check_type == "file_exists":
-                filepath = params.get("path")
-                return self.scanner.file_exists(repo_name, filepath)
-
-            elif check_type == "file_contains":
-                filepath = params.get("path")
-                pattern = params.get("pattern", "")
-                content = self.scanner.get_file_content(repo_name, filepath)
-                if content is None:
-                    return False
-                return ValidationUtils.check_file_pattern(content, pattern)
-
-            elif check_type == "file_size":
-                filepath = params.get("path")
-                min_size = params.get("min_size", 0)
-                content = self.scanner.get_file_content(repo_name, filepath)
-                if content is None:
-                    return False
-                return len(content) >= min_size
-
-            elif check_type == "section_exists":
-                filepath = params.get("path")
-                section = params.get("section", "")
-                content = self.scanner.get_file_content(repo_name, filepath)
-                if content is None:
-                    return False
-                return ValidationUtils.check_section_exists(content, section)
-
-            elif check_type == "yaml_field":
-                filepath = params.get("path")
-                field_path = params.get("field", "")
-                content = self.scanner.get_file_content(repo_name, filepath)
-                if content is None:
-                    return False
-                return ValidationUtils.check_yaml_field(content, field_path)
-
-            else:
-                logger.warning(f"Unknown check type: {check_type}")
-                return False
-
-        except Exception as e:
-            logger.warning(f"Error checking rule {rule.rule_id}: {e}")
-            return False
+    @staticmethod
+    def _rule_violation(rule: ValidationRule, category: str) -> Violation:
+        """Violation of a failed standards rule"""
+        return Violation(
+            severity=rule.severity,
+            rule_id=rule.rule_id,
+            category=category,
+            message=rule.description,
+            recommendation=rule.recommendation,
+            file_path=rule.check_params.get("path")
+        )
 
     def _generate_report(
         self,
         repo_name: str,
         results: Dict[str, CategoryResult],
         total_checks: int,
-        all_violations: List[Violation]
+        all_violations: List[Violation],
+        scan_metadata: Optional[Dict[str, Any]] = None
     ) -> ValidationReport:
         """Generate comprehensive validation report"""
         critical_violations = [v for v in all_violations if v.severity == "critical"]
@@ -667,11 +1979,7 @@ class ArchitecturalValidator:
             categories=results,
             critical_violations=critical_violations,
             recommendations=self._generate_recommendations(all_violations),
-            scan_metadata={
-                "files_scanned": 0,  # TODO: count from repo_structure
-                "scan_duration_ms": 0,  # TODO: track timing
-                "github_api_calls": 0  # TODO: track API calls
-            }
+            scan_metadata=scan_metadata or {}
         )
 
     def _generate_error_report(self, repo_name: str, error: str) -> ValidationReport:
@@ -23,6 +23,9 @@ logger = logging.getLogger(__name__)
 class LicenseValidator(CategoryValidator):
     """Validate GPL v3.0 license compliance"""
 
+    files = ("LICENSE", "README.md")
+    paths = files
+
     def validate(
         self,
         repo_name: str,
@@ -110,6 +113,9 @@ class LicenseValidator(CategoryValidator):
 class DocumentationValidator(CategoryValidator):
     """Validate documentation standards compliance"""
 
+    files = ("README.md", "CLAUDE.md")
+    paths = files
+
     def validate(
         self,
         repo_name: str,
@@ -195,6 +201,9 @@ class DocumentationValidator(CategoryValidator):
 class TerraformInitValidator(CategoryValidator):
     """Validate Terraform unified initialization pattern"""
 
+    files = ("terraform/main.tf",)
+    paths = ("terraform/scripts/terraform-init-unified.sh", "terraform/main.tf")
+
     def validate(
         self,
         repo_name: str,
@@ -279,6 +288,8 @@ class TerraformInitValidator(CategoryValidator):
 class MultiEnvValidator(CategoryValidator):
     """Validate multi-environment terraform setup"""
 
+    paths = ("terraform/dev.tfvars", "terraform/staging.tfvars", "terraform/prod.tfvars")
+
     def validate(
         self,
         repo_name: str,
@@ -320,6 +331,9 @@ class MultiEnvValidator(CategoryValidator):
 class TerraformStateValidator(CategoryValidator):
     """Validate Terraform state management"""
 
+    files = ("terraform/main.tf",)
+    paths = ("terraform/main.tf", "scripts/backup-terraform-state.sh")
+
     def validate(
         self,
         repo_name: str,
@@ -375,6 +389,8 @@ class TerraformStateValidator(CategoryValidator):
 class DisasterRecoveryValidator(CategoryValidator):
     """Validate disaster recovery setup"""
 
+    paths = ("DISASTER_RECOVERY.md", "scripts/backup-postgres.sh")
+
     def validate(
         self,
         repo_name: str,
@@ -430,6 +446,8 @@ class DisasterRecoveryValidator(CategoryValidator):
 class DeploymentValidator(CategoryValidator):
     """Validate deployment standards"""
 
+    paths = ("DEPLOYMENT.md", "scripts/setup-secrets.sh")
+
     def validate(
         self,
         repo_name: str,
@@ -485,6 +503,9 @@ class DeploymentValidator(CategoryValidator):
 class PostgreSQLValidator(CategoryValidator):
     """Validate PostgreSQL setup"""
 
+    files = ("docs/POSTGRESQL_SETUP.md",)
+    paths = ("docs/POSTGRESQL_SETUP.md", "terraform/postgres.tf")
+
     def validate(
         self,
         repo_name: str,
@@ -556,6 +577,9 @@ class PostgreSQLValidator(CategoryValidator):
 class CICDValidator(CategoryValidator):
     """Validate CI/CD configuration"""
 
+    files = ("cloudbuild.yaml",)
+    paths = files
+
     def validate(
         self,
         repo_name: str,
@@ -611,6 +635,9 @@ class CICDValidator(CategoryValidator):
 class ContainerizationValidator(CategoryValidator):
     """Validate Docker/containerization setup"""
 
+    files = ("Dockerfile",)
+    paths = files
+
     def validate(
         self,
         repo_name: str,
@@ -9,107 +9,747 @@ import logging
 import re
 import ast
 import os
-from typing import List, Dict, Optional, Tuple, Any
+import asyncio
+import json
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple, Any, Iterable, Iterator, AsyncIterator, NamedTuple
 from datetime import datetime
 from pathlib import Path
 import hashlib
+import multiprocessing
+import time
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
+
+from core.component_scan_cache import ComponentScanCache, ScanCacheEntry
+from core.database import DatabaseManager, get_db, register_statement, to_vector_literal
 from schemas.knowledge_base_v2 import (
-    Component, ComponentLocation, ComponentProvenance, ComponentVector, ConsolidationRecommendation
+    Component, ComponentLocation, ComponentProvenance, ComponentVector, ConsolidationRecommendation,
+    component_signature, component_vector_metadata
 )
 
 logger = logging.getLogger(__name__)
 
+# Directories pruned from the repository walk
+SKIP_DIRS = frozenset({
+    ".git", "venv", ".venv", "node_modules", "__pycache__", ".pytest", ".pytest_cache",
+    ".tox", ".mypy_cache", "build", "dist",
+})
 
-class ComponentScanner:
-    """Extracts and identifies components from repositories using AST parsing and pattern matching"""
+# Below this many files to parse, starting a process pool costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 64
 
-    # File patterns for different component types
-    COMPONENT_PATTERNS = {
-        "api_client": [
-            r".*_client\.py$",
-            r".*_api\.py$",
-            r".*client\.py$",
-            r"api/.*\.py$",
-        ],
-        "infrastructure": [
-            r"utils/.*\.py$",
-            r"core/.*\.py$",
-            r"lib/.*\.py$",
-            r"common/.*\.py$",
-        ],
-        "business_logic": [
-            r"models/.*\.py$",
-            r"domain/.*\.py$",
-            r"services/.*\.py$",
-        ],
-        "deployment_pattern": [
-            r".*\.tf$",  # Terraform
-            r"cloudbuild\.yaml$",
-            r".*\.yml$",
-            r"Dockerfile.*",
-            r".*_test\.py$",
-        ]
-    }
+# Python files read from the cache or parsed per step of a streaming scan
+SCAN_WINDOW_FILES = 512
+
+# Per-process scanner used by pool workers (set by _init_scan_worker)
+_worker_scanner: Optional["ComponentScanner"] = None
+
+
+def _init_scan_worker(min_loc: int, classifier: "ComponentClassifier") -> None:
+    global _worker_scanner
+    _worker_scanner = ComponentScanner(min_loc=min_loc, max_workers=1, cache=False, classifier=classifier)
+
+
+def _file_sha(path: Path) -> str:
+    """sha256 of a file's bytes"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _scan_python_file_in_worker(task: Tuple[str, str, str]) -> Tuple[str, Optional["Component"]]:
+    return _worker_scanner._scan_python_file(*task)
+
+
+class ComponentFeatures:
+    """Metadata of one Python file, as extracted by ComponentFeatureExtractor"""
+
+    __slots__ = ("public_methods", "imports", "complexity", "docstring", "terms")
+
+    def __init__(
+        self,
+        public_methods: List[str],
+        imports: List[str],
+        complexity: float,
+        docstring: Optional[str],
+        terms: List[str]
+    ):
+        self.public_methods = public_methods
+        self.imports = imports
+        self.complexity = complexity
+        self.docstring = docstring
+        self.terms = terms
+
+    @property
+    def api_signature(self) -> str:
+        """Comma-separated public methods (first 10)"""
+        return ", ".join(self.public_methods[:10])
+
+
+class ComponentFeatureExtractor(ast.NodeVisitor):
+    """
+    Single-pass extraction of component metadata from a parsed module
+
+    One traversal collects public methods, imports and the branch count used
+    as cyclomatic complexity. Expression subtrees are not visited: they cannot
+    contain definitions, imports or branch statements. Technical terms come
+    from one scan with a combined regex.
+    """
+
+    MAX_METHODS = 20
+    MAX_IMPORTS = 20
+    MAX_TERMS_PER_KIND = 5
+
+    BRANCH_NODES = (ast.If, ast.For, ast.While, ast.ExceptHandler)
+
+    # Class names, function names and *_client / *_service identifiers
+    TERM_PATTERN = re.compile(
+        r"\bclass\s+(?P<class_name>[A-Z][a-zA-Z]+)"
+        r"|\bdef\s+(?P<function>[a-z_]+)"
+        r"|\b(?P<identifier>[a-z_]+_(?:client|service))\b",
+        re.IGNORECASE
+    )
+
+    def __init__(self):
+        self._handlers: Dict[type, Any] = {}
+        self._reset()
+
+    def _reset(self) -> None:
+        self._methods: List[str] = []
+        self._imports: Dict[str, None] = {}
+        self._complexity = 1
+
+    def extract(self, tree: ast.Module, content: str) -> ComponentFeatures:
+        """
+        Extract features of a module
+
+        Args:
+            tree: Parsed module
+            content: Module source, scanned for technical terms
+
+        Returns:
+            ComponentFeatures record
+        """
+        self._reset()
+        self.visit(tree)
+        return ComponentFeatures(
+            public_methods=self._methods[:self.MAX_METHODS],
+            imports=list(self._imports)[:self.MAX_IMPORTS],
+            complexity=float(self._complexity),
+            docstring=ast.get_docstring(tree),
+            terms=self.scan_terms(content),
+        )
+
+    def scan_terms(self, content: str) -> List[str]:
+        """Collect up to MAX_TERMS_PER_KIND class names, function names and client/service identifiers"""
+        found: Dict[str, List[str]] = {"class_name": [], "function": [], "_client": [], "_service": []}
+        for match in self.TERM_PATTERN.finditer(content):
+            kind = match.lastgroup
+            term = match.group(kind)
+            if kind == "identifier":
+                kind = "_client" if term.lower().endswith("_client") else "_service"
+            if len(found[kind]) < self.MAX_TERMS_PER_KIND:
+                found[kind].append(term)
+        return [term for terms in found.values() for term in terms]
+
+    def visit(self, node: ast.AST) -> None:
+        # Cached dispatch; NodeVisitor.visit looks the handler up by name per node
+        node_type = type(node)
+        handler = self._handlers.get(node_type)
+        if handler is None:
+            handler = self._handlers[node_type] = getattr(self, "visit_" + node_type.__name__, self.generic_visit)
+        handler(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if isinstance(node, self.BRANCH_NODES):
+            self._complexity += 1
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST) and not isinstance(item, ast.expr):
+                        self.visit(item)
+            elif isinstance(value, ast.AST) and not isinstance(value, ast.expr):
+                self.visit(value)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        if not node.name.startswith("_"):
+            self._methods.append(node.name)
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and not item.name.startswith("_"):
+                self._methods.append(f"{node.name}.{item.name}")
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self._imports[alias.name] = None
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self._imports[node.module] = None
+
+
+# File patterns for different component types, matched from the start of the
+# lowercased path relative to the repository root
+DEFAULT_COMPONENT_PATTERNS = {
+    "api_client": [
+        r".*_client\.py$",
+        r".*_api\.py$",
+        r".*client\.py$",
+        r"api/.*\.py$",
+    ],
+    "infrastructure": [
+        r"utils/.*\.py$",
+        r"core/.*\.py$",
+        r"lib/.*\.py$",
+        r"common/.*\.py$",
+    ],
+    "business_logic": [
+        r"models/.*\.py$",
+        r"domain/.*\.py$",
+        r"services/.*\.py$",
+    ],
+    "deployment_pattern": [
+        r".*\.tf$",  # Terraform
+        r"cloudbuild\.yaml$",
+        r".*\.yml$",
+        r"Dockerfile.*",
+        r".*_test\.py$",
+    ]
+}
+
+# Keywords that indicate component type
+DEFAULT_TYPE_KEYWORDS = {
+    "api_client": ["client", "request", "http", "api", "rest", "endpoint"],
+    "infrastructure": ["retry", "logger", "connection", "pool", "cache", "config"],
+    "business_logic": ["validate", "transform", "process", "compute", "calculate"],
+    "deployment_pattern": ["deploy", "infrastructure", "terraform", "dockerfile", "build"]
+}
+
+
+class ClassificationRule(NamedTuple):
+    """Path patterns and content keywords of one component type"""
+    component_type: str
+    path_patterns: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()
+    min_keyword_matches: int = 2
+
+
+class ComponentClassifier:
+    """
+    Compiled component classification rules
+
+    Rules are tried in order. All path patterns are compiled into one regex
+    with a named group per pattern, so a path is matched once and the first
+    matching pattern decides the type. Paths that match no pattern fall back
+    to content keywords: the first rule with at least min_keyword_matches
+    distinct keywords in the lowercased content wins.
+
+    Keywords are tested as substrings, each distinct keyword at most once per
+    file, and testing stops as soon as the outcome is decided. For rule sets
+    of this size CPython's substring search is faster than one alternation
+    regex over the content (see scripts/benchmark_component_classifier.py).
+    """
+
+    def __init__(self, rules: Iterable[ClassificationRule]):
+        """
+        Compile classification rules
+
+        Args:
+            rules: Rules in priority order
+
+        Raises:
+            ValueError: If a rule is malformed or a path pattern does not compile
+        """
+        self.rules: Tuple[ClassificationRule, ...] = tuple(rules)
+        self._group_types: Dict[str, str] = {}
+        self._keywords: Dict[str, List[str]] = {}
+        self._keyword_rules: List[Tuple[str, Tuple[str, ...], int]] = []
+
+        groups = []
+        for rule in self.rules:
+            if rule.min_keyword_matches < 1:
+                raise ValueError(f"min_keyword_matches of {rule.component_type} must be at least 1")
+            for pattern in rule.path_patterns:
+                try:
+                    compiled = re.compile(pattern)
+                except re.error as e:
+                    raise ValueError(f"Invalid path pattern {pattern!r} of {rule.component_type}: {e}")
+                if compiled.groupindex:
+                    raise ValueError(f"Path pattern {pattern!r} of {rule.component_type} must not use named groups")
+                name = f"p{len(groups)}"
+                groups.append(f"(?P<{name}>{pattern})")
+                self._group_types[name] = rule.component_type
+
+            self._keywords[rule.component_type] = list(rule.keywords)
+            keywords = tuple(dict.fromkeys(keyword.lower() for keyword in rule.keywords))
+            if keywords:
+                self._keyword_rules.append((rule.component_type, keywords, rule.min_keyword_matches))
+
+        self._path_pattern = re.compile("|".join(groups)) if groups else None
+
+        # Identifies the rule set, e.g. to invalidate scan results classified under other rules
+        self.fingerprint = hashlib.sha256(
+            json.dumps([list(rule) for rule in self.rules]).encode()
+        ).hexdigest()[:16]
+
+    @classmethod
+    def from_mapping(
+        cls,
+        patterns: Dict[str, List[str]],
+        keywords: Dict[str, List[str]],
+        min_keyword_matches: int = 2
+    ) -> "ComponentClassifier":
+        """Build rules from type -> path patterns and type -> keywords mappings"""
+        return cls(
+            ClassificationRule(
+                component_type,
+                tuple(patterns.get(component_type, ())),
+                tuple(keywords.get(component_type, ())),
+                min_keyword_matches
+            )
+            for component_type in dict.fromkeys([*patterns, *keywords])
+        )
+
+    @classmethod
+    def default(cls) -> "ComponentClassifier":
+        """Classifier with the built-in rules"""
+        return cls.from_mapping(DEFAULT_COMPONENT_PATTERNS, DEFAULT_TYPE_KEYWORDS)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ComponentClassifier":
+        """
+        Build a classifier from a rules document
+
+        Rules replace the built-in rule of the same type in place; rules for
+        new types are tried after the built-in ones. With replace_defaults
+        only the configured rules are used, in the configured order.
+
+        Args:
+            config: {"replace_defaults": bool, "min_keyword_matches": int,
+                     "rules": [{"type", "paths", "keywords", "min_keyword_matches"}]}
+
+        Raises:
+            ValueError: If the document is malformed
+        """
+        if not isinstance(config, dict) or not isinstance(config.get("rules", []), list):
+            raise ValueError("Component rules must be a mapping with a 'rules' list")
+
+        default_matches = config.get("min_keyword_matches", 2)
+        rules: Dict[str, ClassificationRule] = {}
+        if not config.get("replace_defaults", False):
+            rules.update((rule.component_type, rule) for rule in cls.default().rules)
+
+        for entry in config.get("rules", []):
+            if not isinstance(entry, dict) or not entry.get("type"):
+                raise ValueError(f"Component rule without a type: {entry!r}")
+            rules[entry["type"]] = ClassificationRule(
+                entry["type"],
+                tuple(entry.get("paths", ())),
+                tuple(entry.get("keywords", ())),
+                int(entry.get("min_keyword_matches", default_matches))
+            )
+
+        return cls(rules.values())
+
+    @classmethod
+    def from_file(cls, path: str) -> "ComponentClassifier":
+        """
+        Load rules from a YAML or JSON file (see from_config for the format)
+
+        Raises:
+            ValueError: If the file is malformed
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        if path.endswith(".json"):
+            return cls.from_config(json.loads(text))
+
+        import yaml
+        return cls.from_config(yaml.safe_load(text) or {})
+
+    @classmethod
+    def from_env(cls) -> "ComponentClassifier":
+        """
+        Load rules from COMPONENT_RULES_PATH
+
+        Returns:
+            Configured classifier, or the built-in rules when the variable is
+            unset or the file cannot be loaded
+        """
+        path = os.getenv("COMPONENT_RULES_PATH")
+        if not path:
+            return cls.default()
+        try:
+            return cls.from_file(path)
+        except Exception as e:
+            logger.warning(f"Could not load component rules from {path}, using built-in rules: {e}")
+            return cls.default()
+
+    @property
+    def component_types(self) -> List[str]:
+        """Component types in rule order"""
+        return [rule.component_type for rule in self.rules]
+
+    def keywords_for(self, component_type: str) -> List[str]:
+        """Keywords of a component type, as configured"""
+        return self._keywords.get(component_type, [])
+
+    def classify(self, file_path: str, content: str) -> Optional[str]:
+        """
+        Classify a file by path, then by content
+
+        Args:
+            file_path: Path relative to the repository root
+            content: File content
+
+        Returns:
+            Component type, or None if no rule matches
+        """
+        return self.classify_path(file_path) or self.classify_content(content)
+
+    def classify_path(self, file_path: str) -> Optional[str]:
+        """Component type of the first path pattern matching the lowercased path"""
+        if self._path_pattern is None:
+            return None
+        match = self._path_pattern.match(file_path.lower())
+        return self._group_types[match.lastgroup] if match else None
 
-    # Keywords that indicate component type
-    TYPE_KEYWORDS = {
-        "api_client": ["client", "request", "http", "api", "rest", "endpoint"],
-        "infrastructure": ["retry", "logger", "connection", "pool", "cache", "config"],
-        "business_logic": ["validate", "transform", "process", "compute", "calculate"],
-        "deployment_pattern": ["deploy", "infrastructure", "terraform", "dockerfile", "build"]
-    }
+    def classify_content(self, content: str) -> Optional[str]:
+        """Component type of the first rule with enough distinct keywords in the content"""
+        content_lower = content.lower()
+        found: Dict[str, bool] = {}
+        for component_type, keywords, required in self._keyword_rules:
+            matches = 0
+            remaining = len(keywords)
+            for keyword in keywords:
+                hit = found.get(keyword)
+                if hit is None:
+                    hit = found[keyword] = keyword in content_lower
+                remaining -= 1
+                if hit:
+                    matches += 1
+                    if matches >= required:
+                        return component_type
+                elif matches + remaining < required:
+                    break
+        return None
+
+
+class ComponentScanner:
+    """Extracts and identifies components from repositories using AST parsing and pattern matching"""
 
-    def __init__(self, min_loc: int = 20):
+    def __init__(
+        self,
+        min_loc: int = 20,
+        max_workers: Optional[int] = None,
+        cache: Optional[Any] = None,
+        classifier: Optional[ComponentClassifier] = None
+    ):
         """
         Initialize scanner
 
         Args:
             min_loc: Minimum lines of code to consider a component
+            max_workers: Processes used to parse files (defaults to
+                         COMPONENT_SCAN_WORKERS env var, else the CPU count;
+                         1 parses in-process)
+            cache: ComponentScanCache for incremental rescans (defaults to one
+                   at COMPONENT_SCAN_CACHE_PATH if set; False disables)
+            classifier: Classification rules (defaults to the rules file at
+                        COMPONENT_RULES_PATH if set, else the built-in rules)
         """
         self.min_loc = min_loc
+        self.classifier = classifier or ComponentClassifier.from_env()
+        self.feature_extractor = ComponentFeatureExtractor()
+        self.max_workers = max_workers or int(os.getenv("COMPONENT_SCAN_WORKERS", "0")) or os.cpu_count() or 1
+        self.cache: Optional[ComponentScanCache] = (
+            None if cache is False else cache if cache is not None else ComponentScanCache.from_env()
+        )
+
+        # File counts, cache hits and timings of the most recent scan
+        self.last_scan_report: Optional[Dict[str, Any]] = None
 
     def scan_repository(self, repo_path: str, repo_name: str) -> List[Component]:
         """
         Scan repository and extract components
 
+        Collects iter_repository() into a list; use iter_repository() or
+        aiter_repository() to process large repositories with bounded memory.
+
         Args:
             repo_path: Local path to repository
             repo_name: Repository name (owner/repo)
 
         Returns:
-            List of detected components
+            List of detected components (those found before an error, if any)
         """
         components = []
+        try:
+            for component in self.iter_repository(repo_path, repo_name):
+                components.append(component)
+        except Exception as e:
+            logger.error(f"Error scanning repository {repo_name}: {e}", exc_info=True)
+
+        return components
 
+    def iter_repository(self, repo_path: str, repo_name: str) -> Iterator[Component]:
+        """
+        Scan repository, yielding components as they are found
+
+        Walks the tree once and processes Python files SCAN_WINDOW_FILES at a
+        time in path order: cached results are read for unchanged files and the
+        rest are parsed, in a process pool for large repositories. Only one
+        window of components is held at a time. last_scan_report is set once
+        the generator is exhausted.
+
+        Args:
+            repo_path: Local path to repository
+            repo_name: Repository name (owner/repo)
+
+        Yields:
+            Detected components, Python files first, in path order
+        """
+        started = time.perf_counter()
+        repo_root = Path(repo_path)
+        if not repo_root.exists():
+            logger.warning(f"Repository path does not exist: {repo_path}")
+            return
+
+        files = self._walk_repository(repo_root)
+        report = {
+            "python_files": len(files["python"]),
+            "cache_hits": 0,
+            "parsed": 0,
+            "workers": 1,
+            "components": 0,
+        }
+
+        # Scan Python files
+        for component in self._iter_python_components(files["python"], repo_root, repo_name, report):
+            report["components"] += 1
+            yield component
+
+        # Scan deployment files (Terraform, Docker, etc.)
+        for component in self._extract_deployment_components(
+            repo_root, repo_name, files["terraform"], files["docker"]
+        ):
+            report["components"] += 1
+            yield component
+
+        report["seconds"] = round(time.perf_counter() - started, 4)
+        self.last_scan_report = report
+        logger.info(
+            f"Scanned {repo_name}: {report['python_files']} Python files, "
+            f"{report['cache_hits']} cached, {report['parsed']} parsed "
+            f"with {report['workers']} workers in {report['seconds']}s"
+        )
+
+    async def aiter_repository(
+        self,
+        repo_path: str,
+        repo_name: str,
+        batch_size: int = 100
+    ) -> AsyncIterator[Component]:
+        """
+        Async variant of iter_repository
+
+        The scan runs in a worker thread, batch_size components at a time, and
+        only advances when the consumer asks for more.
+
+        Args:
+            repo_path: Local path to repository
+            repo_name: Repository name (owner/repo)
+            batch_size: Components produced per worker-thread hop
+
+        Yields:
+            Detected components
+        """
+        components = self.iter_repository(repo_path, repo_name)
         try:
-            repo_root = Path(repo_path)
-            if not repo_root.exists():
-                logger.warning(f"Repository path does not exist: {repo_path}")
-                return components
-
-            # Scan Python files
-            py_files = list(repo_root.rglob("*.py"))
-            for py_file in py_files:
-                # Skip common non-component directories
-                if any(part in py_file.parts for part in [".git", "venv", "__pycache__", ".pytest", "build", "dist"]):
-                    continue
+            while True:
+                batch = await asyncio.to_thread(list, islice(components, batch_size))
+                if not batch:
+                    return
+                for component in batch:
+                    yield component
+        finally:
+            # Stops the process pool if the consumer gave up early
+            await asyncio.to_thread(components.close)
+
+    def _walk_repository(self, repo_root: Path) -> Dict[str, List[Path]]:
+        """
+        Collect candidate files in one walk, pruning SKIP_DIRS
 
-                try:
-                    component = self._extract_component_from_file(py_file, repo_path, repo_name)
-                    if component:
+        Returns:
+            Dict with "python", "terraform" and "docker" file lists, in sorted
+            path order
+        """
+        files: Dict[str, List[Path]] = {"python": [], "terraform": [], "docker": []}
+
+        for root, dirs, filenames in os.walk(repo_root):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+            for filename in sorted(filenames):
+                if filename.endswith(".py"):
+                    files["python"].append(Path(root, filename))
+                elif filename.endswith(".tf"):
+                    files["terraform"].append(Path(root, filename))
+                elif filename.startswith("Dockerfile"):
+                    files["docker"].append(Path(root, filename))
+
+        return files
+
+    def _iter_python_components(
+        self,
+        py_files: List[Path],
+        repo_root: Path,
+        repo_name: str,
+        report: Dict[str, Any]
+    ) -> Iterator[Component]:
+        """Extract components from Python files window by window, parsing only files not in the cache"""
+        fingerprint = f"{self.classifier.fingerprint}:{self.min_loc}"
+        index = self.cache.load(repo_name, fingerprint, components=False) if self.cache is not None else {}
+        plan: List[Tuple[Path, str, int, int, Optional[ScanCacheEntry]]] = []
+
+        for path in py_files:
+            rel_path = str(path.relative_to(repo_root))
+            try:
+                stat = path.stat()
+            except OSError as e:
+                logger.debug(f"Could not stat {path}: {e}")
+                continue
+
+            entry = index.get(rel_path)
+            if entry is not None and (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+                # Touched or re-checked-out but possibly unchanged: compare content hashes
+                if _file_sha(path) != entry.sha:
+                    entry = None
+            plan.append((path, rel_path, stat.st_mtime_ns, stat.st_size, entry))
+
+        report["parsed"] = sum(1 for *_, entry in plan if entry is None)
+        report["cache_hits"] = len(plan) - report["parsed"]
+        pool = self._start_scan_pool(report["parsed"], report)
+
+        try:
+            for start in range(0, len(plan), SCAN_WINDOW_FILES):
+                window = plan[start:start + SCAN_WINDOW_FILES]
+                cached = self.cache.get_components(
+                    repo_name, [rel_path for _, rel_path, _, _, entry in window if entry is not None]
+                ) if report["cache_hits"] else {}
+                tasks = [(str(path), rel_path, repo_name) for path, rel_path, _, _, entry in window if entry is None]
+                parsed, pool = self._parse_python_files(tasks, pool, report)
+                parsed = iter(parsed)
+
+                updates: Dict[str, ScanCacheEntry] = {}
+                components: List[Component] = []
+                for path, rel_path, mtime_ns, size, entry in window:
+                    if entry is not None:
+                        data = cached.get(rel_path)
+                        component = Component.model_validate(data) if data else None
+                        if (entry.mtime_ns, entry.size) != (mtime_ns, size):
+                            updates[rel_path] = ScanCacheEntry(mtime_ns, size, entry.sha, data)
+                    else:
+                        sha, component = next(parsed)
+                        updates[rel_path] = ScanCacheEntry(
+                            mtime_ns, size, sha,
+                            component.model_dump(mode="json") if component is not None else None
+                        )
+                    if component is not None:
                         components.append(component)
-                except Exception as e:
-                    logger.debug(f"Could not extract component from {py_file}: {e}")
 
-            # Scan deployment files (Terraform, Docker, etc.)
-            deployment_components = self._extract_deployment_components(repo_root, repo_name)
-            components.extend(deployment_components)
+                self._update_scan_cache(repo_name, updates, (), fingerprint)
+                yield from components
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        self._update_scan_cache(repo_name, {}, set(index) - {rel_path for _, rel_path, *_ in plan}, fingerprint)
+
+    def _update_scan_cache(
+        self,
+        repo_name: str,
+        updates: Dict[str, ScanCacheEntry],
+        removed: Iterable[str],
+        fingerprint: str
+    ) -> None:
+        if self.cache is None or not (updates or removed):
+            return
+        try:
+            self.cache.update(repo_name, updates, removed=removed, fingerprint=fingerprint)
+        except Exception as e:
+            logger.warning(f"Could not update component scan cache: {e}")
 
+    def _start_scan_pool(self, file_count: int, report: Dict[str, Any]) -> Optional[ProcessPoolExecutor]:
+        """Process pool for parsing file_count files, or None to parse in-process"""
+        workers = min(self.max_workers, file_count)
+        if workers <= 1 or file_count < PARALLEL_SCAN_MIN_FILES:
+            return None
+        try:
+            # Spawned, not forked: the scanner runs inside the threaded,
+            # async server, and a forked child can inherit held locks
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_scan_worker,
+                initargs=(self.min_loc, self.classifier)
+            )
         except Exception as e:
-            logger.error(f"Error scanning repository {repo_name}: {e}", exc_info=True)
+            logger.warning(f"Could not start scan workers, parsing in-process: {e}")
+            return None
+        report["workers"] = workers
+        return pool
+
+    def _parse_python_files(
+        self,
+        tasks: List[Tuple[str, str, str]],
+        pool: Optional[ProcessPoolExecutor],
+        report: Dict[str, Any]
+    ) -> Tuple[List[Tuple[str, Optional[Component]]], Optional[ProcessPoolExecutor]]:
+        """
+        Run _scan_python_file over tasks, in the pool if there is one
 
-        return components
+        Returns:
+            (results in task order, pool to use for the next tasks; None once
+            the pool has failed)
+        """
+        if pool is not None and tasks:
+            try:
+                chunksize = max(1, len(tasks) // (report["workers"] * 8))
+                return list(pool.map(_scan_python_file_in_worker, tasks, chunksize=chunksize)), pool
+            except Exception as e:
+                logger.warning(f"Parallel scan failed, parsing in-process: {e}")
+                pool.shutdown(cancel_futures=True)
+                pool = None
+                report["workers"] = 1
+
+        return [self._scan_python_file(*task) for task in tasks], pool
+
+    def _scan_python_file(self, path: str, rel_path: str, repo_name: str) -> Tuple[str, Optional[Component]]:
+        """
+        Read, hash and extract one Python file
+
+        Returns:
+            (sha256 of the file, Component or None)
+        """
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            logger.debug(f"Could not read {path}: {e}")
+            return "", None
+
+        sha = hashlib.sha256(data).hexdigest()
+        try:
+            content = data.decode("utf-8", errors="ignore")
+            return sha, self._extract_component_from_content(content, Path(path), rel_path, repo_name)
+        except Exception as e:
+            logger.debug(f"Could not extract component from {path}: {e}")
+            return sha, None
 
     def _extract_component_from_file(self, file_path: Path, repo_path: str, repo_name: str) -> Optional[Component]:
         """
@@ -126,9 +766,34 @@ class ComponentScanner:
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
+            rel_path = str(file_path.relative_to(repo_path))
+            return self._extract_component_from_content(content, file_path, rel_path, repo_name)
+
+        except Exception as e:
+            logger.debug(f"Error extracting component from {file_path}: {e}")
+            return None
+
+    def _extract_component_from_content(
+        self,
+        content: str,
+        file_path: Path,
+        rel_path: str,
+        repo_name: str
+    ) -> Optional[Component]:
+        """
+        Extract component from Python source
+
+        Args:
+            content: File content
+            file_path: Path to the file
+            rel_path: Path relative to the repository root
+            repo_name: Repository name
 
-            lines = content.split('\n')
-            loc = len(lines)
+        Returns:
+            Component if found, None otherwise
+        """
+        try:
+            loc = content.count('\n') + 1
 
             if loc < self.min_loc:
                 return None
@@ -141,16 +806,15 @@ class ComponentScanner:
                 return None
 
             # Extract component metadata
-            rel_path = str(file_path.relative_to(repo_path))
-            component_type = self._classify_component(rel_path, content)
+            component_type = self.classifier.classify(rel_path, content)
             if not component_type:
                 return None
 
             component_id = self._generate_component_id(repo_name, rel_path)
-            public_methods = self._extract_public_methods(tree)
-            imports = self._extract_imports(tree)
-            keywords = self._extract_keywords(content, component_type)
-            api_signature = self._generate_api_signature(tree)
+            features = self.feature_extractor.extract(tree, content)
+            del tree  # Keep peak memory to one AST per file
+            keywords = set(self.classifier.keywords_for(component_type))
+            keywords.update(features.terms)
             language = self._detect_language(file_path)
 
             return Component(
@@ -160,13 +824,13 @@ class ComponentScanner:
                 repository=repo_name,
                 files=[rel_path],
                 language=language,
-                api_signature=api_signature,
-                imports=imports,
-                keywords=keywords,
-                description=self._extract_docstring(tree),
+                api_signature=features.api_signature,
+                imports=features.imports,
+                keywords=list(keywords)[:15],
+                description=features.docstring,
                 lines_of_code=loc,
-                cyclomatic_complexity=self._calculate_complexity(tree),
-                public_methods=public_methods,
+                cyclomatic_complexity=features.complexity,
+                public_methods=features.public_methods,
                 first_seen=datetime.now(),
                 sync_status="original"
             )
@@ -175,15 +839,21 @@ class ComponentScanner:
             logger.debug(f"Error extracting component from {file_path}: {e}")
             return None
 
-    def _extract_deployment_components(self, repo_root: Path, repo_name: str) -> List[Component]:
+    def _extract_deployment_components(
+        self,
+        repo_root: Path,
+        repo_name: str,
+        terraform_files: Optional[List[Path]] = None,
+        dockerfiles: Optional[List[Path]] = None
+    ) -> List[Component]:
         """Extract deployment-related components (Terraform, Docker, etc.)"""
         components = []
+        if terraform_files is None or dockerfiles is None:
+            files = self._walk_repository(repo_root)
+            terraform_files, dockerfiles = files["terraform"], files["docker"]
 
         # Terraform files
-        for tf_file in repo_root.rglob("*.tf"):
-            if ".git" in tf_file.parts or "build" in tf_file.parts:
-                continue
-
+        for tf_file in terraform_files:
             try:
                 with open(tf_file, 'r', encoding='utf-8', errors='ignore') as f:
                     content = f.read()
@@ -208,10 +878,7 @@ class ComponentScanner:
                 logger.debug(f"Error extracting Terraform component from {tf_file}: {e}")
 
         # Dockerfile
-        for dockerfile in repo_root.rglob("Dockerfile*"):
-            if ".git" in dockerfile.parts:
-                continue
-
+        for dockerfile in dockerfiles:
             try:
                 with open(dockerfile, 'r', encoding='utf-8', errors='ignore') as f:
                     content = f.read()
@@ -237,93 +904,6 @@ class ComponentScanner:
 
         return components
 
-    def _classify_component(self, file_path: str, content: str) -> Optional[str]:
-        """Classify component type based on file path and content"""
-        file_path_lower = file_path.lower()
-
-        # Check file patterns
-        for comp_type, patterns in self.COMPONENT_PATTERNS.items():
-            for pattern in patterns:
-                if re.match(pattern, file_path_lower):
-                    return comp_type
-
-        # Check content keywords
-        content_lower = content.lower()
-        for comp_type, keywords in self.TYPE_KEYWORDS.items():
-            keyword_matches = sum(1 for kw in keywords if kw in content_lower)
-            if keyword_matches >= 2:  # At least 2 keywords match
-                return comp_type
-
-        return None
-
-    def _extract_public_methods(self, tree: ast.AST) -> List[str]:
-        """Extract public method names from AST"""
-        methods = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if not node.name.startswith('_'):  # Public methods
-                    methods.append(node.name)
-            elif isinstance(node, ast.ClassDef):
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef) and not item.name.startswith('_'):
-                        methods.append(f"{node.name}.{item.name}")
-
-        return methods[:20]  # Limit to first 20
-
-    def _extract_imports(self, tree: ast.AST) -> List[str]:
-        """Extract import statements"""
-        imports = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module)
-
-        return list(set(imports))[:20]  # Unique imports, limit to 20
-
-    def _extract_keywords(self, content: str, component_type: str) -> List[str]:
-        """Extract keywords from code"""
-        keywords = set(self.TYPE_KEYWORDS.get(component_type, []))
-
-        # Extract common technical terms
-        patterns = [
-            r'\b[a-z_]+_client\b',
-            r'\b[a-z_]+_service\b',
-            r'\bclass\s+([A-Z][a-zA-Z]+)',
-            r'\bdef\s+([a-z_]+)',
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            keywords.update(matches[:5])  # Add up to 5 matches per pattern
-
-        return list(keywords)[:15]  # Limit to 15 keywords
-
-    def _generate_api_signature(self, tree: ast.AST) -> str:
-        """Generate API signature from public methods"""
-        methods = self._extract_public_methods(tree)
-        return ", ".join(methods[:10])  # Limit to 10 methods
-
-    def _extract_docstring(self, tree: ast.AST) -> Optional[str]:
-        """Extract module or class docstring"""
-        return ast.get_docstring(tree)
-
-    def _calculate_complexity(self, tree: ast.AST) -> float:
-        """
-        Estimate cyclomatic complexity
-        Simple metric: number of if/for/while statements + 1
-        """
-        complexity = 1
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.For, ast.While, ast.ExceptHandler)):
-                complexity += 1
-
-        return float(complexity)
-
     def _detect_language(self, file_path: Path) -> str:
         """Detect programming language from file extension"""
         ext = file_path.suffix.lower()
@@ -346,69 +926,282 @@ class ComponentScanner:
         return hashlib.sha256(content).hexdigest()[:16]
 
 
+# component_vectors statements, registered so they are prepared per pooled
+# connection and reported by name in DatabaseManager.get_query_metrics()
+COMPONENT_VECTOR_LOOKUP_SQL = register_statement("component_vectors.lookup", """
+    SELECT component_id, vector_id, content_signature, vector::text AS vector
+    FROM component_vectors
+    WHERE component_id = ANY($1::text[])
+""")
+
+COMPONENT_VECTOR_UPSERT_SQL = register_statement("component_vectors.upsert", """
+    INSERT INTO component_vectors
+        (vector_id, component_id, repository, component_name, vector, embedding_dimension, content_signature)
+    SELECT v.component_id, v.component_id, v.repository, v.component_name, v.vector::vector,
+           v.dimension, v.signature
+    FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::int[], $6::text[])
+        AS v(component_id, repository, component_name, vector, dimension, signature)
+    ON CONFLICT (vector_id) DO UPDATE SET
+        vector = EXCLUDED.vector,
+        embedding_dimension = EXCLUDED.embedding_dimension,
+        content_signature = EXCLUDED.content_signature,
+        last_updated = NOW()
+""")
+
+# Batched KNN: each requested component's stored vector drives an index-ordered
+# top-k (LATERAL), and the threshold is applied to those k rows afterwards
+COMPONENT_VECTOR_KNN_SQL = register_statement("component_vectors.knn", """
+    SELECT q.component_id AS query_id,
+           n.component_id, n.component_name, n.repository, n.similarity
+    FROM component_vectors q
+    CROSS JOIN LATERAL (
+        SELECT c.component_id, c.component_name, c.repository,
+               1 - (c.vector <=> q.vector) AS similarity
+        FROM component_vectors c
+        WHERE c.component_id != q.component_id
+        ORDER BY c.vector <=> q.vector
+        LIMIT $2
+    ) n
+    WHERE q.component_id = ANY($1::text[])
+    AND n.similarity >= $3
+    ORDER BY q.component_id, n.similarity DESC
+""")
+
+COMPONENT_VECTOR_STATS_SQL = register_statement("component_vectors.stats", """
+    SELECT COUNT(*) AS total_vectors, COUNT(DISTINCT repository) AS repositories
+    FROM component_vectors
+""")
+
+
+def _parse_vector(text: str) -> np.ndarray:
+    """Parse a pgvector text literal ('[1,2,3]') into a float32 array"""
+    return np.array(json.loads(text), dtype=np.float32)
+
+
+class ComponentVectorCache:
+    """
+    Bounded in-memory LRU of component vectors
+
+    Entries are float32 arrays keyed by component_id and the component's
+    content signature; a lookup with a different signature is a miss and
+    drops the stale entry. Evicts least recently used entries once either
+    the entry count or the total vector bytes exceeds its limit.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize vector cache
+
+        Args:
+            max_entries: Maximum cached vectors (0 disables the cache)
+            max_bytes: Maximum total bytes of cached vectors
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        # component_id -> (signature, repository, vector)
+        self._entries: "OrderedDict[str, Tuple[str, Optional[str], np.ndarray]]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, component_id: str, signature: str) -> Optional[np.ndarray]:
+        """Get the vector cached for this component version, or None"""
+        entry = self._entries.get(component_id)
+        if entry is None or entry[0] != signature:
+            if entry is not None:
+                self._remove(component_id)
+                self._stats["invalidations"] += 1
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(component_id)
+        self._stats["hits"] += 1
+        return entry[2]
+
+    def put(self, component_id: str, signature: str, vector: Any, repository: Optional[str] = None) -> None:
+        """Cache a vector for this component version"""
+        vector = np.asarray(vector, dtype=np.float32)
+        if self.max_entries <= 0 or vector.nbytes > self.max_bytes:
+            return
+        if component_id in self._entries:
+            self._remove(component_id)
+        self._entries[component_id] = (signature, repository, vector)
+        self.bytes += vector.nbytes
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._stats["evictions"] += 1
+
+    def invalidate_repository(self, repository: str, current: Dict[str, str]) -> int:
+        """
+        Drop a repository's entries that no longer match its components
+
+        Args:
+            repository: Repository name (format: "owner/repo")
+            current: component_id -> content signature of the repository's components
+
+        Returns:
+            Number of entries dropped
+        """
+        stale = [
+            component_id for component_id, (signature, entry_repository, _) in self._entries.items()
+            if (entry_repository == repository and current.get(component_id) != signature)
+            or (component_id in current and current[component_id] != signature)
+        ]
+        for component_id in stale:
+            self._remove(component_id)
+        self._stats["invalidations"] += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+        self.bytes = 0
+
+    def _remove(self, component_id: str) -> None:
+        self.bytes -= self._entries.pop(component_id)[2].nbytes
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hits, misses, hit rate, evictions, invalidations,
+            entry count and bytes against their limits
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+def group_similar_components(similar: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Merge per-component KNN results into similarity groups
+
+    Components linked by any above-threshold match end up in the same group
+    (connected components of the similarity graph).
+
+    Args:
+        similar: Output of VectorCacheManager.find_similar_batch()
+
+    Returns:
+        Groups with member ids and their deduplicated pairwise scores,
+        largest group first
+    """
+    parent: Dict[str, str] = {}
+
+    def find(node: str) -> str:
+        parent.setdefault(node, node)
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    pairs: Dict[Tuple[str, str], float] = {}
+    for component_id, matches in similar.items():
+        for match in matches:
+            pair = tuple(sorted((component_id, match["component_id"])))
+            pairs[pair] = max(pairs.get(pair, 0.0), match["similarity_score"])
+            parent[find(pair[0])] = find(pair[1])
+
+    groups: Dict[str, Dict[str, Any]] = {}
+    for (first, second), score in pairs.items():
+        group = groups.setdefault(find(first), {"component_ids": set(), "pairs": []})
+        group["component_ids"].update((first, second))
+        group["pairs"].append({"source": first, "target": second, "similarity_score": score})
+
+    result = []
+    for group in groups.values():
+        group["pairs"].sort(key=lambda p: p["similarity_score"], reverse=True)
+        result.append({
+            "component_ids": sorted(group["component_ids"]),
+            "pairs": group["pairs"],
+            "max_similarity": group["pairs"][0]["similarity_score"],
+        })
+    result.sort(key=lambda g: (len(g["component_ids"]), g["max_similarity"]), reverse=True)
+    return result
+
+
 class VectorCacheManager:
-    """Manages component vectors using pgvector for similarity search"""
+    """
+    Manages component vectors using pgvector for similarity search
+
+    All queries run on the shared asyncpg pool of a DatabaseManager, so a scan
+    borrows pooled connections instead of opening one per lookup. Vectors are
+    served from a bounded in-memory LRU, then component_vectors, then
+    pattern-miner; each tier fills the ones above it.
+    """
 
-    def __init__(self, postgres_url: str, pattern_miner_client: Optional[Any] = None):
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, pattern_miner_client: Optional[Any] = None):
         """
         Initialize vector cache manager
 
         Args:
-            postgres_url: PostgreSQL connection string
+            db_manager: DatabaseManager whose pool is used (defaults to the get_db() singleton)
             pattern_miner_client: Client for pattern-miner A2A agent
         """
-        self.postgres_url = postgres_url
+        self.db = db_manager or get_db()
         self.pattern_miner_client = pattern_miner_client
-        self.vector_cache: Dict[str, ComponentVector] = {}  # In-memory cache
+        # In-memory tier (COMPONENT_VECTOR_CACHE_SIZE entries, COMPONENT_VECTOR_CACHE_MB)
+        self.vector_cache = ComponentVectorCache(
+            max_entries=int(os.getenv("COMPONENT_VECTOR_CACHE_SIZE", "10000")),
+            max_bytes=int(float(os.getenv("COMPONENT_VECTOR_CACHE_MB", "64")) * 1024 * 1024),
+        )
+        self._db_stats = {"hits": 0, "stale": 0, "generated": 0}
+        self._schema_ready = False
 
-        self._initialize_pgvector()
+    @property
+    def available(self) -> bool:
+        """Whether the database pool is connected"""
+        return self.db.enabled and self.db.pool is not None
 
-    def _initialize_pgvector(self):
-        """Initialize pgvector extension and table"""
-        try:
-            from sqlalchemy import create_engine, text
+    async def _ensure_schema(self) -> None:
+        """Create the pgvector extension, component_vectors table and index once"""
+        if self._schema_ready:
+            return
 
-            engine = create_engine(self.postgres_url)
-            with engine.connect() as conn:
-                # Create pgvector extension
-                try:
-                    conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
-                    logger.info("pgvector extension initialized")
-                except Exception as e:
-                    logger.debug(f"pgvector extension might already exist: {e}")
-
-                # Create component_vectors table
-                create_table_sql = """
-                    CREATE TABLE IF NOT EXISTS component_vectors (
-                        vector_id VARCHAR(255) PRIMARY KEY,
-                        component_id VARCHAR(255) UNIQUE,
-                        repository VARCHAR(255),
-                        component_name VARCHAR(255),
-                        vector VECTOR(300),
-                        embedding_dimension INT,
-                        created_at TIMESTAMP DEFAULT NOW(),
-                        last_updated TIMESTAMP DEFAULT NOW()
-                    );
-                """
-                conn.execute(text(create_table_sql))
-                conn.commit()
-                logger.info("component_vectors table created/verified")
-
-                # Create index for similarity search
-                try:
-                    conn.execute(text("""
-                        CREATE INDEX IF NOT EXISTS idx_component_vector_cosine
-                        ON component_vectors USING ivfflat (vector vector_cosine_ops)
-                        WITH (lists = 100);
-                    """))
-                    conn.commit()
-                except Exception as e:
-                    logger.debug(f"Index creation skipped: {e}")
+        try:
+            await self.db.execute("CREATE EXTENSION IF NOT EXISTS vector")
+        except Exception as e:
+            logger.debug(f"pgvector extension might already exist: {e}")
+
+        await self.db.execute("""
+            CREATE TABLE IF NOT EXISTS component_vectors (
+                vector_id VARCHAR(255) PRIMARY KEY,
+                component_id VARCHAR(255) UNIQUE,
+                repository VARCHAR(255),
+                component_name VARCHAR(255),
+                vector VECTOR(300),
+                embedding_dimension INT,
+                content_signature VARCHAR(64),
+                created_at TIMESTAMP DEFAULT NOW(),
+                last_updated TIMESTAMP DEFAULT NOW()
+            )
+        """)
+        await self.db.execute(
+            "ALTER TABLE component_vectors ADD COLUMN IF NOT EXISTS content_signature VARCHAR(64)"
+        )
 
+        try:
+            await self.db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_component_vector_cosine
+                ON component_vectors USING ivfflat (vector vector_cosine_ops)
+                WITH (lists = 100)
+            """)
         except Exception as e:
-            logger.error(f"Error initializing pgvector: {e}", exc_info=True)
+            logger.debug(f"Index creation skipped: {e}")
+
+        self._schema_ready = True
+        logger.info("component_vectors table created/verified")
 
-    def get_or_create_vector(self, component: Component) -> Optional[ComponentVector]:
+    async def get_or_create_vector(self, component: Component) -> Optional[ComponentVector]:
         """
         Get cached vector or request generation from pattern-miner
 
@@ -418,134 +1211,174 @@ class VectorCacheManager:
         Returns:
             ComponentVector or None if generation fails
         """
-        # Check cache first
-        if component.component_id in self.vector_cache:
-            return self.vector_cache[component.component_id]
-
-        # Check PostgreSQL
-        vector_id = self._get_vector_from_db(component.component_id)
-        if vector_id:
-            return ComponentVector(
-                vector_id=vector_id,
-                component_id=component.component_id,
-                vector_dimension=300,
-                last_updated=datetime.now()
+        vectors = await self.get_or_create_vectors([component])
+        return vectors.get(component.component_id)
+
+    async def get_or_create_vectors(self, components: List[Component]) -> Dict[str, ComponentVector]:
+        """
+        Get vectors for many components with one lookup and one pattern-miner request
+
+        Args:
+            components: Components to get vectors for
+
+        Returns:
+            Dict mapping component_id to ComponentVector (failed components are omitted)
+        """
+        return {
+            component_id: ComponentVector(
+                vector_id=component_id,
+                component_id=component_id,
+                vector_dimension=len(vector),
+                last_updated=datetime.now(),
+                vector_metadata={"signature": signature}
             )
+            for component_id, (signature, vector) in (await self._resolve_vectors(components)).items()
+        }
+
+    async def get_vectors(self, components: List[Component]) -> Dict[str, np.ndarray]:
+        """
+        Get the float32 vectors of many components
+
+        Args:
+            components: Components to get vectors for
+
+        Returns:
+            Dict mapping component_id to vector (failed components are omitted)
+        """
+        return {
+            component_id: vector
+            for component_id, (_, vector) in (await self._resolve_vectors(components)).items()
+        }
+
+    async def _resolve_vectors(self, components: List[Component]) -> Dict[str, Tuple[str, np.ndarray]]:
+        """Look vectors up tier by tier, returning component_id -> (signature, vector)"""
+        signatures = {c.component_id: component_signature(c) for c in components}
+        resolved: Dict[str, Tuple[str, np.ndarray]] = {}
+
+        # Memory tier
+        missing = []
+        for component in components:
+            signature = signatures[component.component_id]
+            vector = self.vector_cache.get(component.component_id, signature)
+            if vector is not None:
+                resolved[component.component_id] = (signature, vector)
+            else:
+                missing.append(component)
+        if not missing:
+            return resolved
+
+        # PostgreSQL tier; rows written for different component content are stale
+        stored = await self._get_vectors_from_db([c.component_id for c in missing])
+        for component in missing:
+            row = stored.get(component.component_id)
+            if row is None:
+                continue
+            signature = signatures[component.component_id]
+            if row["signature"] is not None and row["signature"] != signature:
+                self._db_stats["stale"] += 1
+                continue
+            self._db_stats["hits"] += 1
+            self.vector_cache.put(component.component_id, signature, row["vector"], component.repository)
+            resolved[component.component_id] = (signature, row["vector"])
+        missing = [c for c in missing if c.component_id not in resolved]
 
         # Request from pattern-miner
-        if self.pattern_miner_client:
-            vector_result = self._request_vector_from_pattern_miner(component)
-            if vector_result:
-                return vector_result
+        if missing and self.pattern_miner_client:
+            for component_id, vector in (await self._request_vectors_from_pattern_miner(missing)).items():
+                resolved[component_id] = (signatures[component_id], vector)
 
-        return None
+        return resolved
 
-    def _get_vector_from_db(self, component_id: str) -> Optional[str]:
-        """Retrieve vector ID from PostgreSQL"""
+    async def _get_vectors_from_db(self, component_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve stored vectors and their content signatures from PostgreSQL"""
+        if not component_ids or not self.available:
+            return {}
         try:
-            from sqlalchemy import create_engine, text
-
-            engine = create_engine(self.postgres_url)
-            with engine.connect() as conn:
-                result = conn.execute(
-                    text("SELECT vector_id FROM component_vectors WHERE component_id = :cid"),
-                    {"cid": component_id}
-                )
-                row = result.fetchone()
-                return row[0] if row else None
+            await self._ensure_schema()
+            rows = await self.db.fetch(COMPONENT_VECTOR_LOOKUP_SQL, component_ids)
+            return {
+                row["component_id"]: {
+                    "signature": row["content_signature"],
+                    "vector": _parse_vector(row["vector"]),
+                }
+                for row in rows if row["vector"] is not None
+            }
         except Exception as e:
-            logger.debug(f"Error retrieving vector from DB: {e}")
-            return None
+            logger.debug(f"Error retrieving vectors from DB: {e}")
+            return {}
 
-    def _request_vector_from_pattern_miner(self, component: Component) -> Optional[ComponentVector]:
+    async def _request_vectors_from_pattern_miner(self, components: List[Component]) -> Dict[str, np.ndarray]:
         """
-        Request TF-IDF vector generation from pattern-miner
+        Request TF-IDF vector generation from pattern-miner and store the results
 
         Args:
-            component: Component to generate vector for
+            components: Components to generate vectors for
 
         Returns:
-            ComponentVector with generated vector or None
+            Dict mapping component_id to generated vector
         """
         try:
             if not self.pattern_miner_client:
                 logger.warning("pattern-miner client not configured")
-                return None
+                return {}
 
-            # Prepare component metadata for vectorization
-            metadata = {
-                "component_id": component.component_id,
-                "name": component.name,
-                "type": component.component_type,
-                "api_signature": component.api_signature or "",
-                "imports": component.imports,
-                "keywords": component.keywords,
-                "description": component.description or ""
-            }
+            generated = await self._generate_vectors(components)
+            await self._store_vectors_in_db(generated)
+            return {component.component_id: vector for component, vector in generated}
 
-            # Request vector generation
-            response = self.pattern_miner_client.execute_skill(
-                skill_id="generate_component_vectors",
-                input_data={"components": [metadata]}
-            )
+        except Exception as e:
+            logger.error(f"Error requesting vectors from pattern-miner: {e}", exc_info=True)
 
-            if response.get("success") and response.get("vectors"):
-                vector_data = response["vectors"][0]
-                vector = vector_data.get("vector", [])
-                vector_id = self._store_vector_in_db(component, vector)
+        return {}
 
-                return ComponentVector(
-                    vector_id=vector_id,
-                    component_id=component.component_id,
-                    vector_dimension=len(vector),
-                    last_updated=datetime.now()
-                )
+    async def _generate_vectors(self, components: List[Component]) -> List[Tuple[Component, np.ndarray]]:
+        """Request vectors from pattern-miner in one call and cache them in memory"""
+        # The A2A client is synchronous; keep it off the event loop
+        response = await asyncio.to_thread(
+            self.pattern_miner_client.execute_skill,
+            skill_id="generate_component_vectors",
+            input_data={"components": [component_vector_metadata(c) for c in components]}
+        )
 
-        except Exception as e:
-            logger.error(f"Error requesting vector from pattern-miner: {e}", exc_info=True)
+        if not (response.get("success") and response.get("vectors")):
+            return []
 
-        return None
+        generated = []
+        for component, vector_data in zip(components, response["vectors"]):
+            vector = np.asarray(vector_data.get("vector", []), dtype=np.float32)
+            self.vector_cache.put(component.component_id, component_signature(component), vector, component.repository)
+            generated.append((component, vector))
+        self._db_stats["generated"] += len(generated)
+        return generated
+
+    async def _store_vectors_in_db(self, items: List[Tuple[Component, Any]]) -> bool:
+        """Upsert (component, vector) pairs into PostgreSQL with one statement"""
+        if not items:
+            return True
+        if not self.available:
+            logger.debug("Database not connected, vectors not stored")
+            return False
 
-    def _store_vector_in_db(self, component: Component, vector: List[float]) -> str:
-        """Store vector in PostgreSQL"""
         try:
-            from sqlalchemy import create_engine, text
-
-            vector_id = component.component_id
-            engine = create_engine(self.postgres_url)
-
-            # Format vector for pgvector
-            vector_str = "[" + ", ".join(str(v) for v in vector) + "]"
-
-            with engine.connect() as conn:
-                conn.execute(
-                    text("""
-                        INSERT INTO component_vectors
-                        (vector_id, component_id, repository, component_name, vector, embedding_dimension)
-                        VALUES (:vid, :cid, :repo, :name, :vec::vector, :dim)
-                        ON CONFLICT (vector_id) DO UPDATE SET
-                            vector = EXCLUDED.vector,
-                            last_updated = NOW()
-                    """),
-                    {
-                        "vid": vector_id,
-                        "cid": component.component_id,
-                        "repo": component.repository,
-                        "name": component.name,
-                        "vec": vector_str,
-                        "dim": len(vector)
-                    }
-                )
-                conn.commit()
-                logger.debug(f"Stored vector for component {component.name}")
-
-            return vector_id
+            await self._ensure_schema()
+            # Vectors travel as text[] and are cast per row; asyncpg has no vector codec
+            await self.db.execute(
+                COMPONENT_VECTOR_UPSERT_SQL,
+                [component.component_id for component, _ in items],
+                [component.repository for component, _ in items],
+                [component.name for component, _ in items],
+                [to_vector_literal(vector) for _, vector in items],
+                [len(vector) for _, vector in items],
+                [component_signature(component) for component, _ in items],
+            )
+            logger.debug(f"Stored {len(items)} component vectors")
+            return True
 
         except Exception as e:
-            logger.error(f"Error storing vector in DB: {e}", exc_info=True)
-            return ""
+            logger.error(f"Error storing vectors in DB: {e}", exc_info=True)
+            return False
 
-    def find_similar(self, component: Component, top_k: int = 5, min_similarity: float = 0.5) -> List[Dict[str, Any]]:
+    async def find_similar(self, component: Component, top_k: int = 5, min_similarity: float = 0.5) -> List[Dict[str, Any]]:
         """
         Find similar components using pgvector cosine similarity
 
@@ -557,55 +1390,57 @@ class VectorCacheManager:
         Returns:
             List of similar components with scores
         """
-        try:
-            vector = self.get_or_create_vector(component)
-            if not vector:
-                logger.warning(f"Could not get vector for {component.name}")
-                return []
-
-            from sqlalchemy import create_engine, text
-
-            engine = create_engine(self.postgres_url)
-            with engine.connect() as conn:
-                # Use pgvector cosine similarity
-                query = text("""
-                    SELECT component_id, component_name, repository,
-                           1 - (vector <=> :vec::vector) as similarity
-                    FROM component_vectors
-                    WHERE component_id != :cid
-                    AND (1 - (vector <=> :vec::vector)) >= :min_sim
-                    ORDER BY similarity DESC
-                    LIMIT :k
-                """)
-
-                # Convert vector to format for comparison
-                vector_str = "[" + ", ".join(str(v) for v in [0.1] * 300) + "]"  # Placeholder
-
-                results = conn.execute(
-                    query,
-                    {
-                        "vec": vector_str,
-                        "cid": component.component_id,
-                        "min_sim": min_similarity,
-                        "k": top_k
-                    }
-                )
+        similar = await self.find_similar_batch([component], top_k=top_k, min_similarity=min_similarity)
+        return similar.get(component.component_id, [])
+
+    async def find_similar_batch(
+        self,
+        components: List[Component],
+        top_k: int = 5,
+        min_similarity: float = 0.5
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find similar components for many components in one round trip
+
+        Vectors are made available first (one lookup, plus one pattern-miner
+        request for components without a stored vector); then a single KNN
+        query compares each stored vector against all others.
 
-                return [
-                    {
-                        "component_id": row[0],
-                        "component_name": row[1],
-                        "repository": row[2],
-                        "similarity_score": float(row[3])
-                    }
-                    for row in results
-                ]
+        Args:
+            components: Components to find similar components for
+            top_k: Number of results per component
+            min_similarity: Minimum similarity score (0-1)
+
+        Returns:
+            Dict mapping component_id to its similar components, best first
+            (components without a vector are omitted)
+        """
+        if not components or not self.available:
+            return {}
+
+        try:
+            vectors = await self.get_or_create_vectors(components)
+            if not vectors:
+                logger.warning(f"Could not get vectors for {len(components)} components")
+                return {}
+
+            rows = await self.db.fetch(COMPONENT_VECTOR_KNN_SQL, list(vectors), top_k, min_similarity)
+
+            similar: Dict[str, List[Dict[str, Any]]] = {component_id: [] for component_id in vectors}
+            for row in rows:
+                similar[row["query_id"]].append({
+                    "component_id": row["component_id"],
+                    "component_name": row["component_name"],
+                    "repository": row["repository"],
+                    "similarity_score": float(row["similarity"])
+                })
+            return similar
 
         except Exception as e:
             logger.error(f"Error finding similar components: {e}", exc_info=True)
-            return []
+            return {}
 
-    def update_vectors(self, components: List[Component]) -> Dict[str, bool]:
+    async def update_vectors(self, components: List[Component]) -> Dict[str, bool]:
         """
         Bulk update vectors for multiple components
 
@@ -615,77 +1450,69 @@ class VectorCacheManager:
         Returns:
             Dict mapping component_id to success status
         """
-        results = {}
+        results = {c.component_id: False for c in components}
 
-        try:
-            if not self.pattern_miner_client:
-                logger.warning("pattern-miner client not configured, cannot update vectors")
-                return {c.component_id: False for c in components}
+        if not self.pattern_miner_client:
+            logger.warning("pattern-miner client not configured, cannot update vectors")
+            return results
 
+        try:
             # Batch request to pattern-miner
-            metadata_list = [
-                {
-                    "component_id": c.component_id,
-                    "name": c.name,
-                    "type": c.component_type,
-                    "api_signature": c.api_signature or "",
-                    "imports": c.imports,
-                    "keywords": c.keywords,
-                    "description": c.description or ""
-                }
-                for c in components
-            ]
-
-            response = self.pattern_miner_client.execute_skill(
-                skill_id="generate_component_vectors",
-                input_data={"components": metadata_list}
-            )
-
-            if response.get("success") and response.get("vectors"):
-                for i, comp in enumerate(components):
-                    if i < len(response["vectors"]):
-                        vector_data = response["vectors"][i]
-                        vector = vector_data.get("vector", [])
-                        self._store_vector_in_db(comp, vector)
-                        results[comp.component_id] = True
-                    else:
-                        results[comp.component_id] = False
-            else:
-                for comp in components:
-                    results[comp.component_id] = False
+            generated = await self._generate_vectors(components)
+            if await self._store_vectors_in_db(generated):
+                for component, _ in generated:
+                    results[component.component_id] = True
 
         except Exception as e:
             logger.error(f"Error updating vectors: {e}", exc_info=True)
-            for comp in components:
-                results[comp.component_id] = False
 
         return results
 
-    def cache_status(self) -> Dict[str, Any]:
-        """Get cache status information"""
-        try:
-            from sqlalchemy import create_engine, text
+    def invalidate_components(self, repository_name: str, signatures: Dict[str, str]) -> int:
+        """
+        Drop cached vectors invalidated by a repository's new component list
+
+        Registered with PostgresRepository.on_components_changed(); entries for
+        components that were removed or whose content changed are dropped.
+
+        Args:
+            repository_name: Repository name (format: "owner/repo")
+            signatures: component_id -> component_signature() of the
+                        repository's components after the write
 
-            engine = create_engine(self.postgres_url)
-            with engine.connect() as conn:
-                result = conn.execute(text("SELECT COUNT(*) FROM component_vectors"))
-                total_vectors = result.scalar()
+        Returns:
+            Number of cached vectors dropped
+        """
+        dropped = self.vector_cache.invalidate_repository(repository_name, signatures)
+        if dropped:
+            logger.debug(f"Invalidated {dropped} cached vectors for {repository_name}")
+        return dropped
+
+    async def cache_status(self) -> Dict[str, Any]:
+        """Get cache status information, including cache and connection pool metrics"""
+        status = {
+            "memory_cache_size": len(self.vector_cache),
+            "memory_cache": self.vector_cache.stats(),
+            "database_cache": dict(self._db_stats),
+            "pool": self.db.get_query_metrics()["pool"],
+        }
 
-                result = conn.execute(text("""
-                    SELECT COUNT(DISTINCT repository) FROM component_vectors
-                """))
-                repos_with_vectors = result.scalar()
+        if not self.available:
+            return {**status, "status": "unavailable", "message": "Database not connected"}
 
+        try:
+            await self._ensure_schema()
+            row = await self.db.fetchrow(COMPONENT_VECTOR_STATS_SQL)
             return {
-                "total_vectors_cached": total_vectors,
-                "repositories_with_vectors": repos_with_vectors,
-                "memory_cache_size": len(self.vector_cache),
+                **status,
+                "total_vectors_cached": row["total_vectors"],
+                "repositories_with_vectors": row["repositories"],
                 "status": "healthy"
             }
 
         except Exception as e:
             logger.error(f"Error getting cache status: {e}", exc_info=True)
-            return {"status": "error", "message": str(e)}
+            return {**status, "status": "error", "message": str(e)}
 
 
 class CentralityCalculator:
@@ -0,0 +1,113 @@
+"""
+Component Indexing Pipeline
+
+Streams components (e.g. from ComponentScanner.aiter_repository) through
+vector generation and batched PostgreSQL writes. Only one batch of components
+and vectors is held at a time; what is kept of each batch are the compact row
+values, written in one short transaction once the stream is exhausted, so no
+connection sits idle in transaction while components are scanned or vectorized.
+"""
+
+import os
+import time
+import logging
+from typing import Dict, List, Optional, Any, Callable, Iterable, AsyncIterable, AsyncIterator, Union
+
+from core.database import abatched
+from schemas.knowledge_base_v2 import Component
+
+logger = logging.getLogger(__name__)
+
+
+class ComponentPipeline:
+    """Vectorize and persist a stream of components batch by batch"""
+
+    def __init__(
+        self,
+        postgres_repo: Any,
+        vector_manager: Optional[Any] = None,
+        batch_size: Optional[int] = None,
+        progress: Optional[Callable[[List[Component], Dict[str, Any]], Any]] = None
+    ):
+        """
+        Initialize pipeline
+
+        Args:
+            postgres_repo: PostgresRepository the components are saved to
+            vector_manager: VectorCacheManager for vector generation (optional)
+            batch_size: Components per vectorization request and INSERT batch
+                        (defaults to COMPONENT_PIPELINE_BATCH_SIZE env var, 200)
+            progress: Called with (batch, report) after each batch is vectorized
+        """
+        self.postgres_repo = postgres_repo
+        self.vector_manager = vector_manager
+        self.batch_size = batch_size or int(os.getenv("COMPONENT_PIPELINE_BATCH_SIZE", "200"))
+        self.progress = progress
+
+        # Counts and timings of the most recent run
+        self.last_run_report: Optional[Dict[str, Any]] = None
+
+    async def run(
+        self,
+        repository: str,
+        components: Union[Iterable[Component], AsyncIterable[Component]]
+    ) -> Dict[str, Any]:
+        """
+        Replace a repository's components with the stream's, vectorizing them on the way
+
+        Args:
+            repository: Repository name (format: "owner/repo")
+            components: Components to index, consumed once
+
+        Returns:
+            Report with components, vectors, batches, saved (None if the write
+            failed) and seconds
+        """
+        started = time.perf_counter()
+        report: Dict[str, Any] = {
+            "repository": repository,
+            "components": 0,
+            "vectors": 0,
+            "vectors_missing": 0,
+            "batches": 0,
+            "saved": 0,
+        }
+        self.last_run_report = report
+
+        report["saved"] = await self.postgres_repo.save_components_stream(
+            repository, self._vectorized(components, report), batch_size=self.batch_size
+        )
+
+        report["seconds"] = round(time.perf_counter() - started, 4)
+        logger.info(
+            f"Indexed {repository}: {report['components']} components in {report['batches']} batches, "
+            f"{report['vectors']} vectors, {report['saved']} saved in {report['seconds']}s"
+        )
+        return report
+
+    async def _vectorized(
+        self,
+        components: Union[Iterable[Component], AsyncIterable[Component]],
+        report: Dict[str, Any]
+    ) -> AsyncIterator[Component]:
+        """Pass components through, generating the vectors of each batch first"""
+        async for batch in abatched(components, self.batch_size):
+            if self.vector_manager is not None:
+                try:
+                    vectors = await self.vector_manager.get_or_create_vectors(batch)
+                    report["vectors"] += len(vectors)
+                    report["vectors_missing"] += len(batch) - len(vectors)
+                except Exception as e:
+                    logger.warning(f"Could not vectorize batch of {len(batch)} components: {e}")
+                    report["vectors_missing"] += len(batch)
+
+            report["components"] += len(batch)
+            report["batches"] += 1
+            if self.progress is not None:
+                try:
+                    self.progress(batch, report)
+                except Exception as e:
+                    logger.warning(f"Component pipeline progress callback failed: {e}")
+
+            for component in batch:
+                yield component
@@ -0,0 +1,202 @@
+"""
+Component Scan Cache Module
+
+Persistent per-file cache for ComponentScanner, so rescans of a large
+repository only re-parse files that changed.
+
+Each entry is keyed by (repository, relative path) and validated against the
+file's (mtime, size, sha256): a matching mtime and size is trusted as-is; if
+either differs, the file is hashed and still counts as unchanged when its
+sha256 matches (e.g. after a fresh checkout). Entries of a repository are
+dropped when the scanner settings they were produced with (classification
+rules, minimum size) change.
+"""
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+from typing import Optional, Dict, Any, Iterable, List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class ScanCacheEntry(NamedTuple):
+    """Cached scan result for one file"""
+    mtime_ns: int
+    size: int
+    sha: str
+    component: Optional[Dict[str, Any]]  # Component.model_dump(mode="json"), None if not a component
+
+
+class ComponentScanCache:
+    """Scan results per file in a local SQLite file"""
+
+    # Paths per IN (...) lookup, below SQLite's host parameter limit
+    QUERY_BATCH = 500
+
+    def __init__(self, path: str):
+        """
+        Initialize scan cache
+
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS component_scan_cache (
+                repository TEXT NOT NULL,
+                path TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                sha TEXT NOT NULL,
+                component TEXT,
+                PRIMARY KEY (repository, path)
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS component_scan_settings (
+                repository TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls) -> Optional["ComponentScanCache"]:
+        """
+        Build a cache at COMPONENT_SCAN_CACHE_PATH
+
+        Returns:
+            ComponentScanCache, or None when the variable is unset or the file
+            cannot be opened
+        """
+        path = os.getenv("COMPONENT_SCAN_CACHE_PATH")
+        if not path:
+            return None
+        try:
+            return cls(path)
+        except Exception as e:
+            logger.warning(f"Component scan cache unavailable at {path}: {e}")
+            return None
+
+    def load(
+        self,
+        repository: str,
+        fingerprint: Optional[str] = None,
+        components: bool = True
+    ) -> Dict[str, ScanCacheEntry]:
+        """
+        Load all cached entries of a repository
+
+        Args:
+            repository: Repository name (owner/repo)
+            fingerprint: Current scanner settings; entries stored under other
+                         settings are dropped instead of returned
+            components: Also load the cached components; without them entries
+                        carry component=None (see get_components)
+
+        Returns:
+            Mapping of relative path to cache entry
+        """
+        with self._lock:
+            if fingerprint is not None:
+                row = self._conn.execute(
+                    "SELECT fingerprint FROM component_scan_settings WHERE repository = ?", (repository,)
+                ).fetchone()
+                if row is None or row[0] != fingerprint:
+                    self._conn.execute("DELETE FROM component_scan_cache WHERE repository = ?", (repository,))
+                    self._conn.commit()
+                    return {}
+            rows = self._conn.execute(
+                f"SELECT path, mtime_ns, size, sha, {'component' if components else 'NULL'} "
+                "FROM component_scan_cache WHERE repository = ?",
+                (repository,)
+            ).fetchall()
+        return {
+            path: ScanCacheEntry(mtime_ns, size, sha, json.loads(component) if component else None)
+            for path, mtime_ns, size, sha, component in rows
+        }
+
+    def get_components(self, repository: str, paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the cached components of some files
+
+        Args:
+            repository: Repository name (owner/repo)
+            paths: Relative paths
+
+        Returns:
+            Mapping of relative path to component, for files that are components
+        """
+        found = {}
+        with self._lock:
+            for start in range(0, len(paths), self.QUERY_BATCH):
+                batch = paths[start:start + self.QUERY_BATCH]
+                rows = self._conn.execute(
+                    "SELECT path, component FROM component_scan_cache "
+                    f"WHERE repository = ? AND component IS NOT NULL AND path IN ({', '.join('?' * len(batch))})",
+                    (repository, *batch)
+                ).fetchall()
+                found.update((path, json.loads(component)) for path, component in rows)
+        return found
+
+    def update(
+        self,
+        repository: str,
+        entries: Dict[str, ScanCacheEntry],
+        removed: Iterable[str] = (),
+        fingerprint: Optional[str] = None
+    ) -> None:
+        """
+        Write changed entries and drop entries of deleted files
+
+        Args:
+            repository: Repository name (owner/repo)
+            entries: Relative path -> entry to insert or replace
+            removed: Relative paths no longer present in the repository
+            fingerprint: Scanner settings the entries were produced with
+        """
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO component_scan_cache "
+                "(repository, path, mtime_ns, size, sha, component) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        repository, path, entry.mtime_ns, entry.size, entry.sha,
+                        json.dumps(entry.component) if entry.component is not None else None
+                    )
+                    for path, entry in entries.items()
+                ]
+            )
+            self._conn.executemany(
+                "DELETE FROM component_scan_cache WHERE repository = ? AND path = ?",
+                [(repository, path) for path in removed]
+            )
+            if fingerprint is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO component_scan_settings (repository, fingerprint) VALUES (?, ?)",
+                    (repository, fingerprint)
+                )
+            self._conn.commit()
+
+    def clear(self, repository: Optional[str] = None) -> None:
+        """Drop the entries of one repository, or of all repositories"""
+        with self._lock:
+            if repository is None:
+                self._conn.execute("DELETE FROM component_scan_cache")
+                self._conn.execute("DELETE FROM component_scan_settings")
+            else:
+                self._conn.execute("DELETE FROM component_scan_cache WHERE repository = ?", (repository,))
+                self._conn.execute("DELETE FROM component_scan_settings WHERE repository = ?", (repository,))
+            self._conn.commit()
@@ -9,16 +9,231 @@ Handles:
 """
 
 import os
+import re
+import time
 import asyncpg
 import logging
 import asyncio
 import ssl
-from typing import Optional, List, Dict, Any
+from collections import deque
+from typing import Optional, List, Dict, Any, Callable, Awaitable, Iterable, AsyncIterable, AsyncIterator, Union
 from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================
+# Prepared Statement Registry
+# ============================================
+
+# Hot queries by SQL text -> statement name. Registered statements are
+# prepared once per pooled connection and reported under their name in
+# query metrics; all other queries are reported by a normalized SQL prefix.
+_STATEMENT_REGISTRY: Dict[str, str] = {}
+
+
+def register_statement(name: str, sql: str) -> str:
+    """
+    Register a hot query under a stable name
+
+    Args:
+        name: Statement name used for prepared statements and metrics
+        sql: SQL text; callers must pass this exact string to execute/fetch
+
+    Returns:
+        The SQL text, so it can be assigned to a module-level constant
+    """
+    existing = _STATEMENT_REGISTRY.get(sql)
+    if existing is not None and existing != name:
+        raise ValueError(f"SQL already registered as '{existing}'")
+    _STATEMENT_REGISTRY[sql] = name
+    return sql
+
+
+def get_registered_statements() -> Dict[str, str]:
+    """Get registered statements as name -> SQL text"""
+    return {name: sql for sql, name in _STATEMENT_REGISTRY.items()}
+
+
+class StatementCachingConnection(asyncpg.Connection):
+    """asyncpg connection that keeps registry statements prepared for its lifetime"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements: Dict[str, Any] = {}
+
+
+class StatementMetrics:
+    """Call count, row count and latency distribution for one statement"""
+
+    # Histogram bucket upper bounds in milliseconds
+    BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self, sample_size: int = 1024):
+        self.calls = 0
+        self.rows = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(self.BUCKETS_MS) + 1)
+        # Recent latencies for percentile estimates
+        self.samples: deque = deque(maxlen=sample_size)
+
+    def observe(self, elapsed_ms: float, rows: int = 0, error: bool = False) -> None:
+        """Record one call"""
+        self.calls += 1
+        self.rows += rows
+        self.errors += int(error)
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.samples.append(elapsed_ms)
+
+        for index, bound in enumerate(self.BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[index] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, q: float) -> float:
+        """Latency percentile (0-100) over the recent sample window"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the metrics endpoint"""
+        histogram = {f"le_{bound}ms": count for bound, count in zip(self.BUCKETS_MS, self.buckets)}
+        histogram["gt_10000ms"] = self.buckets[-1]
+        return {
+            "calls": self.calls,
+            "rows": self.rows,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max_ms, 3),
+            "histogram": histogram,
+        }
+
+
+def _statement_label(query: str) -> str:
+    """Metrics label for a query: registered name or normalized SQL prefix"""
+    name = _STATEMENT_REGISTRY.get(query)
+    if name is not None:
+        return name
+    return "sql:" + re.sub(r"\s+", " ", query).strip()[:80]
+
+
+def _row_count(method: str, result: Any) -> int:
+    """Rows returned or affected by a call, for metrics"""
+    if method == "fetch":
+        return len(result)
+    if method == "execute":
+        # Status strings look like "UPDATE 3" or "INSERT 0 1"
+        tail = result.rsplit(" ", 1)[-1] if isinstance(result, str) else ""
+        return int(tail) if tail.isdigit() else 0
+    return 0 if result is None else 1
+
+
+class UnitOfWork:
+    """
+    Queries pinned to one pooled connection inside a transaction
+
+    Created by DatabaseManager.transaction(). Exposes the same execute/fetch
+    API as DatabaseManager, so repository methods can take either one.
+    """
+
+    def __init__(self, db: "DatabaseManager", connection: Any):
+        self.db = db
+        self.connection = connection
+        self._after_commit: List[Callable[[], Awaitable[Any]]] = []
+
+    async def execute(self, query: str, *args) -> str:
+        """Execute a SQL command on the pinned connection"""
+        return await self.db._run_on(self.connection, "execute", query, args)
+
+    async def executemany(self, query: str, args: List[tuple]) -> None:
+        """Execute a SQL command once per argument tuple on the pinned connection"""
+        await self.db._run_on(self.connection, "executemany", query, (args,))
+
+    async def fetch(self, query: str, *args) -> List[asyncpg.Record]:
+        """Fetch multiple rows on the pinned connection"""
+        return await self.db._run_on(self.connection, "fetch", query, args)
+
+    async def fetchrow(self, query: str, *args) -> Optional[asyncpg.Record]:
+        """Fetch single row on the pinned connection"""
+        return await self.db._run_on(self.connection, "fetchrow", query, args)
+
+    async def fetchval(self, query: str, *args) -> Any:
+        """Fetch single value on the pinned connection"""
+        return await self.db._run_on(self.connection, "fetchval", query, args)
+
+    def after_commit(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        """Run ``callback`` once the outermost transaction has committed"""
+        self._after_commit.append(callback)
+
+
+# Top-k first, threshold second: the inner ORDER BY distance LIMIT k is
+# served by the HNSW/IVFFlat index on patterns.embedding, while a similarity
+# predicate in the WHERE clause would force a sequential scan.
+FIND_SIMILAR_PATTERNS_SQL = register_statement("patterns.find_similar", """
+    SELECT
+        nearest.id,
+        nearest.name,
+        nearest.description,
+        nearest.context,
+        nearest.repo_id,
+        r.name as repo_name,
+        1 - nearest.distance as similarity
+    FROM (
+        SELECT p.id, p.name, p.description, p.context, p.repo_id,
+               p.embedding <=> $1::vector AS distance
+        FROM patterns p
+        WHERE p.embedding IS NOT NULL
+            AND ($3::integer IS NULL OR p.repo_id != $3)
+        ORDER BY p.embedding <=> $1::vector
+        LIMIT $4
+    ) nearest
+    JOIN repositories r ON nearest.repo_id = r.id
+    WHERE 1 - nearest.distance >= $2
+    ORDER BY nearest.distance
+""")
+
+
+def to_vector_literal(embedding: Any) -> str:
+    """Format an embedding as pgvector text input ('[0.1,0.2,...]')"""
+    if isinstance(embedding, str):
+        return embedding
+    return "[" + ",".join(repr(float(value)) for value in embedding) + "]"
+
+
+async def abatched(
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    batch_size: int
+) -> AsyncIterator[List[Any]]:
+    """Group a sync or async iterable into lists of up to batch_size items, e.g. for executemany"""
+    batch: List[Any] = []
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    else:
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
 class DatabaseManager:
     """Manages PostgreSQL database connections with pgvector support"""
 
@@ -54,6 +269,17 @@ class DatabaseManager:
         self.max_size = max_size
         self.pool: Optional[asyncpg.Pool] = None
 
+        # Prepare registered statements per connection (POSTGRES_PREPARE_STATEMENTS)
+        self.prepare_statements = os.getenv("POSTGRES_PREPARE_STATEMENTS", "true").lower() == "true"
+        self.query_metrics: Dict[str, StatementMetrics] = {}
+        # Time spent waiting for a pool connection (contention)
+        self.acquire_metrics = StatementMetrics()
+
+        # Default ANN search knobs (PGVECTOR_EF_SEARCH / PGVECTOR_PROBES);
+        # unset keeps the server defaults
+        self.ef_search = int(os.getenv("PGVECTOR_EF_SEARCH", "0")) or None
+        self.probes = int(os.getenv("PGVECTOR_PROBES", "0")) or None
+
         # Check if PostgreSQL should be used
         self.enabled = os.getenv("USE_POSTGRESQL", "false").lower() == "true"
 
@@ -116,6 +342,7 @@ class DatabaseManager:
                         server_settings={
                             "application_name": "dev-nexus-a2a",
                         },
+                        connection_class=StatementCachingConnection,
                     )
                 except Exception as e:
                     # If this looks like an SSL negotiation failure, try a one-time fallback without SSL
@@ -137,6 +364,7 @@ class DatabaseManager:
                                 server_settings={
                                     "application_name": "dev-nexus-a2a",
                                 },
+                                connection_class=StatementCachingConnection,
                             )
                         except Exception as e2:
                             logger.error(f"Fallback (ssl=False) also failed: {e2}")
@@ -188,9 +416,43 @@ class DatabaseManager:
         if not self.enabled or self.pool is None:
             raise RuntimeError("Database not connected")
 
+        started = time.perf_counter()
         async with self.pool.acquire() as connection:
+            self.acquire_metrics.observe((time.perf_counter() - started) * 1000)
             yield connection
 
+    @asynccontextmanager
+    async def transaction(self, uow: Optional[UnitOfWork] = None):
+        """
+        Unit of work: one pooled connection inside one transaction
+
+        Every statement issued through the yielded UnitOfWork runs on the same
+        connection and commits or rolls back together. Passing an open
+        UnitOfWork nests a savepoint on its connection instead of acquiring a
+        new one, so methods that take an optional ``uow`` compose atomically.
+
+        Args:
+            uow: Open unit of work to join (optional)
+
+        Yields:
+            UnitOfWork bound to the transaction's connection
+        """
+        if uow is not None:
+            async with uow.connection.transaction():
+                yield uow
+            return
+
+        async with self.acquire() as connection:
+            uow = UnitOfWork(self, connection)
+            async with connection.transaction():
+                yield uow
+
+        for callback in uow._after_commit:
+            try:
+                await callback()
+            except Exception as e:
+                logger.warning(f"After-commit callback failed: {e}")
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Check database health
@@ -255,11 +517,7 @@ class DatabaseManager:
         Returns:
             Status message
         """
-        if not self.enabled or self.pool is None:
-            raise RuntimeError("Database not connected")
-
-        async with self.pool.acquire() as conn:
-            return await conn.execute(query, *args)
+        return await self._run("execute", query, args)
 
     async def fetch(self, query: str, *args) -> List[asyncpg.Record]:
         """
@@ -272,11 +530,7 @@ class DatabaseManager:
         Returns:
             List of records
         """
-        if not self.enabled or self.pool is None:
-            raise RuntimeError("Database not connected")
-
-        async with self.pool.acquire() as conn:
-            return await conn.fetch(query, *args)
+        return await self._run("fetch", query, args)
 
     async def fetchrow(self, query: str, *args) -> Optional[asyncpg.Record]:
         """
@@ -289,11 +543,7 @@ class DatabaseManager:
         Returns:
             Single record or None
         """
-        if not self.enabled or self.pool is None:
-            raise RuntimeError("Database not connected")
-
-        async with self.pool.acquire() as conn:
-            return await conn.fetchrow(query, *args)
+        return await self._run("fetchrow", query, args)
 
     async def fetchval(self, query: str, *args) -> Any:
         """
@@ -306,11 +556,92 @@ class DatabaseManager:
         Returns:
             Single value
         """
-        if not self.enabled or self.pool is None:
-            raise RuntimeError("Database not connected")
+        return await self._run("fetchval", query, args)
+
+    async def _run(self, method: str, query: str, args: tuple) -> Any:
+        """Run a query on a pooled connection and record its metrics"""
+        async with self.acquire() as conn:
+            return await self._run_on(conn, method, query, args)
+
+    async def _run_on(self, conn: Any, method: str, query: str, args: tuple) -> Any:
+        """
+        Run a query on ``conn`` and record its metrics
+
+        Registered reads are served from the connection's prepared statement
+        cache; writes rely on asyncpg's implicit statement cache.
+        """
+        label = _statement_label(query)
+        started = time.perf_counter()
+        result = None
+        error = False
+        try:
+            statement = None
+            if method in ("fetch", "fetchrow", "fetchval") and query in _STATEMENT_REGISTRY:
+                statement = await self._get_prepared(conn, label, query)
 
-        async with self.pool.acquire() as conn:
-            return await conn.fetchval(query, *args)
+            if statement is not None:
+                result = await getattr(statement, method)(*args)
+            else:
+                result = await getattr(conn, method)(query, *args)
+            return result
+        except Exception:
+            error = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            metrics = self.query_metrics.get(label)
+            if metrics is None:
+                metrics = self.query_metrics[label] = StatementMetrics()
+            metrics.observe(elapsed_ms, 0 if error else _row_count(method, result), error)
+
+    async def _get_prepared(self, conn: Any, name: str, query: str) -> Optional[Any]:
+        """Get (preparing on first use) a registered statement for this connection"""
+        if not self.prepare_statements:
+            return None
+
+        cache = getattr(conn, "prepared_statements", None)
+        if cache is None:
+            return None
+
+        statement = cache.get(name)
+        if statement is None:
+            statement = await conn.prepare(query)
+            cache[name] = statement
+        return statement
+
+    def get_query_metrics(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get per-statement metrics, slowest total time first
+
+        Args:
+            limit: Maximum number of statements to include
+
+        Returns:
+            Dictionary with per-statement call/row counts and latency percentiles
+        """
+        ordered = sorted(
+            self.query_metrics.items(),
+            key=lambda item: item[1].total_ms,
+            reverse=True
+        )
+        if limit is not None:
+            ordered = ordered[:limit]
+
+        return {
+            "pool": {
+                "max_size": self.max_size,
+                "size": self.pool.get_size() if self.pool is not None and hasattr(self.pool, "get_size") else 0,
+                "acquire_wait": self.acquire_metrics.to_dict(),
+            },
+            "prepared_statements": self.prepare_statements,
+            "registered_statements": len(_STATEMENT_REGISTRY),
+            "statements": {label: metrics.to_dict() for label, metrics in ordered},
+        }
+
+    def reset_query_metrics(self) -> None:
+        """Clear all collected query and pool metrics"""
+        self.query_metrics.clear()
+        self.acquire_metrics = StatementMetrics()
 
     # ============================================
     # Vector Operations (pgvector)
@@ -348,7 +679,8 @@ class DatabaseManager:
             RETURNING id
         """
         return await self.fetchval(
-            query, repo_id, name, description, context, embedding
+            query, repo_id, name, description, context,
+            to_vector_literal(embedding) if embedding is not None else None
         )
 
     async def find_similar_patterns(
@@ -357,38 +689,39 @@ class DatabaseManager:
         limit: int = 10,
         threshold: float = 0.8,
         exclude_repo_id: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        exact: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Find similar patterns using vector similarity
 
+        Fetches the ``limit`` nearest patterns through the vector index, then
+        drops those below ``threshold``. Search knobs apply to this query only
+        (``SET LOCAL`` inside a transaction).
+
         Args:
             embedding: Query embedding vector
             limit: Maximum number of results
             threshold: Minimum similarity threshold (0-1)
             exclude_repo_id: Optional repo ID to exclude
+            ef_search: HNSW candidate list size (defaults to PGVECTOR_EF_SEARCH)
+            probes: IVFFlat lists to probe (defaults to PGVECTOR_PROBES)
+            exact: Skip the index and scan exactly (recall baseline)
 
         Returns:
             List of similar patterns with similarity scores
         """
-        query = """
-            SELECT
-                p.id,
-                p.name,
-                p.description,
-                p.context,
-                p.repo_id,
-                r.name as repo_name,
-                1 - (p.embedding <=> $1::vector) as similarity
-            FROM patterns p
-            JOIN repositories r ON p.repo_id = r.id
-            WHERE p.embedding IS NOT NULL
-                AND 1 - (p.embedding <=> $1::vector) >= $2
-                AND ($3::integer IS NULL OR p.repo_id != $3)
-            ORDER BY p.embedding <=> $1::vector
-            LIMIT $4
-        """
-
-        rows = await self.fetch(query, embedding, threshold, exclude_repo_id, limit)
+        settings = self._search_settings(ef_search, probes, exact)
+        args = (to_vector_literal(embedding), threshold, exclude_repo_id, limit)
+
+        if settings:
+            async with self.transaction() as uow:
+                for name, value in settings:
+                    await uow.execute("SELECT set_config($1, $2, true)", name, value)
+                rows = await uow.fetch(FIND_SIMILAR_PATTERNS_SQL, *args)
+        else:
+            rows = await self.fetch(FIND_SIMILAR_PATTERNS_SQL, *args)
 
         return [
             {
@@ -403,6 +736,25 @@ class DatabaseManager:
             for row in rows
         ]
 
+    def _search_settings(
+        self,
+        ef_search: Optional[int],
+        probes: Optional[int],
+        exact: bool
+    ) -> List[tuple]:
+        """Session settings (name, value) for one vector search"""
+        if exact:
+            return [("enable_indexscan", "off")]
+
+        settings = []
+        ef_search = ef_search or self.ef_search
+        probes = probes or self.probes
+        if ef_search:
+            settings.append(("hnsw.ef_search", str(int(ef_search))))
+        if probes:
+            settings.append(("ivfflat.probes", str(int(probes))))
+        return settings
+
     async def update_pattern_embedding(
         self, pattern_id: int, embedding: List[float]
     ) -> None:
@@ -414,7 +766,39 @@ class DatabaseManager:
             embedding: Vector embedding
         """
         query = "UPDATE patterns SET embedding = $1::vector WHERE id = $2"
-        await self.execute(query, embedding, pattern_id)
+        await self.execute(query, to_vector_literal(embedding), pattern_id)
+
+    async def update_pattern_embeddings(
+        self,
+        pattern_ids: List[int],
+        embeddings: List[Any],
+        uow: Optional[UnitOfWork] = None,
+    ) -> int:
+        """
+        Update embeddings for many patterns with one statement
+
+        Args:
+            pattern_ids: Pattern IDs
+            embeddings: Vector embeddings, aligned with ``pattern_ids``
+            uow: Open unit of work to run on (optional)
+
+        Returns:
+            Number of patterns updated
+        """
+        if not pattern_ids:
+            return 0
+
+        # Vectors travel as text[] and are cast per row; asyncpg has no vector codec
+        query = """
+            UPDATE patterns AS p
+            SET embedding = v.embedding::vector
+            FROM unnest($1::int[], $2::text[]) AS v(id, embedding)
+            WHERE p.id = v.id
+        """
+        status = await (uow or self).execute(
+            query, list(pattern_ids), [to_vector_literal(embedding) for embedding in embeddings]
+        )
+        return _row_count("execute", status)
 
     async def get_patterns_without_embeddings(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,337 @@
+"""
+Embedding Cache Module
+
+Content-addressed cache for text embeddings, keyed by
+(model, dimensions, sha256 of the normalized text), so the same text is never
+sent to the embeddings API twice.
+
+Tiers:
+- In-memory LRU (always on)
+- Persistent store (optional): SQLite file on disk or a Postgres table
+"""
+
+import os
+import re
+import json
+import asyncio
+import sqlite3
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text before hashing: NFC, collapsed whitespace, stripped"""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+def embedding_cache_key(model: str, dimensions: int, text: str) -> str:
+    """Cache key for ``text`` embedded with ``model`` at ``dimensions``"""
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{model}:{dimensions}:{digest}"
+
+
+class DiskEmbeddingStore:
+    """Persistent embedding tier in a local SQLite file"""
+
+    def __init__(self, path: str):
+        """
+        Initialize disk store
+
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache (key TEXT PRIMARY KEY, embedding TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_many_sync(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Look up embeddings by key"""
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, embedding FROM embedding_cache WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                found.update((key, json.loads(embedding)) for key, embedding in rows)
+        return found
+
+    def put_many_sync(self, items: Dict[str, List[float]]) -> None:
+        """Store embeddings by key"""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (key, embedding) VALUES (?, ?)",
+                [(key, json.dumps(embedding)) for key, embedding in items.items()]
+            )
+            self._conn.commit()
+
+    async def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Look up embeddings by key without blocking the event loop"""
+        return await asyncio.to_thread(self.get_many_sync, keys)
+
+    async def put_many(self, items: Dict[str, List[float]]) -> None:
+        """Store embeddings by key without blocking the event loop"""
+        await asyncio.to_thread(self.put_many_sync, items)
+
+
+class PostgresEmbeddingStore:
+    """Persistent embedding tier in the embedding_cache table (shared by all instances)"""
+
+    def __init__(self, db_manager: Any):
+        """
+        Initialize Postgres store
+
+        Args:
+            db_manager: DatabaseManager instance
+        """
+        self.db = db_manager
+        self._schema_ready = False
+
+    async def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        await self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                key TEXT PRIMARY KEY,
+                embedding REAL[] NOT NULL,
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+            )
+            """
+        )
+        self._schema_ready = True
+
+    async def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Look up embeddings by key"""
+        await self._ensure_schema()
+        rows = await self.db.fetch(
+            "SELECT key, embedding FROM embedding_cache WHERE key = ANY($1::text[])",
+            keys
+        )
+        return {row["key"]: list(row["embedding"]) for row in rows}
+
+    async def put_many(self, items: Dict[str, List[float]]) -> None:
+        """Store embeddings by key"""
+        await self._ensure_schema()
+        await self.db.execute(
+            """
+            INSERT INTO embedding_cache (key, embedding)
+            SELECT key, embedding::real[]
+            FROM unnest($1::text[], $2::text[]) AS t(key, embedding)
+            ON CONFLICT (key) DO NOTHING
+            """,
+            list(items.keys()),
+            # unnest() would flatten a 2-D array, so each vector travels as an array literal
+            ["{" + ",".join(repr(float(v)) for v in embedding) + "}" for embedding in items.values()]
+        )
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache: bounded in-memory LRU over an optional persistent store
+
+    The synchronous lookups and writes (get_many_sync/put_many_sync, used by
+    EmbeddingGenerator.generate_embedding) only reach stores with synchronous
+    methods. PostgresEmbeddingStore has none, so with the Postgres tier the
+    sync path uses the memory tier alone; only the async path reads and
+    writes the shared table.
+    """
+
+    def __init__(self, max_entries: int = 10000, store: Optional[Any] = None):
+        """
+        Initialize embedding cache
+
+        Args:
+            max_entries: In-memory LRU capacity (0 disables the memory tier)
+            store: Persistent tier (DiskEmbeddingStore or PostgresEmbeddingStore)
+        """
+        self.max_entries = max_entries
+        self.store = store
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "memory_hits": 0,
+            "store_hits": 0,
+            "evictions": 0,
+            "store_errors": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "EmbeddingCache":
+        """
+        Build a cache from EMBEDDING_CACHE_SIZE, EMBEDDING_CACHE_BACKEND
+        ("memory", "disk" or "postgres") and EMBEDDING_CACHE_PATH
+
+        The Postgres tier needs a database; attach it with attach_store().
+        """
+        cache = cls(max_entries=int(os.getenv("EMBEDDING_CACHE_SIZE", "10000")))
+        if os.getenv("EMBEDDING_CACHE_BACKEND", "memory").lower() == "disk":
+            path = os.getenv("EMBEDDING_CACHE_PATH", ".cache/embeddings.sqlite3")
+            try:
+                cache.store = DiskEmbeddingStore(path)
+            except Exception as e:
+                logger.warning(f"Embedding disk cache unavailable at {path}: {e}")
+        return cache
+
+    @staticmethod
+    def wants_postgres_store() -> bool:
+        """Whether EMBEDDING_CACHE_BACKEND selects the Postgres tier"""
+        return os.getenv("EMBEDDING_CACHE_BACKEND", "memory").lower() == "postgres"
+
+    def attach_store(self, store: Any) -> None:
+        """Set the persistent tier if none is configured yet"""
+        if self.store is None:
+            self.store = store
+
+    # Memory tier
+
+    def _memory_get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+            return embedding
+
+    def _memory_put(self, items: Dict[str, List[float]]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            for key, embedding in items.items():
+                self._entries[key] = embedding
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _split(self, keys: Iterable[str]) -> Tuple[Dict[str, List[float]], List[str]]:
+        found: Dict[str, List[float]] = {}
+        missing: List[str] = []
+        for key in dict.fromkeys(keys):
+            embedding = self._memory_get(key)
+            if embedding is not None:
+                found[key] = embedding
+            else:
+                missing.append(key)
+        self._stats["memory_hits"] += len(found)
+        return found, missing
+
+    def _count(self, requested: int, found: int) -> None:
+        self._stats["hits"] += found
+        self._stats["misses"] += requested - found
+
+    # Lookups
+
+    def get_many_sync(self, keys: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up embeddings in the memory tier and a synchronous store
+
+        Args:
+            keys: Cache keys (duplicates are looked up once)
+
+        Returns:
+            Mapping of found keys to embeddings
+        """
+        found, missing = self._split(keys)
+        requested = len(found) + len(missing)
+        if missing and hasattr(self.store, "get_many_sync"):
+            try:
+                stored = self.store.get_many_sync(missing)
+            except Exception as e:
+                self._stats["store_errors"] += 1
+                logger.warning(f"Embedding cache store lookup failed: {e}")
+                stored = {}
+            self._stats["store_hits"] += len(stored)
+            self._memory_put(stored)
+            found.update(stored)
+        self._count(requested, len(found))
+        return found
+
+    async def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up embeddings in the memory tier, then the persistent store
+
+        Args:
+            keys: Cache keys (duplicates are looked up once)
+
+        Returns:
+            Mapping of found keys to embeddings
+        """
+        found, missing = self._split(keys)
+        requested = len(found) + len(missing)
+        if missing and self.store is not None:
+            try:
+                stored = await self.store.get_many(missing)
+            except Exception as e:
+                self._stats["store_errors"] += 1
+                logger.warning(f"Embedding cache store lookup failed: {e}")
+                stored = {}
+            self._stats["store_hits"] += len(stored)
+            self._memory_put(stored)
+            found.update(stored)
+        self._count(requested, len(found))
+        return found
+
+    # Writes
+
+    def put_many_sync(self, items: Dict[str, List[float]]) -> None:
+        """Store embeddings in the memory tier and a synchronous store"""
+        if not items:
+            return
+        self._memory_put(items)
+        if hasattr(self.store, "put_many_sync"):
+            try:
+                self.store.put_many_sync(items)
+            except Exception as e:
+                self._stats["store_errors"] += 1
+                logger.warning(f"Embedding cache store write failed: {e}")
+
+    async def put_many(self, items: Dict[str, List[float]]) -> None:
+        """Store embeddings in the memory tier and the persistent store"""
+        if not items:
+            return
+        self._memory_put(items)
+        if self.store is not None:
+            try:
+                await self.store.put_many(items)
+            except Exception as e:
+                self._stats["store_errors"] += 1
+                logger.warning(f"Embedding cache store write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop the memory tier (the persistent store is kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hits, misses, hit rate, per-tier hits, evictions,
+            memory size and the persistent store type
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "store": type(self.store).__name__ if self.store is not None else None,
+        }
@@ -3,16 +3,46 @@ Embedding Generation Module
 
 Generates vector embeddings for patterns using OpenAI's text-embedding models.
 Supports batch processing and caching for efficiency.
+
+The async pipeline (generate_embeddings_async) packs texts into requests by
+token count, runs a bounded number of requests concurrently and backs off on
+rate limits, so it never blocks the A2A server's event loop.
 """
 
 import os
+import random
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Sequence, Tuple
+import numpy as np
 import openai
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+
+from core.embedding_cache import EmbeddingCache, PostgresEmbeddingStore, embedding_cache_key
+
+try:
+    import tiktoken
+except ImportError:  # Optional: token counts fall back to a character estimate
+    tiktoken = None
 
 logger = logging.getLogger(__name__)
 
+# OpenAI embedding request limits
+MAX_INPUT_TOKENS = 8191
+MAX_BATCH_INPUTS = 2048
+# Stay well under the 300k tokens-per-request limit
+DEFAULT_MAX_BATCH_TOKENS = 100_000
+# Conservative characters-per-token estimate when tiktoken is unavailable
+CHARS_PER_TOKEN = 3
+
+# Errors worth retrying: rate limits, timeouts and transient server failures
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
 
 class EmbeddingGenerator:
     """Generates embeddings for text using OpenAI"""
@@ -22,6 +52,12 @@ class EmbeddingGenerator:
         api_key: Optional[str] = None,
         model: str = "text-embedding-3-small",
         dimensions: int = 1536,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None,
+        max_retries: int = 5,
+        retry_base_delay: float = 1.0,
+        cache: Optional[EmbeddingCache] = None,
     ):
         """
         Initialize embedding generator
@@ -30,20 +66,128 @@ class EmbeddingGenerator:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             model: Embedding model to use
             dimensions: Embedding dimensions (1536 for text-embedding-3-small)
+            base_url: API base URL (defaults to OPENAI_BASE_URL env var)
+            max_concurrency: Concurrent async requests (defaults to
+                             EMBEDDING_MAX_CONCURRENCY env var, 4)
+            max_batch_tokens: Token budget per request (defaults to
+                              EMBEDDING_MAX_BATCH_TOKENS env var, 100k)
+            max_retries: Retries per request on rate limits and transient errors
+            retry_base_delay: First backoff delay in seconds (doubles per retry)
+            cache: Embedding cache consulted before any API call (defaults to
+                   EmbeddingCache.from_env())
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
         if not self.api_key:
             logger.warning(
                 "OPENAI_API_KEY not set. Embedding generation will be unavailable."
             )
             self.client = None
+            self.async_client = None
         else:
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = OpenAI(api_key=self.api_key, base_url=base_url)
+            # Retries are handled here so backoff honours Retry-After across batches
+            self.async_client = AsyncOpenAI(api_key=self.api_key, base_url=base_url, max_retries=0)
 
         self.model = model
         self.dimensions = dimensions
         self.enabled = self.client is not None
 
+        self.max_concurrency = max_concurrency or int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "4"))
+        self.max_batch_tokens = max_batch_tokens or int(
+            os.getenv("EMBEDDING_MAX_BATCH_TOKENS", str(DEFAULT_MAX_BATCH_TOKENS))
+        )
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self._encoding = None
+        self.cache = cache if cache is not None else EmbeddingCache.from_env()
+
+    def cache_key(self, text: str) -> str:
+        """Embedding cache key for ``text`` under this model and dimensions"""
+        return embedding_cache_key(self.model, self.dimensions, text)
+
+    # ============================================
+    # Token accounting
+    # ============================================
+
+    def _get_encoding(self) -> Optional[Any]:
+        """tiktoken encoding for the model, or None when tiktoken is unavailable"""
+        if tiktoken is None:
+            return None
+        if self._encoding is None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+        return self._encoding
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count (or conservatively estimate) the tokens in ``text``
+
+        Args:
+            text: Input text
+
+        Returns:
+            Token count
+        """
+        encoding = self._get_encoding()
+        if encoding is not None:
+            return len(encoding.encode(text))
+        return len(text) // CHARS_PER_TOKEN + 1
+
+    def truncate(self, text: str) -> str:
+        """
+        Truncate ``text`` to the model's per-input token limit
+
+        Args:
+            text: Input text
+
+        Returns:
+            Text of at most MAX_INPUT_TOKENS tokens
+        """
+        encoding = self._get_encoding()
+        if encoding is not None:
+            tokens = encoding.encode(text)
+            if len(tokens) <= MAX_INPUT_TOKENS:
+                return text
+            logger.warning(f"Truncating text from {len(tokens)} to {MAX_INPUT_TOKENS} tokens")
+            return encoding.decode(tokens[:MAX_INPUT_TOKENS])
+
+        max_chars = (MAX_INPUT_TOKENS - 1) * CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        logger.warning(f"Truncating text from {len(text)} to {max_chars} characters")
+        return text[:max_chars]
+
+    def pack_batches(self, texts: List[str], max_inputs: int = MAX_BATCH_INPUTS) -> List[List[int]]:
+        """
+        Group text indices into requests by token budget
+
+        Args:
+            texts: Input texts (already truncated)
+            max_inputs: Maximum inputs per request
+
+        Returns:
+            List of index lists, one per request, in input order
+        """
+        max_inputs = min(max_inputs, MAX_BATCH_INPUTS)
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+
+        for index, text in enumerate(texts):
+            tokens = self.count_tokens(text)
+            if current and (current_tokens + tokens > self.max_batch_tokens or len(current) >= max_inputs):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
     def generate_embedding(self, text: str) -> Optional[List[float]]:
         """
         Generate embedding for single text
@@ -60,9 +204,12 @@ class EmbeddingGenerator:
 
         try:
             # Truncate text if too long (OpenAI has 8191 token limit)
-            if len(text) > 8000:
-                logger.warning(f"Truncating text from {len(text)} to 8000 characters")
-                text = text[:8000]
+            text = self.truncate(text)
+
+            key = self.cache_key(text)
+            cached = self.cache.get_many_sync([key])
+            if key in cached:
+                return list(cached[key])
 
             response = self.client.embeddings.create(
                 model=self.model, input=text, dimensions=self.dimensions
@@ -71,6 +218,7 @@ class EmbeddingGenerator:
             embedding = response.data[0].embedding
             logger.debug(f"Generated embedding with {len(embedding)} dimensions")
 
+            self.cache.put_many_sync({key: embedding})
             return embedding
 
         except Exception as e:
@@ -94,48 +242,190 @@ class EmbeddingGenerator:
             logger.debug("Embedding generation disabled (no API key)")
             return [None] * len(texts)
 
-        embeddings = []
+        # Truncate long texts; only uncached, distinct texts go to the API
+        truncated = [self.truncate(text) for text in texts]
+        keys = [self.cache_key(text) for text in truncated]
+        found = self.cache.get_many_sync(keys)
+        pending = self._pending_by_key(keys, truncated, found)
+        pending_keys = list(pending)
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
+        for i in range(0, len(pending_keys), batch_size):
+            batch_keys = pending_keys[i : i + batch_size]
 
             try:
-                # Truncate long texts
-                truncated_batch = [
-                    text[:8000] if len(text) > 8000 else text for text in batch
-                ]
-
                 response = self.client.embeddings.create(
                     model=self.model,
-                    input=truncated_batch,
+                    input=[pending[key] for key in batch_keys],
                     dimensions=self.dimensions,
                 )
 
                 batch_embeddings = [item.embedding for item in response.data]
-                embeddings.extend(batch_embeddings)
+                generated = dict(zip(batch_keys, batch_embeddings))
+                self.cache.put_many_sync(generated)
+                found.update(generated)
 
                 logger.info(f"Generated {len(batch_embeddings)} embeddings in batch")
 
             except Exception as e:
+                # Failed texts stay missing and come back as None
                 logger.error(f"Failed to generate batch embeddings: {e}")
-                # Add None for failed embeddings
-                embeddings.extend([None] * len(batch))
 
-        return embeddings
+        return [list(found[key]) if key in found else None for key in keys]
+
+    @staticmethod
+    def _pending_by_key(
+        keys: List[str],
+        texts: List[str],
+        found: Dict[str, List[float]]
+    ) -> Dict[str, str]:
+        """Distinct uncached texts by cache key, in first-seen order"""
+        pending: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in pending:
+                pending[key] = text
+        return pending
+
+    # ============================================
+    # Async pipeline
+    # ============================================
+
+    async def generate_embedding_async(self, text: str) -> Optional[List[float]]:
+        """
+        Generate embedding for single text without blocking the event loop
 
-    def generate_pattern_embedding(self, pattern: Dict[str, Any]) -> Optional[List[float]]:
+        Args:
+            text: Input text
+
+        Returns:
+            Embedding vector or None if disabled or failed
         """
-        Generate embedding for a pattern
+        embeddings = await self.generate_embeddings_async([text])
+        return embeddings[0]
 
-        Combines pattern name, description, and context into a single text
+    async def generate_embeddings_async(
+        self,
+        texts: List[str],
+        max_inputs: int = MAX_BATCH_INPUTS,
+        on_batch: Optional[Callable[[List[int], List[List[float]]], Awaitable[Any]]] = None,
+    ) -> List[Optional[List[float]]]:
+        """
+        Generate embeddings for many texts with concurrent, token-packed requests
+
+        Cached embeddings are served without an API call, and identical texts
+        are requested once. The rest are truncated to the per-input token
+        limit and packed into requests under ``max_batch_tokens``. Up to
+        ``max_concurrency`` requests run at once; rate-limited and transient
+        failures are retried with exponential backoff.
+
+        Args:
+            texts: List of input texts
+            max_inputs: Maximum inputs per request
+            on_batch: Awaited with (indices, embeddings) for cache hits and
+                      then as each request succeeds, e.g. to write results
+                      back while other requests are still in flight
+
+        Returns:
+            List of embedding vectors in input order (None for failures)
+        """
+        if not self.enabled:
+            logger.debug("Embedding generation disabled (no API key)")
+            return [None] * len(texts)
+
+        truncated = [self.truncate(text) for text in texts]
+        keys = [self.cache_key(text) for text in truncated]
+        found = await self.cache.get_many(keys)
+        results: List[Optional[List[float]]] = [
+            list(found[key]) if key in found else None for key in keys
+        ]
+
+        positions: Dict[str, List[int]] = {}
+        for index, key in enumerate(keys):
+            positions.setdefault(key, []).append(index)
+
+        hit_indices = [index for index, key in enumerate(keys) if key in found]
+        if hit_indices and on_batch is not None:
+            await on_batch(hit_indices, [results[index] for index in hit_indices])
+
+        pending = self._pending_by_key(keys, truncated, found)
+        pending_keys = list(pending)
+        batches = self.pack_batches([pending[key] for key in pending_keys], max_inputs)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_batch(batch: List[int]) -> None:
+            batch_keys = [pending_keys[i] for i in batch]
+            async with semaphore:
+                try:
+                    embeddings = await self._request_embeddings([pending[key] for key in batch_keys])
+                except Exception as e:
+                    logger.error(f"Failed to generate batch embeddings ({len(batch)} texts): {e}")
+                    return
+
+            await self.cache.put_many(dict(zip(batch_keys, embeddings)))
+
+            indices: List[int] = []
+            batch_embeddings: List[List[float]] = []
+            for key, embedding in zip(batch_keys, embeddings):
+                for index in positions[key]:
+                    results[index] = embedding
+                    indices.append(index)
+                    batch_embeddings.append(embedding)
+            if on_batch is not None:
+                await on_batch(indices, batch_embeddings)
+
+        await asyncio.gather(*(run_batch(batch) for batch in batches))
+
+        logger.info(
+            f"Generated {sum(1 for e in results if e is not None)}/{len(texts)} embeddings "
+            f"({len(hit_indices)} cached) in {len(batches)} requests"
+        )
+        return results
+
+    async def _request_embeddings(self, inputs: List[str]) -> List[List[float]]:
+        """One embeddings request, retried with backoff on retryable errors"""
+        attempt = 0
+        while True:
+            try:
+                response = await self.async_client.embeddings.create(
+                    model=self.model, input=inputs, dimensions=self.dimensions
+                )
+                ordered = sorted(response.data, key=lambda item: item.index)
+                return [item.embedding for item in ordered]
+
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(e, attempt)
+                attempt += 1
+                logger.warning(
+                    f"Embedding request failed ({type(e).__name__}), "
+                    f"retry {attempt}/{self.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Backoff delay: the server's Retry-After if given, else exponential with jitter"""
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+
+        delay = self.retry_base_delay * (2 ** attempt)
+        return min(60.0, delay + random.uniform(0, delay / 2))
+
+    @staticmethod
+    def pattern_text(pattern: Dict[str, Any]) -> str:
+        """
+        Combine pattern name, description, and context into a single text
 
         Args:
             pattern: Pattern dictionary with name, description, context
 
         Returns:
-            Embedding vector or None
+            Combined text (empty if the pattern has no text fields)
         """
-        # Combine pattern fields for embedding
         text_parts = []
 
         if "name" in pattern and pattern["name"]:
@@ -147,7 +437,21 @@ class EmbeddingGenerator:
         if "context" in pattern and pattern["context"]:
             text_parts.append(f"Context: {pattern['context']}")
 
-        combined_text = "\n".join(text_parts)
+        return "\n".join(text_parts)
+
+    def generate_pattern_embedding(self, pattern: Dict[str, Any]) -> Optional[List[float]]:
+        """
+        Generate embedding for a pattern
+
+        Combines pattern name, description, and context into a single text
+
+        Args:
+            pattern: Pattern dictionary with name, description, context
+
+        Returns:
+            Embedding vector or None
+        """
+        combined_text = self.pattern_text(pattern)
 
         if not combined_text:
             logger.warning("Pattern has no text fields for embedding")
@@ -155,6 +459,24 @@ class EmbeddingGenerator:
 
         return self.generate_embedding(combined_text)
 
+    async def generate_pattern_embedding_async(self, pattern: Dict[str, Any]) -> Optional[List[float]]:
+        """
+        Generate embedding for a pattern without blocking the event loop
+
+        Args:
+            pattern: Pattern dictionary with name, description, context
+
+        Returns:
+            Embedding vector or None
+        """
+        combined_text = self.pattern_text(pattern)
+
+        if not combined_text:
+            logger.warning("Pattern has no text fields for embedding")
+            return None
+
+        return await self.generate_embedding_async(combined_text)
+
     def calculate_similarity(
         self, embedding1: List[float], embedding2: List[float]
     ) -> float:
@@ -169,8 +491,6 @@ class EmbeddingGenerator:
             Similarity score (0-1, higher is more similar)
         """
         try:
-            import numpy as np
-
             vec1 = np.array(embedding1)
             vec2 = np.array(embedding2)
 
@@ -191,6 +511,96 @@ class EmbeddingGenerator:
             logger.error(f"Failed to calculate similarity: {e}")
             return 0.0
 
+    def top_k_similar(
+        self,
+        queries: Any,
+        matrix: np.ndarray,
+        k: int = 10,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the ``k`` most similar candidates for one or many queries
+
+        One matrix multiply against a matrix from build_normalized_matrix, then
+        ``argpartition`` (O(n)) for the top k and a sort of only those k.
+
+        Args:
+            queries: Query embedding (1-D) or matrix of query embeddings (2-D)
+            matrix: Row-normalized float32 candidate matrix
+            k: Number of results per query
+
+        Returns:
+            (indices, scores) with shape (k,) for a single query or
+            (queries, k) for a matrix, best match first. Scores are cosine
+            similarities.
+        """
+        single = np.ndim(queries) == 1
+        query_matrix = normalize_rows(np.atleast_2d(np.asarray(queries, dtype=np.float32)))
+
+        scores = query_matrix @ matrix.T
+        k = max(0, min(k, scores.shape[1]))
+        if k < scores.shape[1]:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k] if k else scores[:, :0].astype(np.intp)
+        else:
+            top = np.tile(np.arange(scores.shape[1]), (scores.shape[0], 1))
+
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        indices = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        if single:
+            return indices[0], top_scores[0]
+        return indices, top_scores
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (all-zero rows stay zero)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def build_normalized_matrix(embeddings: Sequence[Sequence[float]]) -> np.ndarray:
+    """
+    Build the candidate matrix for EmbeddingGenerator.top_k_similar
+
+    Args:
+        embeddings: Candidate embedding vectors, all the same length
+
+    Returns:
+        C-contiguous float32 matrix with unit-length rows
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a sequence of equal-length vectors, got shape {matrix.shape}")
+    return np.ascontiguousarray(normalize_rows(matrix), dtype=np.float32)
+
+
+def save_normalized_matrix(path: str, matrix: np.ndarray, ids: Optional[Sequence[Any]] = None) -> None:
+    """
+    Persist a normalized matrix (and optional row ids) as a .npz file
+
+    Args:
+        path: Output file path
+        matrix: Matrix from build_normalized_matrix
+        ids: Identifier for each row (e.g. pattern ids)
+    """
+    np.savez(path, matrix=matrix, ids=np.asarray(ids if ids is not None else np.arange(len(matrix))))
+
+
+def load_normalized_matrix(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load a matrix saved by save_normalized_matrix
+
+    Args:
+        path: .npz file path
+
+    Returns:
+        (matrix, ids)
+    """
+    with np.load(path, allow_pickle=False) as data:
+        return data["matrix"], data["ids"]
+
 
 # Singleton instance
 _embedding_generator: Optional[EmbeddingGenerator] = None
@@ -204,6 +614,13 @@ def get_embedding_generator() -> EmbeddingGenerator:
     return _embedding_generator
 
 
+def get_embedding_cache_stats() -> Optional[Dict[str, Any]]:
+    """Embedding cache counters, or None if no generator has been created yet"""
+    if _embedding_generator is None:
+        return None
+    return _embedding_generator.cache.stats()
+
+
 async def generate_and_store_embeddings(
     db_manager,
     batch_size: int = 50,
@@ -214,7 +631,8 @@ async def generate_and_store_embeddings(
 
     Args:
         db_manager: DatabaseManager instance
-        batch_size: Number of patterns to process at once
+        batch_size: Maximum patterns per embeddings request (requests are
+                    also capped by token budget)
         max_patterns: Maximum patterns to process in one run
 
     Returns:
@@ -229,6 +647,9 @@ async def generate_and_store_embeddings(
             "processed": 0,
         }
 
+    if EmbeddingCache.wants_postgres_store():
+        generator.cache.attach_store(PostgresEmbeddingStore(db_manager))
+
     # Get patterns without embeddings
     patterns = await db_manager.get_patterns_without_embeddings(limit=max_patterns)
 
@@ -241,44 +662,35 @@ async def generate_and_store_embeddings(
 
     logger.info(f"Generating embeddings for {len(patterns)} patterns")
 
-    # Generate embeddings in batches
+    # Same text as generate_pattern_embedding, so both share cache entries
+    texts = [generator.pattern_text(p) for p in patterns]
     processed = 0
     failed = 0
 
-    for i in range(0, len(patterns), batch_size):
-        batch = patterns[i : i + batch_size]
-
-        # Prepare texts for batch embedding
-        texts = [
-            f"Pattern: {p['name']}\nDescription: {p['description']}\nContext: {p['context']}"
-            for p in batch
-        ]
-
-        # Generate embeddings
-        embeddings = generator.generate_embeddings_batch(texts, batch_size=batch_size)
-
-        # Store embeddings
-        for pattern, embedding in zip(batch, embeddings):
-            if embedding:
-                try:
-                    await db_manager.update_pattern_embedding(
-                        pattern["id"], embedding
-                    )
-                    processed += 1
-                except Exception as e:
-                    logger.error(
-                        f"Failed to store embedding for pattern {pattern['id']}: {e}"
-                    )
-                    failed += 1
-            else:
-                failed += 1
+    async def store_batch(indices: List[int], embeddings: List[List[float]]) -> None:
+        # One bulk UPDATE per request, written while other requests are in flight
+        nonlocal processed, failed
+        try:
+            await db_manager.update_pattern_embeddings(
+                [patterns[i]["id"] for i in indices], embeddings
+            )
+            processed += len(indices)
+        except Exception as e:
+            logger.error(f"Failed to store {len(indices)} embeddings: {e}")
+            failed += len(indices)
 
         logger.info(f"Processed batch: {processed} success, {failed} failed")
 
+    embeddings = await generator.generate_embeddings_async(
+        texts, max_inputs=batch_size, on_batch=store_batch
+    )
+    failed += sum(1 for embedding in embeddings if embedding is None)
+
     return {
         "success": True,
         "message": f"Generated embeddings for {processed} patterns",
         "processed": processed,
         "failed": failed,
         "total": len(patterns),
+        "cache": generator.cache.stats(),
     }
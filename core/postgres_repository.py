@@ -5,8 +5,12 @@ Provides data access layer for all knowledge base operations using PostgreSQL.
 Replaces the JSON-based KnowledgeBaseManager.
 """
 
+import os
+import time
+import uuid
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Iterable, AsyncIterable, Union
 from datetime import datetime
 import json
 
@@ -19,196 +23,873 @@ from schemas.knowledge_base_v2 import (
     LessonLearned,
     ReusableComponent,
     TestingInfo,
-    SecurityInfo
+    SecurityInfo,
+    component_signature
 )
-from core.database import DatabaseManager
+from core.database import DatabaseManager, UnitOfWork, register_statement, abatched
 
 logger = logging.getLogger(__name__)
 
 
+# Hot read queries, registered so DatabaseManager prepares them once per
+# pooled connection and reports them by name in query metrics
+
+BULK_PATTERNS_SQL = register_statement("repository.bulk_patterns", """
+    SELECT repo_id, name
+    FROM (
+        SELECT repo_id, name, created_at,
+               ROW_NUMBER() OVER (PARTITION BY repo_id ORDER BY created_at DESC) AS rn
+        FROM patterns
+        WHERE repo_id = ANY($1::int[])
+    ) ranked
+    WHERE rn <= 50
+    ORDER BY repo_id, created_at DESC
+""")
+
+BULK_DECISIONS_SQL = register_statement("repository.bulk_decisions", """
+    SELECT repo_id, what
+    FROM (
+        SELECT repo_id, what, created_at,
+               ROW_NUMBER() OVER (PARTITION BY repo_id ORDER BY created_at DESC) AS rn
+        FROM technical_decisions
+        WHERE repo_id = ANY($1::int[])
+    ) ranked
+    WHERE rn <= 20
+    ORDER BY repo_id, created_at DESC
+""")
+
+BULK_COMPONENTS_SQL = register_statement("repository.bulk_components", """
+    SELECT
+        repo_id, name, description, location, language,
+        component_id, component_type, api_signature, imports, keywords,
+        lines_of_code, cyclomatic_complexity, public_methods,
+        first_seen, derived_from, sync_status
+    FROM (
+        SELECT
+            repo_id, name, purpose as description, location, language,
+            component_id, component_type, api_signature, imports, keywords,
+            lines_of_code, cyclomatic_complexity, public_methods,
+            first_seen, derived_from, sync_status, created_at,
+            ROW_NUMBER() OVER (PARTITION BY repo_id ORDER BY created_at DESC) AS rn
+        FROM reusable_components
+        WHERE repo_id = ANY($1::int[])
+    ) ranked
+    WHERE rn <= 20
+    ORDER BY repo_id, created_at DESC
+""")
+
+BULK_KEYWORDS_SQL = register_statement("repository.bulk_keywords", """
+    SELECT repo_id, keyword
+    FROM (
+        SELECT repo_id, keyword,
+               ROW_NUMBER() OVER (PARTITION BY repo_id ORDER BY keyword) AS rn
+        FROM (
+            SELECT DISTINCT p.repo_id, k.keyword
+            FROM keywords k
+            JOIN pattern_keywords pk ON pk.keyword_id = k.id
+            JOIN patterns p ON p.id = pk.pattern_id
+            WHERE p.repo_id = ANY($1::int[])
+        ) distinct_keywords
+    ) ranked
+    WHERE rn <= 50
+""")
+
+BULK_DEPLOYMENTS_SQL = register_statement("repository.bulk_deployments", """
+    SELECT DISTINCT ON (repo_id)
+        repo_id, description, commands, environment_variables
+    FROM deployment_scripts
+    WHERE repo_id = ANY($1::int[])
+    ORDER BY repo_id, created_at DESC
+""")
+
+BULK_DEPENDENCIES_SQL = register_statement("repository.bulk_dependencies", """
+    SELECT repo_id, dependency_name, dependency_type
+    FROM dependencies
+    WHERE repo_id = ANY($1::int[])
+""")
+
+ALL_REPOSITORIES_SQL = register_statement("repository.all", """
+    SELECT id, name, problem_domain, last_analyzed, last_commit_sha,
+           created_at, updated_at
+    FROM repositories
+    ORDER BY name
+""")
+
+REPO_PATTERNS_SQL = register_statement("repository.patterns", """
+    SELECT name
+    FROM patterns
+    WHERE repo_id = $1
+    ORDER BY created_at DESC
+    LIMIT 50
+""")
+
+REPO_DECISIONS_SQL = register_statement("repository.decisions", """
+    SELECT what
+    FROM technical_decisions
+    WHERE repo_id = $1
+    ORDER BY created_at DESC
+    LIMIT 20
+""")
+
+REPO_COMPONENTS_SQL = register_statement("repository.components", """
+    SELECT
+        name, purpose as description, location, language,
+        component_id, component_type, api_signature, imports, keywords,
+        lines_of_code, cyclomatic_complexity, public_methods,
+        first_seen, derived_from, sync_status
+    FROM reusable_components
+    WHERE repo_id = $1
+    ORDER BY created_at DESC
+    LIMIT 20
+""")
+
+REPO_KEYWORDS_SQL = register_statement("repository.keywords", """
+    SELECT DISTINCT k.keyword
+    FROM keywords k
+    JOIN pattern_keywords pk ON pk.keyword_id = k.id
+    JOIN patterns p ON p.id = pk.pattern_id
+    WHERE p.repo_id = $1
+    LIMIT 50
+""")
+
+REPO_ROW_SQL = register_statement(
+    "repository.row",
+    "SELECT problem_domain, last_analyzed, last_commit_sha FROM repositories WHERE id = $1"
+)
+
+REPO_DEPLOYMENT_SQL = register_statement("repository.deployment", """
+    SELECT description, commands, environment_variables
+    FROM deployment_scripts
+    WHERE repo_id = $1
+    ORDER BY created_at DESC
+    LIMIT 1
+""")
+
+REPO_DEPENDENCIES_SQL = register_statement("repository.dependencies", """
+    SELECT dependency_name, dependency_type
+    FROM dependencies
+    WHERE repo_id = $1
+""")
+
+REPOSITORY_ID_BY_NAME_SQL = register_statement(
+    "repository.id_by_name",
+    "SELECT id FROM repositories WHERE name = $1"
+)
+
+REPOSITORY_BY_NAME_SQL = register_statement(
+    "repository.by_name",
+    "SELECT id, updated_at FROM repositories WHERE name = $1"
+)
+
+# Component row insert (PostgresRepository.COMPONENT_COLUMNS order)
+COMPONENT_INSERT_SQL = """
+    INSERT INTO reusable_components (
+        repo_id, name, purpose, location,
+        component_id, component_type, language,
+        api_signature, imports, keywords,
+        lines_of_code, cyclomatic_complexity, public_methods,
+        first_seen, derived_from, sync_status,
+        created_at, updated_at
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, NOW(), NOW())
+"""
+
+# Neither technical_decisions nor deployment_scripts has a unique constraint
+# to conflict on: decisions are inserted only if missing, and the deployment
+# upsert updates the repository's row and inserts only when none was updated
+DECISION_INSERT_SQL = """
+    INSERT INTO technical_decisions (repo_id, what, created_at)
+    SELECT $1::int, $2::text, NOW()
+    WHERE NOT EXISTS (
+        SELECT 1 FROM technical_decisions
+        WHERE repo_id = $1::int AND what = $2::text
+    )
+"""
+
+DEPLOYMENT_UPSERT_SQL = """
+    WITH updated AS (
+        UPDATE deployment_scripts SET
+            description = $3::text,
+            commands = $4::jsonb,
+            environment_variables = $5::jsonb
+        WHERE repo_id = $1::int AND name = $2::varchar
+        RETURNING id
+    )
+    INSERT INTO deployment_scripts (
+        repo_id, name, description, commands, environment_variables
+    )
+    SELECT $1::int, $2::varchar, $3::text, $4::jsonb, $5::jsonb
+    WHERE NOT EXISTS (SELECT 1 FROM updated)
+"""
+
+
 class PostgresRepository:
     """
     PostgreSQL-based repository for knowledge base operations.
     Provides the same interface as KnowledgeBaseManager but uses PostgreSQL.
     """
 
-    def __init__(self, db_manager: DatabaseManager):
+    # reusable_components columns written by add_or_update_components and bulk saves
+    COMPONENT_COLUMNS = [
+        "repo_id", "name", "purpose", "location",
+        "component_id", "component_type", "language",
+        "api_signature", "imports", "keywords",
+        "lines_of_code", "cyclomatic_complexity", "public_methods",
+        "first_seen", "derived_from", "sync_status",
+    ]
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        snapshot_ttl: Optional[float] = None,
+        invalidation_channel: Optional[str] = None,
+    ):
         """
         Initialize PostgreSQL repository
 
         Args:
             db_manager: DatabaseManager instance for database operations
+            snapshot_ttl: Seconds a cached knowledge base snapshot stays valid
+                          (defaults to KB_SNAPSHOT_TTL_SECONDS env var, 300).
+                          0 disables the snapshot cache.
+            invalidation_channel: Postgres LISTEN/NOTIFY channel used to drop
+                                  snapshots on other instances after a write
+                                  (defaults to KB_INVALIDATION_CHANNEL env var,
+                                  disabled when unset)
         """
         self.db = db_manager
 
-    async def get_all_repositories(self) -> Dict[str, RepositoryMetadata]:
+        # Knowledge base snapshot cache, keyed by a version bumped on every write
+        self.snapshot_ttl = (
+            snapshot_ttl
+            if snapshot_ttl is not None
+            else float(os.getenv("KB_SNAPSHOT_TTL_SECONDS", "300"))
+        )
+        self.invalidation_channel = invalidation_channel or os.getenv("KB_INVALIDATION_CHANNEL")
+        self.instance_id = uuid.uuid4().hex
+        self._kb_version = 0
+        self._snapshot: Optional[KnowledgeBaseV2] = None
+        self._snapshot_version = -1
+        self._snapshot_loaded_at = 0.0
+        self._snapshot_lock: Optional[asyncio.Lock] = None
+        self._snapshot_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+        self._listener_connection = None
+        # Called with (repository_name, components) after component writes commit
+        self._component_listeners: List[Callable[[str, List[Any]], Any]] = []
+
+        # Per-table row counts and timings of the most recent bulk save
+        self.last_save_report: Optional[Dict[str, Any]] = None
+
+    async def get_all_repositories(self, bulk: bool = True) -> Dict[str, RepositoryMetadata]:
         """
         Load all repositories from PostgreSQL
 
+        Args:
+            bulk: Load all repositories with a fixed number of set-based queries
+                  (default). When False, falls back to the per-repository loader
+                  which issues roughly 8 queries per repository.
+
         Returns:
             Dictionary mapping repository names to RepositoryMetadata objects
         """
         try:
-            query = """
-                SELECT id, name, problem_domain, last_analyzed, created_at, updated_at
-                FROM repositories
-                ORDER BY name
-            """
-            rows = await self.db.fetch(query)
+            return await self._fetch_all_repositories(bulk)
 
-            repositories = {}
-            for row in rows:
-                repo_name = row['name']
-
-                # Get latest patterns for this repository
-                latest_patterns = await self._get_latest_patterns(row['id'])
-
-                # Get deployment info
-                deployment = await self._get_deployment_info(row['id'])
-
-                # Get dependency info
-                dependencies = await self._get_dependency_info(row['id'])
-
-                # Create RepositoryMetadata object
-                repo_info = RepositoryMetadata(
-                    latest_patterns=latest_patterns,
-                    deployment=deployment,
-                    dependencies=dependencies,
-                    testing=TestingInfo(),
-                    security=SecurityInfo(),
-                    history=[],
-                    last_updated=row['updated_at']
-                )
+        except Exception as e:
+            logger.error(f"Failed to load repositories: {e}")
+            return {}
 
-                repositories[repo_name] = repo_info
+    async def _fetch_all_repositories(self, bulk: bool = True) -> Dict[str, RepositoryMetadata]:
+        rows = await self.db.fetch(ALL_REPOSITORIES_SQL)
 
-            return repositories
+        if bulk:
+            return await self._load_repositories_bulk(rows)
 
-        except Exception as e:
-            logger.error(f"Failed to load repositories: {e}")
+        repositories = {}
+        for row in rows:
+            repo_name = row['name']
+
+            # Get latest patterns for this repository
+            latest_patterns = await self._get_latest_patterns(row['id'])
+
+            # Get deployment info
+            deployment = await self._get_deployment_info(row['id'])
+
+            # Get dependency info
+            dependencies = await self._get_dependency_info(row['id'])
+
+            # Create RepositoryMetadata object
+            repo_info = RepositoryMetadata(
+                latest_patterns=latest_patterns,
+                deployment=deployment,
+                dependencies=dependencies,
+                testing=TestingInfo(),
+                security=SecurityInfo(),
+                history=[],
+                last_updated=row['updated_at']
+            )
+
+            repositories[repo_name] = repo_info
+
+        return repositories
+
+    async def _load_repositories_bulk(self, repo_rows: List[Any]) -> Dict[str, RepositoryMetadata]:
+        """
+        Assemble RepositoryMetadata for many repositories using set-based queries
+
+        Fetches patterns, decisions, components, keywords, deployment scripts and
+        dependencies for every repository in ``repo_rows`` with one query per
+        table (``= ANY($1)``), so the round-trip count is constant regardless of
+        how many repositories exist. Per-repository limits match the
+        per-repository loader (50 patterns, 20 decisions, 20 components,
+        50 keywords, latest deployment script).
+
+        Args:
+            repo_rows: Rows from the repositories table (id, name, problem_domain,
+                       last_analyzed, last_commit_sha, updated_at)
+
+        Returns:
+            Dictionary mapping repository names to RepositoryMetadata objects
+        """
+        if not repo_rows:
             return {}
 
-    async def load_knowledge_base(self) -> KnowledgeBaseV2:
+        repo_ids = [row['id'] for row in repo_rows]
+
+        pattern_rows = await self.db.fetch(BULK_PATTERNS_SQL, repo_ids)
+        decision_rows = await self.db.fetch(BULK_DECISIONS_SQL, repo_ids)
+        component_rows = await self.db.fetch(BULK_COMPONENTS_SQL, repo_ids)
+        keyword_rows = await self.db.fetch(BULK_KEYWORDS_SQL, repo_ids)
+        deployment_rows = await self.db.fetch(BULK_DEPLOYMENTS_SQL, repo_ids)
+        dependency_rows = await self.db.fetch(BULK_DEPENDENCIES_SQL, repo_ids)
+
+        patterns_by_repo = self._group_by_repo(pattern_rows)
+        decisions_by_repo = self._group_by_repo(decision_rows)
+        components_by_repo = self._group_by_repo(component_rows)
+        keywords_by_repo = self._group_by_repo(keyword_rows)
+        dependencies_by_repo = self._group_by_repo(dependency_rows)
+        deployment_by_repo = {row['repo_id']: row for row in deployment_rows}
+
+        repositories = {}
+        for row in repo_rows:
+            repo_id = row['id']
+            repositories[row['name']] = RepositoryMetadata(
+                latest_patterns=self._build_pattern_entry(
+                    row,
+                    patterns_by_repo.get(repo_id, []),
+                    decisions_by_repo.get(repo_id, []),
+                    components_by_repo.get(repo_id, []),
+                    keywords_by_repo.get(repo_id, [])
+                ),
+                deployment=self._build_deployment_info(deployment_by_repo.get(repo_id)),
+                dependencies=self._build_dependency_info(dependencies_by_repo.get(repo_id, [])),
+                testing=TestingInfo(),
+                security=SecurityInfo(),
+                history=[],
+                last_updated=row['updated_at']
+            )
+
+        return repositories
+
+    async def load_knowledge_base(self, use_cache: bool = True) -> KnowledgeBaseV2:
         """
         Load complete knowledge base from PostgreSQL
         Compatible with old KnowledgeBaseManager.load_knowledge_base()
 
+        Served from the in-process snapshot while it matches the current KB
+        version and is younger than ``snapshot_ttl``. Callers always receive
+        their own copy, so mutating it never touches the cached snapshot.
+
+        Args:
+            use_cache: Set False to bypass the snapshot and read from PostgreSQL
+
         Returns:
             KnowledgeBaseV2 object
         """
-        repositories = await self.get_all_repositories()
+        use_cache = use_cache and self.snapshot_ttl > 0
+
+        if use_cache and self._snapshot_is_fresh():
+            self._snapshot_stats["hits"] += 1
+            return self._snapshot.model_copy(deep=True)
+
+        if not use_cache:
+            return await self._build_knowledge_base()
+
+        if self._snapshot_lock is None:
+            self._snapshot_lock = asyncio.Lock()
+
+        async with self._snapshot_lock:
+            # Another task may have rebuilt the snapshot while we waited
+            if self._snapshot_is_fresh():
+                self._snapshot_stats["hits"] += 1
+                return self._snapshot.model_copy(deep=True)
+
+            self._snapshot_stats["misses"] += 1
+            version = self._kb_version
+            kb = await self._build_knowledge_base()
+
+            # Skip caching failed loads and loads that raced with a write
+            if version == self._kb_version and "load_error" not in kb.metadata:
+                self._snapshot = kb.model_copy(deep=True)
+                self._snapshot_version = version
+                self._snapshot_loaded_at = time.monotonic()
+
+            return kb
+
+    async def _build_knowledge_base(self) -> KnowledgeBaseV2:
+        """Read the complete knowledge base from PostgreSQL"""
         now = datetime.now()
-        return KnowledgeBaseV2(
+        metadata: Dict[str, str] = {}
+        try:
+            repositories = await self._fetch_all_repositories()
+        except Exception as e:
+            logger.error(f"Failed to load repositories: {e}")
+            repositories = {}
+            metadata["load_error"] = str(e)
+
+        kb = KnowledgeBaseV2(
             schema_version="2.0",
             repositories=repositories,
             created_at=now,
-            last_updated=now
+            last_updated=now,
+            metadata=metadata
+        )
+        # Baseline for change tracking, so save_knowledge_base writes only deltas
+        kb.mark_clean()
+        return kb
+
+    # Snapshot cache management
+
+    @property
+    def kb_version(self) -> int:
+        """Monotonically increasing knowledge base version, bumped on every write"""
+        return self._kb_version
+
+    def _snapshot_is_fresh(self) -> bool:
+        """Whether the cached snapshot matches the current version and TTL"""
+        return (
+            self._snapshot is not None
+            and self._snapshot_version == self._kb_version
+            and time.monotonic() - self._snapshot_loaded_at < self.snapshot_ttl
         )
 
-    async def save_knowledge_base(self, kb: KnowledgeBaseV2) -> bool:
+    def invalidate(self) -> None:
+        """
+        Drop the cached knowledge base snapshot and bump the KB version
+
+        Safe to call at any time; the next load_knowledge_base() reads from
+        PostgreSQL. Also invoked when another instance publishes a write on
+        the invalidation channel.
+        """
+        self._kb_version += 1
+        self._snapshot = None
+        self._snapshot_stats["invalidations"] += 1
+
+    async def _record_write(self) -> None:
+        """Invalidate the local snapshot and notify other instances of a write"""
+        self.invalidate()
+
+        if not self.invalidation_channel:
+            return
+
+        try:
+            await self.db.execute(
+                "SELECT pg_notify($1, $2)",
+                self.invalidation_channel,
+                self.instance_id
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish KB invalidation on '{self.invalidation_channel}': {e}")
+
+    def on_components_changed(self, callback: Callable[[str, Dict[str, str]], Any]) -> None:
+        """
+        Register a callback for committed component writes
+
+        Args:
+            callback: Called with (repository_name, {component_id: content
+                      signature}) once a write replacing a repository's
+                      components has committed
+        """
+        self._component_listeners.append(callback)
+
+    def _notify_components_changed(self, repository_name: str, signatures: Dict[str, str]) -> None:
+        """Run the component listeners, logging instead of raising on failure"""
+        for callback in self._component_listeners:
+            try:
+                callback(repository_name, signatures)
+            except Exception as e:
+                logger.warning(f"Component change listener failed for {repository_name}: {e}")
+
+    def _on_invalidation_notice(self, connection, pid, channel, payload) -> None:
+        """asyncpg LISTEN callback: drop the snapshot when another instance wrote"""
+        if payload == self.instance_id:
+            return
+        logger.info(f"KB snapshot invalidated by notification on '{channel}'")
+        self.invalidate()
+
+    async def start_invalidation_listener(self) -> bool:
+        """
+        LISTEN on the invalidation channel so writes from other instances drop
+        this instance's snapshot
+
+        Holds one dedicated pool connection until stop_invalidation_listener().
+
+        Returns:
+            True if the listener is active, False otherwise
+        """
+        if not self.invalidation_channel or self._listener_connection is not None:
+            return self._listener_connection is not None
+
+        if not self.db.enabled or self.db.pool is None:
+            logger.warning("Cannot start KB invalidation listener: database not connected")
+            return False
+
+        try:
+            connection = await self.db.pool.acquire()
+            await connection.add_listener(self.invalidation_channel, self._on_invalidation_notice)
+            self._listener_connection = connection
+            logger.info(f"Listening for KB invalidations on '{self.invalidation_channel}'")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to start KB invalidation listener: {e}")
+            return False
+
+    async def stop_invalidation_listener(self) -> None:
+        """Stop listening for invalidations and release the dedicated connection"""
+        connection = self._listener_connection
+        if connection is None:
+            return
+
+        self._listener_connection = None
+        try:
+            await connection.remove_listener(self.invalidation_channel, self._on_invalidation_notice)
+        finally:
+            await self.db.pool.release(connection)
+
+    def snapshot_status(self) -> Dict[str, Any]:
+        """
+        Get knowledge base snapshot cache statistics
+
+        Returns:
+            Dictionary with version, freshness and hit/miss/invalidation counters
+        """
+        age = (
+            time.monotonic() - self._snapshot_loaded_at
+            if self._snapshot is not None
+            else None
+        )
+        return {
+            "enabled": self.snapshot_ttl > 0,
+            "kb_version": self._kb_version,
+            "cached": self._snapshot_is_fresh(),
+            "age_seconds": round(age, 3) if age is not None else None,
+            "ttl_seconds": self.snapshot_ttl,
+            "invalidation_channel": self.invalidation_channel,
+            "listening": self._listener_connection is not None,
+            **self._snapshot_stats,
+        }
+
+    async def save_knowledge_base(
+        self,
+        kb: KnowledgeBaseV2,
+        single_transaction: bool = False,
+        only_changed: bool = True
+    ) -> bool:
         """
         Save complete knowledge base to PostgreSQL
         Persists all repositories, patterns, decisions, components, etc.
 
+        Uses the batched persistence path (see bulk_save_knowledge_base). The
+        per-table report of the last save is kept in ``last_save_report``.
+
         Args:
             kb: KnowledgeBaseV2 object to save
+            single_transaction: Save the whole KB atomically instead of one
+                                transaction per repository
+            only_changed: For a KB returned by load_knowledge_base(), write only
+                          the repositories and sections changed since it was
+                          loaded
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            logger.info(f"[SAVE_KB] Starting knowledge base save with {len(kb.repositories)} repositories")
+            report = await self.bulk_save_knowledge_base(
+                kb, single_transaction=single_transaction, only_changed=only_changed
+            )
+            return not (single_transaction and report["repositories"]["failed"])
 
-            # Save each repository and its metadata
-            for repo_name, repo_metadata in kb.repositories.items():
-                try:
-                    # Ensure repository exists and get ID
-                    repo_id = await self._ensure_repository(repo_name)
-
-                    # Save latest patterns
-                    latest = repo_metadata.latest_patterns
-                    if latest:
-                        # Save patterns
-                        for pattern in latest.patterns:
-                            await self.db.execute(
-                                """
-                                INSERT INTO patterns (repo_id, name, created_at)
-                                VALUES ($1, $2, NOW())
-                                ON CONFLICT (repo_id, name) DO NOTHING
-                                """,
-                                repo_id,
-                                pattern
-                            )
-
-                        # Save technical decisions
-                        for decision in latest.decisions:
-                            await self.db.execute(
-                                """
-                                INSERT INTO technical_decisions (repo_id, what, created_at)
-                                VALUES ($1, $2, NOW())
-                                ON CONFLICT (repo_id, what) DO NOTHING
-                                """,
-                                repo_id,
-                                decision
-                            )
-
-                        # Save keywords
-                        for keyword in latest.keywords:
-                            # Get or create keyword
-                            kw_row = await self.db.fetchrow(
-                                "SELECT id FROM keywords WHERE keyword = $1",
-                                keyword
-                            )
-                            kw_id = kw_row['id'] if kw_row else None
-
-                            if not kw_id:
-                                kw_row = await self.db.fetchrow(
-                                    "INSERT INTO keywords (keyword) VALUES ($1) RETURNING id",
-                                    keyword
-                                )
-                                kw_id = kw_row['id']
-
-                        # Save commit SHA if available
-                        if latest.commit_sha and latest.commit_sha != "unknown":
-                            await self.db.execute(
-                                """
-                                UPDATE repositories
-                                SET last_commit_sha = $1, last_analyzed = NOW()
-                                WHERE id = $2
-                                """,
-                                latest.commit_sha,
-                                repo_id
-                            )
-
-                    # Save components (if any)
-                    if repo_metadata.components:
-                        await self.add_or_update_components(repo_name, repo_metadata.components)
-
-                    # Save lessons learned
-                    for lesson in repo_metadata.deployment.lessons_learned:
-                        await self.add_lesson_learned(repo_name, lesson)
-
-                    # Save dependency info
-                    if repo_metadata.dependencies:
-                        await self.update_dependency_info(repo_name, repo_metadata.dependencies)
-
-                    # Save deployment info
-                    if repo_metadata.deployment:
-                        await self.add_deployment_info(repo_name, repo_metadata.deployment)
-
-                    logger.info(f"[SAVE_KB] Saved repository: {repo_name}")
+        except Exception as e:
+            logger.error(f"[SAVE_KB] Failed to save knowledge base: {e}", exc_info=True)
+            return False
+
+    async def bulk_save_knowledge_base(
+        self,
+        kb: KnowledgeBaseV2,
+        single_transaction: bool = False,
+        only_changed: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Persist a knowledge base with batched statements on one connection
+
+        Each repository (or, with ``single_transaction``, the whole KB) is
+        written in one transaction. Patterns, decisions, keywords and deployment
+        info are inserted with ``executemany``, skipping or updating rows that
+        already exist; components and dependencies are replaced and re-loaded
+        with ``COPY``.
+
+        When the KB carries a change-tracking baseline (set by
+        load_knowledge_base) and ``only_changed`` is True, only repositories
+        and sections whose content changed since the baseline are written.
 
+        Args:
+            kb: KnowledgeBaseV2 object to save
+            single_transaction: Save the whole KB atomically instead of one
+                                transaction per repository. A failure then
+                                rolls back every repository.
+            only_changed: Write only changed repositories/sections of a
+                          tracked KB
+
+        Returns:
+            Report with saved/failed/unchanged repositories and per-table row
+            counts and timings (seconds)
+        """
+        started = time.perf_counter()
+        report: Dict[str, Any] = {
+            "mode": "single_transaction" if single_transaction else "per_repository",
+            "repositories": {"saved": 0, "failed": [], "unchanged": 0},
+            "tables": {},
+            "total_seconds": 0.0,
+        }
+
+        changes = kb.changed_sections() if only_changed else None
+        if changes is None:
+            items = list(kb.repositories.items())
+        else:
+            items = [(name, kb.repositories[name]) for name in changes]
+            report["repositories"]["unchanged"] = len(kb.repositories) - len(items)
+            report["changed_sections"] = {name: sorted(sections) for name, sections in changes.items()}
+
+        if not items:
+            logger.info("[SAVE_KB] No changes since knowledge base was loaded, nothing to save")
+            self.last_save_report = report
+            return report
+
+        logger.info(f"[SAVE_KB] Starting knowledge base save with {len(items)} repositories ({report['mode']})")
+        saved_names: List[str] = []
+
+        async with self.db.acquire() as conn:
+            if single_transaction:
+                try:
+                    async with conn.transaction():
+                        await self._save_repositories_batch(conn, items, report, changes)
+                    report["repositories"]["saved"] = len(items)
+                    saved_names = [name for name, _ in items]
                 except Exception as e:
-                    logger.error(f"[SAVE_KB] Failed to save repository {repo_name}: {e}", exc_info=True)
-                    # Continue with next repository instead of failing entirely
-                    continue
+                    logger.error(f"[SAVE_KB] Knowledge base save rolled back: {e}", exc_info=True)
+                    report["repositories"]["failed"] = [name for name, _ in items]
+            else:
+                for item in items:
+                    try:
+                        async with conn.transaction():
+                            await self._save_repositories_batch(conn, [item], report, changes)
+                        report["repositories"]["saved"] += 1
+                        saved_names.append(item[0])
+                    except Exception as e:
+                        logger.error(f"[SAVE_KB] Failed to save repository {item[0]}: {e}", exc_info=True)
+                        # Continue with next repository instead of failing entirely
+                        report["repositories"]["failed"].append(item[0])
+
+        if saved_names:
+            for name in saved_names:
+                if changes is None or "components" in changes.get(name, ()):
+                    self._notify_components_changed(
+                        name, {c.component_id: component_signature(c) for c in kb.repositories[name].components}
+                    )
+            kb.mark_clean(saved_names)
+            await self._record_write()
+
+        report["total_seconds"] = round(time.perf_counter() - started, 4)
+        for stats in report["tables"].values():
+            stats["seconds"] = round(stats["seconds"], 4)
+        self.last_save_report = report
+
+        logger.info(
+            f"[SAVE_KB] Saved {report['repositories']['saved']}/{len(items)} repositories "
+            f"in {report['total_seconds']}s: "
+            + ", ".join(f"{table}={stats['rows']}" for table, stats in report["tables"].items())
+        )
+        return report
 
-            logger.info("[SAVE_KB] Knowledge base saved successfully")
-            return True
+    async def _save_repositories_batch(
+        self,
+        conn: Any,
+        items: List[Any],
+        report: Dict[str, Any],
+        changes: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Write a batch of (repository_name, RepositoryMetadata) pairs on ``conn``
 
-        except Exception as e:
-            logger.error(f"[SAVE_KB] Failed to save knowledge base: {e}", exc_info=True)
-            return False
+        Must run inside a transaction; every table is written with a fixed
+        number of statements regardless of how many repositories are in the
+        batch. With ``changes`` (repository -> changed section names), sections
+        that did not change are skipped.
+        """
+        def record(table: str, rows: int, since: float) -> None:
+            if rows or table in report["tables"]:
+                stats = report["tables"].setdefault(table, {"rows": 0, "seconds": 0.0})
+                stats["rows"] += rows
+                stats["seconds"] += time.perf_counter() - since
+
+        def changed(section: str) -> List[Any]:
+            if changes is None:
+                return items
+            return [(name, metadata) for name, metadata in items if section in changes.get(name, ())]
+
+        names = [name for name, _ in items]
+
+        # Repositories: create missing rows, then resolve ids in one query
+        since = time.perf_counter()
+        await conn.execute(
+            """
+            INSERT INTO repositories (name, created_at, updated_at)
+            SELECT name, NOW(), NOW() FROM unnest($1::text[]) AS t(name)
+            ON CONFLICT (name) DO NOTHING
+            """,
+            names
+        )
+        id_rows = await conn.fetch("SELECT id, name FROM repositories WHERE name = ANY($1::text[])", names)
+        repo_ids = {row['name']: row['id'] for row in id_rows}
+
+        commit_rows = [
+            (metadata.latest_patterns.commit_sha, repo_ids[name])
+            for name, metadata in changed("patterns")
+            if metadata.latest_patterns
+            and metadata.latest_patterns.commit_sha
+            and metadata.latest_patterns.commit_sha != "unknown"
+        ]
+        if commit_rows:
+            await conn.executemany(
+                "UPDATE repositories SET last_commit_sha = $1, last_analyzed = NOW() WHERE id = $2",
+                commit_rows
+            )
+        record("repositories", len(items), since)
+
+        # Patterns, decisions and keywords from latest_patterns
+        pattern_rows = []
+        decision_rows = []
+        keyword_links = []
+        for name, metadata in changed("patterns"):
+            latest = metadata.latest_patterns
+            if not latest:
+                continue
+            repo_id = repo_ids[name]
+            pattern_rows.extend((repo_id, pattern) for pattern in dict.fromkeys(latest.patterns))
+            decision_rows.extend((repo_id, decision) for decision in dict.fromkeys(latest.decisions))
+            keyword_links.extend((repo_id, keyword) for keyword in dict.fromkeys(latest.keywords))
+
+        since = time.perf_counter()
+        if pattern_rows:
+            await conn.executemany(
+                """
+                INSERT INTO patterns (repo_id, name, created_at)
+                VALUES ($1, $2, NOW())
+                ON CONFLICT (repo_id, name) DO NOTHING
+                """,
+                pattern_rows
+            )
+        record("patterns", len(pattern_rows), since)
+
+        since = time.perf_counter()
+        if decision_rows:
+            await conn.executemany(DECISION_INSERT_SQL, decision_rows)
+        record("technical_decisions", len(decision_rows), since)
+
+        since = time.perf_counter()
+        keywords = sorted({keyword for _, keyword in keyword_links})
+        if keywords:
+            await conn.executemany(
+                "INSERT INTO keywords (keyword) VALUES ($1) ON CONFLICT (keyword) DO NOTHING",
+                [(keyword,) for keyword in keywords]
+            )
+        record("keywords", len(keywords), since)
+
+        # Components: replace per repository, reload with COPY
+        since = time.perf_counter()
+        component_items = changed("components")
+        component_repo_ids = [repo_ids[name] for name, metadata in component_items if metadata.components]
+        now = datetime.now()
+        component_records = [
+            (*self._component_record(repo_ids[name], name, component), now, now)
+            for name, metadata in component_items
+            for component in metadata.components
+        ]
+        if component_repo_ids:
+            await conn.execute(
+                "DELETE FROM reusable_components WHERE repo_id = ANY($1::int[])",
+                component_repo_ids
+            )
+            await conn.copy_records_to_table(
+                "reusable_components",
+                records=component_records,
+                columns=self.COMPONENT_COLUMNS + ["created_at", "updated_at"]
+            )
+        record("reusable_components", len(component_records), since)
+
+        # Lessons learned: skip lessons already recorded for the repository
+        since = time.perf_counter()
+        lesson_rows = [
+            (repo_ids[name], lesson.lesson[:500], lesson.context, lesson.category, lesson.severity, lesson.timestamp)
+            for name, metadata in changed("lessons_learned")
+            for lesson in metadata.deployment.lessons_learned
+        ]
+        if lesson_rows:
+            await conn.executemany(
+                """
+                INSERT INTO lessons_learned (
+                    repo_id, title, description, category, impact, date, created_at
+                )
+                SELECT $1::int, $2::varchar, $3::text, $4::varchar, $5::varchar, $6::timestamptz, NOW()
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM lessons_learned
+                    WHERE repo_id = $1::int AND title = $2::varchar AND date = $6::timestamptz
+                )
+                """,
+                lesson_rows
+            )
+        record("lessons_learned", len(lesson_rows), since)
+
+        # Dependencies: replace per repository, reload with COPY
+        since = time.perf_counter()
+        dependency_items = changed("dependencies")
+        dependency_records = [
+            (repo_ids[name], dep_name, dep_type)
+            for name, metadata in dependency_items
+            for dep_name, dep_type in self._dependency_rows(metadata.dependencies)
+        ]
+        if dependency_items:
+            await conn.execute(
+                "DELETE FROM dependencies WHERE repo_id = ANY($1::int[])",
+                [repo_ids[name] for name, _ in dependency_items]
+            )
+        if dependency_records:
+            await conn.copy_records_to_table(
+                "dependencies",
+                records=dependency_records,
+                columns=["repo_id", "dependency_name", "dependency_type"]
+            )
+        record("dependencies", len(dependency_records), since)
+
+        # Deployment info: one upserted deployment_scripts row per repository
+        since = time.perf_counter()
+        deployment_rows = [
+            (repo_ids[name], *self._deployment_values(metadata.deployment))
+            for name, metadata in changed("deployment")
+        ]
+        if deployment_rows:
+            await conn.executemany(DEPLOYMENT_UPSERT_SQL, deployment_rows)
+        record("deployment_scripts", len(deployment_rows), since)
 
     async def get_repository_info(self, repository_name: str) -> Optional[RepositoryMetadata]:
         """
@@ -221,8 +902,7 @@ class PostgresRepository:
             RepositoryMetadata object or None if not found
         """
         try:
-            query = "SELECT id, updated_at FROM repositories WHERE name = $1"
-            row = await self.db.fetchrow(query, repository_name)
+            row = await self.db.fetchrow(REPOSITORY_BY_NAME_SQL, repository_name)
 
             if not row:
                 return None
@@ -252,7 +932,8 @@ class PostgresRepository:
     async def add_lesson_learned(
         self,
         repository_name: str,
-        lesson: LessonLearned
+        lesson: LessonLearned,
+        uow: Optional[UnitOfWork] = None
     ) -> bool:
         """
         Add a lesson learned to a repository
@@ -260,31 +941,34 @@ class PostgresRepository:
         Args:
             repository_name: Repository name (format: "owner/repo")
             lesson: LessonLearned object
+            uow: Open unit of work to join (optional)
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Ensure repository exists
-            repo_id = await self._ensure_repository(repository_name)
-
-            # Insert lesson learned
-            query = """
-                INSERT INTO lessons_learned (
-                    repo_id, title, description, category, impact, date, created_at
+            async with self.db.transaction(uow) as tx:
+                # Ensure repository exists
+                repo_id = await self._ensure_repository(repository_name, tx)
+
+                # Insert lesson learned
+                query = """
+                    INSERT INTO lessons_learned (
+                        repo_id, title, description, category, impact, date, created_at
+                    )
+                    VALUES ($1, $2, $3, $4, $5, $6, NOW())
+                """
+
+                await tx.execute(
+                    query,
+                    repo_id,
+                    lesson.lesson[:500],  # Use lesson text as title
+                    lesson.context,
+                    lesson.category,
+                    lesson.severity,
+                    lesson.timestamp
                 )
-                VALUES ($1, $2, $3, $4, $5, $6, NOW())
-            """
-
-            await self.db.execute(
-                query,
-                repo_id,
-                lesson.lesson[:500],  # Use lesson text as title
-                lesson.context,
-                lesson.category,
-                lesson.severity,
-                lesson.timestamp
-            )
+                tx.after_commit(self._record_write)
 
             logger.info(f"Added lesson learned for {repository_name}")
             return True
@@ -296,60 +980,47 @@ class PostgresRepository:
     async def update_dependency_info(
         self,
         repository_name: str,
-        dependency_info: DependencyInfo
+        dependency_info: DependencyInfo,
+        uow: Optional[UnitOfWork] = None
     ) -> bool:
         """
         Update dependency information for a repository
 
+        The existing rows are replaced in one transaction, so readers never see
+        a partially rewritten dependency list.
+
         Args:
             repository_name: Repository name (format: "owner/repo")
             dependency_info: DependencyInfo object
+            uow: Open unit of work to join (optional)
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            repo_id = await self._ensure_repository(repository_name)
-
-            # Delete existing dependencies
-            await self.db.execute(
-                "DELETE FROM dependencies WHERE repo_id = $1",
-                repo_id
-            )
-
-            # Insert consumers
-            for consumer in dependency_info.consumers:
-                await self.db.execute(
-                    """
-                    INSERT INTO dependencies (repo_id, dependency_name, dependency_type)
-                    VALUES ($1, $2, 'consumer')
-                    """,
-                    repo_id,
-                    consumer.get('repository', consumer.get('name', 'unknown'))
-                )
+            async with self.db.transaction(uow) as tx:
+                repo_id = await self._ensure_repository(repository_name, tx)
 
-            # Insert derivatives
-            for derivative in dependency_info.derivatives:
-                await self.db.execute(
-                    """
-                    INSERT INTO dependencies (repo_id, dependency_name, dependency_type)
-                    VALUES ($1, $2, 'derivative')
-                    """,
-                    repo_id,
-                    derivative.get('repository', derivative.get('name', 'unknown'))
+                # Delete existing dependencies
+                await tx.execute(
+                    "DELETE FROM dependencies WHERE repo_id = $1",
+                    repo_id
                 )
 
-            # Insert external dependencies
-            for external in dependency_info.external_dependencies:
-                dep_name = external if isinstance(external, str) else external.get('name', 'unknown')
-                await self.db.execute(
-                    """
-                    INSERT INTO dependencies (repo_id, dependency_name, dependency_type)
-                    VALUES ($1, $2, 'external')
-                    """,
-                    repo_id,
-                    dep_name
-                )
+                # Insert consumers, derivatives and external dependencies
+                rows = [
+                    (repo_id, dep_name, dep_type)
+                    for dep_name, dep_type in self._dependency_rows(dependency_info)
+                ]
+                if rows:
+                    await tx.executemany(
+                        """
+                        INSERT INTO dependencies (repo_id, dependency_name, dependency_type)
+                        VALUES ($1, $2, $3)
+                        """,
+                        rows
+                    )
+                tx.after_commit(self._record_write)
 
             logger.info(f"Updated dependency info for {repository_name}")
             return True
@@ -361,7 +1032,8 @@ class PostgresRepository:
     async def add_deployment_info(
         self,
         repository_name: str,
-        deployment_info: DeploymentInfo
+        deployment_info: DeploymentInfo,
+        uow: Optional[UnitOfWork] = None
     ) -> bool:
         """
         Add deployment information for a repository
@@ -369,6 +1041,7 @@ class PostgresRepository:
         Args:
             repository_name: Repository name (format: "owner/repo")
             deployment_info: DeploymentInfo object
+            uow: Open unit of work to join (optional)
 
         Returns:
             True if successful, False otherwise
@@ -377,31 +1050,19 @@ class PostgresRepository:
             logger.info(f"[ADD_DEPLOYMENT] Starting for repository: {repository_name}")
             logger.info(f"[ADD_DEPLOYMENT] Database manager enabled: {self.db.enabled}, pool: {self.db.pool is not None}")
 
-            repo_id = await self._ensure_repository(repository_name)
-            logger.info(f"[ADD_DEPLOYMENT] Repository ID: {repo_id}")
+            async with self.db.transaction(uow) as tx:
+                repo_id = await self._ensure_repository(repository_name, tx)
+                logger.info(f"[ADD_DEPLOYMENT] Repository ID: {repo_id}")
 
-            # Store deployment info as JSON in deployment_scripts table
-            # (This is a simplified approach - could be expanded to use dedicated tables)
-            query = """
-                INSERT INTO deployment_scripts (
-                    repo_id, name, description, commands, environment_variables
+                # Store deployment info as JSON in deployment_scripts table
+                # (This is a simplified approach - could be expanded to use dedicated tables)
+                logger.info(f"[ADD_DEPLOYMENT] Executing deployment info insert for repo_id {repo_id}")
+                await tx.execute(
+                    DEPLOYMENT_UPSERT_SQL,
+                    repo_id,
+                    *self._deployment_values(deployment_info)
                 )
-                VALUES ($1, $2, $3, $4, $5)
-                ON CONFLICT (repo_id, name) DO UPDATE SET
-                    description = EXCLUDED.description,
-                    commands = EXCLUDED.commands,
-                    environment_variables = EXCLUDED.environment_variables
-            """
-
-            logger.info(f"[ADD_DEPLOYMENT] Executing deployment info insert for repo_id {repo_id}")
-            await self.db.execute(
-                query,
-                repo_id,
-                deployment_info.ci_cd_platform or "deployment",
-                json.dumps(deployment_info.infrastructure or {}),
-                json.dumps(deployment_info.scripts or []),
-                json.dumps({})  # environment_variables
-            )
+                tx.after_commit(self._record_write)
 
             logger.info(f"[ADD_DEPLOYMENT] Successfully added deployment info for {repository_name}")
             return True
@@ -410,13 +1071,19 @@ class PostgresRepository:
             logger.error(f"[ADD_DEPLOYMENT] Failed to add deployment info for {repository_name}: {e}", exc_info=True)
             return False
 
-    async def add_repository(self, name: str, problem_domain: str = "") -> int:
+    async def add_repository(
+        self,
+        name: str,
+        problem_domain: str = "",
+        uow: Optional[UnitOfWork] = None
+    ) -> int:
         """
         Add a new repository to the database
 
         Args:
             name: Repository name (format: "owner/repo")
             problem_domain: Problem domain or description (optional)
+            uow: Open unit of work to join (optional)
 
         Returns:
             Repository ID
@@ -428,7 +1095,12 @@ class PostgresRepository:
                 VALUES ($1, $2, NOW(), NOW())
                 RETURNING id
             """
-            row = await self.db.fetchrow(query, name, problem_domain)
+            if uow is not None:
+                row = await uow.fetchrow(query, name, problem_domain)
+                uow.after_commit(self._record_write)
+            else:
+                row = await self.db.fetchrow(query, name, problem_domain)
+                await self._record_write()
             repo_id = row['id']
             logger.info(f"[ADD_REPO] Repository '{name}' added with ID {repo_id}")
             return repo_id
@@ -440,113 +1112,111 @@ class PostgresRepository:
     async def add_or_update_components(
         self,
         repository_name: str,
-        components: List[Any]  # List of Component objects
+        components: List[Any],  # List of Component objects
+        uow: Optional[UnitOfWork] = None
     ) -> bool:
         """
         Add or update components for a repository in the database
 
+        The existing rows are replaced in one transaction, so readers never see
+        a partially rewritten component list.
+
         Args:
             repository_name: Repository name (format: "owner/repo")
             components: List of Component objects to persist
+            uow: Open unit of work to join (optional)
 
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if not components:
-                logger.info(f"No components to save for {repository_name}")
-                return True
+        return await self.save_components_stream(repository_name, components, uow=uow) is not None
 
-            # Ensure repository exists
-            repo_id = await self._ensure_repository(repository_name)
+    async def save_components_stream(
+        self,
+        repository_name: str,
+        components: Union[Iterable[Any], AsyncIterable[Any]],
+        batch_size: int = 500,
+        uow: Optional[UnitOfWork] = None
+    ) -> Optional[int]:
+        """
+        Replace a repository's components from a (possibly async) stream
 
-            # Delete existing components for this repository
-            await self.db.execute(
-                "DELETE FROM reusable_components WHERE repo_id = $1",
-                repo_id
-            )
+        The stream is consumed before the transaction opens, so whatever
+        produces it (scanning, vectorization) never holds a connection idle in
+        transaction. Only the row values are staged: components are released
+        batch by batch. The rewrite is then one short transaction, a DELETE
+        plus batch_size-row INSERTs: readers see the previous components until
+        it commits, and an empty stream leaves them untouched.
 
-            # Insert new components with all available fields
-            query = """
-                INSERT INTO reusable_components (
-                    repo_id, name, purpose, location,
-                    component_id, component_type, language,
-                    api_signature, imports, keywords,
-                    lines_of_code, cyclomatic_complexity, public_methods,
-                    first_seen, derived_from, sync_status,
-                    created_at, updated_at
-                )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, NOW(), NOW())
-            """
+        Args:
+            repository_name: Repository name (format: "owner/repo")
+            components: Component objects to persist
+            batch_size: Rows per INSERT batch
+            uow: Open unit of work to join (optional)
 
-            for component in components:
-                # Use first file as location, or component name if no files
-                location = (
-                    component.files[0]
-                    if (hasattr(component, 'files') and component.files)
-                    else getattr(component, 'name', 'unknown')
-                )
+        Returns:
+            Number of components written, or None if the write failed
+        """
+        try:
+            staged: List[tuple] = []
+            signatures: Dict[str, str] = {}
+            async for batch in abatched(components, batch_size):
+                staged.extend(self._component_values(repository_name, component) for component in batch)
+                signatures.update((c.component_id, component_signature(c)) for c in batch)
 
-                # Prepare all fields from Component object
-                component_id = getattr(component, 'component_id', f"{repository_name}/{getattr(component, 'name', 'unknown')}")
-                name = getattr(component, 'name', str(component))
-                description = getattr(component, 'description', '')
-                component_type = getattr(component, 'component_type', 'unknown')
-                language = getattr(component, 'language', 'unknown')
-                api_signature = getattr(component, 'api_signature', None)
-                imports = json.dumps(getattr(component, 'imports', []))
-                keywords = json.dumps(getattr(component, 'keywords', []))
-                lines_of_code = getattr(component, 'lines_of_code', 0)
-                cyclomatic_complexity = getattr(component, 'cyclomatic_complexity', None)
-                public_methods = json.dumps(getattr(component, 'public_methods', []))
-                first_seen = getattr(component, 'first_seen', datetime.now())
-                derived_from = getattr(component, 'derived_from', None)
-                sync_status = getattr(component, 'sync_status', 'unknown')
-
-                await self.db.execute(
-                    query,
-                    repo_id,
-                    name,
-                    description,
-                    location,
-                    component_id,
-                    component_type,
-                    language,
-                    api_signature,
-                    imports,
-                    keywords,
-                    lines_of_code,
-                    cyclomatic_complexity,
-                    public_methods,
-                    first_seen,
-                    derived_from,
-                    sync_status
+            if not staged:
+                logger.info(f"No components to save for {repository_name}")
+                return 0
+
+            async with self.db.transaction(uow) as tx:
+                # Ensure repository exists and replace its components
+                repo_id = await self._ensure_repository(repository_name, tx)
+                await tx.execute(
+                    "DELETE FROM reusable_components WHERE repo_id = $1",
+                    repo_id
                 )
+                for start in range(0, len(staged), batch_size):
+                    await tx.executemany(
+                        COMPONENT_INSERT_SQL,
+                        [(repo_id, *values) for values in staged[start:start + batch_size]]
+                    )
 
-            logger.info(f"Saved {len(components)} components for {repository_name}")
-            return True
+                tx.after_commit(self._record_write)
+
+                async def notify_listeners() -> None:
+                    self._notify_components_changed(repository_name, signatures)
+
+                tx.after_commit(notify_listeners)
+
+            logger.info(f"Saved {len(staged)} components for {repository_name}")
+            return len(staged)
 
         except Exception as e:
             logger.error(f"Failed to save components for {repository_name}: {e}", exc_info=True)
-            return False
+            return None
 
     # Helper methods
 
-    async def _ensure_repository(self, repository_name: str) -> int:
+    async def _ensure_repository(
+        self,
+        repository_name: str,
+        uow: Optional[UnitOfWork] = None
+    ) -> int:
         """
         Ensure repository exists in database, create if not
 
         Args:
             repository_name: Repository name (format: "owner/repo")
+            uow: Open unit of work to run on (optional)
 
         Returns:
             Repository ID
         """
+        db = uow or self.db
         try:
             # Check if exists
-            query = "SELECT id FROM repositories WHERE name = $1"
             logger.info(f"[ENSURE_REPO] Checking if repository '{repository_name}' exists")
-            row = await self.db.fetchrow(query, repository_name)
+            row = await db.fetchrow(REPOSITORY_ID_BY_NAME_SQL, repository_name)
 
             if row:
                 logger.info(f"[ENSURE_REPO] Repository '{repository_name}' already exists with ID {row['id']}")
@@ -559,7 +1229,7 @@ class PostgresRepository:
                 VALUES ($1, NOW(), NOW())
                 RETURNING id
             """
-            row = await self.db.fetchrow(query, repository_name)
+            row = await db.fetchrow(query, repository_name)
             logger.info(f"[ENSURE_REPO] Repository '{repository_name}' created with ID {row['id']}")
             return row['id']
         except Exception as e:
@@ -570,40 +1240,147 @@ class PostgresRepository:
         """Get latest patterns for a repository"""
         try:
             # Get patterns as simple strings
-            patterns_query = """
-                SELECT name
-                FROM patterns
-                WHERE repo_id = $1
-                ORDER BY created_at DESC
-                LIMIT 50
-            """
-            pattern_rows = await self.db.fetch(patterns_query, repo_id)
-            patterns = [row['name'] for row in pattern_rows]
+            pattern_rows = await self.db.fetch(REPO_PATTERNS_SQL, repo_id)
 
             # Get technical decisions as simple strings
-            decisions_query = """
-                SELECT what
-                FROM technical_decisions
-                WHERE repo_id = $1
-                ORDER BY created_at DESC
-                LIMIT 20
-            """
-            decision_rows = await self.db.fetch(decisions_query, repo_id)
-            decisions = [row['what'] for row in decision_rows]
+            decision_rows = await self.db.fetch(REPO_DECISIONS_SQL, repo_id)
 
             # Get reusable components with extended schema
-            components_query = """
-                SELECT
-                    name, purpose as description, location, language,
-                    component_id, component_type, api_signature, imports, keywords,
-                    lines_of_code, cyclomatic_complexity, public_methods,
-                    first_seen, derived_from, sync_status
-                FROM reusable_components
-                WHERE repo_id = $1
-                ORDER BY created_at DESC
-                LIMIT 20
-            """
-            component_rows = await self.db.fetch(components_query, repo_id)
+            component_rows = await self.db.fetch(REPO_COMPONENTS_SQL, repo_id)
+
+            # Get keywords
+            keyword_rows = await self.db.fetch(REPO_KEYWORDS_SQL, repo_id)
+
+            # Get repository info for additional fields
+            repo_row = await self.db.fetchrow(REPO_ROW_SQL, repo_id)
+
+            return self._build_pattern_entry(
+                repo_row, pattern_rows, decision_rows, component_rows, keyword_rows
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to get latest patterns: {e}")
+            return self._empty_pattern_entry()
+
+    async def _get_deployment_info(self, repo_id: int) -> DeploymentInfo:
+        """Get deployment info for a repository"""
+        try:
+            row = await self.db.fetchrow(REPO_DEPLOYMENT_SQL, repo_id)
+            return self._build_deployment_info(row)
+
+        except Exception as e:
+            logger.error(f"Failed to get deployment info: {e}")
+            return DeploymentInfo()
+
+    async def _get_dependency_info(self, repo_id: int) -> DependencyInfo:
+        """Get dependency info for a repository"""
+        try:
+            rows = await self.db.fetch(REPO_DEPENDENCIES_SQL, repo_id)
+            return self._build_dependency_info(rows)
+
+        except Exception as e:
+            logger.error(f"Failed to get dependency info: {e}")
+            return DependencyInfo()
+
+    # Model-to-row helpers shared by the single-repository writers and bulk saves
+
+    @staticmethod
+    def _component_record(repo_id: int, repository_name: str, component: Any) -> tuple:
+        """Build a reusable_components row (COMPONENT_COLUMNS order) from a Component"""
+        return (repo_id, *PostgresRepository._component_values(repository_name, component))
+
+    @staticmethod
+    def _component_values(repository_name: str, component: Any) -> tuple:
+        """Build a reusable_components row without its leading repo_id"""
+        # Use first file as location, or component name if no files
+        location = (
+            component.files[0]
+            if (hasattr(component, 'files') and component.files)
+            else getattr(component, 'name', 'unknown')
+        )
+
+        return (
+            getattr(component, 'name', str(component)),
+            getattr(component, 'description', ''),
+            location,
+            getattr(component, 'component_id', f"{repository_name}/{getattr(component, 'name', 'unknown')}"),
+            getattr(component, 'component_type', 'unknown'),
+            getattr(component, 'language', 'unknown'),
+            getattr(component, 'api_signature', None),
+            json.dumps(getattr(component, 'imports', [])),
+            json.dumps(getattr(component, 'keywords', [])),
+            getattr(component, 'lines_of_code', 0),
+            getattr(component, 'cyclomatic_complexity', None),
+            json.dumps(getattr(component, 'public_methods', [])),
+            getattr(component, 'first_seen', datetime.now()),
+            getattr(component, 'derived_from', None),
+            getattr(component, 'sync_status', 'unknown'),
+        )
+
+    @staticmethod
+    def _dependency_rows(dependency_info: DependencyInfo) -> List[tuple]:
+        """Flatten DependencyInfo into (dependency_name, dependency_type) rows"""
+        def related_name(relationship: Any) -> str:
+            if isinstance(relationship, dict):
+                return relationship.get('repository', relationship.get('name', 'unknown'))
+            return getattr(relationship, 'target_repo', 'unknown')
+
+        rows = [(related_name(consumer), 'consumer') for consumer in dependency_info.consumers]
+        rows.extend((related_name(derivative), 'derivative') for derivative in dependency_info.derivatives)
+        rows.extend(
+            (external if isinstance(external, str) else external.get('name', 'unknown'), 'external')
+            for external in dependency_info.external_dependencies
+        )
+        return rows
+
+    @staticmethod
+    def _deployment_values(deployment_info: DeploymentInfo) -> tuple:
+        """Build (name, description, commands, environment_variables) for deployment_scripts"""
+        scripts = [
+            script.model_dump(mode='json') if hasattr(script, 'model_dump') else script
+            for script in (deployment_info.scripts or [])
+        ]
+        return (
+            deployment_info.ci_cd_platform or "deployment",
+            json.dumps(deployment_info.infrastructure or {}),
+            json.dumps(scripts),
+            json.dumps({}),  # environment_variables
+        )
+
+    # Row-to-model builders shared by the per-repository and bulk loaders
+
+    @staticmethod
+    def _group_by_repo(rows: List[Any]) -> Dict[int, List[Any]]:
+        """Group rows by their repo_id column, preserving query order"""
+        grouped: Dict[int, List[Any]] = {}
+        for row in rows:
+            grouped.setdefault(row['repo_id'], []).append(row)
+        return grouped
+
+    @staticmethod
+    def _empty_pattern_entry() -> PatternEntry:
+        """Placeholder PatternEntry used when pattern data cannot be loaded"""
+        return PatternEntry(
+            patterns=[],
+            decisions=[],
+            reusable_components=[],
+            dependencies=[],
+            problem_domain="",
+            keywords=[],
+            analyzed_at=datetime.now(),
+            commit_sha="unknown"
+        )
+
+    def _build_pattern_entry(
+        self,
+        repo_row: Optional[Any],
+        pattern_rows: List[Any],
+        decision_rows: List[Any],
+        component_rows: List[Any],
+        keyword_rows: List[Any]
+    ) -> PatternEntry:
+        """Build a PatternEntry from already-fetched rows"""
+        try:
             components = [
                 ReusableComponent(
                     name=row['name'],
@@ -616,64 +1393,32 @@ class PostgresRepository:
                 for row in component_rows
             ]
 
-            # Get keywords
-            keywords_query = """
-                SELECT DISTINCT k.keyword
-                FROM keywords k
-                JOIN pattern_keywords pk ON pk.keyword_id = k.id
-                JOIN patterns p ON p.id = pk.pattern_id
-                WHERE p.repo_id = $1
-                LIMIT 50
-            """
-            keyword_rows = await self.db.fetch(keywords_query, repo_id)
-            keywords = [row['keyword'] for row in keyword_rows]
-
-            # Get repository info for additional fields
-            repo_query = "SELECT problem_domain, last_analyzed, last_commit_sha FROM repositories WHERE id = $1"
-            repo_row = await self.db.fetchrow(repo_query, repo_id)
             problem_domain = repo_row['problem_domain'] if repo_row else ""
             analyzed_at = repo_row['last_analyzed'] if repo_row else datetime.now()
             commit_sha = repo_row['last_commit_sha'] if repo_row else ""
 
             return PatternEntry(
-                patterns=patterns,
-                decisions=decisions,
+                patterns=[row['name'] for row in pattern_rows],
+                decisions=[row['what'] for row in decision_rows],
                 reusable_components=components,
                 dependencies=[],  # Handled separately
                 problem_domain=problem_domain or "",
-                keywords=keywords,
+                keywords=[row['keyword'] for row in keyword_rows],
                 analyzed_at=analyzed_at,
                 commit_sha=commit_sha or "unknown"
             )
 
         except Exception as e:
-            logger.error(f"Failed to get latest patterns: {e}")
-            return PatternEntry(
-                patterns=[],
-                decisions=[],
-                reusable_components=[],
-                dependencies=[],
-                problem_domain="",
-                keywords=[],
-                analyzed_at=datetime.now(),
-                commit_sha="unknown"
-            )
+            logger.error(f"Failed to build latest patterns: {e}")
+            return self._empty_pattern_entry()
 
-    async def _get_deployment_info(self, repo_id: int) -> DeploymentInfo:
-        """Get deployment info for a repository"""
-        try:
-            query = """
-                SELECT description, commands, environment_variables
-                FROM deployment_scripts
-                WHERE repo_id = $1
-                ORDER BY created_at DESC
-                LIMIT 1
-            """
-            row = await self.db.fetchrow(query, repo_id)
-
-            if not row:
-                return DeploymentInfo()
+    @staticmethod
+    def _build_deployment_info(row: Optional[Any]) -> DeploymentInfo:
+        """Build DeploymentInfo from the latest deployment_scripts row"""
+        if not row:
+            return DeploymentInfo()
 
+        try:
             infrastructure = json.loads(row['description']) if row['description'] else {}
             scripts = json.loads(row['commands']) if row['commands'] else []
 
@@ -686,19 +1431,13 @@ class PostgresRepository:
             )
 
         except Exception as e:
-            logger.error(f"Failed to get deployment info: {e}")
+            logger.error(f"Failed to build deployment info: {e}")
             return DeploymentInfo()
 
-    async def _get_dependency_info(self, repo_id: int) -> DependencyInfo:
-        """Get dependency info for a repository"""
+    @staticmethod
+    def _build_dependency_info(rows: List[Any]) -> DependencyInfo:
+        """Build DependencyInfo from dependencies rows"""
         try:
-            query = """
-                SELECT dependency_name, dependency_type
-                FROM dependencies
-                WHERE repo_id = $1
-            """
-            rows = await self.db.fetch(query, repo_id)
-
             consumers = []
             derivatives = []
             external_deps = []
@@ -721,7 +1460,7 @@ class PostgresRepository:
             )
 
         except Exception as e:
-            logger.error(f"Failed to get dependency info: {e}")
+            logger.error(f"Failed to build dependency info: {e}")
             return DependencyInfo()
 
     # Compatibility methods for runtime monitoring
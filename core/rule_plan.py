@@ -0,0 +1,321 @@
+"""
+Rule Execution Plans
+
+Compiles the ValidationRules of a ParsedStandard into an ExecutionPlan:
+rules grouped by the file they target, regexes compiled once, and every
+check on a file evaluated against a single read of it (YAML parsed at most
+once). Plans are cached by RuleCompiler and rebuilt only when the standard's
+source document changes.
+"""
+
+import re
+import json
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache, cached_property
+from typing import Dict, List, Optional, Any, Callable, Set
+
+import yaml
+
+from core.standards_loader import ParsedStandard, ValidationRule
+
+logger = logging.getLogger(__name__)
+
+PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str, flags: int = PATTERN_FLAGS) -> "re.Pattern[str]":
+    """
+    Compile a regex once per process
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return re.compile(pattern, flags)
+
+
+def section_pattern(section_title: str) -> "re.Pattern[str]":
+    """Regex matching a markdown heading with the given title"""
+    return compile_pattern(rf"^#+\s+{re.escape(section_title)}", re.MULTILINE)
+
+
+def yaml_field_exists(data: Any, field_path: str) -> bool:
+    """
+    Check if parsed YAML contains a field at a dot-notation path
+
+    Args:
+        data: Parsed YAML document
+        field_path: Field path (e.g., "steps.0.args")
+
+    Returns:
+        True if the field exists, False otherwise
+    """
+    if not isinstance(data, dict):
+        return False
+
+    current = data
+    for key in field_path.split("."):
+        if isinstance(current, dict) and key in current:
+            current = current[key]
+        elif isinstance(current, list):
+            try:
+                idx = int(key)
+            except ValueError:
+                return False
+            if not 0 <= idx < len(current):
+                return False
+            current = current[idx]
+        else:
+            return False
+    return True
+
+
+class FileView:
+    """One read of a file, with its YAML parsed on first use"""
+
+    def __init__(self, content: str):
+        self.content = content
+
+    @cached_property
+    def yaml(self) -> Any:
+        """Parsed YAML document, None if the content is not valid YAML"""
+        try:
+            return yaml.safe_load(self.content)
+        except yaml.YAMLError as e:
+            logger.warning(f"Invalid YAML: {e}")
+            return None
+
+
+@dataclass
+class CompiledRule:
+    """A validation rule bound to a precompiled check"""
+    index: int  # position in the standard's validation_rules
+    rule: ValidationRule
+    check: Callable[[FileView], bool]
+
+
+@dataclass
+class FilePlan:
+    """Checks targeting one file"""
+    path: str
+    exists_rules: List[int] = field(default_factory=list)
+    content_rules: List[CompiledRule] = field(default_factory=list)
+
+
+@dataclass
+class ExecutionPlan:
+    """Compiled validation rules of one standard"""
+    category: str
+    fingerprint: str
+    rule_count: int
+    files: Dict[str, FilePlan] = field(default_factory=dict)
+    invalid_rules: List[int] = field(default_factory=list)  # always fail
+
+    @property
+    def content_paths(self) -> List[str]:
+        """Files whose contents the plan reads"""
+        return [path for path, plan in self.files.items() if plan.content_rules]
+
+    def evaluate(
+        self,
+        repo_name: str,
+        scanner: Any,
+        paths: Optional[Set[str]] = None
+    ) -> List[Optional[bool]]:
+        """
+        Run the checks, reading each file at most once
+
+        Args:
+            repo_name: Repository name in format 'owner/repo'
+            scanner: Scanner with get_file_content() and file_exists()
+            paths: Only evaluate rules targeting these files (default: all)
+
+        Returns:
+            Pass/fail per rule, in the standard's rule order; None for rules
+            not evaluated because their file is not in paths
+        """
+        results: List[Optional[bool]] = [False if paths is None else None] * self.rule_count
+
+        for path, file_plan in self.files.items():
+            if paths is not None and path not in paths:
+                continue
+            for compiled in file_plan.content_rules:
+                results[compiled.index] = False
+
+            content = None
+            if file_plan.content_rules:
+                try:
+                    content = scanner.get_file_content(repo_name, path)
+                except Exception as e:
+                    logger.warning(f"Error reading {path} for {self.category} rules: {e}")
+
+            if content is not None:
+                view = FileView(content)
+                for compiled in file_plan.content_rules:
+                    try:
+                        results[compiled.index] = compiled.check(view)
+                    except Exception as e:
+                        logger.warning(f"Error checking rule {compiled.rule.rule_id}: {e}")
+
+            if file_plan.exists_rules:
+                # Readable content already proves the file exists
+                if content is not None:
+                    exists = True
+                else:
+                    try:
+                        exists = scanner.file_exists(repo_name, path)
+                    except Exception as e:
+                        logger.warning(f"Error checking {path} exists: {e}")
+                        exists = False
+                for index in file_plan.exists_rules:
+                    results[index] = exists
+
+        return results
+
+
+def standard_fingerprint(standard: ParsedStandard) -> str:
+    """Hash identifying the source of a standard's rules"""
+    if standard.content_hash:
+        return standard.content_hash
+    # Standards built in code: hash the rules themselves
+    rules = [
+        (rule.rule_id, rule.check_type, rule.check_params, rule.severity)
+        for rule in standard.validation_rules
+    ]
+    return hashlib.sha256(json.dumps(rules, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def compile_rule(rule: ValidationRule) -> Optional[Callable[[FileView], bool]]:
+    """
+    Precompiled content check of a rule
+
+    Returns:
+        Check taking a FileView, or None if the rule cannot be compiled
+
+    Raises:
+        ValueError: If the check type is unknown
+    """
+    check_type = rule.check_type
+    params = rule.check_params
+
+    if check_type == "file_contains":
+        try:
+            regex = compile_pattern(params.get("pattern", ""))
+        except re.error as e:
+            logger.warning(f"Invalid regex pattern: {params.get('pattern')}: {e}")
+            return None
+        return lambda view: regex.search(view.content) is not None
+
+    if check_type == "file_size":
+        min_size = params.get("min_size", 0)
+        return lambda view: len(view.content) >= min_size
+
+    if check_type == "section_exists":
+        regex = section_pattern(params.get("section", ""))
+        return lambda view: regex.search(view.content) is not None
+
+    if check_type == "yaml_field":
+        field_path = params.get("field", "")
+        return lambda view: yaml_field_exists(view.yaml, field_path)
+
+    raise ValueError(f"Unknown check type: {check_type}")
+
+
+def compile_standard(standard: ParsedStandard, fingerprint: Optional[str] = None) -> ExecutionPlan:
+    """
+    Compile a standard's validation rules into an execution plan
+
+    Rules that cannot be evaluated (unknown check type, no path, invalid
+    regex) are kept as always failing, as the interpreted checks did.
+
+    Args:
+        standard: Parsed standard
+        fingerprint: Precomputed standard_fingerprint()
+
+    Returns:
+        ExecutionPlan with rules grouped by target file
+    """
+    plan = ExecutionPlan(
+        category=standard.category,
+        fingerprint=fingerprint or standard_fingerprint(standard),
+        rule_count=len(standard.validation_rules),
+    )
+
+    for index, rule in enumerate(standard.validation_rules):
+        path = rule.check_params.get("path")
+        if not path:
+            logger.warning(f"Rule {rule.rule_id} has no target path")
+            plan.invalid_rules.append(index)
+            continue
+
+        file_plan = plan.files.setdefault(path, FilePlan(path=path))
+        if rule.check_type == "file_exists":
+            file_plan.exists_rules.append(index)
+            continue
+
+        try:
+            check = compile_rule(rule)
+        except ValueError as e:
+            logger.warning(str(e))
+            check = None
+        if check is None:
+            plan.invalid_rules.append(index)
+        else:
+            file_plan.content_rules.append(CompiledRule(index=index, rule=rule, check=check))
+
+    return plan
+
+
+class RuleCompiler:
+    """Cache of execution plans, one per standard category"""
+
+    def __init__(self):
+        """Initialize compiler with an empty plan cache"""
+        self._plans: Dict[str, ExecutionPlan] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "compilations": 0}
+
+    def plan_for(self, standard: ParsedStandard) -> ExecutionPlan:
+        """
+        Execution plan of a standard, compiled on first use
+
+        A cached plan is reused until the standard's fingerprint changes
+        (i.e. its source document was edited and reloaded).
+
+        Args:
+            standard: Parsed standard
+
+        Returns:
+            ExecutionPlan for the standard's current rules
+        """
+        fingerprint = standard_fingerprint(standard)
+        with self._lock:
+            plan = self._plans.get(standard.category)
+            if plan is not None and plan.fingerprint == fingerprint:
+                self._stats["hits"] += 1
+                return plan
+
+        plan = compile_standard(standard, fingerprint)
+        with self._lock:
+            self._plans[standard.category] = plan
+            self._stats["compilations"] += 1
+        logger.debug(f"Compiled {plan.rule_count} {standard.category} rules over {len(plan.files)} files")
+        return plan
+
+    def clear(self) -> None:
+        """Drop all cached plans"""
+        with self._lock:
+            self._plans.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get compiler counters
+
+        Returns:
+            Dictionary with plan cache hits, compilations and cached plans
+        """
+        with self._lock:
+            return {**self._stats, "plans": len(self._plans)}
@@ -0,0 +1,308 @@
+"""
+Scanner Cache Module
+
+Cache for RepositoryScanner / LocalCloneScanner results, so repeated
+validations do not refetch what has not changed.
+
+Entries:
+- "blob:<sha>": file contents by git blob SHA (immutable, never expire)
+- "tree:<repo>": repository structure with the ETag it was fetched with
+  (kept until evicted; the scanner revalidates it with a conditional request)
+- "path:<repo>:<path>": contents read by path before the repository was
+  scanned (expire after the TTL)
+
+Tiers:
+- In-memory LRU bounded by entry count and bytes (always on)
+- SQLite file on disk (optional), shared by every process using the same path,
+  bounded by entry count (least recently used rows and expired rows pruned)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DiskScannerStore:
+    """Persistent scanner cache tier in a local SQLite file"""
+
+    # Writes between two prunes of expired and least recently used rows
+    PRUNE_INTERVAL = 100
+
+    def __init__(self, path: str, max_entries: int = 100000):
+        """
+        Initialize disk store
+
+        Args:
+            path: SQLite database file (created if missing)
+            max_entries: Rows kept; least recently used rows beyond it are
+                         deleted, along with expired ones, every PRUNE_INTERVAL
+                         writes (shared by every process using the file)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._writes = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # Other processes may hold the write lock briefly
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scanner_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL,
+                last_used REAL
+            )
+            """
+        )
+        # Files created before entries were bounded lack last_used
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(scanner_cache)")}
+        if "last_used" not in columns:
+            self._conn.execute("ALTER TABLE scanner_cache ADD COLUMN last_used REAL")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_scanner_cache_last_used ON scanner_cache(last_used)")
+        self._conn.commit()
+        self.prune()
+
+    def get(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """Look up an unexpired entry, returning (value, expires_at)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM scanner_cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, now)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute("UPDATE scanner_cache SET last_used = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def put(self, key: str, value: Any, expires_at: Optional[float] = None) -> None:
+        """Store an entry, pruning the store every PRUNE_INTERVAL writes"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scanner_cache (key, value, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, time.time())
+            )
+            self._conn.commit()
+            self._writes += 1
+            due = self._writes % self.PRUNE_INTERVAL == 0
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Delete expired entries, then the least recently used beyond max_entries
+
+        Returns:
+            Number of rows deleted
+        """
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM scanner_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+            ).rowcount
+            excess = self._conn.execute("SELECT COUNT(*) FROM scanner_cache").fetchone()[0] - self.max_entries
+            if excess > 0:
+                deleted += self._conn.execute(
+                    "DELETE FROM scanner_cache WHERE key IN "
+                    "(SELECT key FROM scanner_cache ORDER BY last_used LIMIT ?)",
+                    (excess,)
+                ).rowcount
+            self._conn.commit()
+        return deleted
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._conn.execute("DELETE FROM scanner_cache")
+            self._conn.commit()
+
+
+class ScannerCache:
+    """Two-tier scanner cache: bounded in-memory LRU over an optional SQLite store"""
+
+    def __init__(
+        self,
+        max_entries: int = 5000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 300,
+        store: Optional[DiskScannerStore] = None
+    ):
+        """
+        Initialize scanner cache
+
+        Args:
+            max_entries: In-memory LRU capacity (0 disables the memory tier)
+            max_bytes: Maximum total (estimated) bytes of in-memory entries
+            ttl: Seconds before path-keyed contents expire and cached
+                 structures are revalidated
+            store: Persistent tier shared across processes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.store = store
+        self.bytes = 0
+        # key -> (value, size, expires_at)
+        self._entries: "OrderedDict[str, Tuple[Any, int, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "memory_hits": 0,
+            "store_hits": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "store_errors": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "ScannerCache":
+        """
+        Build a cache from SCANNER_CACHE_SIZE, SCANNER_CACHE_MAX_BYTES,
+        SCANNER_CACHE_TTL, SCANNER_CACHE_PATH (enables the disk tier) and
+        SCANNER_CACHE_DISK_MAX_ENTRIES
+        """
+        cache = cls(
+            max_entries=int(os.getenv("SCANNER_CACHE_SIZE", "5000")),
+            max_bytes=int(os.getenv("SCANNER_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            ttl=float(os.getenv("SCANNER_CACHE_TTL", "300")),
+        )
+        path = os.getenv("SCANNER_CACHE_PATH")
+        if path:
+            try:
+                cache.store = DiskScannerStore(
+                    path, max_entries=int(os.getenv("SCANNER_CACHE_DISK_MAX_ENTRIES", "100000"))
+                )
+            except Exception as e:
+                logger.warning(f"Scanner disk cache unavailable at {path}: {e}")
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, decode: Optional[Callable[[Any], Any]] = None) -> Optional[Any]:
+        """
+        Look up an entry in the memory tier, then the disk tier
+
+        Args:
+            key: Cache key
+            decode: Converts a value read from disk (its JSON form) back to
+                    the in-memory value; entries found on disk are promoted
+
+        Returns:
+            Cached value, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, _, expires_at = entry
+                if expires_at is None or expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    self._stats["memory_hits"] += 1
+                    return value
+                self._remove(key)
+                self._stats["expirations"] += 1
+
+        if self.store is not None:
+            try:
+                stored = self.store.get(key)
+            except Exception as e:
+                self._stats["store_errors"] += 1
+                logger.warning(f"Scanner cache store lookup failed: {e}")
+                stored = None
+            if stored is not None:
+                encoded, expires_at = stored
+                value = decode(encoded) if decode is not None else encoded
+                self._memory_put(key, value, len(json.dumps(encoded)), expires_at)
+                with self._lock:
+                    self._stats["hits"] += 1
+                    self._stats["store_hits"] += 1
+                return value
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        size: int,
+        ttl: Optional[float] = None,
+        encoded: Optional[Any] = None
+    ) -> None:
+        """
+        Store an entry in both tiers
+
+        Args:
+            key: Cache key
+            value: Value kept in memory
+            size: Approximate bytes the value occupies in memory
+            ttl: Seconds until the entry expires (None: never)
+            encoded: JSON-compatible form written to disk (defaults to value)
+        """
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._memory_put(key, value, size, expires_at)
+        if self.store is not None:
+            try:
+                self.store.put(key, encoded if encoded is not None else value, expires_at)
+            except Exception as e:
+                self._stats["store_errors"] += 1
+                logger.warning(f"Scanner cache store write failed: {e}")
+
+    def _memory_put(self, key: str, value: Any, size: int, expires_at: Optional[float]) -> None:
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def _remove(self, key: str) -> None:
+        self.bytes -= self._entries.pop(key)[1]
+
+    def clear(self, persistent: bool = False) -> None:
+        """Drop the memory tier, and the disk tier if ``persistent``"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+        if persistent and self.store is not None:
+            self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hits, misses, hit rate, per-tier hits, evictions,
+            expirations, memory entries and bytes against their limits and the
+            disk store path
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "store": self.store.path if self.store is not None else None,
+        }
@@ -2,18 +2,27 @@
 Standards Loader
 
 Loads and parses architectural standards documents for validation.
-Standards are loaded once at server initialization and cached in memory.
+Standards are loaded at server initialization and cached in memory, optionally
+also in a JSON file of parse results (so restarts skip parsing and network
+fetches), and can be hot-reloaded when their documents change.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import logging
 import os
+import tempfile
+import threading
 import requests
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_REMOTE_URL = "https://raw.githubusercontent.com/patelmm79/dev-nexus/main"
+
 
 @dataclass
 class ValidationRule:
@@ -36,6 +45,15 @@ class ParsedStandard:
     required_sections: Dict[str, List[str]] = field(default_factory=dict)  # file -> sections
     validation_rules: List[ValidationRule] = field(default_factory=list)
     documentation_content: str = ""
+    content_hash: str = ""  # SHA-256 of documentation_content
+
+
+class RemoteDocument(NamedTuple):
+    """Result of a (conditional) standards document fetch"""
+    content: Optional[str]  # None if not modified or failed
+    etag: Optional[str]
+    last_modified: Optional[str]
+    not_modified: bool = False
 
 
 class StandardsLoader:
@@ -44,6 +62,14 @@ class StandardsLoader:
 
     Loads standards files at initialization (read-only filesystem access).
     Standards are then used by validators via GitHub API to check repositories.
+
+    Documents missing locally are fetched from GitHub in parallel, with
+    If-None-Match / If-Modified-Since when a previous copy is known. Parsed
+    standards can be kept in a JSON cache file keyed by content hash, so a
+    restart neither re-parses unchanged documents nor waits for the network
+    when every document has a cached copy (those are revalidated in the
+    background). reload() picks up changed documents, and can run
+    periodically in a background thread.
     """
 
     # Mapping of standard category to file path
@@ -60,15 +86,56 @@ class StandardsLoader:
         "containerization": "Dockerfile",
     }
 
-    def __init__(self, repo_root: str):
+    # Bump when parsing changes, so cached parse results are discarded
+    CACHE_VERSION = 1
+
+    def __init__(
+        self,
+        repo_root: str,
+        cache_path: Optional[str] = None,
+        reload_interval: Optional[float] = None,
+        remote_url: Optional[str] = None,
+        fetch_timeout: Optional[float] = None
+    ):
         """
         Initialize standards loader
 
         Args:
             repo_root: Path to repository root directory
+            cache_path: JSON file for parsed standards (defaults to
+                        STANDARDS_CACHE_PATH env var; unset disables the cache)
+            reload_interval: Seconds between background reloads (defaults to
+                             STANDARDS_RELOAD_INTERVAL env var, 0 disables)
+            remote_url: Base URL of documents missing locally (defaults to
+                        STANDARDS_REMOTE_URL env var, dev-nexus main branch)
+            fetch_timeout: Seconds per remote fetch (defaults to
+                           STANDARDS_FETCH_TIMEOUT env var, 10)
         """
         self.repo_root = Path(repo_root)
         self.standards: Dict[str, ParsedStandard] = {}
+        self.cache_path = cache_path or os.getenv("STANDARDS_CACHE_PATH") or None
+        self.reload_interval = (
+            reload_interval if reload_interval is not None
+            else float(os.getenv("STANDARDS_RELOAD_INTERVAL", "0"))
+        )
+        self.remote_url = (remote_url or os.getenv("STANDARDS_REMOTE_URL", DEFAULT_REMOTE_URL)).rstrip("/")
+        self.fetch_timeout = fetch_timeout or float(os.getenv("STANDARDS_FETCH_TIMEOUT", "10"))
+
+        # category -> where its document came from and how to revalidate it:
+        # source ("local"/"remote"), content_hash, mtime_ns (local), etag and
+        # last_modified (remote)
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._reload_lock = threading.Lock()
+        self._stop_reload = threading.Event()
+        self._reload_thread: Optional[threading.Thread] = None
+        self._stats = {
+            "parsed": 0,
+            "cache_hits": 0,
+            "fetched": 0,
+            "not_modified": 0,
+            "fetch_errors": 0,
+            "reloads": 0,
+        }
 
         logger.info(f"Loading standards from {self.repo_root}")
         self._load_all_standards()
@@ -76,41 +143,135 @@ class StandardsLoader:
 
     def _load_all_standards(self) -> None:
         """Load and parse all standards documents"""
+        cached = self._read_cache()
+        standards: Dict[str, ParsedStandard] = {}
+        remote: List[str] = []
+
         for category, filepath in self.STANDARDS_MAPPING.items():
             try:
                 file_path = self.repo_root / filepath
-                content = None
 
                 # Try local file first
                 if file_path.exists():
                     content = file_path.read_text(encoding='utf-8')
+                    standards[category] = self._standard_for(category, content, cached.get(category))
+                    self._sources[category] = {
+                        "source": "local",
+                        "content_hash": standards[category].content_hash,
+                        "mtime_ns": file_path.stat().st_mtime_ns,
+                    }
                     logger.info(f"Loaded local standard: {category}")
-                else:
-                    # Fall back to GitHub for Cloud Run deployments
-                    logger.info(f"Local file not found, fetching from GitHub: {filepath}")
-                    content = self._fetch_standard_from_github(filepath)
-
-                if content:
-                    parsed = self._parse_standard(category, content)
-                    self.standards[category] = parsed
-                    logger.info(f"Loaded standard: {category} ({len(parsed.validation_rules)} rules)")
-                else:
-                    logger.warning(f"Could not load standard {category} from local or GitHub")
+                    continue
+
+                entry = cached.get(category)
+                if entry is not None and entry.get("source") == "remote":
+                    # Serve the cached copy now, revalidate in the background
+                    standards[category] = entry["standard"]
+                    self._sources[category] = {key: entry.get(key) for key in ("source", "content_hash", "etag", "last_modified")}
+                    self._stats["cache_hits"] += 1
+                    logger.info(f"Loaded cached standard: {category}")
+                remote.append(category)
             except Exception as e:
                 logger.error(f"Failed to load standard {category}: {e}")
 
-    def _fetch_standard_from_github(self, filepath: str) -> Optional[str]:
+        # Fall back to GitHub for Cloud Run deployments; only documents with
+        # no cached copy hold up startup
+        missing = [category for category in remote if category not in standards]
+        if missing:
+            logger.info(f"Local files not found, fetching from GitHub: {', '.join(missing)}")
+            standards.update(self._load_remote(missing))
+        for category in self.STANDARDS_MAPPING:
+            if category not in standards:
+                logger.warning(f"Could not load standard {category} from local or GitHub")
+
+        self.standards = self._ordered(standards)
+        self._write_cache()
+
+        revalidate = len(remote) > len(missing)
+        if revalidate or self.reload_interval > 0:
+            self.start_auto_reload(initial=revalidate)
+
+    def _standard_for(
+        self,
+        category: str,
+        content: str,
+        cached: Optional[Dict[str, Any]] = None
+    ) -> ParsedStandard:
+        """Parsed standard for a document, reusing the cached parse if the content is unchanged"""
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        if cached is not None and cached.get("standard") is not None and cached.get("content_hash") == content_hash:
+            self._stats["cache_hits"] += 1
+            return cached["standard"]
+
+        parsed = self._parse_standard(category, content)
+        self._stats["parsed"] += 1
+        logger.info(f"Loaded standard: {category} ({len(parsed.validation_rules)} rules)")
+        return parsed
+
+    def _load_remote(self, categories: List[str]) -> Dict[str, ParsedStandard]:
+        """
+        Fetch and parse documents from GitHub in parallel, conditionally where possible
+
+        Args:
+            categories: Categories whose documents are not available locally
+
+        Returns:
+            Standards that were fetched and changed (or are new)
+        """
+        if not categories:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(categories))) as pool:
+            documents = list(pool.map(
+                lambda category: self._fetch_standard_from_github(
+                    self.STANDARDS_MAPPING[category], self._sources.get(category)
+                ),
+                categories
+            ))
+
+        loaded: Dict[str, ParsedStandard] = {}
+        for category, document in zip(categories, documents):
+            if document is None:
+                continue
+            if document.not_modified:
+                self._stats["not_modified"] += 1
+                continue
+
+            self._stats["fetched"] += 1
+            source = self._sources.get(category, {})
+            standard = self._standard_for(category, document.content, {
+                "content_hash": source.get("content_hash"),
+                "standard": self.standards.get(category),
+            })
+            self._sources[category] = {
+                "source": "remote",
+                "content_hash": standard.content_hash,
+                "etag": document.etag,
+                "last_modified": document.last_modified,
+            }
+            if self.standards.get(category) is not standard:
+                loaded[category] = standard
+        return loaded
+
+    def _fetch_standard_from_github(
+        self,
+        filepath: str,
+        source: Optional[Dict[str, Any]] = None
+    ) -> Optional[RemoteDocument]:
         """
         Fetch standard document from GitHub repository
 
         Used as fallback when local files aren't available (e.g., Cloud Run deployment).
-        Fetches from patelmm79/dev-nexus main branch.
+        Fetches from the dev-nexus main branch (see remote_url).
 
         Args:
             filepath: Path to file in repository (e.g., "DEPLOYMENT.md" or "docs/LICENSE_STANDARD.md")
+            source: Previous fetch of the document (etag, last_modified) for a
+                    conditional request
 
         Returns:
-            File content as string, or None if fetch fails
+            RemoteDocument (not_modified when the previous copy is current),
+            or None if fetch fails
         """
         try:
             github_token = os.environ.get("GITHUB_TOKEN")
@@ -118,19 +279,170 @@ class StandardsLoader:
                 logger.warning("GITHUB_TOKEN not set, cannot fetch standards from GitHub")
                 return None
 
-            url = f"https://raw.githubusercontent.com/patelmm79/dev-nexus/main/{filepath}"
+            url = f"{self.remote_url}/{filepath}"
             headers = {"Authorization": f"token {github_token}"}
-
-            response = requests.get(url, headers=headers, timeout=10)
+            if source and source.get("source") == "remote":
+                if source.get("etag"):
+                    headers["If-None-Match"] = source["etag"]
+                if source.get("last_modified"):
+                    headers["If-Modified-Since"] = source["last_modified"]
+
+            response = requests.get(url, headers=headers, timeout=self.fetch_timeout)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if response.status_code == 304:
+                logger.debug(f"{filepath} not modified on GitHub")
+                return RemoteDocument(None, etag or source.get("etag"), last_modified or source.get("last_modified"), True)
             if response.status_code == 200:
                 logger.info(f"Successfully fetched {filepath} from GitHub")
-                return response.text
-            else:
-                logger.warning(f"Failed to fetch {filepath} from GitHub: {response.status_code}")
-                return None
+                return RemoteDocument(response.text, etag, last_modified)
+
+            logger.warning(f"Failed to fetch {filepath} from GitHub: {response.status_code}")
         except Exception as e:
             logger.error(f"Error fetching {filepath} from GitHub: {e}")
-            return None
+        self._stats["fetch_errors"] += 1
+        return None
+
+    def reload(self) -> List[str]:
+        """
+        Reload standards whose documents changed
+
+        Local documents are re-read when their modification time changes and
+        re-parsed when their content does. Remote documents are revalidated
+        with conditional requests. Validations in progress keep the standards
+        they started with.
+
+        Returns:
+            Categories whose standard changed
+        """
+        with self._reload_lock:
+            self._stats["reloads"] += 1
+            standards = dict(self.standards)
+            changed: List[str] = []
+            remote: List[str] = []
+
+            for category, filepath in self.STANDARDS_MAPPING.items():
+                file_path = self.repo_root / filepath
+                source = self._sources.get(category, {})
+                try:
+                    if not file_path.exists():
+                        remote.append(category)
+                        continue
+
+                    mtime_ns = file_path.stat().st_mtime_ns
+                    if source.get("source") == "local" and source.get("mtime_ns") == mtime_ns:
+                        continue
+                    content = file_path.read_text(encoding='utf-8')
+                    standard = self._standard_for(category, content, {
+                        "content_hash": source.get("content_hash"),
+                        "standard": standards.get(category),
+                    })
+                    self._sources[category] = {
+                        "source": "local",
+                        "content_hash": standard.content_hash,
+                        "mtime_ns": mtime_ns,
+                    }
+                    if standards.get(category) is not standard:
+                        standards[category] = standard
+                        changed.append(category)
+                except Exception as e:
+                    logger.error(f"Failed to reload standard {category}: {e}")
+
+            fetched = self._load_remote(remote)
+            standards.update(fetched)
+            changed.extend(fetched)
+
+            if changed:
+                self.standards = self._ordered(standards)
+                self._write_cache()
+                logger.info(f"Reloaded standards: {', '.join(changed)}")
+            return changed
+
+    def start_auto_reload(self, interval: Optional[float] = None, initial: bool = False) -> None:
+        """
+        Reload standards periodically in a background daemon thread
+
+        Args:
+            interval: Seconds between reloads (default: reload_interval; 0
+                      reloads only once if initial is set)
+            initial: Reload once immediately
+        """
+        if self._reload_thread is not None and self._reload_thread.is_alive():
+            return
+        if interval is not None:
+            self.reload_interval = interval
+
+        self._stop_reload.clear()
+        self._reload_thread = threading.Thread(
+            target=self._reload_loop, args=(initial,), name="standards-reload", daemon=True
+        )
+        self._reload_thread.start()
+
+    def stop_auto_reload(self, timeout: Optional[float] = None) -> None:
+        """Stop the background reload thread"""
+        self._stop_reload.set()
+        if self._reload_thread is not None:
+            self._reload_thread.join(timeout)
+            self._reload_thread = None
+
+    def _reload_loop(self, initial: bool) -> None:
+        if initial:
+            self._safe_reload()
+        while self.reload_interval > 0 and not self._stop_reload.wait(self.reload_interval):
+            self._safe_reload()
+
+    def _safe_reload(self) -> None:
+        try:
+            self.reload()
+        except Exception as e:
+            logger.error(f"Standards reload failed: {e}")
+
+    def _ordered(self, standards: Dict[str, ParsedStandard]) -> Dict[str, ParsedStandard]:
+        """Standards in STANDARDS_MAPPING order"""
+        return {category: standards[category] for category in self.STANDARDS_MAPPING if category in standards}
+
+    def _read_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Cache file entries by category, with decoded standards ({} if unavailable)"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.CACHE_VERSION:
+                logger.info("Standards cache was written by another parser version, ignoring it")
+                return {}
+            entries = data.get("standards", {})
+            for entry in entries.values():
+                entry["standard"] = self._decode_standard(entry["standard"])
+            return entries
+        except Exception as e:
+            logger.warning(f"Could not read standards cache {self.cache_path}: {e}")
+            return {}
+
+    def _write_cache(self) -> None:
+        """Write the parsed standards to the cache file (atomically)"""
+        if not self.cache_path:
+            return
+        entries = {
+            category: {**self._sources[category], "standard": asdict(standard)}
+            for category, standard in self.standards.items()
+            if category in self._sources
+        }
+        try:
+            directory = os.path.dirname(os.path.abspath(self.cache_path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".standards-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": self.CACHE_VERSION, "standards": entries}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write standards cache {self.cache_path}: {e}")
+
+    @staticmethod
+    def _decode_standard(data: Dict[str, Any]) -> ParsedStandard:
+        """Rebuild a ParsedStandard from its cached (asdict) form"""
+        rules = [ValidationRule(**rule) for rule in data.get("validation_rules", [])]
+        return ParsedStandard(**{**data, "validation_rules": rules})
 
     def _parse_standard(self, category: str, content: str) -> ParsedStandard:
         """
@@ -151,7 +463,8 @@ class StandardsLoader:
         parsed = ParsedStandard(
             category=category,
             title=self._extract_title(content),
-            documentation_content=content
+            documentation_content=content,
+            content_hash=hashlib.sha256(content.encode("utf-8")).hexdigest()
         )
 
         # Category-specific parsing
@@ -516,3 +829,18 @@ class StandardsLoader:
     def list_categories(self) -> List[str]:
         """Get list of available standard categories"""
         return list(self.standards.keys())
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get loading counters
+
+        Returns:
+            Dictionary with documents parsed, parse results reused from the
+            cache, remote documents fetched / not modified / failed, reloads,
+            and whether background reloading is running
+        """
+        return {
+            **self._stats,
+            "cache_path": self.cache_path,
+            "auto_reload": self._reload_thread is not None and self._reload_thread.is_alive(),
+        }
@@ -0,0 +1,287 @@
+"""
+Vector Index Management for pgvector
+
+Handles:
+- Creating and replacing the ANN index on patterns.embedding (HNSW or IVFFlat)
+- Index status (access method, build parameters, size)
+- Recall/latency measurement of ANN search against an exact-scan baseline
+"""
+
+import math
+import re
+import time
+import logging
+from typing import Optional, List, Dict, Any, Iterable
+
+from core.database import DatabaseManager, StatementMetrics
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "idx_patterns_embedding"
+INDEX_METHODS = ("hnsw", "ivfflat")
+
+# pgvector defaults for HNSW builds
+DEFAULT_HNSW_M = 16
+DEFAULT_HNSW_EF_CONSTRUCTION = 64
+
+
+def default_ivfflat_lists(rows: int) -> int:
+    """pgvector guidance: rows / 1000 up to 1M rows, sqrt(rows) beyond"""
+    if rows <= 1_000_000:
+        return max(1, rows // 1000)
+    return int(math.sqrt(rows))
+
+
+def build_index_sql(
+    method: str,
+    name: str = INDEX_NAME,
+    m: int = DEFAULT_HNSW_M,
+    ef_construction: int = DEFAULT_HNSW_EF_CONSTRUCTION,
+    lists: int = 100,
+    concurrently: bool = True,
+) -> str:
+    """
+    Build the CREATE INDEX statement for patterns.embedding
+
+    Args:
+        method: "hnsw" or "ivfflat"
+        name: Index name
+        m: HNSW max connections per layer
+        ef_construction: HNSW candidate list size while building
+        lists: IVFFlat list count
+        concurrently: Build without blocking writes
+
+    Returns:
+        SQL statement
+    """
+    if method == "hnsw":
+        options = f"m = {int(m)}, ef_construction = {int(ef_construction)}"
+    elif method == "ivfflat":
+        options = f"lists = {int(lists)}"
+    else:
+        raise ValueError(f"Unsupported vector index method '{method}' (expected one of {INDEX_METHODS})")
+
+    return (
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}{name} "
+        f"ON patterns USING {method} (embedding vector_cosine_ops) WITH ({options})"
+    )
+
+
+def parse_index_definition(indexdef: str) -> Dict[str, Any]:
+    """Extract access method and WITH (...) options from a pg_indexes definition"""
+    method_match = re.search(r"USING\s+(\w+)", indexdef)
+    options_match = re.search(r"WITH\s*\((.*)\)", indexdef)
+
+    options: Dict[str, Any] = {}
+    if options_match:
+        for option in options_match.group(1).split(","):
+            key, _, value = option.partition("=")
+            value = value.strip().strip("'")
+            options[key.strip()] = int(value) if value.isdigit() else value
+
+    return {
+        "method": method_match.group(1).lower() if method_match else None,
+        "options": options,
+    }
+
+
+class VectorIndexManager:
+    """Creates, inspects and benchmarks the pgvector index on patterns.embedding"""
+
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize vector index manager
+
+        Args:
+            db_manager: DatabaseManager instance
+        """
+        self.db = db_manager
+
+    async def index_status(self) -> Dict[str, Any]:
+        """
+        Get the current pattern embedding index
+
+        Returns:
+            Dictionary with index name, method, build options, size and the
+            number of embedded patterns (``exists`` is False when missing)
+        """
+        row = await self.db.fetchrow(
+            """
+            SELECT indexdef, pg_relation_size(format('%I', indexname)::regclass) AS size_bytes
+            FROM pg_indexes
+            WHERE tablename = 'patterns' AND indexname = $1
+            """,
+            INDEX_NAME
+        )
+        embedded = await self.db.fetchval(
+            "SELECT count(*) FROM patterns WHERE embedding IS NOT NULL"
+        )
+
+        status: Dict[str, Any] = {
+            "name": INDEX_NAME,
+            "exists": row is not None,
+            "embedded_patterns": embedded or 0,
+        }
+        if row is not None:
+            status.update(parse_index_definition(row["indexdef"]))
+            status["size_bytes"] = row["size_bytes"]
+        return status
+
+    async def ensure_index(
+        self,
+        method: str = "hnsw",
+        m: int = DEFAULT_HNSW_M,
+        ef_construction: int = DEFAULT_HNSW_EF_CONSTRUCTION,
+        lists: Optional[int] = None,
+        rebuild: bool = False,
+        maintenance_work_mem: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make sure patterns.embedding has the requested ANN index
+
+        A differing (or, with ``rebuild``, any) existing index is replaced
+        without blocking writers: the new index is built CONCURRENTLY under a
+        temporary name, then swapped in with a drop and rename.
+
+        Args:
+            method: "hnsw" or "ivfflat"
+            m: HNSW max connections per layer
+            ef_construction: HNSW candidate list size while building
+            lists: IVFFlat list count (defaults from the embedded row count)
+            rebuild: Rebuild even if the existing index already matches
+            maintenance_work_mem: Build memory, e.g. "2GB" (HNSW builds are
+                                  much faster when the graph fits in memory)
+
+        Returns:
+            Dictionary with the action taken ("unchanged", "created" or
+            "replaced"), the index status and build time
+        """
+        status = await self.index_status()
+        if method == "ivfflat" and lists is None:
+            lists = default_ivfflat_lists(status["embedded_patterns"])
+
+        wanted = {"m": m, "ef_construction": ef_construction} if method == "hnsw" else {"lists": lists}
+        if status["exists"] and not rebuild and status.get("method") == method \
+                and all(status["options"].get(key) == value for key, value in wanted.items()):
+            logger.info(f"Vector index {INDEX_NAME} already matches ({method} {wanted})")
+            return {"action": "unchanged", "build_seconds": 0.0, "index": status}
+
+        temp_name = f"{INDEX_NAME}_new"
+        started = time.perf_counter()
+
+        async with self.db.acquire() as conn:
+            # A failed concurrent build leaves an INVALID index behind
+            await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {temp_name}")
+            if maintenance_work_mem:
+                await conn.execute("SELECT set_config('maintenance_work_mem', $1, false)", maintenance_work_mem)
+
+            logger.info(f"Building vector index {temp_name}: {method} {wanted}")
+            try:
+                await conn.execute(build_index_sql(
+                    method, name=temp_name, m=m, ef_construction=ef_construction,
+                    lists=lists or 100
+                ))
+            finally:
+                if maintenance_work_mem:
+                    await conn.execute("RESET maintenance_work_mem")
+
+            async with conn.transaction():
+                await conn.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+                await conn.execute(f"ALTER INDEX {temp_name} RENAME TO {INDEX_NAME}")
+
+        build_seconds = round(time.perf_counter() - started, 3)
+        logger.info(f"Vector index {INDEX_NAME} built in {build_seconds}s")
+
+        return {
+            "action": "replaced" if status["exists"] else "created",
+            "build_seconds": build_seconds,
+            "index": await self.index_status(),
+        }
+
+    async def sample_query_embeddings(self, sample_size: int = 50) -> List[str]:
+        """Pick stored pattern embeddings to use as benchmark queries"""
+        rows = await self.db.fetch(
+            """
+            SELECT embedding::text AS embedding
+            FROM patterns
+            WHERE embedding IS NOT NULL
+            ORDER BY random()
+            LIMIT $1
+            """,
+            sample_size
+        )
+        return [row["embedding"] for row in rows]
+
+    async def measure_recall(
+        self,
+        queries: Optional[List[Any]] = None,
+        k: int = 10,
+        ef_search_values: Iterable[int] = (),
+        probes_values: Iterable[int] = (),
+        sample_size: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        Measure ANN recall@k and latency against an exact scan
+
+        Each query runs once with the index disabled to get the true top-k,
+        then once per search setting through the index.
+
+        Args:
+            queries: Query embeddings (defaults to a random sample of stored ones)
+            k: Neighbours per query
+            ef_search_values: HNSW ef_search settings to try
+            probes_values: IVFFlat probes settings to try
+            sample_size: Number of stored embeddings to sample when no queries
+
+        Returns:
+            Dictionary with the exact-scan latency and, per setting, mean
+            recall@k and p50/p95/p99 latency in milliseconds
+        """
+        if queries is None:
+            queries = await self.sample_query_embeddings(sample_size)
+
+        settings = [{"ef_search": value} for value in ef_search_values]
+        settings += [{"probes": value} for value in probes_values]
+        if not settings:
+            settings = [{}]
+
+        exact_metrics = StatementMetrics()
+        truth: List[set] = []
+        for query in queries:
+            ids, elapsed_ms = await self._timed_search(query, k, exact=True)
+            truth.append(ids)
+            exact_metrics.observe(elapsed_ms, rows=len(ids))
+
+        results = []
+        for setting in settings:
+            metrics = StatementMetrics()
+            recalls = []
+            for query, expected in zip(queries, truth):
+                ids, elapsed_ms = await self._timed_search(query, k, **setting)
+                metrics.observe(elapsed_ms, rows=len(ids))
+                if expected:
+                    recalls.append(len(ids & expected) / len(expected))
+
+            latency = metrics.to_dict()
+            results.append({
+                **setting,
+                "recall": round(sum(recalls) / len(recalls), 4) if recalls else None,
+                "p50_ms": latency["p50_ms"],
+                "p95_ms": latency["p95_ms"],
+                "p99_ms": latency["p99_ms"],
+            })
+
+        exact = exact_metrics.to_dict()
+        return {
+            "k": k,
+            "queries": len(queries),
+            "exact": {"p50_ms": exact["p50_ms"], "p95_ms": exact["p95_ms"], "p99_ms": exact["p99_ms"]},
+            "settings": results,
+        }
+
+    async def _timed_search(self, query: Any, k: int, **knobs) -> tuple:
+        """Run one top-k search with no threshold; returns (ids, elapsed ms)"""
+        started = time.perf_counter()
+        rows = await self.db.find_similar_patterns(query, limit=k, threshold=-1.0, **knobs)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        return {row["id"] for row in rows}, elapsed_ms
@@ -5,9 +5,11 @@ Enhanced schema with deployment, dependencies, testing, and security sections.
 Uses Pydantic for data validation and serialization.
 """
 
-from typing import List, Dict, Optional
+import json
+import hashlib
+from typing import Any, List, Dict, Optional, Iterable, Set
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ReusableComponent(BaseModel):
@@ -205,6 +207,25 @@ class RepositoryMetadata(BaseModel):
     created_at: Optional[datetime] = None
     last_updated: datetime
 
+    def section_fingerprints(self) -> Dict[str, str]:
+        """
+        Content hashes of the sections persisted to PostgreSQL
+
+        Used for change tracking: a section whose hash differs from the one
+        recorded at load time needs to be written back.
+        """
+        sections = {
+            "patterns": self.latest_patterns.model_dump(mode="json"),
+            "components": [component.model_dump(mode="json") for component in self.components],
+            "lessons_learned": [lesson.model_dump(mode="json") for lesson in self.deployment.lessons_learned],
+            "dependencies": self.dependencies.model_dump(mode="json"),
+            "deployment": self.deployment.model_dump(mode="json", exclude={"lessons_learned"}),
+        }
+        return {
+            name: hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+            for name, value in sections.items()
+        }
+
 
 class KnowledgeBaseV2(BaseModel):
     """Complete knowledge base schema v2"""
@@ -219,11 +240,59 @@ class KnowledgeBaseV2(BaseModel):
     last_updated: datetime
     metadata: Dict[str, str] = Field(default_factory=dict)
 
+    # Section fingerprints per repository as of the last load/save (change tracking)
+    _baseline: Optional[Dict[str, Dict[str, str]]] = PrivateAttr(default=None)
+
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
 
+    @property
+    def is_tracked(self) -> bool:
+        """Whether a baseline exists to diff changes against"""
+        return self._baseline is not None
+
+    def mark_clean(self, repositories: Optional[Iterable[str]] = None) -> None:
+        """
+        Record the current state as the baseline for change tracking
+
+        Args:
+            repositories: Only re-baseline these repositories (default: all)
+        """
+        if repositories is None:
+            self._baseline = {}
+            repositories = self.repositories.keys()
+        elif self._baseline is None:
+            # Repositories outside the baseline count as changed on next save
+            self._baseline = {}
+
+        for name in repositories:
+            if name in self.repositories:
+                self._baseline[name] = self.repositories[name].section_fingerprints()
+
+    def changed_sections(self) -> Optional[Dict[str, Set[str]]]:
+        """
+        Sections changed since the baseline, per repository
+
+        Repositories added after the baseline report every section.
+
+        Returns:
+            Mapping of repository name to changed section names, or None if the
+            knowledge base is not tracked (every section should be written)
+        """
+        if self._baseline is None:
+            return None
+
+        changes: Dict[str, Set[str]] = {}
+        for name, metadata in self.repositories.items():
+            current = metadata.section_fingerprints()
+            baseline = self._baseline.get(name, {})
+            changed = {section for section, digest in current.items() if baseline.get(section) != digest}
+            if changed:
+                changes[name] = changed
+        return changes
+
 
 # Helper functions for common operations
 
@@ -250,6 +319,25 @@ def create_empty_repository_metadata(commit_sha: str, problem_domain: str = "Unk
     )
 
 
+def component_vector_metadata(component: Component) -> Dict[str, Any]:
+    """Component fields sent to pattern-miner for vectorization"""
+    return {
+        "component_id": component.component_id,
+        "name": component.name,
+        "type": component.component_type,
+        "api_signature": component.api_signature or "",
+        "imports": component.imports,
+        "keywords": component.keywords,
+        "description": component.description or ""
+    }
+
+
+def component_signature(component: Component) -> str:
+    """Content signature of the fields a component vector is generated from"""
+    content = json.dumps(component_vector_metadata(component), sort_keys=True).encode()
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
 def create_lesson_learned(
     category: str,
     lesson: str,
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark ComponentClassifier against the per-pattern classification loop
+
+Classifies a synthetic set of (path, content) samples with:
+- the previous loop: re.match per path pattern, then one substring scan per
+  keyword for every component type
+- ComponentClassifier: one combined path regex, then substring checks with
+  early exit
+- for reference, the keyword fallback done as one alternation regex scan
+
+Checks that the previous loop and ComponentClassifier agree on every sample.
+Needs no database or network access.
+
+Usage:
+    python scripts/benchmark_component_classifier.py
+    python scripts/benchmark_component_classifier.py --samples 5000 --repeat 5
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.component_analyzer import ComponentClassifier, DEFAULT_COMPONENT_PATTERNS, DEFAULT_TYPE_KEYWORDS
+from benchmark_component_scan import TEMPLATE
+
+# Paths that match a pattern early, late or not at all
+PATHS = [
+    "pkg/http_client.py", "api/routes.py", "core/database.py", "services/billing.py",
+    "pkg/handlers/orders.py", "tools/migrate_schema.py", "tests/orders_test.py", "src/app/main.py",
+]
+
+PLAIN_CONTENT = '''"""Order handlers"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Order:
+    order_id: str
+    total: float
+
+
+def apply_discount(order: Order, rate: float) -> Order:
+    return Order(order.order_id, order.total * (1 - rate))
+''' * 4
+
+
+def legacy_classify(file_path: str, content: str):
+    """Classification as done before ComponentClassifier"""
+    file_path_lower = file_path.lower()
+    for comp_type, patterns in DEFAULT_COMPONENT_PATTERNS.items():
+        for pattern in patterns:
+            if re.match(pattern, file_path_lower):
+                return comp_type
+
+    content_lower = content.lower()
+    for comp_type, keywords in DEFAULT_TYPE_KEYWORDS.items():
+        keyword_matches = sum(1 for kw in keywords if kw in content_lower)
+        if keyword_matches >= 2:
+            return comp_type
+    return None
+
+
+def alternation_keyword_scan():
+    """Keyword fallback as a single alternation regex over the content"""
+    keywords = [kw for keywords in DEFAULT_TYPE_KEYWORDS.values() for kw in keywords]
+    pattern = re.compile("|".join(sorted(map(re.escape, set(keywords)), key=len, reverse=True)))
+
+    def classify_content(content: str):
+        found = set(pattern.findall(content.lower()))
+        for comp_type, keywords in DEFAULT_TYPE_KEYWORDS.items():
+            if sum(1 for kw in keywords if kw in found) >= 2:
+                return comp_type
+        return None
+
+    return classify_content
+
+
+def build_samples(count: int) -> list:
+    samples = []
+    for index in range(count):
+        content = TEMPLATE.format(index=index) if index % 2 else PLAIN_CONTENT
+        samples.append((PATHS[index % len(PATHS)], content))
+    return samples
+
+
+def timed(function, samples: list, repeat: int) -> float:
+    """Best time over ``repeat`` runs, in microseconds per sample"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path, content in samples:
+            function(path, content)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / len(samples)
+
+
+def run_benchmark(count: int, repeat: int) -> int:
+    classifier = ComponentClassifier.default()
+    samples = build_samples(count)
+
+    mismatches = sum(
+        1 for path, content in samples
+        if legacy_classify(path, content) != classifier.classify(path, content)
+    )
+    if mismatches:
+        print(f"{mismatches} samples classified differently")
+        return 1
+
+    unmatched = [(path, content) for path, content in samples if classifier.classify_path(path) is None]
+    scan_content = alternation_keyword_scan()
+
+    print(f"{count} samples ({len(unmatched)} fall back to keywords)")
+    print(f"  classify, previous loop:        {timed(legacy_classify, samples, repeat):8.2f} us")
+    print(f"  classify, ComponentClassifier:  {timed(classifier.classify, samples, repeat):8.2f} us")
+    print(f"  path only, previous loop:       "
+          f"{timed(lambda path, _: legacy_classify(path, ''), samples, repeat):8.2f} us")
+    print(f"  path only, combined regex:      "
+          f"{timed(lambda path, _: classifier.classify_path(path), samples, repeat):8.2f} us")
+    print(f"  keywords, substring checks:     "
+          f"{timed(lambda _, content: classifier.classify_content(content), unmatched, repeat):8.2f} us")
+    print(f"  keywords, alternation regex:    "
+          f"{timed(lambda _, content: scan_content(content), unmatched, repeat):8.2f} us")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ComponentClassifier")
+    parser.add_argument("--samples", type=int, default=2000, help="Files to classify (default: 2000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant, best is reported (default: 5)")
+    args = parser.parse_args()
+
+    return run_benchmark(args.samples, args.repeat)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
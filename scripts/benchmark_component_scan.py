@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark ComponentScanner on a synthetic repository
+
+Generates a repository of Python files (plus a vendored node_modules tree the
+walk should prune) and times:
+- a cold serial scan (one process, no cache)
+- a cold parallel scan (process pool)
+- a warm rescan with the per-file cache and no changes
+- a rescan after changing a fraction of the files
+- peak traced memory of a cached scan collected into a list versus
+  consumed from iter_repository()
+
+Needs no database or network access.
+
+Usage:
+    python scripts/benchmark_component_scan.py
+    python scripts/benchmark_component_scan.py --files 20000 --workers 8 --changed 0.01
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.component_analyzer import ComponentScanner
+from core.component_scan_cache import ComponentScanCache
+
+DIRECTORIES = ["api", "utils", "core", "services", "models", "pkg/handlers", "pkg/tools"]
+
+TEMPLATE = '''"""Synthetic module {index}"""
+
+import logging
+import requests
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Service{index}Client:
+    """HTTP client with retry and cache for service {index}"""
+
+    def __init__(self, base_url: str, retries: int = 3):
+        self.base_url = base_url
+        self.retries = retries
+        self.cache: Dict[str, dict] = {{}}
+
+    def get(self, path: str) -> Optional[dict]:
+        for attempt in range(self.retries):
+            try:
+                response = requests.get(f"{{self.base_url}}/{{path}}")
+                if response.status_code == 200:
+                    return response.json()
+            except Exception as e:
+                logger.warning(f"request failed: {{e}}")
+        return None
+
+    def process(self, items: List[dict]) -> List[dict]:
+        results = []
+        for item in items:
+            if item.get("valid"):
+                results.append(self.transform(item))
+            elif item.get("retry"):
+                results.append(self.get(item["path"]))
+        return results
+
+    def transform(self, item: dict) -> dict:
+        return {{key: value for key, value in item.items() if value is not None}}
+
+    def _private(self) -> None:
+        pass
+
+
+def compute_{index}(values: List[int]) -> int:
+    total = 0
+    for value in values:
+        if value > 0:
+            total += value
+    return total
+'''
+
+
+def build_repository(root: Path, count: int, vendored: int) -> None:
+    """Write ``count`` component files and ``vendored`` files under node_modules"""
+    for index in range(count):
+        directory = root / DIRECTORIES[index % len(DIRECTORIES)] / f"group_{index // 500}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"module_{index}_client.py").write_text(TEMPLATE.format(index=index))
+
+    vendor = root / "node_modules" / "some-package"
+    vendor.mkdir(parents=True, exist_ok=True)
+    for index in range(vendored):
+        (vendor / f"vendored_{index}.py").write_text(TEMPLATE.format(index=index))
+
+
+def timed_scan(scanner: ComponentScanner, root: Path) -> tuple:
+    start = time.perf_counter()
+    components = scanner.scan_repository(str(root), "bench/repo")
+    return time.perf_counter() - start, len(components), scanner.last_scan_report
+
+
+def peak_memory_mb(function) -> float:
+    """Peak Python heap allocated while running function, in MB"""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def consume(components) -> int:
+    count = 0
+    for _ in components:
+        count += 1
+    return count
+
+
+def run_benchmark(count: int, workers: int, changed: float, vendored: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory) / "repo"
+        start = time.perf_counter()
+        build_repository(root, count, vendored)
+        print(f"Generated {count} files (+{vendored} vendored) in {time.perf_counter() - start:.1f}s")
+
+        serial_s, found, _ = timed_scan(ComponentScanner(max_workers=1, cache=False), root)
+        print(f"  cold scan, 1 process:          {serial_s:8.2f}s  ({found} components)")
+
+        cache = ComponentScanCache(os.path.join(directory, "scan-cache.sqlite3"))
+        parallel_s, found, report = timed_scan(ComponentScanner(max_workers=workers, cache=cache), root)
+        print(f"  cold scan, {report['workers']} processes:        {parallel_s:8.2f}s  "
+              f"({serial_s / parallel_s:.1f}x)")
+
+        warm_s, _, report = timed_scan(ComponentScanner(max_workers=workers, cache=cache), root)
+        print(f"  warm rescan, no changes:        {warm_s:8.2f}s  "
+              f"({serial_s / warm_s:.1f}x, {report['cache_hits']} cache hits)")
+
+        files = sorted(root.rglob("module_*_client.py"))
+        step = max(1, int(1 / changed)) if changed > 0 else len(files) + 1
+        for path in files[::step]:
+            path.write_text(path.read_text() + "\n# edited\n")
+
+        incremental_s, _, report = timed_scan(ComponentScanner(max_workers=workers, cache=cache), root)
+        print(f"  rescan, {report['parsed']} files changed:     {incremental_s:8.2f}s  "
+              f"({serial_s / incremental_s:.1f}x)")
+
+        scanner = ComponentScanner(max_workers=1, cache=cache)
+        listed_mb = peak_memory_mb(lambda: scanner.scan_repository(str(root), "bench/repo"))
+        streamed_mb = peak_memory_mb(lambda: consume(scanner.iter_repository(str(root), "bench/repo")))
+        print(f"  peak memory, scan_repository:   {listed_mb:8.1f} MB")
+        print(f"  peak memory, iter_repository:   {streamed_mb:8.1f} MB")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ComponentScanner on a synthetic repository")
+    parser.add_argument("--files", type=int, default=20_000, help="Python files to generate (default: 20000)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Parser processes (default: CPU count)")
+    parser.add_argument("--changed", type=float, default=0.01,
+                        help="Fraction of files edited before the last rescan (default: 0.01)")
+    parser.add_argument("--vendored", type=int, default=2000,
+                        help="Files under node_modules, which the walk should skip (default: 2000)")
+    args = parser.parse_args()
+
+    run_benchmark(args.files, args.workers, args.changed, args.vendored)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
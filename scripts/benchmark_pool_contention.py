@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Load test connection pool contention for multi-statement repository writes
+
+Runs concurrent update_dependency_info / add_or_update_components writers
+against a simulated asyncpg pool (default max_size=10) and compares:
+
+- per-statement: every statement checks out its own pool connection, with no
+  transaction (the behaviour before DatabaseManager.transaction())
+- unit-of-work:  each write pins one connection inside one transaction
+
+The pool simulates a fixed network round trip per statement, so no PostgreSQL
+instance is needed.
+
+Usage:
+    python scripts/benchmark_pool_contention.py
+    python scripts/benchmark_pool_contention.py --writers 200 --rows 50 --pool-size 10
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, List
+
+# Add parent directory to path
+sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+
+from core.database import DatabaseManager
+from core.postgres_repository import PostgresRepository
+from schemas.knowledge_base_v2 import Component, DependencyInfo
+
+
+class SimulatedConnection:
+    """Connection stand-in where every statement costs one round trip"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def execute(self, query: str, *args) -> str:
+        await asyncio.sleep(self.latency)
+        return "OK"
+
+    async def executemany(self, query: str, rows: List[tuple]) -> None:
+        # asyncpg pipelines executemany: one round trip plus a little per row
+        await asyncio.sleep(self.latency * (1 + 0.05 * len(rows)))
+
+    async def fetchrow(self, query: str, *args) -> Any:
+        await asyncio.sleep(self.latency)
+        return {"id": 1}
+
+    @asynccontextmanager
+    async def transaction(self):
+        await asyncio.sleep(self.latency)  # BEGIN
+        yield
+        await asyncio.sleep(self.latency)  # COMMIT
+
+
+class SimulatedPool:
+    """Fixed-size pool; acquire waits while all connections are checked out"""
+
+    def __init__(self, max_size: int, latency: float):
+        self.max_size = max_size
+        self._free: asyncio.Queue = asyncio.Queue()
+        for _ in range(max_size):
+            self._free.put_nowait(SimulatedConnection(latency))
+
+    def get_size(self) -> int:
+        return self.max_size
+
+    @asynccontextmanager
+    async def acquire(self):
+        conn = await self._free.get()
+        try:
+            yield conn
+        finally:
+            self._free.put_nowait(conn)
+
+
+def make_components(count: int) -> List[Component]:
+    now = datetime.now()
+    return [
+        Component(
+            component_id=f"org/repo/component-{i}", name=f"component-{i}",
+            component_type="utility", repository="org/repo",
+            files=[f"src/component_{i}.py"], language="python", first_seen=now
+        )
+        for i in range(count)
+    ]
+
+
+async def write_per_statement(repo: PostgresRepository, dependency_info: DependencyInfo,
+                              components: List[Component]) -> None:
+    """Pre-unit-of-work write path: one pool checkout per statement"""
+    db = repo.db
+    repo_id = (await db.fetchrow("SELECT id FROM repositories WHERE name = $1", "org/repo"))["id"]
+    await db.execute("DELETE FROM dependencies WHERE repo_id = $1", repo_id)
+    for dep_name, dep_type in repo._dependency_rows(dependency_info):
+        await db.execute("INSERT INTO dependencies VALUES ($1, $2, $3)", repo_id, dep_name, dep_type)
+
+    repo_id = (await db.fetchrow("SELECT id FROM repositories WHERE name = $1", "org/repo"))["id"]
+    await db.execute("DELETE FROM reusable_components WHERE repo_id = $1", repo_id)
+    for component in components:
+        await db.execute("INSERT INTO reusable_components VALUES (...)",
+                         *repo._component_record(repo_id, "org/repo", component))
+
+
+async def write_unit_of_work(repo: PostgresRepository, dependency_info: DependencyInfo,
+                             components: List[Component]) -> None:
+    await repo.update_dependency_info("org/repo", dependency_info)
+    await repo.add_or_update_components("org/repo", components)
+
+
+async def run_mode(mode: str, writers: int, rows: int, pool_size: int, latency: float) -> None:
+    db = DatabaseManager(max_size=pool_size)
+    db.enabled = True
+    db.pool = SimulatedPool(pool_size, latency)
+    repo = PostgresRepository(db, snapshot_ttl=0)
+
+    dependency_info = DependencyInfo(external_dependencies=[f"package-{i}" for i in range(rows)])
+    components = make_components(rows)
+    write = write_per_statement if mode == "per-statement" else write_unit_of_work
+
+    start = time.perf_counter()
+    await asyncio.gather(*(write(repo, dependency_info, components) for _ in range(writers)))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    wait = db.acquire_metrics.to_dict()
+    print(
+        f"{mode:<14} | {wait['calls']:>8} | {wait['mean_ms']:>9.1f} | {wait['max_ms']:>9.1f} "
+        f"| {wait['total_ms']:>12.0f} | {elapsed_ms:>9.0f}"
+    )
+
+
+async def run_benchmark(writers: int, rows: int, pool_size: int, latency_ms: float) -> None:
+    """Run both write paths and print pool acquire counts and wait times"""
+    print(f"{writers} concurrent writers, {rows} dependencies + {rows} components each, "
+          f"pool max_size={pool_size}, simulated round trip {latency_ms} ms")
+    print(f"{'mode':<14} | {'acquires':>8} | {'wait mean':>9} | {'wait max':>9} "
+          f"| {'wait total ms':>12} | {'wall ms':>9}")
+    print("-" * 78)
+
+    for mode in ("per-statement", "unit-of-work"):
+        await run_mode(mode, writers, rows, pool_size, latency_ms / 1000)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test pool contention for repository writes")
+    parser.add_argument("--writers", type=int, default=100, help="Concurrent writers (default: 100)")
+    parser.add_argument("--rows", type=int, default=20,
+                        help="Dependencies and components per write (default: 20)")
+    parser.add_argument("--pool-size", type=int, default=10, help="Pool max_size (default: 10)")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.5,
+        help="Simulated per-statement round-trip latency in milliseconds (default: 0.5)"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.writers, args.rows, args.pool_size, args.latency_ms))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark PostgresRepository.get_all_repositories
+
+Compares the per-repository loader (roughly 8 queries per repository) with the
+set-based bulk loader (a fixed number of queries) by query count and wall time.
+
+The benchmark runs against an in-memory synthetic database that simulates a
+fixed network round-trip per query, so it needs no PostgreSQL instance.
+
+Usage:
+    python scripts/benchmark_repository_loading.py
+    python scripts/benchmark_repository_loading.py --sizes 10 100 1000 --latency-ms 0.5
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+
+from core.postgres_repository import PostgresRepository
+
+TABLE_PATTERN = re.compile(r"FROM\s+([a-z_]+)", re.IGNORECASE)
+
+
+class SyntheticDatabase:
+    """
+    Minimal stand-in for DatabaseManager serving generated rows
+
+    Routes each query by the first table in its FROM clause and filters rows by
+    the repo id argument (a single id or a list for ``= ANY($1)`` queries).
+    Every call counts as one round trip and sleeps for ``latency`` seconds.
+    """
+
+    def __init__(self, repo_count: int, latency: float = 0.0005):
+        self.latency = latency
+        self.query_count = 0
+        self.enabled = True
+        self.pool = object()
+        self.tables = self._generate(repo_count)
+
+    @staticmethod
+    def _generate(repo_count: int) -> Dict[str, List[Dict[str, Any]]]:
+        now = datetime.now()
+        tables: Dict[str, List[Dict[str, Any]]] = {
+            "repositories": [],
+            "patterns": [],
+            "technical_decisions": [],
+            "reusable_components": [],
+            "keywords": [],
+            "deployment_scripts": [],
+            "dependencies": [],
+        }
+
+        for repo_id in range(1, repo_count + 1):
+            tables["repositories"].append({
+                "id": repo_id,
+                "name": f"org/repo-{repo_id:05d}",
+                "problem_domain": "benchmark",
+                "last_analyzed": now,
+                "last_commit_sha": f"{repo_id:040x}",
+                "created_at": now,
+                "updated_at": now,
+            })
+            for i in range(10):
+                tables["patterns"].append({
+                    "repo_id": repo_id,
+                    "name": f"pattern-{i}",
+                    "created_at": now - timedelta(minutes=i),
+                })
+            for i in range(5):
+                tables["technical_decisions"].append({
+                    "repo_id": repo_id,
+                    "what": f"decision-{i}",
+                    "created_at": now - timedelta(minutes=i),
+                })
+            for i in range(3):
+                tables["reusable_components"].append({
+                    "repo_id": repo_id,
+                    "name": f"component-{i}",
+                    "description": "synthetic component",
+                    "location": f"src/component_{i}.py",
+                    "language": "python",
+                    "component_id": f"org/repo-{repo_id:05d}/component-{i}",
+                    "component_type": "utility",
+                    "api_signature": None,
+                    "imports": "[]",
+                    "keywords": '["synthetic"]',
+                    "lines_of_code": 100,
+                    "cyclomatic_complexity": 1.0,
+                    "public_methods": "[]",
+                    "first_seen": now,
+                    "derived_from": None,
+                    "sync_status": "original",
+                })
+            for i in range(5):
+                tables["keywords"].append({"repo_id": repo_id, "keyword": f"keyword-{i}"})
+            tables["deployment_scripts"].append({
+                "repo_id": repo_id,
+                "description": '{"platform": "cloud_run"}',
+                "commands": "[]",
+                "environment_variables": "{}",
+            })
+            for i in range(4):
+                tables["dependencies"].append({
+                    "repo_id": repo_id,
+                    "dependency_name": f"package-{i}",
+                    "dependency_type": "external",
+                })
+
+        return tables
+
+    def _select(self, query: str, args: tuple) -> List[Dict[str, Any]]:
+        match = TABLE_PATTERN.search(query)
+        rows = self.tables.get(match.group(1), []) if match else []
+        if not args:
+            return list(rows)
+
+        ids = set(args[0]) if isinstance(args[0], list) else {args[0]}
+        key = "id" if match and match.group(1) == "repositories" else "repo_id"
+        return [row for row in rows if row[key] in ids]
+
+    async def fetch(self, query: str, *args) -> List[Dict[str, Any]]:
+        self.query_count += 1
+        await asyncio.sleep(self.latency)
+        return self._select(query, args)
+
+    async def fetchrow(self, query: str, *args) -> Optional[Dict[str, Any]]:
+        self.query_count += 1
+        await asyncio.sleep(self.latency)
+        rows = self._select(query, args)
+        return rows[0] if rows else None
+
+
+async def run_benchmark(sizes: List[int], latency_ms: float) -> None:
+    """Run both loaders at each size and print a comparison table"""
+    print(f"Simulated round-trip latency: {latency_ms} ms")
+    print(f"{'repos':>6} | {'mode':<12} | {'queries':>8} | {'wall ms':>10}")
+    print("-" * 46)
+
+    for size in sizes:
+        for mode, bulk in (("per-repo", False), ("bulk", True)):
+            db = SyntheticDatabase(size, latency=latency_ms / 1000)
+            repo = PostgresRepository(db)
+
+            start = time.perf_counter()
+            repositories = await repo.get_all_repositories(bulk=bulk)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            assert len(repositories) == size
+            print(f"{size:>6} | {mode:<12} | {db.query_count:>8} | {elapsed_ms:>10.1f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark repository loading strategies")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000],
+        help="Repository counts to benchmark (default: 10 100 1000)"
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.5,
+        help="Simulated per-query round-trip latency in milliseconds (default: 0.5)"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.sizes, args.latency_ms))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
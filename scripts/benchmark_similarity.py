@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark in-process embedding similarity search
+
+Compares EmbeddingGenerator.calculate_similarity called once per candidate
+with the batched top_k_similar (one matrix multiply plus argpartition) on
+random vectors. Needs no API key or database.
+
+Usage:
+    python scripts/benchmark_similarity.py
+    python scripts/benchmark_similarity.py --count 100000 --dimensions 1536 --queries 10
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+
+from core.embeddings import EmbeddingGenerator, build_normalized_matrix
+
+
+def run_benchmark(count: int, dimensions: int, queries: int, k: int, pairwise_sample: int) -> None:
+    """Time matrix build, batched top-k and the per-pair baseline"""
+    generator = EmbeddingGenerator(api_key="")
+    rng = np.random.default_rng(0)
+    candidates = rng.normal(size=(count, dimensions)).astype(np.float32)
+    query_vectors = rng.normal(size=(queries, dimensions)).astype(np.float32)
+
+    start = time.perf_counter()
+    matrix = build_normalized_matrix(candidates)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    generator.top_k_similar(query_vectors[0], matrix, k=k)  # warm up BLAS
+    start = time.perf_counter()
+    for query in query_vectors:
+        generator.top_k_similar(query, matrix, k=k)
+    single_ms = (time.perf_counter() - start) * 1000 / queries
+
+    start = time.perf_counter()
+    generator.top_k_similar(query_vectors, matrix, k=k)
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    # Per-pair baseline on a sample, extrapolated to the full candidate set
+    sample = candidates[:pairwise_sample].tolist()
+    query = query_vectors[0].tolist()
+    start = time.perf_counter()
+    for candidate in sample:
+        generator.calculate_similarity(query, candidate)
+    pairwise_ms = (time.perf_counter() - start) * 1000 * count / len(sample)
+
+    print(f"{count} candidates x {dimensions} dimensions, k={k}")
+    print(f"  build normalized matrix:        {build_ms:10.1f} ms")
+    print(f"  top_k_similar, one query:       {single_ms:10.1f} ms")
+    print(f"  top_k_similar, {queries} queries batched: {batch_ms:7.1f} ms")
+    print(f"  calculate_similarity per pair:  {pairwise_ms:10.1f} ms per query (extrapolated)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark batched cosine top-k")
+    parser.add_argument("--count", type=int, default=100_000, help="Candidate vectors (default: 100000)")
+    parser.add_argument("--dimensions", type=int, default=1536, help="Vector dimensions (default: 1536)")
+    parser.add_argument("--queries", type=int, default=10, help="Queries to time (default: 10)")
+    parser.add_argument("--k", type=int, default=10, help="Results per query (default: 10)")
+    parser.add_argument("--pairwise-sample", type=int, default=2000,
+                        help="Candidates timed with calculate_similarity (default: 2000)")
+    args = parser.parse_args()
+
+    run_benchmark(args.count, args.dimensions, args.queries, args.k, args.pairwise_sample)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Manage the pgvector index on patterns.embedding
+
+Commands:
+    status     Show the current index (method, build options, size)
+    ensure     Create or replace the index (HNSW by default)
+    benchmark  Measure recall@k and latency per ef_search/probes setting
+               against an exact-scan baseline
+
+Usage:
+    python scripts/manage_vector_index.py status
+    python scripts/manage_vector_index.py ensure --method hnsw --m 16 --ef-construction 64
+    python scripts/manage_vector_index.py ensure --method ivfflat --lists 1000
+    python scripts/manage_vector_index.py benchmark --k 10 --ef-search 40 80 160 320
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import init_db, close_db
+from core.vector_index import (
+    VectorIndexManager, INDEX_METHODS, DEFAULT_HNSW_M, DEFAULT_HNSW_EF_CONSTRUCTION
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def print_benchmark(report: dict) -> None:
+    """Print a recall/latency table"""
+    exact = report["exact"]
+    print(f"{report['queries']} queries, k={report['k']}")
+    print(f"exact scan: p50 {exact['p50_ms']} ms, p95 {exact['p95_ms']} ms")
+    print(f"{'setting':<16} | {'recall':>7} | {'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8}")
+    print("-" * 60)
+    for result in report["settings"]:
+        setting = ", ".join(f"{key}={result[key]}" for key in ("ef_search", "probes") if key in result)
+        print(
+            f"{setting or 'default':<16} | {result['recall'] if result['recall'] is not None else '-':>7} "
+            f"| {result['p50_ms']:>8} | {result['p95_ms']:>8} | {result['p99_ms']:>8}"
+        )
+
+
+async def run(args: argparse.Namespace) -> bool:
+    db = await init_db()
+    try:
+        if not db.enabled or not db.pool:
+            logger.error("PostgreSQL is not available. Set USE_POSTGRESQL=true and check credentials.")
+            return False
+
+        manager = VectorIndexManager(db)
+
+        if args.command == "status":
+            print(json.dumps(await manager.index_status(), indent=2))
+        elif args.command == "ensure":
+            result = await manager.ensure_index(
+                method=args.method,
+                m=args.m,
+                ef_construction=args.ef_construction,
+                lists=args.lists,
+                rebuild=args.rebuild,
+                maintenance_work_mem=args.maintenance_work_mem,
+            )
+            print(json.dumps(result, indent=2))
+        elif args.command == "benchmark":
+            report = await manager.measure_recall(
+                k=args.k,
+                ef_search_values=args.ef_search,
+                probes_values=args.probes,
+                sample_size=args.queries,
+            )
+            if args.json:
+                print(json.dumps(report, indent=2))
+            else:
+                print_benchmark(report)
+        return True
+
+    except Exception as e:
+        logger.error(f"Vector index command failed: {e}", exc_info=True)
+        return False
+
+    finally:
+        await close_db()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Manage the pgvector index on patterns.embedding")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("status", help="Show the current index")
+
+    ensure = subparsers.add_parser("ensure", help="Create or replace the index")
+    ensure.add_argument("--method", choices=INDEX_METHODS, default="hnsw")
+    ensure.add_argument("--m", type=int, default=DEFAULT_HNSW_M, help="HNSW connections per layer")
+    ensure.add_argument("--ef-construction", type=int, default=DEFAULT_HNSW_EF_CONSTRUCTION,
+                        help="HNSW build candidate list size")
+    ensure.add_argument("--lists", type=int, default=None,
+                        help="IVFFlat list count (default: rows/1000, or sqrt(rows) above 1M)")
+    ensure.add_argument("--rebuild", action="store_true", help="Rebuild even if the index matches")
+    ensure.add_argument("--maintenance-work-mem", default=None, help="Build memory, e.g. 2GB")
+
+    benchmark = subparsers.add_parser("benchmark", help="Measure recall and latency")
+    benchmark.add_argument("--k", type=int, default=10, help="Neighbours per query (default: 10)")
+    benchmark.add_argument("--queries", type=int, default=50,
+                           help="Stored embeddings to sample as queries (default: 50)")
+    benchmark.add_argument("--ef-search", type=int, nargs="*", default=[], help="HNSW ef_search values")
+    benchmark.add_argument("--probes", type=int, nargs="*", default=[], help="IVFFlat probes values")
+    benchmark.add_argument("--json", action="store_true", help="Print the raw report as JSON")
+
+    args = parser.parse_args()
+    success = asyncio.run(run(args))
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -36,6 +36,7 @@ sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 
 from core.database import DatabaseManager
 from core.embeddings import EmbeddingGenerator
+from core.embedding_cache import EmbeddingCache, PostgresEmbeddingStore
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -134,7 +135,7 @@ class KnowledgeBaseMigrator:
                 # Generate embedding if requested
                 embedding = None
                 if generate_embeddings and self.embedding_gen and self.embedding_gen.enabled:
-                    embedding = self.embedding_gen.generate_pattern_embedding(pattern)
+                    embedding = await self.embedding_gen.generate_pattern_embedding_async(pattern)
                     if embedding:
                         self.stats["embeddings_generated"] += 1
 
@@ -406,6 +407,9 @@ async def main():
         embedding_gen = None
         if args.generate_embeddings:
             embedding_gen = EmbeddingGenerator()
+            # Re-runs reuse embeddings of unchanged pattern texts
+            if EmbeddingCache.wants_postgres_store():
+                embedding_gen.cache.attach_store(PostgresEmbeddingStore(db))
             if not embedding_gen.enabled:
                 logger.warning(
                     "Embedding generation requested but OPENAI_API_KEY not set. Skipping embeddings."
@@ -439,6 +443,8 @@ async def main():
         logger.info(f"Lessons learned:     {stats['lessons']}")
         if args.generate_embeddings:
             logger.info(f"Embeddings generated: {stats['embeddings_generated']}")
+            cache_stats = embedding_gen.cache.stats()
+            logger.info(f"Embedding cache:     {cache_stats['hits']} hits, {cache_stats['misses']} misses")
         logger.info(f"Errors:              {stats['errors']}")
         logger.info("=" * 60)
 
@@ -349,7 +349,14 @@ CREATE TABLE IF NOT EXISTS patterns (
 
 CREATE INDEX IF NOT EXISTS idx_patterns_repo_id ON patterns(repo_id);
 CREATE INDEX IF NOT EXISTS idx_patterns_name ON patterns(name);
-CREATE INDEX IF NOT EXISTS idx_patterns_embedding ON patterns USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+CREATE INDEX IF NOT EXISTS idx_patterns_embedding ON patterns USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+
+-- Embedding cache keyed by model:dimensions:sha256(normalized text)
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    key TEXT PRIMARY KEY,
+    embedding REAL[] NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
 
 -- Technical decisions table
 CREATE TABLE IF NOT EXISTS technical_decisions (
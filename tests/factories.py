@@ -0,0 +1,20 @@
+"""
+Test data factories shared by the component test modules
+"""
+
+from datetime import datetime
+
+from schemas.knowledge_base_v2 import Component
+
+
+def make_component(index: int, repository: str = "owner/repo") -> Component:
+    """Minimal api_client Component, distinct per index"""
+    return Component(
+        component_id=f"comp-{index}",
+        name=f"Component{index}",
+        component_type="api_client",
+        repository=repository,
+        files=[f"src/component_{index}.py"],
+        language="Python",
+        first_seen=datetime(2024, 1, 1),
+    )
@@ -0,0 +1,127 @@
+"""
+Unit tests for the Architectural Compliance A2A skills
+
+Tests the request limits of the validate_repositories batch skill and
+incremental validation through validate_repository_architecture.
+"""
+
+import unittest
+import asyncio
+from unittest.mock import MagicMock
+
+from a2a.skills.architectural_compliance import (
+    ValidateRepositoriesSkill,
+    ValidateRepositoryArchitectureSkill,
+    MAX_BATCH_WORKERS,
+)
+from core.architectural_validator import BatchValidationReport, CategoryResult, ValidationReport
+
+
+class TestValidateRepositoriesSkill(unittest.TestCase):
+    """Tests for ValidateRepositoriesSkill request limits"""
+
+    def setUp(self):
+        self.validator = MagicMock()
+        self.validator.validate_repositories.return_value = BatchValidationReport(
+            reports=[], summary={"repositories": 0, "average_compliance_score": 0.0}
+        )
+        self.skill = ValidateRepositoriesSkill(self.validator, max_repositories=3)
+
+    def test_max_workers_clamped(self):
+        """Test requested workers are capped on the server"""
+        result = asyncio.run(self.skill.execute({"repositories": ["o/a"], "max_workers": 10000}))
+
+        self.assertTrue(result["success"])
+        _, kwargs = self.validator.validate_repositories.call_args
+        self.assertEqual(kwargs["max_workers"], MAX_BATCH_WORKERS)
+
+    def test_invalid_max_workers_rejected(self):
+        """Test non-positive or non-integer worker counts are rejected"""
+        for value in (0, -1, "8", 2.5):
+            result = asyncio.run(self.skill.execute({"repositories": ["o/a"], "max_workers": value}))
+            self.assertFalse(result["success"])
+        self.validator.validate_repositories.assert_not_called()
+
+    def test_organization_over_limit_rejected(self):
+        """Test an organization larger than the server limit fails instead of being truncated"""
+        self.validator.list_organization_repositories.return_value = ["o/a", "o/b", "o/c", "o/d"]
+
+        result = asyncio.run(self.skill.execute({"organization": "o"}))
+
+        self.assertFalse(result["success"])
+        self.assertEqual((result["repositories"], result["max_repositories"]), (4, 3))
+        self.validator.validate_repositories.assert_not_called()
+
+    def test_requested_limit_cannot_exceed_server_limit(self):
+        """Test max_repositories only lowers the server limit"""
+        repositories = ["o/a", "o/b", "o/c", "o/d"]
+
+        raised = asyncio.run(self.skill.execute({"repositories": repositories, "max_repositories": 10}))
+        lowered = asyncio.run(self.skill.execute({"repositories": repositories[:3], "max_repositories": 2}))
+
+        self.assertEqual(raised["max_repositories"], 3)
+        self.assertEqual(lowered["max_repositories"], 2)
+        self.validator.validate_repositories.assert_not_called()
+
+    def test_within_limit_validates_all(self):
+        """Test requests within the limits validate every repository"""
+        result = asyncio.run(self.skill.execute({"repositories": ["o/a", "o/b", "o/c"]}))
+
+        self.assertTrue(result["success"])
+        args, _ = self.validator.validate_repositories.call_args
+        self.assertEqual(args[0], ["o/a", "o/b", "o/c"])
+
+
+class TestValidateRepositoryArchitectureSkill(unittest.TestCase):
+    """Tests for incremental validation through ValidateRepositoryArchitectureSkill"""
+
+    def setUp(self):
+        self.validator = MagicMock()
+        self.validator.validate_incremental.return_value = ValidationReport(
+            repository="o/a", overall_compliance_score=0.0, compliance_grade="F",
+            summary={}, categories={
+                "license": CategoryResult("license", passed=False, compliance_score=0.0, error="boom")
+            },
+            critical_violations=[], recommendations=[], scan_metadata={"commit": "b" * 40},
+        )
+        self.skill = ValidateRepositoryArchitectureSkill(self.validator)
+
+    def test_previous_report_passed_to_validator(self):
+        """Test a previous report given by the caller is the baseline of the incremental run"""
+        previous = {
+            "categories": {
+                "license": {
+                    "compliance_score": 0.5, "passed": False, "checks_performed": 2,
+                    "violations": [{"severity": "critical", "rule_id": "license_001",
+                                    "message": "No LICENSE", "recommendation": "Add one"}],
+                }
+            },
+            "scan_metadata": {"commit": "a" * 40},
+        }
+
+        result = asyncio.run(self.skill.execute({
+            "repository": "o/a", "base_commit": "a" * 7, "head_commit": "main",
+            "previous_report": previous, "notify_agents": False,
+        }))
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["categories"]["license"]["error"], "boom")
+        _, kwargs = self.validator.validate_incremental.call_args
+        report = kwargs["previous"]
+        self.assertEqual(report.scan_metadata["commit"], "a" * 40)
+        self.assertEqual([v.rule_id for v in report.critical_violations], ["license_001"])
+        self.assertEqual(report.categories["license"].violations[0].category, "license")
+
+    def test_invalid_previous_report_rejected(self):
+        """Test a malformed previous report fails instead of validating against nothing"""
+        result = asyncio.run(self.skill.execute({
+            "repository": "o/a", "changed_paths": ["README.md"],
+            "previous_report": {"categories": {"license": {"passed": True}}},
+        }))
+
+        self.assertFalse(result["success"])
+        self.validator.validate_incremental.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
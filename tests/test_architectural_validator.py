@@ -5,17 +5,28 @@ Tests repository scanner, validators, and utilities.
 Uses mocked GitHub client for isolated testing.
 """
 
+import base64
+import hashlib
+import json
+import shutil
+import subprocess
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from github import GithubException
 
+from core.scanner_cache import ScannerCache, DiskScannerStore
+from core.standards_loader import ParsedStandard
 from core.architectural_validator import (
+    ArchitecturalValidator,
+    LocalCloneScanner,
     RepositoryScanner,
     ValidationUtils,
     FileInfo,
     RepoStructure,
     Violation,
     CategoryResult,
+    ValidationReport,
     ValidationRule,
 )
 
@@ -39,7 +50,7 @@ class TestRepositoryScanner:
         """Test scanner initializes with GitHub client"""
         scanner = RepositoryScanner(mock_github_client)
         assert scanner.github == mock_github_client
-        assert len(scanner._file_cache) == 0
+        assert len(scanner.cache) == 0
 
     def test_file_exists_returns_true(self, scanner, mock_github_client):
         """Test file_exists returns True when file found"""
@@ -115,12 +126,12 @@ class TestRepositoryScanner:
     def test_clear_cache(self, scanner, mock_github_client):
         """Test clearing scanner cache"""
         # Add something to cache
-        scanner._file_cache["key"] = "value"
-        assert len(scanner._file_cache) > 0
+        scanner.cache.put("key", "value", 5)
+        assert len(scanner.cache) > 0
 
         # Clear cache
         scanner.clear_cache()
-        assert len(scanner._file_cache) == 0
+        assert len(scanner.cache) == 0
 
 
 class TestValidationUtils:
@@ -315,5 +326,717 @@ class TestViolation:
         assert v.standard_reference == ""
 
 
+def tree_response(entries, etag='W/"tree-1"', truncated=False):
+    """Raw requestJson() result for a recursive Git tree"""
+    tree = [
+        {"path": path, "type": type, "sha": sha or f"sha-{path}", "size": 10}
+        for path, type, sha in entries
+    ]
+    return 200, {"ETag": etag}, json.dumps({"tree": tree, "truncated": truncated})
+
+
+def blob_response(sha):
+    content = base64.b64encode(f"content of {sha}".encode()).decode()
+    return 200, {}, json.dumps({"sha": sha, "encoding": "base64", "content": content})
+
+
+def commit_sha(tree):
+    """Commit SHA of the head commit whose tree response is given"""
+    return hashlib.sha1(tree[2].encode()).hexdigest()
+
+
+class FakeRequester:
+    """Stand-in for Github.requester serving commits, trees, blobs and 304s"""
+
+    def __init__(self, tree):
+        self.tree = tree  # tree of the default branch's head
+        self.refs = {}  # other refs -> tree response of their commit
+        self.compare_files = []
+        self.requests = []
+
+    def requestJson(self, verb, url, parameters=None, headers=None):
+        self.requests.append((url, headers))
+        if "/compare/" in url:
+            return 200, {}, json.dumps({"files": self.compare_files})
+        if "/git/blobs/" in url:
+            return blob_response(url.rsplit("/", 1)[1])
+        if "/git/trees/" in url:
+            commit = url.rsplit("/", 1)[1]
+            return next(tree for tree in [self.tree, *self.refs.values()] if commit_sha(tree) == commit)
+
+        tree = self.refs.get(url.rsplit("/", 1)[1], self.tree)
+        if tree[0] >= 400:
+            return tree
+        if headers and headers.get("If-None-Match") == tree[1]["ETag"]:
+            return 304, {}, ""
+        return 200, {"ETag": tree[1]["ETag"]}, json.dumps({"sha": commit_sha(tree)})
+
+    def urls(self, fragment):
+        return [url for url, _ in self.requests if fragment in url]
+
+
+@pytest.fixture
+def requester(mock_github_client):
+    """Repository with README.md, docs/guide.md and a submodule on branch main"""
+    mock_github_client.get_repo.return_value = MagicMock(default_branch="main")
+    mock_github_client.requester = FakeRequester(tree_response([
+        ("README.md", "blob", "readme-v1"),
+        ("docs", "tree", None),
+        ("docs/guide.md", "blob", "guide-v1"),
+        ("vendor/lib", "commit", None),
+    ]))
+    return mock_github_client.requester
+
+
+class TestGitTreeScan:
+    """Test single-request structure scans and SHA-keyed contents"""
+
+    def test_structure_from_one_tree_request(self, scanner, requester):
+        """Test the whole tree comes from one recursive request"""
+        structure = scanner.scan_repository_structure("owner/repo")
+
+        assert requester.requests == [
+            ("/repos/owner/repo/commits/main", None),
+            (f"/repos/owner/repo/git/trees/{structure.commit}", None),
+        ]
+        assert structure.commit == commit_sha(requester.tree)
+        assert set(structure.files) == {"README.md", "docs/guide.md"}
+        assert structure.directories == {"docs"}
+        assert structure.files["README.md"].sha == "readme-v1"
+        assert scanner.api_calls == 3  # get_repo + commit + tree
+
+    def test_file_exists_answered_from_structure(self, scanner, requester, mock_github_client):
+        """Test file_exists makes no request once the repository is scanned"""
+        scanner.scan_repository_structure("owner/repo")
+
+        assert scanner.file_exists("owner/repo", "README.md") is True
+        assert scanner.file_exists("owner/repo", "docs") is True
+        assert scanner.file_exists("owner/repo", "LICENSE") is False
+        mock_github_client.get_repo.return_value.get_contents.assert_not_called()
+        assert scanner.api_calls == 3
+
+    def test_contents_cached_by_blob_sha_across_rescans(self, scanner, requester):
+        """Test unchanged blobs are not refetched after a new commit"""
+        scanner.scan_repository_structure("owner/repo")
+        assert scanner.get_file_content("owner/repo", "README.md") == "content of readme-v1"
+        assert scanner.get_file_content("owner/repo", "docs/guide.md") == "content of guide-v1"
+        assert scanner.get_file_content("owner/repo", "missing.md") is None
+
+        # New commit changes README.md only
+        requester.tree = tree_response([
+            ("README.md", "blob", "readme-v2"), ("docs", "tree", None), ("docs/guide.md", "blob", "guide-v1")
+        ], etag='W/"tree-2"')
+        scanner.scan_repository_structure("owner/repo", refresh=True)
+        scanner.get_file_content("owner/repo", "docs/guide.md")
+        assert scanner.get_file_content("owner/repo", "README.md") == "content of readme-v2"
+
+        assert [url.rsplit("/", 1)[1] for url in requester.urls("/git/blobs/")] == [
+            "readme-v1", "guide-v1", "readme-v2"
+        ]
+        assert scanner.api_calls == 8  # get_repo, 2 commits, 2 trees, 3 blobs
+
+    def test_pinned_structure_serves_reads_after_eviction(self, mock_github_client, requester):
+        """Test reads inside pinned() use the scanned structure once the tree entry is evicted"""
+        scanner = RepositoryScanner(mock_github_client, cache=ScannerCache(max_entries=1))
+        requester.refs["feature"] = tree_response([("README.md", "blob", "readme-feature")], etag='W/"feature"')
+        structure = scanner.scan_repository_structure("owner/repo", ref="feature")
+
+        with scanner.pinned("owner/repo", structure):
+            assert scanner.get_file_content("owner/repo", "README.md") == "content of readme-feature"
+            assert scanner.get_file_content("owner/repo", "docs/guide.md") is None
+            assert scanner.file_exists("owner/repo", "docs") is False
+
+        mock_github_client.get_repo.return_value.get_contents.assert_not_called()
+        assert scanner._pinned.get("owner/repo") is None
+
+    def test_truncated_tree_falls_back_to_traversal(self, scanner, requester, mock_github_client):
+        """Test truncated trees are walked directory by directory"""
+        requester.tree = tree_response([("README.md", "blob", None)], truncated=True)
+        repo = mock_github_client.get_repo.return_value
+        repo.get_contents.return_value = [MagicMock(path="LICENSE", type="file", size=10, sha="lic")]
+
+        structure = scanner.scan_repository_structure("owner/repo")
+
+        assert set(structure.files) == {"LICENSE"}
+        repo.get_contents.assert_called_once_with("", ref=commit_sha(requester.tree))
+
+    def test_empty_repository(self, scanner, requester):
+        """Test an empty repository scans as an empty structure"""
+        requester.tree = (409, {}, json.dumps({"message": "Git Repository is empty."}))
+
+        structure = scanner.scan_repository_structure("owner/repo")
+
+        assert structure.files == {}
+
+
+class TestScannerRevalidation:
+    """Test ETag revalidation and the shared disk tier"""
+
+    def test_unchanged_tree_revalidates_with_304(self, scanner, requester):
+        """Test rescans send If-None-Match and keep the structure on 304"""
+        first = scanner.scan_repository_structure("owner/repo")
+        second = scanner.scan_repository_structure("owner/repo", refresh=True)
+
+        assert second is first
+        assert requester.requests[-1] == ("/repos/owner/repo/commits/main", {"If-None-Match": 'W/"tree-1"'})
+        assert scanner.api_calls == 3
+        assert scanner.not_modified == 1
+
+    def test_structure_within_ttl_is_not_revalidated(self, scanner, requester):
+        """Test scans without refresh are served from the cache until the TTL"""
+        scanner.scan_repository_structure("owner/repo")
+        scanner.scan_repository_structure("owner/repo")
+        assert len(requester.requests) == 2
+
+        scanner.cache.ttl = 0
+        scanner.scan_repository_structure("owner/repo")
+        assert len(requester.requests) == 3
+
+    def test_disk_tier_shared_across_scanners(self, tmp_path, mock_github_client, requester):
+        """Test a second process reuses structures and blobs from disk"""
+        path = str(tmp_path / "scanner.sqlite3")
+        first = RepositoryScanner(mock_github_client, ScannerCache(store=DiskScannerStore(path)))
+        first.scan_repository_structure("owner/repo")
+        first.get_file_content("owner/repo", "README.md")
+
+        second = RepositoryScanner(mock_github_client, ScannerCache(store=DiskScannerStore(path)))
+        second.scan_repository_structure("owner/repo", refresh=True)
+
+        assert second.get_file_content("owner/repo", "README.md") == "content of readme-v1"
+        assert second.api_calls == 0
+        assert second.not_modified == 1
+        assert second.stats()["cache"]["store_hits"] == 2
+
+    def test_validator_reports_cache_stats(self, mock_github_client, requester):
+        """Test hit-rate stats are exposed by the validator"""
+        loader = MagicMock()
+        loader.list_categories.return_value = []
+        validator = ArchitecturalValidator(mock_github_client, loader, clone_scanner=MagicMock())
+
+        validator.validate_repository("owner/repo")
+        report = validator.validate_repository("owner/repo")
+
+        assert report.scan_metadata["github_api_calls"] == 0
+        stats = validator.cache_stats()
+        assert stats["not_modified"] == 1
+        assert stats["cache"]["hits"] >= 1
+        assert 0 < stats["cache"]["hit_rate"] <= 1
+
+def git(cwd, *args):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def source_repo(tmp_path):
+    """Git repository served over file:// with partial clone allowed"""
+    root = tmp_path / "origin" / "owner" / "repo"
+    (root / "terraform" / "scripts").mkdir(parents=True)
+    (root / "LICENSE").write_text("GNU GENERAL PUBLIC LICENSE")
+    (root / "README.md").write_text("# Repo\n\n## Usage\n")
+    (root / "terraform" / "scripts" / "terraform-init-unified.sh").write_text("#!/bin/sh\n")
+    git(root, "init", "--quiet")
+    git(root, "add", ".")
+    git(root, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "--quiet", "-m", "initial")
+    git(root, "config", "uploadpack.allowFilter", "true")
+    return root
+
+
+@pytest.fixture
+def clone_scanner(tmp_path, source_repo):
+    """LocalCloneScanner cloning from the file:// source repository"""
+    return LocalCloneScanner(
+        clone_dir=str(tmp_path / "clones"),
+        checkout_root="",
+        url_template=f"file://{tmp_path / 'origin'}/{{repo}}",
+        token="",
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestLocalCloneScanner:
+    """Test LocalCloneScanner against a local git repository"""
+
+    def test_scan_structure_from_blobless_clone(self, clone_scanner):
+        """Test structure is read from the clone's trees"""
+        structure = clone_scanner.scan_repository_structure("owner/repo")
+
+        assert set(structure.files) == {"LICENSE", "README.md", "terraform/scripts/terraform-init-unified.sh"}
+        assert structure.directories == {"terraform", "terraform/scripts"}
+        assert all(info.sha for info in structure.files.values())
+
+    def test_file_exists_served_from_structure(self, clone_scanner):
+        """Test file_exists matches files and directories without further git calls"""
+        clone_scanner.scan_repository_structure("owner/repo")
+        with patch.object(clone_scanner, "_git", side_effect=AssertionError("unexpected git call")):
+            assert clone_scanner.file_exists("owner/repo", "LICENSE") is True
+            assert clone_scanner.file_exists("owner/repo", "terraform/") is True
+            assert clone_scanner.file_exists("owner/repo", "Dockerfile") is False
+
+    def test_get_file_content_fetches_blob_lazily(self, clone_scanner):
+        """Test file content is read from the clone and cached"""
+        assert clone_scanner.get_file_content("owner/repo", "README.md").startswith("# Repo")
+        assert clone_scanner.get_file_content("owner/repo", "missing.md") is None
+        sha = clone_scanner._structure_cache["owner/repo"].files["README.md"].sha
+        assert clone_scanner.cache.get(f"blob:{sha}").startswith("# Repo")
+
+    def test_rescan_after_clear_cache_fetches_new_commit(self, clone_scanner, source_repo):
+        """Test an existing clone is refreshed rather than recloned"""
+        clone_scanner.scan_repository_structure("owner/repo")
+        (source_repo / "Dockerfile").write_text("FROM python:3.11-slim\n")
+        git(source_repo, "add", ".")
+        git(source_repo, "-c", "user.name=test", "-c", "user.email=test@example.com",
+            "commit", "--quiet", "-m", "add Dockerfile")
+
+        assert clone_scanner.file_exists("owner/repo", "Dockerfile") is False
+        clone_scanner.clear_cache()
+        assert clone_scanner.file_exists("owner/repo", "Dockerfile") is True
+
+    def test_scan_at_ref_reads_that_commit(self, clone_scanner, source_repo):
+        """Test a ref scan records the commit and switches reads to it"""
+        initial = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=source_repo, check=True, capture_output=True
+        ).stdout.decode().strip()
+        (source_repo / "Dockerfile").write_text("FROM python:3.11-slim\n")
+        git(source_repo, "add", ".")
+        git(source_repo, "-c", "user.name=test", "-c", "user.email=test@example.com",
+            "commit", "--quiet", "-m", "add Dockerfile")
+
+        assert clone_scanner.scan_repository_structure("owner/repo").commit != initial
+        assert clone_scanner.file_exists("owner/repo", "Dockerfile") is True
+
+        assert clone_scanner.scan_repository_structure("owner/repo", ref=initial).commit == initial
+        assert clone_scanner.file_exists("owner/repo", "Dockerfile") is False
+
+    def test_local_checkout_read_in_place(self, tmp_path, source_repo):
+        """Test a checkout under checkout_root is used without cloning"""
+        scanner = LocalCloneScanner(
+            clone_dir=str(tmp_path / "clones"), checkout_root=str(tmp_path / "origin"), token=""
+        )
+
+        structure = scanner.scan_repository_structure("owner/repo")
+
+        assert "terraform/scripts/terraform-init-unified.sh" in structure.files
+        assert not any(path.startswith(".git") for path in structure.files)
+        assert structure.files["LICENSE"].size == len("GNU GENERAL PUBLIC LICENSE")
+        assert scanner.get_file_content("owner/repo", "LICENSE") == "GNU GENERAL PUBLIC LICENSE"
+        assert not (tmp_path / "clones").exists()
+
+    def test_prefetch_fetches_blobs_in_one_batch(self, clone_scanner):
+        """Test prefetched contents are served without further git calls"""
+        assert clone_scanner.prefetch("owner/repo", ["README.md", "LICENSE", "missing.md"]) == 2
+        assert clone_scanner.prefetch("owner/repo", ["README.md"]) == 0
+
+        with patch.object(clone_scanner, "_git", side_effect=AssertionError("unexpected git call")):
+            assert clone_scanner.get_file_content("owner/repo", "LICENSE") == "GNU GENERAL PUBLIC LICENSE"
+            assert clone_scanner.get_file_content("owner/repo", "README.md").startswith("# Repo")
+
+    def test_unreachable_repository_raises(self, clone_scanner):
+        """Test clone failures surface as RuntimeError"""
+        with pytest.raises(RuntimeError):
+            clone_scanner.scan_repository_structure("owner/missing")
+        assert clone_scanner.file_exists("owner/missing", "LICENSE") is False
+
+
+class TestConcurrentValidation:
+    """Test prefetching and concurrent category validation"""
+
+    @pytest.fixture
+    def validator(self, mock_github_client, requester):
+        requester.tree = tree_response([
+            ("LICENSE", "blob", "license-sha"),
+            ("README.md", "blob", "readme-sha"),
+            ("CLAUDE.md", "blob", "claude-sha"),
+            ("Dockerfile", "blob", "dockerfile-sha"),
+        ])
+        loader = MagicMock()
+        loader.list_categories.return_value = ["license", "documentation", "custom"]
+        loader.get_standard.side_effect = lambda category: MagicMock(
+            category=category,
+            validation_rules=[
+                ValidationRule("custom_001", "custom", "low", "Dockerfile pins a base image",
+                               "file_contains", {"path": "Dockerfile", "pattern": "FROM"}, "Pin it"),
+                ValidationRule("custom_002", "custom", "low", "Makefile exists",
+                               "file_exists", {"path": "Makefile"}, "Add one"),
+            ] if category == "custom" else []
+        )
+        return ArchitecturalValidator(mock_github_client, loader, clone_scanner=MagicMock(), max_workers=4)
+
+    def test_prefetches_union_of_files_once(self, validator, requester):
+        """Test each file read by any category is fetched once, before validation"""
+        report = validator.validate_repository("owner/repo", concurrent=True)
+
+        blobs = sorted(url.rsplit("/", 1)[1] for url in requester.urls("/git/blobs/"))
+        assert blobs == ["claude-sha", "dockerfile-sha", "license-sha", "readme-sha"]
+        assert report.scan_metadata["concurrent"] is True
+        assert report.scan_metadata["prefetched_files"] == 4
+        assert list(report.categories) == ["license", "documentation", "custom"]
+        assert all(result.duration_ms >= 0 for result in report.categories.values())
+
+    def test_concurrent_and_sequential_reports_match(self, validator):
+        """Test concurrency does not change results"""
+        concurrent = validator.validate_repository("owner/repo", concurrent=True)
+        sequential = validator.validate_repository("owner/repo", concurrent=False)
+
+        def outcome(report):
+            return {
+                category: (result.compliance_score, sorted(v.rule_id for v in result.violations))
+                for category, result in report.categories.items()
+            }
+
+        assert outcome(concurrent) == outcome(sequential)
+        assert concurrent.overall_compliance_score == sequential.overall_compliance_score
+        assert sequential.scan_metadata["prefetched_files"] == 0
+
+    def test_failing_category_does_not_stop_others(self, validator):
+        """Test an exception in one category yields a failed result for it only"""
+        validator.validators["license"].validate = MagicMock(side_effect=RuntimeError("boom"))
+
+        report = validator.validate_repository("owner/repo", concurrent=True)
+
+        assert report.categories["license"].passed is False
+        assert report.categories["license"].compliance_score == 0.0
+        assert report.categories["license"].error == "boom"
+        assert report.categories["documentation"].checks_performed > 0
+
+
+class TestBatchValidation:
+    """Test multi-repository validation with a shared scanner and standards"""
+
+    @pytest.fixture
+    def standards_loader(self):
+        loader = MagicMock()
+        loader.list_categories.return_value = ["license", "documentation"]
+        loader.get_standard.side_effect = lambda category: MagicMock(category=category, validation_rules=[])
+        return loader
+
+    @pytest.fixture
+    def validator(self, mock_github_client, standards_loader, requester):
+        def get_repo(repo_name):
+            if repo_name == "owner/missing":
+                raise GithubException(404, {"message": "Not Found"}, None)
+            return MagicMock(default_branch="main")
+
+        mock_github_client.get_repo.side_effect = get_repo
+        return ArchitecturalValidator(mock_github_client, standards_loader, clone_scanner=MagicMock())
+
+    def test_validates_each_repository_once(self, validator, standards_loader):
+        """Test duplicates are dropped, failures reported and standards selected once"""
+        repositories = ["owner/one", "owner/two", "owner/one", "owner/missing"]
+
+        batch = validator.validate_repositories(repositories, max_workers=3)
+
+        assert sorted(r.repository for r in batch.reports) == ["owner/missing", "owner/one", "owner/two"]
+        assert standards_loader.get_standard.call_count == 2
+        summary = batch.summary
+        assert (summary["repositories"], summary["validated"], summary["failed"]) == (3, 2, 1)
+        assert summary["failed_repositories"] == ["owner/missing"]
+        assert set(summary["category_pass_rates"]) == {"license", "documentation"}
+        assert set(summary["latency_ms"]) == {"min", "p50", "p95", "max", "mean"}
+        assert summary["github_api_calls"] == sum(r.scan_metadata["github_api_calls"] for r in batch.reports)
+
+    def test_per_repository_api_calls(self, validator, requester):
+        """Test concurrent repositories do not count each other's requests"""
+        batch = validator.validate_repositories(["owner/one", "owner/two"], max_workers=2)
+
+        for report in batch.reports:
+            # default branch + tree, blobs are shared by SHA
+            assert report.scan_metadata["github_api_calls"] >= 2
+        assert len(requester.urls("/git/blobs/readme-v1")) == 1
+
+    def test_reports_stream_as_completed(self, validator):
+        """Test each report reaches the callback, in the order they are returned"""
+        streamed = []
+
+        batch = validator.validate_repositories(["owner/one", "owner/two"], on_report=streamed.append)
+
+        assert streamed == batch.reports
+
+    def test_unknown_backend_rejected_before_starting(self, validator, mock_github_client):
+        """Test an invalid backend fails the whole batch up front"""
+        with pytest.raises(ValueError):
+            validator.validate_repositories(["owner/one"], backend="svn")
+        mock_github_client.get_repo.assert_not_called()
+
+    def test_list_organization_repositories(self, validator, mock_github_client):
+        """Test archived repositories and forks are skipped, users are accepted"""
+        repos = [
+            MagicMock(full_name="someone/active", archived=False, fork=False),
+            MagicMock(full_name="someone/old", archived=True, fork=False),
+            MagicMock(full_name="someone/fork", archived=False, fork=True),
+        ]
+        mock_github_client.get_organization.side_effect = GithubException(404, {"message": "Not Found"}, None)
+        mock_github_client.get_user.return_value.get_repos.return_value = repos
+
+        assert validator.list_organization_repositories("someone") == ["someone/active"]
+        assert validator.list_organization_repositories("someone", include_archived=True) == [
+            "someone/active", "someone/old"
+        ]
+
+
+class TestIncrementalValidation:
+    """Test revalidation limited to what changed paths affect"""
+
+    @pytest.fixture
+    def standards(self):
+        return {
+            "license": ParsedStandard(category="license", title="License", content_hash="license-v1"),
+            "documentation": ParsedStandard(category="documentation", title="Docs", content_hash="docs-v1"),
+            "custom": ParsedStandard(category="custom", title="Custom", content_hash="custom-v1", validation_rules=[
+                ValidationRule("custom_001", "custom", "low", "Dockerfile pins a base image",
+                               "file_contains", {"path": "Dockerfile", "pattern": "FROM"}, "Pin it"),
+                ValidationRule("custom_002", "custom", "low", "Makefile exists",
+                               "file_exists", {"path": "Makefile"}, "Add one"),
+            ]),
+        }
+
+    @pytest.fixture
+    def validator(self, mock_github_client, requester, standards):
+        requester.tree = tree_response([
+            ("LICENSE", "blob", "license-sha"),
+            ("README.md", "blob", "readme-sha"),
+            ("Dockerfile", "blob", "dockerfile-sha"),
+        ])
+        loader = MagicMock()
+        loader.list_categories.return_value = list(standards)
+        loader.get_standard.side_effect = standards.get
+        return ArchitecturalValidator(mock_github_client, loader, clone_scanner=MagicMock(), max_workers=1)
+
+    def test_unrelated_change_reuses_all_results(self, validator, requester):
+        """Test a change no check looks at re-runs nothing"""
+        full = validator.validate_repository("owner/repo")
+        blobs_before = len(requester.urls("/git/blobs/"))
+
+        report = validator.validate_incremental("owner/repo", changed_paths=["src/foo.py"])
+
+        assert report.scan_metadata["incremental"] is True
+        assert report.scan_metadata["revalidated_categories"] == []
+        assert report.scan_metadata["reused_categories"] == ["license", "documentation", "custom"]
+        assert report.overall_compliance_score == full.overall_compliance_score
+        assert report.summary == full.summary
+        assert len(requester.urls("/git/blobs/")) == blobs_before
+
+    def test_changed_validator_path_reruns_category(self, validator):
+        """Test categories whose checked paths changed are re-run in full"""
+        validator.validate_repository("owner/repo")
+
+        report = validator.validate_incremental("owner/repo", changed_paths=["README.md"])
+
+        assert report.scan_metadata["revalidated_categories"] == ["license", "documentation"]
+        assert report.scan_metadata["reused_categories"] == ["custom"]
+
+    def test_generic_rules_reevaluated_per_file(self, validator, requester):
+        """Test only the rules on changed files are re-evaluated, others keep their outcome"""
+        full = validator.validate_repository("owner/repo")
+        assert {v.rule_id for v in full.categories["custom"].violations} == {"custom_001", "custom_002"}
+
+        requester.tree = tree_response([
+            ("LICENSE", "blob", "license-sha"),
+            ("README.md", "blob", "readme-sha"),
+            ("Dockerfile", "blob", "dockerfile-sha"),
+            ("Makefile", "blob", "makefile-sha"),
+        ], etag='W/"tree-2"')
+        with patch.object(validator.scanner, "get_file_content", wraps=validator.scanner.get_file_content) as reads:
+            report = validator.validate_incremental("owner/repo", changed_paths=["Makefile"])
+
+        reads.assert_not_called()
+        assert report.scan_metadata["revalidated_categories"] == ["custom"]
+        assert [v.rule_id for v in report.categories["custom"].violations] == ["custom_001"]
+        assert report.summary["failed_checks"] == full.summary["failed_checks"] - 1
+
+    def test_changed_standard_reruns_category(self, validator, standards):
+        """Test a category whose standard changed is re-run even if no path it checks changed"""
+        validator.validate_repository("owner/repo")
+        standards["license"] = ParsedStandard(category="license", title="License", content_hash="license-v2")
+
+        report = validator.validate_incremental("owner/repo", changed_paths=[])
+
+        assert report.scan_metadata["revalidated_categories"] == ["license"]
+
+    def test_errored_category_rerun(self, validator):
+        """Test a category that failed to validate is not carried forward as a result"""
+        license_validator = validator.validators["license"]
+        validate = license_validator.validate
+        license_validator.validate = MagicMock(side_effect=RuntimeError("boom"))
+        validator.validate_repository("owner/repo")
+        license_validator.validate = validate
+
+        report = validator.validate_incremental("owner/repo", changed_paths=["src/foo.py"])
+
+        assert report.scan_metadata["revalidated_categories"] == ["license"]
+        assert report.categories["license"].error is None
+        assert report.categories["license"].checks_performed > 0
+
+    def test_scoped_run_does_not_replace_baseline(self, validator):
+        """Test only full validations become the baseline, so no category is dropped"""
+        full = validator.validate_repository("owner/repo")
+        validator.validate_repository("owner/repo", scope=["license"])
+
+        report = validator.validate_incremental("owner/repo", changed_paths=["src/foo.py"])
+
+        assert validator.last_report("owner/repo") is report
+        assert report.scan_metadata["reused_categories"] == ["license", "documentation", "custom"]
+        assert report.summary == full.summary
+
+    def test_scoped_previous_report_completed(self, validator):
+        """Test categories missing from a given previous report are validated, not dropped"""
+        previous = validator.validate_repository("owner/repo", scope=["license"])
+
+        report = validator.validate_incremental("owner/repo", previous=previous, changed_paths=["src/foo.py"])
+
+        assert list(report.categories) == ["license", "documentation", "custom"]
+        assert report.scan_metadata["revalidated_categories"] == ["documentation", "custom"]
+
+    def test_previous_report_from_dict(self, validator):
+        """Test a report passed back in its JSON form is a usable baseline"""
+        full = validator.validate_repository("owner/repo")
+        data = {
+            "categories": {
+                name: {
+                    "compliance_score": result.compliance_score,
+                    "passed": result.passed,
+                    "checks_performed": result.checks_performed,
+                    "violations": [
+                        {"severity": v.severity, "rule_id": v.rule_id, "message": v.message,
+                         "recommendation": v.recommendation, "file_path": v.file_path}
+                        for v in result.violations
+                    ],
+                }
+                for name, result in full.categories.items()
+            },
+            "scan_metadata": full.scan_metadata,
+        }
+        validator.last_reports.clear()
+
+        report = validator.validate_incremental(
+            "owner/repo", previous=ValidationReport.from_dict(data), changed_paths=["src/foo.py"]
+        )
+
+        assert report.scan_metadata["revalidated_categories"] == []
+        assert report.summary == full.summary
+        assert report.critical_violations == full.critical_violations
+
+    def test_baselines_bounded(self, validator):
+        """Test the least recently used baseline is dropped past max_baselines"""
+        validator.max_baselines = 2
+        for repo in ("owner/a", "owner/b"):
+            validator.validate_repository(repo)
+        validator.last_report("owner/a")
+        validator.validate_repository("owner/c")
+
+        assert list(validator.last_reports) == ["owner/a", "owner/c"]
+
+    def test_commit_range_compared_through_api(self, validator, requester):
+        """Test base/head commits are turned into changed paths with one compare request"""
+        base = validator.validate_repository("owner/repo").scan_metadata["commit"]
+        requester.refs["feature"] = tree_response([
+            ("LICENSE", "blob", "license-sha"), ("README.md", "blob", "readme-sha"),
+        ], etag='W/"feature"')
+        requester.compare_files = [{"filename": "docs/NEW.md", "previous_filename": "CLAUDE.md"}]
+
+        report = validator.validate_incremental("owner/repo", base=base[:7], head="feature")
+
+        head = commit_sha(requester.refs["feature"])
+        assert requester.urls(f"/compare/{base[:7]}...{head}")
+        assert report.scan_metadata["commit"] == head
+        assert report.scan_metadata["changed_paths"] == 2
+        assert report.scan_metadata["revalidated_categories"] == ["documentation"]
+
+    def test_head_scanned_and_read(self, validator, requester):
+        """Test re-evaluated rules read the files of head, not of the default branch"""
+        validator.validate_repository("owner/repo")
+        requester.refs["feature"] = tree_response([
+            ("LICENSE", "blob", "license-sha"), ("README.md", "blob", "readme-sha"),
+            ("Dockerfile", "blob", "dockerfile-sha"), ("Makefile", "blob", "makefile-sha"),
+        ], etag='W/"feature"')
+
+        report = validator.validate_incremental("owner/repo", changed_paths=["Makefile"], head="feature")
+
+        assert report.scan_metadata["commit"] == commit_sha(requester.refs["feature"])
+        assert [v.rule_id for v in report.categories["custom"].violations] == ["custom_001"]
+
+    def test_reads_pinned_to_scanned_structure(self, validator, requester, mock_github_client):
+        """Test a validation reads the commit it scanned even when its cached tree is evicted"""
+        validator.scanner.cache = ScannerCache(max_entries=1)
+        requester.refs["feature"] = tree_response([
+            ("LICENSE", "blob", "license-sha"), ("README.md", "blob", "readme-sha"),
+            ("Dockerfile", "blob", "dockerfile-sha"), ("Makefile", "blob", "makefile-sha"),
+        ], etag='W/"feature"')
+
+        report = validator.validate_repository("owner/repo", ref="feature")
+
+        mock_github_client.get_repo.return_value.get_contents.assert_not_called()
+        assert report.scan_metadata["commit"] == commit_sha(requester.refs["feature"])
+        assert [v.rule_id for v in report.categories["custom"].violations] == ["custom_001"]
+
+    def test_base_not_validated_by_previous_report_validates_fully(self, validator, requester):
+        """Test a base other than the previously validated commit is not trusted"""
+        validator.validate_repository("owner/repo")
+
+        report = validator.validate_incremental("owner/repo", base="abc1234", head="main")
+
+        assert not requester.urls("/compare/")
+        assert "incremental" not in report.scan_metadata
+        assert report.scan_metadata["commit"] == commit_sha(requester.tree)
+
+    def test_without_previous_report_validates_fully(self, validator):
+        """Test there is nothing to reuse on the first run"""
+        report = validator.validate_incremental("owner/repo", changed_paths=["README.md"])
+
+        assert "incremental" not in report.scan_metadata
+        assert list(report.categories) == ["license", "documentation", "custom"]
+        assert validator.last_reports["owner/repo"] is report
+
+    def test_change_set_required(self, validator):
+        """Test changed paths or a commit range must be given"""
+        with pytest.raises(ValueError):
+            validator.validate_incremental("owner/repo")
+
+
+class TestScannerBackendSelection:
+    """Test per-call scanner backend selection in ArchitecturalValidator"""
+
+    @pytest.fixture
+    def standards_loader(self):
+        loader = MagicMock()
+        loader.list_categories.return_value = ["license"]
+        loader.get_standard.return_value = MagicMock(category="license", validation_rules=[])
+        return loader
+
+    def test_backend_selects_scanner(self, mock_github_client, standards_loader):
+        """Test validators read through the requested backend's scanner"""
+        clone = MagicMock()
+        clone.file_exists.return_value = True
+        clone.get_file_content.return_value = "x" * 40000
+        validator = ArchitecturalValidator(mock_github_client, standards_loader, clone_scanner=clone)
+
+        report = validator.validate_repository("owner/repo", backend="clone")
+
+        clone.scan_repository_structure.assert_called_once_with("owner/repo", refresh=True, ref=None)
+        clone.file_exists.assert_called_with("owner/repo", "LICENSE")
+        mock_github_client.get_repo.assert_not_called()
+        assert report.scan_metadata["scanner_backend"] == "clone"
+        assert report.scan_metadata["github_api_calls"] == 0
+        assert validator.validators["license"].scanner is validator.scanner
+
+    def test_failed_clone_falls_back_to_api(self, mock_github_client, standards_loader, requester):
+        """Test a clone failure validates through the GitHub API instead"""
+        clone = MagicMock()
+        clone.scan_repository_structure.side_effect = RuntimeError("git fetch failed")
+        validator = ArchitecturalValidator(mock_github_client, standards_loader, clone_scanner=clone)
+
+        report = validator.validate_repository("owner/repo", backend="clone")
+
+        assert report.scan_metadata["scanner_backend"] == "api"
+        assert report.scan_metadata["files_scanned"] == 2
+        mock_github_client.get_repo.assert_called_with("owner/repo")
+        clone.file_exists.assert_not_called()
+
+    def test_unknown_backend_rejected(self, mock_github_client, standards_loader):
+        """Test unknown backends raise ValueError"""
+        validator = ArchitecturalValidator(mock_github_client, standards_loader, clone_scanner=MagicMock())
+        with pytest.raises(ValueError):
+            validator.validate_repository("owner/repo", backend="svn")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,12 +4,21 @@ Unit tests for Component Analysis Engine
 Tests ComponentScanner, VectorCacheManager, and CentralityCalculator classes.
 """
 
+import os
+import ast
+import json
+import asyncio
 import unittest
 import tempfile
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import patch
 
-from core.component_analyzer import ComponentScanner, CentralityCalculator
+import core.component_analyzer as component_analyzer
+from core.component_analyzer import (
+    ComponentScanner, CentralityCalculator, ComponentFeatureExtractor, ComponentClassifier, ClassificationRule
+)
+from core.component_scan_cache import ComponentScanCache
 from schemas.knowledge_base_v2 import Component, KnowledgeBaseV2, RepositoryMetadata, PatternEntry
 
 
@@ -152,6 +161,262 @@ resource "google_cloud_run_service" "api" {
         self.assertGreater(len(deployment), 0)
 
 
+class TestComponentFeatureExtractor(unittest.TestCase):
+    """Tests for the single-pass feature extractor"""
+
+    SOURCE = '''
+"""Payments client"""
+
+import os
+import requests
+from typing import List
+from requests import adapters
+
+class PaymentsClient:
+    def charge(self, amount):
+        if amount <= 0:
+            raise ValueError("amount")
+        for attempt in range(3):
+            try:
+                return requests.post("/charge", json={"amount": amount})
+            except requests.RequestException:
+                continue
+        handler = lambda x: [y for y in x if y]
+        return None
+
+    def _sign(self, payload):
+        while payload:
+            payload = payload[1:]
+
+def build_payments_client():
+    billing_service = None
+    return PaymentsClient()
+'''
+
+    def test_extracts_all_features_in_one_pass(self):
+        features = ComponentFeatureExtractor().extract(ast.parse(self.SOURCE), self.SOURCE)
+
+        self.assertEqual(features.public_methods, ["PaymentsClient.charge", "charge", "build_payments_client"])
+        self.assertEqual(features.imports, ["os", "requests", "typing"])
+        # if + for + except + while, plus one
+        self.assertEqual(features.complexity, 5.0)
+        self.assertEqual(features.docstring, "Payments client")
+        self.assertEqual(features.api_signature, "PaymentsClient.charge, charge, build_payments_client")
+        self.assertEqual(
+            set(features.terms),
+            {"PaymentsClient", "charge", "_sign", "build_payments_client", "billing_service"}
+        )
+
+    def test_record_uses_slots_and_extractor_is_reusable(self):
+        extractor = ComponentFeatureExtractor()
+        first = extractor.extract(ast.parse(self.SOURCE), self.SOURCE)
+        second = extractor.extract(ast.parse("import json\n"), "import json\n")
+
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertEqual(second.imports, ["json"])
+        self.assertEqual(second.public_methods, [])
+        self.assertEqual(second.complexity, 1.0)
+
+
+CLIENT_TEMPLATE = '''
+"""Client {index}"""
+
+import requests
+
+class Client{index}:
+    def fetch(self, url):
+        return requests.get(url)
+''' + "\n" * 20
+
+
+class TestIncrementalParallelScan(unittest.TestCase):
+    """Tests for the single-walk, cached and parallel scanning engine"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repo_root = Path(self.temp_dir.name) / "repo"
+        for index in range(4):
+            path = self.repo_root / "pkg" / f"service_{index}_client.py"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(CLIENT_TEMPLATE.format(index=index))
+        self.cache = ComponentScanCache(os.path.join(self.temp_dir.name, "scan.sqlite3"))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def scan(self, **kwargs):
+        scanner = ComponentScanner(min_loc=10, max_workers=1, cache=self.cache, **kwargs)
+        components = scanner.scan_repository(str(self.repo_root), "test/repo")
+        return components, scanner.last_scan_report
+
+    def test_rescan_only_parses_changed_files(self):
+        first, report = self.scan()
+        self.assertEqual((report["parsed"], report["cache_hits"]), (4, 0))
+
+        changed = self.repo_root / "pkg" / "service_1_client.py"
+        changed.write_text(CLIENT_TEMPLATE.format(index=99))
+        (self.repo_root / "pkg" / "service_3_client.py").unlink()
+
+        second, report = self.scan()
+        self.assertEqual((report["parsed"], report["cache_hits"]), (1, 2))
+        self.assertEqual(len(second), 3)
+        self.assertEqual(second[0].model_dump(), first[0].model_dump())
+        self.assertEqual(sorted(self.cache.load("test/repo")), [
+            "pkg/service_0_client.py", "pkg/service_1_client.py", "pkg/service_2_client.py"
+        ])
+
+    def test_touched_but_unchanged_file_is_a_hash_hit(self):
+        self.scan()
+        os.utime(self.repo_root / "pkg" / "service_0_client.py", ns=(1, 1))
+
+        _, report = self.scan()
+        self.assertEqual((report["parsed"], report["cache_hits"]), (0, 4))
+
+    def test_walk_prunes_vendor_directories(self):
+        for directory in ("node_modules/lib", ".git/hooks", "venv/lib"):
+            path = self.repo_root / directory / "vendored_client.py"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(CLIENT_TEMPLATE.format(index=0))
+
+        files = ComponentScanner(cache=False)._walk_repository(self.repo_root)
+        self.assertEqual(len(files["python"]), 4)
+
+    def test_process_pool_matches_in_process_scan(self):
+        serial, _ = self.scan()
+        self.cache.clear()
+
+        with patch.object(component_analyzer, "PARALLEL_SCAN_MIN_FILES", 2):
+            scanner = ComponentScanner(min_loc=10, max_workers=2, cache=False)
+            parallel = scanner.scan_repository(str(self.repo_root), "test/repo")
+
+        self.assertEqual(scanner.last_scan_report["workers"], 2)
+        self.assertEqual(
+            [(c.component_id, c.component_type, c.lines_of_code) for c in parallel],
+            [(c.component_id, c.component_type, c.lines_of_code) for c in serial]
+        )
+
+    def test_iter_repository_streams_window_by_window(self):
+        expected = [c.component_id for c in self.scan()[0]]
+        self.cache.clear()
+
+        with patch.object(component_analyzer, "SCAN_WINDOW_FILES", 2):
+            scanner = ComponentScanner(min_loc=10, max_workers=1, cache=self.cache)
+            stream = scanner.iter_repository(str(self.repo_root), "test/repo")
+            first = next(stream)
+            # Only the first window has been parsed and cached so far
+            self.assertEqual(len(self.cache.load("test/repo")), 2)
+            self.assertIsNone(scanner.last_scan_report)
+            rest = list(stream)
+
+        self.assertEqual([first.component_id] + [c.component_id for c in rest], expected)
+        self.assertEqual(scanner.last_scan_report["components"], 4)
+
+    def test_aiter_repository_matches_scan(self):
+        expected = [c.component_id for c in self.scan()[0]]
+        scanner = ComponentScanner(min_loc=10, max_workers=1, cache=self.cache)
+
+        async def collect():
+            return [c.component_id async for c in scanner.aiter_repository(str(self.repo_root), "test/repo", 3)]
+
+        self.assertEqual(asyncio.run(collect()), expected)
+        self.assertEqual(scanner.last_scan_report["cache_hits"], 4)
+
+    def test_rule_change_invalidates_cached_results(self):
+        self.scan()
+        classifier = ComponentClassifier([ClassificationRule("gateway", (r"pkg/.*\.py$",))])
+
+        components, report = self.scan(classifier=classifier)
+        self.assertEqual((report["parsed"], report["cache_hits"]), (4, 0))
+        self.assertEqual({c.component_type for c in components}, {"gateway"})
+
+        _, report = self.scan(classifier=classifier)
+        self.assertEqual((report["parsed"], report["cache_hits"]), (0, 4))
+
+
+class TestComponentClassifier(unittest.TestCase):
+    """Tests for the compiled classification rules"""
+
+    def setUp(self):
+        self.classifier = ComponentClassifier.default()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_rules(self, filename: str, text: str) -> str:
+        path = os.path.join(self.temp_dir.name, filename)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_first_matching_path_pattern_wins(self):
+        cases = {
+            "core/payments_client.py": "api_client",  # *_client.py comes before core/
+            "API/Routes.py": "api_client",
+            "core/database.py": "infrastructure",
+            "services/billing.py": "business_logic",
+            "tests/orders_test.py": "deployment_pattern",
+            "src/app/main.py": None,
+        }
+        for path, expected in cases.items():
+            self.assertEqual(self.classifier.classify_path(path), expected, path)
+
+    def test_keyword_fallback_needs_two_distinct_keywords(self):
+        self.assertEqual(self.classifier.classify("src/a.py", "Retry with a CACHE"), "infrastructure")
+        self.assertIsNone(self.classifier.classify("src/a.py", "retry retry retry"))
+        # Both api_client and infrastructure match; the earlier rule wins
+        self.assertEqual(self.classifier.classify("src/a.py", "http client with retry cache"), "api_client")
+
+    def test_rules_loaded_from_yaml_extend_defaults(self):
+        path = self.write_rules("rules.yaml", """
+rules:
+  - type: data_pipeline
+    paths: ['pipelines/.*\\.py$']
+    keywords: [dataframe, spark]
+  - type: api_client
+    paths: ['clients/.*\\.py$']
+    keywords: [grpc, stub]
+""")
+        classifier = ComponentClassifier.from_file(path)
+
+        self.assertEqual(classifier.component_types,
+                         ["api_client", "infrastructure", "business_logic", "deployment_pattern", "data_pipeline"])
+        self.assertEqual(classifier.classify_path("pipelines/ingest.py"), "data_pipeline")
+        self.assertEqual(classifier.classify_path("clients/orders.py"), "api_client")
+        self.assertIsNone(classifier.classify_path("pkg/orders_client.py"))
+        self.assertEqual(classifier.classify("src/job.py", "spark DataFrame"), "data_pipeline")
+        self.assertEqual(classifier.keywords_for("api_client"), ["grpc", "stub"])
+        self.assertNotEqual(classifier.fingerprint, self.classifier.fingerprint)
+
+    def test_rules_loaded_from_json_can_replace_defaults(self):
+        path = self.write_rules("rules.json", json.dumps({
+            "replace_defaults": True,
+            "min_keyword_matches": 1,
+            "rules": [{"type": "handler", "keywords": ["handle"]}],
+        }))
+        classifier = ComponentClassifier.from_file(path)
+
+        self.assertEqual(classifier.component_types, ["handler"])
+        self.assertIsNone(classifier.classify_path("core/database.py"))
+        self.assertEqual(classifier.classify("core/database.py", "def handle(event)"), "handler")
+
+    def test_invalid_rules_are_rejected(self):
+        for rule in (
+            ClassificationRule("broken", ("api/(.*\\.py",)),
+            ClassificationRule("named", ("(?P<name>api)/.*",)),
+            ClassificationRule("lenient", (), ("api",), 0),
+        ):
+            with self.assertRaises(ValueError):
+                ComponentClassifier([rule])
+
+    def test_unreadable_rules_file_falls_back_to_defaults(self):
+        path = self.write_rules("rules.yaml", "rules: [{paths: []}]")
+        with patch.dict(os.environ, {"COMPONENT_RULES_PATH": path}):
+            classifier = ComponentClassifier.from_env()
+
+        self.assertEqual(classifier.fingerprint, self.classifier.fingerprint)
+
+
 class TestCentralityCalculator(unittest.TestCase):
     """Tests for CentralityCalculator class"""
 
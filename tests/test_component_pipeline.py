@@ -0,0 +1,104 @@
+"""
+Unit tests for ComponentPipeline
+
+Uses fake repository and vector manager objects, so no PostgreSQL or
+pattern-miner is needed.
+"""
+
+import unittest
+import asyncio
+
+from core.component_pipeline import ComponentPipeline
+from factories import make_component
+
+
+class Source:
+    """Async component stream that tracks how far ahead of the consumer it has run"""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.produced = 0
+
+    async def __aiter__(self):
+        for index in range(self.count):
+            self.produced += 1
+            yield make_component(index)
+
+
+class FakeRepository:
+    def __init__(self, source=None, fail=False):
+        self.source = source
+        self.fail = fail
+        self.batches = []
+        self.lead = 0
+
+    async def save_components_stream(self, repository, components, batch_size=500):
+        written = 0
+        async for component in components:
+            written += 1
+            if self.source is not None:
+                self.lead = max(self.lead, self.source.produced - written)
+        self.batches.append(batch_size)
+        return None if self.fail else written
+
+
+class FakeVectorManager:
+    def __init__(self, fail_on_batch=None):
+        self.requests = []
+        self.fail_on_batch = fail_on_batch
+
+    async def get_or_create_vectors(self, components):
+        self.requests.append(len(components))
+        if len(self.requests) == self.fail_on_batch:
+            raise RuntimeError("pattern-miner unavailable")
+        # Every other component gets a vector
+        return {c.component_id: object() for c in components[::2]}
+
+
+class TestComponentPipeline(unittest.TestCase):
+
+    def test_stream_is_vectorized_and_saved_in_batches(self):
+        source = Source(10)
+        repository = FakeRepository(source)
+        vectors = FakeVectorManager()
+        progress = []
+        pipeline = ComponentPipeline(
+            repository, vectors, batch_size=4,
+            progress=lambda batch, report: progress.append((len(batch), report["components"]))
+        )
+
+        report = asyncio.run(pipeline.run("owner/repo", source))
+
+        self.assertEqual(vectors.requests, [4, 4, 2])
+        self.assertEqual(progress, [(4, 4), (4, 8), (2, 10)])
+        self.assertEqual(repository.batches, [4])
+        # The source never runs more than one batch ahead of the writer
+        self.assertLessEqual(repository.lead, 4)
+        self.assertEqual(
+            (report["components"], report["vectors"], report["vectors_missing"], report["batches"], report["saved"]),
+            (10, 5, 5, 3, 10)
+        )
+        self.assertIs(pipeline.last_run_report, report)
+
+    def test_vectorization_failure_does_not_stop_the_write(self):
+        vectors = FakeVectorManager(fail_on_batch=1)
+        report = asyncio.run(
+            ComponentPipeline(FakeRepository(), vectors, batch_size=3).run(
+                "owner/repo", [make_component(i) for i in range(5)]
+            )
+        )
+
+        self.assertEqual(report["saved"], 5)
+        self.assertEqual((report["vectors"], report["vectors_missing"]), (1, 4))
+
+    def test_failed_write_is_reported(self):
+        report = asyncio.run(
+            ComponentPipeline(FakeRepository(fail=True), batch_size=2).run("owner/repo", [make_component(0)])
+        )
+
+        self.assertIsNone(report["saved"])
+        self.assertEqual(report["components"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+Unit tests for DatabaseManager query instrumentation
+
+Uses a fake asyncpg pool, so no PostgreSQL is needed.
+"""
+
+import unittest
+import asyncio
+from contextlib import asynccontextmanager
+
+from core.database import (
+    DatabaseManager, StatementMetrics, register_statement, get_registered_statements
+)
+
+
+TEST_SQL = register_statement("test.by_id", "SELECT id FROM test_table WHERE id = $1")
+
+
+class FakePreparedStatement:
+    def __init__(self, conn, query):
+        self.conn = conn
+        self.query = query
+
+    async def fetch(self, *args):
+        self.conn.calls.append(("prepared", self.query, args))
+        return [{"id": arg} for arg in args]
+
+    async def fetchrow(self, *args):
+        rows = await self.fetch(*args)
+        return rows[0]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.prepared_statements = {}
+        self.calls = []
+        self.prepare_count = 0
+
+    async def prepare(self, query):
+        self.prepare_count += 1
+        return FakePreparedStatement(self, query)
+
+    async def fetch(self, query, *args):
+        if "FAIL" in query:
+            raise RuntimeError("boom")
+        self.calls.append(("text", query, args))
+        return [{"id": 1}, {"id": 2}]
+
+    async def execute(self, query, *args):
+        self.calls.append(("text", query, args))
+        return "UPDATE 3"
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.calls.append(("begin", None, ()))
+        yield
+        self.calls.append(("commit", None, ()))
+
+
+class FakePool:
+    def __init__(self):
+        self.conn = FakeConnection()
+        self.acquires = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquires += 1
+        yield self.conn
+
+
+def make_manager(prepare_statements=True):
+    db = DatabaseManager()
+    db.enabled = True
+    db.pool = FakePool()
+    db.prepare_statements = prepare_statements
+    return db
+
+
+class TestStatementRegistry(unittest.TestCase):
+
+    def test_register_returns_sql_and_is_listed(self):
+        self.assertEqual(get_registered_statements()["test.by_id"], TEST_SQL)
+
+    def test_reregistering_same_sql_under_other_name_fails(self):
+        with self.assertRaises(ValueError):
+            register_statement("test.other_name", TEST_SQL)
+
+    def test_repository_hot_queries_are_registered(self):
+        import core.postgres_repository  # noqa: F401 - registers statements on import
+
+        names = get_registered_statements()
+        for name in ("repository.bulk_patterns", "repository.keywords",
+                     "repository.components", "repository.dependencies",
+                     "patterns.find_similar"):
+            self.assertIn(name, names)
+
+
+class TestStatementMetrics(unittest.TestCase):
+
+    def test_percentiles_and_histogram(self):
+        metrics = StatementMetrics()
+        for ms in range(1, 101):
+            metrics.observe(float(ms), rows=2)
+
+        data = metrics.to_dict()
+        self.assertEqual(data["calls"], 100)
+        self.assertEqual(data["rows"], 200)
+        self.assertEqual(data["p50_ms"], 50.0)
+        self.assertEqual(data["p95_ms"], 95.0)
+        self.assertEqual(data["p99_ms"], 99.0)
+        self.assertEqual(data["max_ms"], 100.0)
+        self.assertEqual(data["histogram"]["le_1ms"], 1)
+        self.assertEqual(data["histogram"]["le_100ms"], 50)
+        self.assertEqual(sum(data["histogram"].values()), 100)
+
+    def test_empty_metrics(self):
+        self.assertEqual(StatementMetrics().to_dict()["p99_ms"], 0.0)
+
+
+class TestQueryInstrumentation(unittest.TestCase):
+
+    def test_registered_statement_prepared_once_per_connection(self):
+        db = make_manager()
+
+        async def run():
+            await db.fetch(TEST_SQL, 1)
+            await db.fetch(TEST_SQL, 2)
+            return await db.fetchrow(TEST_SQL, 3)
+
+        row = asyncio.run(run())
+        self.assertEqual(row, {"id": 3})
+        self.assertEqual(db.pool.conn.prepare_count, 1)
+        self.assertTrue(all(kind == "prepared" for kind, _, _ in db.pool.conn.calls))
+
+        stats = db.get_query_metrics()["statements"]["test.by_id"]
+        self.assertEqual(stats["calls"], 3)
+        self.assertEqual(stats["rows"], 3)
+
+    def test_preparing_can_be_disabled(self):
+        db = make_manager(prepare_statements=False)
+        asyncio.run(db.fetch(TEST_SQL, 1))
+
+        self.assertEqual(db.pool.conn.prepare_count, 0)
+        self.assertEqual(db.pool.conn.calls[0][0], "text")
+        self.assertIn("test.by_id", db.get_query_metrics()["statements"])
+
+    def test_adhoc_queries_labelled_by_sql_and_errors_counted(self):
+        db = make_manager()
+
+        async def run():
+            await db.execute("UPDATE   test_table\n SET x = 1")
+            with self.assertRaises(RuntimeError):
+                await db.fetch("SELECT FAIL")
+
+        asyncio.run(run())
+        statements = db.get_query_metrics()["statements"]
+        self.assertEqual(statements["sql:UPDATE test_table SET x = 1"]["rows"], 3)
+        self.assertEqual(statements["sql:SELECT FAIL"]["errors"], 1)
+
+        db.reset_query_metrics()
+        self.assertEqual(db.get_query_metrics()["statements"], {})
+
+    def test_disconnected_manager_raises(self):
+        db = DatabaseManager()
+        db.pool = None
+        with self.assertRaises(RuntimeError):
+            asyncio.run(db.fetch(TEST_SQL, 1))
+
+
+class TestTransaction(unittest.TestCase):
+
+    def test_statements_share_one_connection_and_commit_callbacks_run(self):
+        db = make_manager()
+        committed = []
+
+        async def on_commit():
+            committed.append([kind for kind, _, _ in db.pool.conn.calls])
+
+        async def run():
+            async with db.transaction() as uow:
+                await uow.execute("DELETE FROM test_table")
+                await uow.fetch(TEST_SQL, 1)
+                async with db.transaction(uow) as nested:
+                    self.assertIs(nested, uow)
+                    nested.after_commit(on_commit)
+                self.assertEqual(committed, [])
+
+        asyncio.run(run())
+        self.assertEqual(db.pool.acquires, 1)
+        self.assertEqual(committed[0][0], "begin")
+        self.assertEqual(committed[0][-1], "commit")
+        self.assertEqual(db.get_query_metrics()["pool"]["acquire_wait"]["calls"], 1)
+
+    def test_rollback_skips_commit_callbacks(self):
+        db = make_manager()
+        committed = []
+
+        async def on_commit():
+            committed.append(True)
+
+        async def run():
+            async with db.transaction() as uow:
+                uow.after_commit(on_commit)
+                await uow.fetch("SELECT FAIL")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(run())
+        self.assertEqual(committed, [])
+
+
+
+class TestBulkEmbeddingUpdate(unittest.TestCase):
+
+    def test_embeddings_written_with_one_unnest_update(self):
+        db = make_manager()
+        updated = asyncio.run(db.update_pattern_embeddings([7, 8], [[0.5, 1], "[1,2]"]))
+
+        self.assertEqual(updated, 3)  # FakeConnection reports "UPDATE 3"
+        self.assertEqual(len(db.pool.conn.calls), 1)
+        _, query, args = db.pool.conn.calls[0]
+        self.assertIn("unnest($1::int[], $2::text[])", query)
+        self.assertEqual(args, ([7, 8], ["[0.5,1.0]", "[1,2]"]))
+
+    def test_empty_update_skips_database(self):
+        db = make_manager()
+        self.assertEqual(asyncio.run(db.update_pattern_embeddings([], [])), 0)
+        self.assertEqual(db.pool.conn.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
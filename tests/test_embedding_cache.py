@@ -0,0 +1,89 @@
+"""
+Unit tests for the content-hash embedding cache
+"""
+
+import os
+import tempfile
+import unittest
+import asyncio
+
+from core.embedding_cache import (
+    EmbeddingCache, DiskEmbeddingStore, embedding_cache_key, normalize_text
+)
+
+
+class FakeAsyncStore:
+    """Async-only persistent tier (like PostgresEmbeddingStore)"""
+
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        self.lookups = 0
+
+    async def get_many(self, keys):
+        self.lookups += 1
+        return {key: self.entries[key] for key in keys if key in self.entries}
+
+    async def put_many(self, items):
+        self.entries.update(items)
+
+
+class TestCacheKeys(unittest.TestCase):
+
+    def test_key_ignores_whitespace_differences(self):
+        self.assertEqual(normalize_text("  Pattern:\tretry\n\nwith  backoff "), "Pattern: retry with backoff")
+        self.assertEqual(
+            embedding_cache_key("m", 1536, "retry  with backoff"),
+            embedding_cache_key("m", 1536, "retry with backoff\n")
+        )
+
+    def test_key_depends_on_model_and_dimensions(self):
+        keys = {
+            embedding_cache_key("m1", 1536, "text"),
+            embedding_cache_key("m2", 1536, "text"),
+            embedding_cache_key("m1", 256, "text"),
+        }
+        self.assertEqual(len(keys), 3)
+
+
+class TestEmbeddingCache(unittest.TestCase):
+
+    def test_lru_eviction_and_counters(self):
+        cache = EmbeddingCache(max_entries=2)
+        cache.put_many_sync({"a": [1.0], "b": [2.0]})
+        cache.get_many_sync(["a"])          # a becomes most recent
+        cache.put_many_sync({"c": [3.0]})   # evicts b
+
+        found = cache.get_many_sync(["a", "b", "c"])
+        self.assertEqual(set(found), {"a", "c"})
+
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hits"], 3)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["memory_entries"], 2)
+
+    def test_store_hits_promoted_to_memory(self):
+        store = FakeAsyncStore({"k": [0.5]})
+        cache = EmbeddingCache(store=store)
+
+        self.assertEqual(asyncio.run(cache.get_many(["k", "k"])), {"k": [0.5]})
+        asyncio.run(cache.get_many(["k"]))
+
+        self.assertEqual(store.lookups, 1)
+        stats = cache.stats()
+        self.assertEqual(stats["store_hits"], 1)
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["store"], "FakeAsyncStore")
+
+    def test_disk_store_survives_new_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache", "embeddings.sqlite3")
+            EmbeddingCache(store=DiskEmbeddingStore(path)).put_many_sync({"k": [0.25, 0.5]})
+
+            fresh = EmbeddingCache(store=DiskEmbeddingStore(path))
+            self.assertEqual(fresh.get_many_sync(["k"]), {"k": [0.25, 0.5]})
+            self.assertEqual(asyncio.run(fresh.get_many(["missing"])), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
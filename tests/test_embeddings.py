@@ -0,0 +1,274 @@
+"""
+Unit tests for the async embedding pipeline
+
+Runs EmbeddingGenerator against a local fake OpenAI embeddings server, so no
+API key or network access is needed.
+"""
+
+import os
+import json
+import tempfile
+import threading
+import unittest
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+import core.embeddings as embeddings_module
+from core.embeddings import (
+    EmbeddingGenerator, generate_and_store_embeddings, build_normalized_matrix,
+    save_normalized_matrix, load_normalized_matrix
+)
+
+
+class FakeEmbeddingServer:
+    """
+    Minimal /v1/embeddings server
+
+    Each embedding is [len(text), index]. The first ``rate_limited`` requests
+    get a 429 with Retry-After: 0. Tracks request sizes and peak concurrency.
+    """
+
+    def __init__(self, rate_limited: int = 0, delay: float = 0.05):
+        self.rate_limited = rate_limited
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.peak_active = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with server.lock:
+                    server.active += 1
+                    server.peak_active = max(server.peak_active, server.active)
+                    throttled = server.rate_limited > 0
+                    if throttled:
+                        server.rate_limited -= 1
+                    else:
+                        server.requests.append(body["input"])
+                try:
+                    threading.Event().wait(server.delay)
+                    if throttled:
+                        self._send(429, {"error": {"message": "rate limited", "type": "rate_limit"}},
+                                   {"Retry-After": "0"})
+                        return
+                    data = [
+                        {"object": "embedding", "index": i, "embedding": [float(len(text)), float(i)]}
+                        for i, text in enumerate(body["input"])
+                    ]
+                    self._send(200, {
+                        "object": "list", "data": data, "model": body["model"],
+                        "usage": {"prompt_tokens": 1, "total_tokens": 1},
+                    })
+                finally:
+                    with server.lock:
+                        server.active -= 1
+
+            def _send(self, status, payload, headers=None):
+                encoded = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(encoded)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def make_generator(server, **kwargs):
+    return EmbeddingGenerator(api_key="test-key", base_url=server.url, dimensions=2,
+                              retry_base_delay=0.01, **kwargs)
+
+
+class FakeDatabase:
+    def __init__(self, patterns):
+        self.patterns = patterns
+        self.updates = []
+
+    async def get_patterns_without_embeddings(self, limit=100):
+        return self.patterns[:limit]
+
+    async def update_pattern_embeddings(self, pattern_ids, embeddings):
+        self.updates.append((pattern_ids, embeddings))
+        return len(pattern_ids)
+
+
+class TestTokenPacking(unittest.TestCase):
+
+    def test_batches_respect_token_budget_and_input_cap(self):
+        generator = EmbeddingGenerator(api_key="test-key", max_batch_tokens=100)
+        texts = ["x" * 150] * 5  # ~51 tokens each by estimate
+
+        self.assertEqual(generator.pack_batches(texts), [[0], [1], [2], [3], [4]])
+        self.assertEqual(generator.pack_batches(["a"] * 5, max_inputs=2), [[0, 1], [2, 3], [4]])
+
+    def test_long_text_truncated_to_input_limit(self):
+        generator = EmbeddingGenerator(api_key="test-key")
+        truncated = generator.truncate("y" * 100_000)
+
+        self.assertLessEqual(generator.count_tokens(truncated), 8191)
+        self.assertEqual(generator.truncate("short"), "short")
+
+
+class TestAsyncEmbeddingPipeline(unittest.TestCase):
+
+    def test_concurrent_batches_preserve_order(self):
+        with FakeEmbeddingServer() as server:
+            generator = make_generator(server, max_concurrency=3)
+            texts = [f"text {'z' * i}" for i in range(10)]
+            embeddings = asyncio.run(generator.generate_embeddings_async(texts, max_inputs=2))
+
+        self.assertEqual([e[0] for e in embeddings], [float(len(t)) for t in texts])
+        self.assertEqual(len(server.requests), 5)
+        self.assertEqual(server.peak_active, 3)
+
+    def test_rate_limited_requests_are_retried(self):
+        with FakeEmbeddingServer(rate_limited=2) as server:
+            generator = make_generator(server)
+            embedding = asyncio.run(generator.generate_embedding_async("hello"))
+
+        self.assertEqual(embedding, [5.0, 0.0])
+
+    def test_exhausted_retries_yield_none(self):
+        with FakeEmbeddingServer(rate_limited=10) as server:
+            generator = make_generator(server, max_retries=1)
+            embeddings = asyncio.run(generator.generate_embeddings_async(["a", "b"]))
+
+        self.assertEqual(embeddings, [None, None])
+
+    def test_disabled_generator_returns_none(self):
+        generator = EmbeddingGenerator(api_key="")
+        generator.enabled = False
+        self.assertEqual(asyncio.run(generator.generate_embeddings_async(["a"])), [None])
+
+    def test_generate_and_store_writes_back_in_bulk(self):
+        patterns = [
+            {"id": i, "name": f"p{i}", "description": "d", "context": "c"} for i in range(1, 6)
+        ]
+        db = FakeDatabase(patterns)
+
+        with FakeEmbeddingServer() as server:
+            generator = make_generator(server)
+            previous = embeddings_module._embedding_generator
+            embeddings_module._embedding_generator = generator
+            try:
+                result = asyncio.run(generate_and_store_embeddings(db, batch_size=2))
+            finally:
+                embeddings_module._embedding_generator = previous
+
+        self.assertEqual(result["processed"], 5)
+        self.assertEqual(result["failed"], 0)
+        self.assertEqual(sorted(len(ids) for ids, _ in db.updates), [1, 2, 2])
+        self.assertEqual(sorted(i for ids, _ in db.updates for i in ids), [1, 2, 3, 4, 5])
+
+
+class TestEmbeddingCacheIntegration(unittest.TestCase):
+
+    def test_cached_and_duplicate_texts_skip_the_api(self):
+        with FakeEmbeddingServer() as server:
+            generator = make_generator(server)
+            first = asyncio.run(generator.generate_embeddings_async(["alpha", "beta", "alpha "]))
+            second = asyncio.run(generator.generate_embeddings_async(["beta", "gamma"]))
+
+        # "alpha " normalizes to "alpha", so only three distinct texts are sent
+        self.assertEqual(sorted(t for request in server.requests for t in request), ["alpha", "beta", "gamma"])
+        self.assertEqual(first[0], first[2])
+        self.assertEqual(second[0], first[1])
+        stats = generator.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 3)
+
+    def test_sync_batch_uses_cache(self):
+        with FakeEmbeddingServer() as server:
+            generator = make_generator(server)
+            generator.generate_embeddings_batch(["one", "two"])
+            embeddings = generator.generate_embeddings_batch(["two", "three"])
+            single = generator.generate_embedding("one")
+
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(embeddings[0], [3.0, 1.0])
+        self.assertEqual(single, [3.0, 0.0])
+
+    def test_stored_pattern_embeddings_shared_with_single_pattern_path(self):
+        patterns = [{"id": 1, "name": "retry", "description": None, "context": "http clients"}]
+
+        with FakeEmbeddingServer() as server:
+            generator = make_generator(server)
+            previous = embeddings_module._embedding_generator
+            embeddings_module._embedding_generator = generator
+            try:
+                asyncio.run(generate_and_store_embeddings(FakeDatabase(patterns)))
+            finally:
+                embeddings_module._embedding_generator = previous
+            embedding = generator.generate_pattern_embedding(patterns[0])
+
+        self.assertEqual(server.requests, [["Pattern: retry\nContext: http clients"]])
+        self.assertEqual(embedding, [float(len("Pattern: retry\nContext: http clients")), 0.0])
+
+
+
+class TestBatchSimilarity(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = EmbeddingGenerator(api_key="")
+        rng = np.random.default_rng(7)
+        self.candidates = rng.normal(size=(200, 16)).tolist()
+        self.matrix = build_normalized_matrix(self.candidates)
+
+    def test_matches_pairwise_cosine(self):
+        query = self.candidates[3]
+        indices, scores = self.generator.top_k_similar(query, self.matrix, k=5)
+
+        expected = sorted(
+            range(len(self.candidates)),
+            key=lambda i: -np.dot(query, self.candidates[i]) / (
+                np.linalg.norm(query) * np.linalg.norm(self.candidates[i]))
+        )[:5]
+        self.assertEqual(indices.tolist(), expected)
+        self.assertEqual(indices[0], 3)
+        self.assertAlmostEqual(float(scores[0]), 1.0, places=5)
+        self.assertTrue(np.all(np.diff(scores) <= 0))
+
+    def test_query_matrix_and_small_candidate_sets(self):
+        indices, scores = self.generator.top_k_similar(self.candidates[:4], self.matrix, k=3)
+        self.assertEqual(indices.shape, (4, 3))
+        self.assertEqual(indices[:, 0].tolist(), [0, 1, 2, 3])
+
+        small = build_normalized_matrix([[1, 0], [0, 1], [0, 0]])
+        indices, scores = self.generator.top_k_similar([1, 0], small, k=10)
+        self.assertEqual(indices.tolist(), [0, 1, 2])
+        self.assertEqual(scores.tolist(), [1.0, 0.0, 0.0])
+
+    def test_matrix_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "patterns.npz")
+            save_normalized_matrix(path, self.matrix, ids=list(range(100, 300)))
+            matrix, ids = load_normalized_matrix(path)
+
+        self.assertEqual(matrix.dtype, np.float32)
+        np.testing.assert_array_equal(matrix, self.matrix)
+        self.assertEqual(ids[0], 100)
+        self.assertAlmostEqual(float(np.linalg.norm(matrix[0])), 1.0, places=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
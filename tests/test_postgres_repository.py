@@ -0,0 +1,569 @@
+"""
+Unit tests for PostgresRepository
+
+Runs against an in-memory fake of DatabaseManager, so no PostgreSQL is needed.
+"""
+
+import os
+import re
+import unittest
+import asyncio
+from pathlib import Path
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+from core.database import DatabaseManager
+from core.postgres_repository import PostgresRepository, DECISION_INSERT_SQL, DEPLOYMENT_UPSERT_SQL
+from schemas.knowledge_base_v2 import (
+    KnowledgeBaseV2, DependencyInfo, Component, create_empty_repository_metadata,
+    create_lesson_learned
+)
+
+from factories import make_component
+
+
+TABLE_PATTERN = re.compile(r"FROM\s+([a-z_]+)", re.IGNORECASE)
+
+SCHEMA_SCRIPT = Path(__file__).resolve().parent.parent / "terraform" / "scripts" / "postgres_init.sh"
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+class FakeDatabase:
+    """In-memory DatabaseManager stand-in that routes reads by table name"""
+
+    def __init__(self, repo_count: int):
+        self.enabled = True
+        self.pool = object()
+        self.queries = []
+        now = datetime(2026, 1, 1, 12, 0, 0)
+        self.tables = {
+            "repositories": [], "patterns": [], "technical_decisions": [],
+            "reusable_components": [], "keywords": [], "deployment_scripts": [],
+            "dependencies": [],
+        }
+        for repo_id in range(1, repo_count + 1):
+            self.tables["repositories"].append({
+                "id": repo_id, "name": f"org/repo-{repo_id}", "problem_domain": "testing",
+                "last_analyzed": now, "last_commit_sha": "abc123",
+                "created_at": now, "updated_at": now,
+            })
+            for i in range(3):
+                self.tables["patterns"].append({
+                    "repo_id": repo_id, "name": f"pattern-{i}",
+                    "created_at": now - timedelta(minutes=i),
+                })
+            self.tables["technical_decisions"].append({"repo_id": repo_id, "what": "use postgres"})
+            self.tables["reusable_components"].append({
+                "repo_id": repo_id, "name": "client", "description": "API client",
+                "location": "src/client.py", "language": "python", "api_signature": None,
+                "keywords": '["http"]',
+            })
+            self.tables["keywords"].append({"repo_id": repo_id, "keyword": "retry"})
+            self.tables["deployment_scripts"].append({
+                "repo_id": repo_id, "description": '{"platform": "cloud_run"}', "commands": "[]",
+            })
+            self.tables["dependencies"].append({
+                "repo_id": repo_id, "dependency_name": "fastapi", "dependency_type": "external",
+            })
+
+    def _select(self, query, args):
+        self.queries.append(query)
+        table = TABLE_PATTERN.search(query).group(1)
+        rows = self.tables.get(table, [])
+        if not args:
+            return list(rows)
+        ids = set(args[0]) if isinstance(args[0], list) else {args[0]}
+        key = "id" if table == "repositories" else "repo_id"
+        return [row for row in rows if row[key] in ids]
+
+    async def fetch(self, query, *args):
+        return self._select(query, args)
+
+    async def fetchrow(self, query, *args):
+        rows = self._select(query, args)
+        return rows[0] if rows else None
+
+    async def execute(self, query, *args):
+        self.queries.append(query)
+        return "OK"
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquires = getattr(self, "acquires", 0) + 1
+        self.connection = getattr(self, "connection", None) or FakeConnection()
+        yield self.connection
+
+    async def _run_on(self, conn, method, query, args):
+        return await getattr(conn, method)(query, *args)
+
+    transaction = DatabaseManager.transaction
+
+
+class FakeConnection:
+    """asyncpg connection stand-in recording statements and transactions"""
+
+    def __init__(self, fail_on=None):
+        self.statements = []
+        self.copied = {}
+        self.transactions = 0
+        self.repo_ids = {}
+        self.fail_on = fail_on
+
+    def _record(self, kind, query, payload=None):
+        self.statements.append((kind, " ".join(query.split())))
+        if self.fail_on and payload is not None and self.fail_on in str(payload):
+            raise RuntimeError(f"simulated failure for {self.fail_on}")
+
+    async def execute(self, query, *args):
+        self._record("execute", query, args)
+        return "OK"
+
+    async def executemany(self, query, rows):
+        self._record("executemany", query)
+
+    async def fetch(self, query, *args):
+        self._record("fetch", query)
+        for name in args[0]:
+            self.repo_ids.setdefault(name, len(self.repo_ids) + 1)
+        return [{"id": self.repo_ids[name], "name": name} for name in args[0]]
+
+    async def copy_records_to_table(self, table, records, columns):
+        self._record("copy", table)
+        self.copied.setdefault(table, []).extend(records)
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+
+class TestBulkRepositoryLoading(unittest.TestCase):
+    """Tests for the set-based get_all_repositories loader"""
+
+    def test_bulk_matches_per_repository_loader(self):
+        """Bulk and per-repository loaders assemble identical metadata"""
+        async def run_test():
+            per_repo = await PostgresRepository(FakeDatabase(5)).get_all_repositories(bulk=False)
+            bulk = await PostgresRepository(FakeDatabase(5)).get_all_repositories(bulk=True)
+            return per_repo, bulk
+
+        per_repo, bulk = asyncio.run(run_test())
+
+        self.assertEqual(list(per_repo.keys()), list(bulk.keys()))
+        for name in per_repo:
+            self.assertEqual(per_repo[name].model_dump(), bulk[name].model_dump())
+
+        repo = bulk["org/repo-1"]
+        self.assertEqual(repo.latest_patterns.patterns, ["pattern-0", "pattern-1", "pattern-2"])
+        self.assertEqual(repo.latest_patterns.keywords, ["retry"])
+        self.assertEqual(repo.latest_patterns.reusable_components[0].tags, ["http"])
+        self.assertEqual(repo.dependencies.external_dependencies, ["fastapi"])
+        self.assertEqual(repo.deployment.infrastructure, {"platform": "cloud_run"})
+
+    def test_bulk_query_count_is_constant(self):
+        """Bulk loading issues the same number of queries regardless of size"""
+        counts = []
+        for size in (1, 10, 50):
+            db = FakeDatabase(size)
+            asyncio.run(PostgresRepository(db).get_all_repositories())
+            counts.append(len(db.queries))
+
+        self.assertEqual(len(set(counts)), 1)
+        self.assertEqual(counts[0], 7)
+
+    def test_bulk_with_no_repositories(self):
+        """Empty database returns an empty mapping after a single query"""
+        db = FakeDatabase(0)
+        result = asyncio.run(PostgresRepository(db).get_all_repositories())
+        self.assertEqual(result, {})
+        self.assertEqual(len(db.queries), 1)
+
+
+class TestKnowledgeBaseSnapshotCache(unittest.TestCase):
+    """Tests for the versioned knowledge base snapshot cache"""
+
+    def test_second_load_served_from_snapshot(self):
+        """Repeated loads hit the snapshot without querying the database"""
+        db = FakeDatabase(3)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+
+        first = asyncio.run(repo.load_knowledge_base())
+        query_count = len(db.queries)
+        second = asyncio.run(repo.load_knowledge_base())
+
+        self.assertEqual(len(db.queries), query_count)
+        self.assertEqual(first.repositories.keys(), second.repositories.keys())
+        self.assertEqual(repo.snapshot_status()["hits"], 1)
+        self.assertEqual(repo.snapshot_status()["misses"], 1)
+
+    def test_callers_receive_independent_copies(self):
+        """Mutating a loaded KB does not leak into the cached snapshot"""
+        repo = PostgresRepository(FakeDatabase(2), snapshot_ttl=60)
+
+        kb = asyncio.run(repo.load_knowledge_base())
+        kb.repositories.pop("org/repo-1")
+        reloaded = asyncio.run(repo.load_knowledge_base())
+
+        self.assertIn("org/repo-1", reloaded.repositories)
+
+    def test_write_bumps_version_and_invalidates(self):
+        """Successful writes bump the KB version and force a reload"""
+        db = FakeDatabase(2)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+        repo._ensure_repository = AsyncMock(return_value=1)
+
+        asyncio.run(repo.load_knowledge_base())
+        version = repo.kb_version
+        asyncio.run(repo.update_dependency_info("org/repo-1", DependencyInfo()))
+
+        self.assertGreater(repo.kb_version, version)
+        self.assertFalse(repo.snapshot_status()["cached"])
+
+        query_count = len(db.queries)
+        asyncio.run(repo.load_knowledge_base())
+        self.assertGreater(len(db.queries), query_count)
+
+    def test_ttl_expiry_and_explicit_invalidate(self):
+        """Zero TTL disables caching; invalidate() drops a fresh snapshot"""
+        uncached = PostgresRepository(FakeDatabase(1), snapshot_ttl=0)
+        asyncio.run(uncached.load_knowledge_base())
+        self.assertFalse(uncached.snapshot_status()["cached"])
+
+        repo = PostgresRepository(FakeDatabase(1), snapshot_ttl=60)
+        asyncio.run(repo.load_knowledge_base())
+        self.assertTrue(repo.snapshot_status()["cached"])
+        repo.invalidate()
+        self.assertFalse(repo.snapshot_status()["cached"])
+
+    def test_notification_from_other_instance_invalidates(self):
+        """Own notifications are ignored, other instances' drop the snapshot"""
+        repo = PostgresRepository(FakeDatabase(1), snapshot_ttl=60, invalidation_channel="kb")
+        asyncio.run(repo.load_knowledge_base())
+
+        repo._on_invalidation_notice(None, 1, "kb", repo.instance_id)
+        self.assertTrue(repo.snapshot_status()["cached"])
+
+        repo._on_invalidation_notice(None, 1, "kb", "another-instance")
+        self.assertFalse(repo.snapshot_status()["cached"])
+
+
+def build_knowledge_base(repo_count: int) -> KnowledgeBaseV2:
+    """Build a KB with patterns, keywords, components, lessons and dependencies"""
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    kb = KnowledgeBaseV2(created_at=now, last_updated=now)
+    for i in range(repo_count):
+        name = f"org/repo-{i}"
+        metadata = create_empty_repository_metadata(commit_sha=f"sha{i}")
+        metadata.latest_patterns.patterns = ["retry", "circuit breaker"]
+        metadata.latest_patterns.decisions = ["use asyncpg"]
+        metadata.latest_patterns.keywords = ["resilience", "http"]
+        metadata.components = [
+            Component(
+                component_id=f"{name}/client", name="client", component_type="api_client",
+                repository=name, files=["src/client.py"], language="python", first_seen=now
+            )
+        ]
+        metadata.deployment.lessons_learned = [create_lesson_learned("reliability", "Retry", "ctx")]
+        metadata.dependencies = DependencyInfo(external_dependencies=["fastapi", "asyncpg"])
+        kb.repositories[name] = metadata
+    return kb
+
+
+class TestBulkKnowledgeBaseSave(unittest.TestCase):
+    """Tests for the batched, transactional save_knowledge_base path"""
+
+    def test_single_transaction_uses_fixed_statement_count(self):
+        """Whole-KB saves issue the same number of statements for any size"""
+        counts = []
+        for size in (1, 25):
+            db = FakeDatabase(0)
+            repo = PostgresRepository(db, snapshot_ttl=0)
+            report = asyncio.run(repo.bulk_save_knowledge_base(build_knowledge_base(size), single_transaction=True))
+            counts.append(len(db.connection.statements))
+            self.assertEqual(db.connection.transactions, 1)
+            self.assertEqual(report["repositories"]["saved"], size)
+
+        self.assertEqual(counts[0], counts[1])
+
+    def test_report_has_per_table_rows_and_timings(self):
+        """Report counts rows per table and COPYs components and dependencies"""
+        db = FakeDatabase(0)
+        repo = PostgresRepository(db, snapshot_ttl=0)
+        report = asyncio.run(repo.bulk_save_knowledge_base(build_knowledge_base(3)))
+
+        self.assertEqual(report["mode"], "per_repository")
+        self.assertEqual(db.connection.transactions, 3)
+        self.assertEqual(report["tables"]["patterns"]["rows"], 6)
+        self.assertEqual(report["tables"]["keywords"]["rows"], 6)
+        self.assertEqual(report["tables"]["dependencies"]["rows"], 6)
+        self.assertEqual(len(db.connection.copied["reusable_components"]), 3)
+        self.assertEqual(len(db.connection.copied["dependencies"]), 6)
+        self.assertIn("seconds", report["tables"]["lessons_learned"])
+        self.assertIs(repo.last_save_report, report)
+
+    def test_failed_repository_does_not_block_others(self):
+        """Per-repository mode records failures and keeps saving the rest"""
+        db = FakeDatabase(0)
+        db.connection = FakeConnection(fail_on="org/repo-1")
+        repo = PostgresRepository(db, snapshot_ttl=0)
+
+        saved = asyncio.run(repo.save_knowledge_base(build_knowledge_base(3)))
+
+        self.assertTrue(saved)
+        self.assertEqual(repo.last_save_report["repositories"]["failed"], ["org/repo-1"])
+        self.assertEqual(repo.last_save_report["repositories"]["saved"], 2)
+
+    def test_single_transaction_failure_returns_false(self):
+        """A failure inside the whole-KB transaction fails the save"""
+        db = FakeDatabase(0)
+        db.connection = FakeConnection(fail_on="org/repo-1")
+        repo = PostgresRepository(db, snapshot_ttl=0)
+
+        saved = asyncio.run(repo.save_knowledge_base(build_knowledge_base(3), single_transaction=True))
+
+        self.assertFalse(saved)
+        self.assertEqual(len(repo.last_save_report["repositories"]["failed"]), 3)
+
+
+class TestDeltaAwareSave(unittest.TestCase):
+    """Tests for change-tracked saves of a loaded knowledge base"""
+
+    def test_unchanged_kb_writes_nothing(self):
+        """Saving a KB straight after loading it issues no statements"""
+        db = FakeDatabase(5)
+        repo = PostgresRepository(db, snapshot_ttl=0)
+
+        kb = asyncio.run(repo.load_knowledge_base())
+        saved = asyncio.run(repo.save_knowledge_base(kb))
+
+        self.assertTrue(saved)
+        self.assertIsNone(getattr(db, "connection", None))
+        self.assertEqual(repo.last_save_report["repositories"]["unchanged"], 5)
+
+    def test_single_component_update_writes_only_components(self):
+        """Changing one repository's components touches only that section"""
+        db = FakeDatabase(5)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+
+        kb = asyncio.run(repo.load_knowledge_base())
+        kb.repositories["org/repo-3"].components = build_knowledge_base(1).repositories["org/repo-0"].components
+        asyncio.run(repo.save_knowledge_base(kb))
+
+        report = repo.last_save_report
+        self.assertEqual(report["changed_sections"], {"org/repo-3": ["components"]})
+        self.assertEqual(set(report["tables"]), {"repositories", "reusable_components"})
+        self.assertEqual(len(db.connection.statements), 4)
+
+        # The saved KB is clean again and the snapshot was invalidated
+        self.assertEqual(kb.changed_sections(), {})
+        self.assertFalse(repo.snapshot_status()["cached"])
+
+    def test_snapshot_copies_keep_baseline(self):
+        """KBs served from the snapshot are change-tracked too"""
+        repo = PostgresRepository(FakeDatabase(2), snapshot_ttl=60)
+        asyncio.run(repo.load_knowledge_base())
+
+        kb = asyncio.run(repo.load_knowledge_base())
+        kb.repositories["org/repo-1"].latest_patterns.patterns.append("bulkhead")
+
+        self.assertEqual(kb.changed_sections(), {"org/repo-1": {"patterns"}})
+
+    def test_untracked_kb_saves_everything(self):
+        """KBs built in memory, or only_changed=False, write every section"""
+        db = FakeDatabase(0)
+        repo = PostgresRepository(db, snapshot_ttl=0)
+        kb = build_knowledge_base(2)
+
+        asyncio.run(repo.save_knowledge_base(kb))
+        self.assertEqual(repo.last_save_report["repositories"]["saved"], 2)
+
+        asyncio.run(repo.save_knowledge_base(kb, only_changed=False))
+        self.assertEqual(repo.last_save_report["repositories"]["saved"], 2)
+
+
+
+class TestUnitOfWorkWrites(unittest.TestCase):
+    """Tests for transactional multi-statement writes"""
+
+    def test_dependency_update_runs_in_one_transaction(self):
+        """DELETE and INSERTs share one connection and one transaction"""
+        db = FakeDatabase(1)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+        repo._ensure_repository = AsyncMock(return_value=1)
+        dependency_info = DependencyInfo(external_dependencies=["fastapi", "asyncpg"])
+
+        self.assertTrue(asyncio.run(repo.update_dependency_info("org/repo-1", dependency_info)))
+
+        self.assertEqual(db.acquires, 1)
+        self.assertEqual(db.connection.transactions, 1)
+        kinds = [kind for kind, _ in db.connection.statements]
+        self.assertEqual(kinds, ["execute", "executemany"])
+        self.assertEqual(repo.kb_version, 1)
+
+    def test_failed_write_rolls_back_without_invalidating(self):
+        """A failure inside the unit of work leaves the snapshot version alone"""
+        db = FakeDatabase(1)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+        repo._ensure_repository = AsyncMock(return_value=1)
+        repo._dependency_rows = Mock(side_effect=RuntimeError("bad dependency"))
+
+        self.assertFalse(asyncio.run(repo.update_dependency_info("org/repo-1", DependencyInfo())))
+        self.assertEqual(repo.kb_version, 0)
+
+    def test_caller_unit_of_work_composes_writes(self):
+        """Writes joined to a caller's unit of work share its connection and commit"""
+        db = FakeDatabase(1)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+        repo._ensure_repository = AsyncMock(return_value=1)
+        component = Component(
+            component_id="org/repo-1/client", name="client", component_type="api_client",
+            repository="org/repo-1", files=["src/client.py"], language="python",
+            first_seen=datetime(2026, 1, 1)
+        )
+
+        async def run_test():
+            async with db.transaction() as uow:
+                await repo.update_dependency_info("org/repo-1", DependencyInfo(), uow=uow)
+                await repo.add_or_update_components("org/repo-1", [component], uow=uow)
+                # Invalidation waits for the outer commit
+                self.assertEqual(repo.kb_version, 0)
+
+        asyncio.run(run_test())
+
+        self.assertEqual(db.acquires, 1)
+        # Outer transaction plus one savepoint per joined write
+        self.assertEqual(db.connection.transactions, 3)
+        self.assertEqual(repo.kb_version, 2)
+
+    def test_component_listeners_run_after_commit(self):
+        """Component change listeners see the new component list only once committed"""
+        db = FakeDatabase(1)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+        repo._ensure_repository = AsyncMock(return_value=1)
+        component = Component(
+            component_id="org/repo-1/client", name="client", component_type="api_client",
+            repository="org/repo-1", files=["src/client.py"], language="python",
+            first_seen=datetime(2026, 1, 1)
+        )
+        calls = []
+        repo.on_components_changed(lambda name, components: calls.append((name, len(components))))
+
+        async def run_test():
+            async with db.transaction() as uow:
+                await repo.add_or_update_components("org/repo-1", [component], uow=uow)
+                self.assertEqual(calls, [])
+
+        asyncio.run(run_test())
+        self.assertEqual(calls, [("org/repo-1", 1)])
+
+
+class TestStreamingComponentSave(unittest.TestCase):
+    """Tests for save_components_stream"""
+
+    def test_stream_is_inserted_in_batches_in_one_transaction(self):
+        db = FakeDatabase(1)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+        repo._ensure_repository = AsyncMock(return_value=1)
+        signatures = []
+        repo.on_components_changed(lambda name, changed: signatures.append(sorted(changed)))
+
+        async def stream():
+            for component in (make_component(i, "org/repo-1") for i in range(5)):
+                yield component
+
+        written = asyncio.run(repo.save_components_stream("org/repo-1", stream(), batch_size=2))
+
+        self.assertEqual(written, 5)
+        self.assertEqual(db.connection.transactions, 1)
+        kinds = [kind for kind, _ in db.connection.statements]
+        self.assertEqual(kinds, ["execute", "executemany", "executemany", "executemany"])
+        self.assertEqual(signatures, [[f"comp-{i}" for i in range(5)]])
+        self.assertEqual(repo.kb_version, 1)
+
+    def test_stream_consumed_before_transaction(self):
+        db = FakeDatabase(1)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+        repo._ensure_repository = AsyncMock(return_value=1)
+        acquired_while_streaming = []
+
+        async def stream():
+            for component in (make_component(i, "org/repo-1") for i in range(4)):
+                acquired_while_streaming.append(getattr(db, "acquires", 0))
+                yield component
+
+        self.assertEqual(asyncio.run(repo.save_components_stream("org/repo-1", stream(), batch_size=2)), 4)
+        self.assertEqual(acquired_while_streaming, [0, 0, 0, 0])
+        self.assertEqual(db.acquires, 1)
+
+    def test_empty_stream_keeps_existing_components(self):
+        db = FakeDatabase(1)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+        repo._ensure_repository = AsyncMock(return_value=1)
+
+        self.assertEqual(asyncio.run(repo.save_components_stream("org/repo-1", iter(()))), 0)
+        self.assertFalse(hasattr(db, "connection"))
+        self.assertEqual(repo.kb_version, 0)
+
+    def test_failure_mid_stream_rolls_back(self):
+        db = FakeDatabase(1)
+        repo = PostgresRepository(db, snapshot_ttl=60)
+        repo._ensure_repository = AsyncMock(return_value=1)
+
+        def stream():
+            yield from (make_component(i, "org/repo-1") for i in range(3))
+            raise RuntimeError("scan failed")
+
+        self.assertIsNone(asyncio.run(repo.save_components_stream("org/repo-1", stream(), batch_size=2)))
+        self.assertEqual(repo.kb_version, 0)
+
+
+def schema_table_ddl(table: str) -> str:
+    """CREATE TEMP TABLE statement for a table as defined in postgres_init.sh"""
+    match = re.search(
+        rf"CREATE TABLE IF NOT EXISTS {table} \(.*?\n\);", SCHEMA_SCRIPT.read_text(), re.DOTALL
+    )
+    ddl = match.group(0).replace("CREATE TABLE IF NOT EXISTS", "CREATE TEMP TABLE")
+    return ddl.replace(" REFERENCES repositories(id) ON DELETE CASCADE", "")
+
+
+@unittest.skipUnless(TEST_DATABASE_URL, "TEST_DATABASE_URL not set")
+class TestSaveStatementsOnPostgres(unittest.TestCase):
+    """Runs the save statements against PostgreSQL and the deployed schema"""
+
+    async def _run(self, statements):
+        import asyncpg
+
+        conn = await asyncpg.connect(TEST_DATABASE_URL)
+        try:
+            for table in ("technical_decisions", "deployment_scripts"):
+                await conn.execute(schema_table_ddl(table))
+            for query, rows in statements:
+                await conn.executemany(query, rows)
+            decisions = await conn.fetch("SELECT repo_id, what FROM technical_decisions ORDER BY id")
+            deployments = await conn.fetch(
+                "SELECT repo_id, name, description FROM deployment_scripts ORDER BY id"
+            )
+            return decisions, deployments
+        finally:
+            await conn.close()
+
+    def test_saving_twice_keeps_one_row_each(self):
+        decisions = [(1, "use asyncpg"), (2, "use asyncpg")]
+        first = [(1, "cloud_build", '{"region": "us"}', "[]", "{}")]
+        second = [(1, "cloud_build", '{"region": "eu"}', "[]", "{}"), (2, "cloud_build", "{}", "[]", "{}")]
+
+        saved_decisions, deployments = asyncio.run(self._run([
+            (DECISION_INSERT_SQL, decisions), (DEPLOYMENT_UPSERT_SQL, first),
+            (DECISION_INSERT_SQL, decisions), (DEPLOYMENT_UPSERT_SQL, second),
+        ]))
+
+        self.assertEqual([tuple(row) for row in saved_decisions], decisions)
+        self.assertEqual(
+            [tuple(row) for row in deployments],
+            [(1, "cloud_build", '{"region": "eu"}'), (2, "cloud_build", "{}")]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
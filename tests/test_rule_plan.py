@@ -0,0 +1,108 @@
+"""
+Unit tests for rule execution plans
+"""
+
+import unittest
+from unittest.mock import patch
+
+import yaml
+
+from core.rule_plan import RuleCompiler, compile_standard
+from core.standards_loader import ParsedStandard, ValidationRule
+
+
+def rule(rule_id, check_type, **params):
+    return ValidationRule(rule_id, "custom", "medium", rule_id, check_type, params, "")
+
+
+class FakeScanner:
+    """Serves file contents and counts reads"""
+
+    def __init__(self, files):
+        self.files = files
+        self.reads = []
+        self.exists_checks = []
+
+    def get_file_content(self, repo_name, path):
+        self.reads.append(path)
+        return self.files.get(path)
+
+    def file_exists(self, repo_name, path):
+        self.exists_checks.append(path)
+        return path in self.files
+
+
+class TestExecutionPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.standard = ParsedStandard(category="custom", title="Custom", validation_rules=[
+            rule("readme_exists", "file_exists", path="README.md"),
+            rule("readme_setup", "section_exists", path="README.md", section="Setup"),
+            rule("readme_license", "file_contains", path="README.md", pattern="gpl"),
+            rule("readme_size", "file_size", path="README.md", min_size=1000),
+            rule("build_steps", "yaml_field", path="cloudbuild.yaml", field="steps.0.name"),
+            rule("build_timeout", "yaml_field", path="cloudbuild.yaml", field="timeout"),
+            rule("makefile_exists", "file_exists", path="Makefile"),
+            rule("docker_from", "file_contains", path="Dockerfile", pattern="FROM"),
+            rule("bad_regex", "file_contains", path="README.md", pattern="(unclosed"),
+            rule("unknown", "file_matches", path="README.md"),
+            rule("no_path", "file_exists"),
+        ])
+        self.scanner = FakeScanner({
+            "README.md": "# Project\n\n## Setup\n\nLicensed under GPL.\n",
+            "cloudbuild.yaml": "steps:\n  - name: gcr.io/cloud-builders/docker\n",
+        })
+
+    def test_rules_grouped_by_file(self):
+        plan = compile_standard(self.standard)
+
+        self.assertEqual(list(plan.files), ["README.md", "cloudbuild.yaml", "Makefile", "Dockerfile"])
+        self.assertEqual(plan.content_paths, ["README.md", "cloudbuild.yaml", "Dockerfile"])
+        self.assertEqual(plan.invalid_rules, [8, 9, 10])
+
+    def test_each_file_read_once(self):
+        plan = compile_standard(self.standard)
+
+        with patch("core.rule_plan.yaml.safe_load", wraps=yaml.safe_load) as safe_load:
+            results = plan.evaluate("owner/repo", self.scanner)
+
+        self.assertEqual(results, [True, True, True, False, True, False, False, False, False, False, False])
+        self.assertEqual(sorted(self.scanner.reads), ["Dockerfile", "README.md", "cloudbuild.yaml"])
+        # README.md existence follows from its content
+        self.assertEqual(self.scanner.exists_checks, ["Makefile"])
+        self.assertEqual(safe_load.call_count, 1)
+
+
+class TestRuleCompiler(unittest.TestCase):
+
+    def test_plan_cached_until_document_changes(self):
+        compiler = RuleCompiler()
+        rules = [rule("readme_exists", "file_exists", path="README.md")]
+        standard = ParsedStandard(category="custom", title="", validation_rules=rules, content_hash="v1")
+
+        plan = compiler.plan_for(standard)
+        self.assertIs(compiler.plan_for(standard), plan)
+
+        edited = ParsedStandard(category="custom", title="", validation_rules=rules, content_hash="v2")
+        self.assertIsNot(compiler.plan_for(edited), plan)
+        self.assertEqual(compiler.stats(), {"hits": 1, "compilations": 2, "plans": 1})
+
+    def test_standards_without_source_keyed_by_rules(self):
+        compiler = RuleCompiler()
+        first = ParsedStandard(category="custom", title="", validation_rules=[
+            rule("docker_from", "file_contains", path="Dockerfile", pattern="FROM")
+        ])
+        same = ParsedStandard(category="custom", title="", validation_rules=[
+            rule("docker_from", "file_contains", path="Dockerfile", pattern="FROM")
+        ])
+        changed = ParsedStandard(category="custom", title="", validation_rules=[
+            rule("docker_from", "file_contains", path="Dockerfile", pattern="FROM python")
+        ])
+
+        plan = compiler.plan_for(first)
+        self.assertIs(compiler.plan_for(same), plan)
+        self.assertIsNot(compiler.plan_for(changed), plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Unit tests for the repository scanner cache
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from core.scanner_cache import ScannerCache, DiskScannerStore
+
+
+class TestScannerCache(unittest.TestCase):
+
+    def test_lru_bounded_by_entries_and_bytes(self):
+        cache = ScannerCache(max_entries=3, max_bytes=100)
+        for key in ("a", "b", "c"):
+            cache.put(key, key, 10)
+        cache.get("a")  # a becomes most recently used
+        cache.put("d", "d", 10)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "a")
+
+        cache.put("big", "x" * 80, 80)  # pushes out c to stay within 100 bytes
+        self.assertEqual(list(cache._entries), ["d", "a", "big"])
+        self.assertEqual(cache.bytes, 100)
+
+        cache.put("huge", "x" * 200, 200)  # larger than the whole budget
+        self.assertIsNone(cache.get("huge"))
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+    def test_entries_expire_after_ttl(self):
+        cache = ScannerCache()
+        with patch("core.scanner_cache.time.time", return_value=1000.0):
+            cache.put("path:owner/repo:README.md", {"content": "hi"}, 2, ttl=60)
+            cache.put("blob:abc", "hi", 2)
+        with patch("core.scanner_cache.time.time", return_value=1061.0):
+            self.assertIsNone(cache.get("path:owner/repo:README.md"))
+            self.assertEqual(cache.get("blob:abc"), "hi")
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["expirations"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_disk_tier_shared_between_caches(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scanner.sqlite3")
+            ScannerCache(store=DiskScannerStore(path)).put(
+                "tree:owner/repo", object(), 50, encoded={"etag": "W/\"1\""}
+            )
+
+            other = ScannerCache(store=DiskScannerStore(path))
+            value = other.get("tree:owner/repo", decode=lambda data: data["etag"])
+
+            self.assertEqual(value, "W/\"1\"")
+            self.assertEqual(other.stats()["store_hits"], 1)
+            # Promoted to the memory tier
+            self.assertEqual(other.get("tree:owner/repo"), "W/\"1\"")
+            self.assertEqual(other.stats()["memory_hits"], 1)
+
+            other.clear(persistent=True)
+            self.assertIsNone(ScannerCache(store=DiskScannerStore(path)).get("tree:owner/repo"))
+
+    def test_disk_tier_prunes_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = DiskScannerStore(os.path.join(directory, "scanner.sqlite3"), max_entries=2)
+            store.PRUNE_INTERVAL = 4
+            with patch("core.scanner_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]):
+                store.put("blob:a", "a")
+                store.put("blob:b", "b")
+                store.put("path:owner/repo:README.md", "hi", expires_at=3.5)
+                store.get("blob:a")  # a becomes most recently used
+                store.put("blob:c", "c")  # 4th write prunes
+
+            keys = {row[0] for row in store._conn.execute("SELECT key FROM scanner_cache")}
+            self.assertEqual(keys, {"blob:a", "blob:c"})
+
+    def test_disk_tier_migrates_unbounded_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scanner.sqlite3")
+            conn = sqlite3.connect(path)
+            conn.execute("CREATE TABLE scanner_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)")
+            conn.executemany(
+                "INSERT INTO scanner_cache (key, value) VALUES (?, ?)", [("blob:a", '"a"'), ("blob:b", '"b"')]
+            )
+            conn.commit()
+            conn.close()
+
+            store = DiskScannerStore(path, max_entries=1)
+
+            self.assertEqual(store._conn.execute("SELECT COUNT(*) FROM scanner_cache").fetchone()[0], 1)
+            store.put("blob:c", "c")
+            self.assertEqual(store.get("blob:c"), ("c", None))
+
+    def test_from_env(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache", "scanner.sqlite3")
+            env = {
+                "SCANNER_CACHE_SIZE": "10", "SCANNER_CACHE_TTL": "5", "SCANNER_CACHE_PATH": path,
+                "SCANNER_CACHE_DISK_MAX_ENTRIES": "50",
+            }
+            with patch.dict(os.environ, env):
+                cache = ScannerCache.from_env()
+
+            self.assertEqual((cache.max_entries, cache.ttl, cache.store.max_entries), (10, 5.0, 50))
+            self.assertEqual(cache.stats()["store"], path)
+            self.assertTrue(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
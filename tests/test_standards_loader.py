@@ -4,8 +4,12 @@ Unit tests for StandardsLoader
 Tests standards loading, parsing, and data structure creation.
 """
 
+import json
+import os
+
 import pytest
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 from core.standards_loader import StandardsLoader, ParsedStandard, ValidationRule
 
 
@@ -173,6 +177,94 @@ class TestStandardsLoader:
         assert "Dockerfile" in docker_std.required_files
 
 
+class SmallLoader(StandardsLoader):
+    """Loader for two documents: license (local) and ci_cd (local or remote)"""
+    STANDARDS_MAPPING = {
+        "license": "docs/LICENSE_STANDARD.md",
+        "ci_cd": "cloudbuild.yaml",
+    }
+
+
+def remote_response(status, text="", etag=None):
+    response = MagicMock(status_code=status, text=text)
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+class TestStandardsCache:
+    """Test parse result caching, remote fetches and reloading"""
+
+    @pytest.fixture
+    def docs_root(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "LICENSE_STANDARD.md").write_text("# License Standard\n")
+        (tmp_path / "cloudbuild.yaml").write_text("steps: []\n")
+        return tmp_path
+
+    @pytest.fixture
+    def cache_path(self, tmp_path):
+        return str(tmp_path / "cache" / "standards.json")
+
+    def test_parse_results_reused_across_restarts(self, docs_root, cache_path):
+        """Test unchanged documents are not parsed again"""
+        first = SmallLoader(str(docs_root), cache_path=cache_path)
+        second = SmallLoader(str(docs_root), cache_path=cache_path)
+
+        assert first.stats()["parsed"] == 2
+        assert (second.stats()["parsed"], second.stats()["cache_hits"]) == (0, 2)
+        assert second.get_all_standards() == first.get_all_standards()
+        assert second.list_categories() == ["license", "ci_cd"]
+
+    def test_changed_document_or_parser_version_reparsed(self, docs_root, cache_path):
+        """Test the cache is keyed by content hash and parser version"""
+        SmallLoader(str(docs_root), cache_path=cache_path)
+        (docs_root / "cloudbuild.yaml").write_text("steps: [build]\n")
+        assert SmallLoader(str(docs_root), cache_path=cache_path).stats()["parsed"] == 1
+
+        with open(cache_path) as f:
+            data = json.load(f)
+        data["version"] = -1
+        with open(cache_path, "w") as f:
+            json.dump(data, f)
+        assert SmallLoader(str(docs_root), cache_path=cache_path).stats()["parsed"] == 2
+
+    def test_remote_documents_served_from_cache_and_revalidated(self, docs_root, cache_path):
+        """Test a cached remote document does not block startup and is revalidated conditionally"""
+        (docs_root / "cloudbuild.yaml").unlink()
+
+        with patch.dict(os.environ, {"GITHUB_TOKEN": "token"}), \
+                patch("core.standards_loader.requests.get") as get:
+            get.return_value = remote_response(200, "steps: []\n", etag='"v1"')
+            first = SmallLoader(str(docs_root), cache_path=cache_path, remote_url="https://example.com/repo")
+            assert get.call_args[0][0] == "https://example.com/repo/cloudbuild.yaml"
+            assert first.stats()["fetched"] == 1
+
+            get.reset_mock()
+            get.return_value = remote_response(304)
+            second = SmallLoader(str(docs_root), cache_path=cache_path)
+            assert second.get_standard("ci_cd") == first.get_standard("ci_cd")
+            second.stop_auto_reload(timeout=5)
+
+        assert get.call_args[1]["headers"]["If-None-Match"] == '"v1"'
+        assert second.stats()["not_modified"] == 1
+
+    def test_reload_picks_up_changed_documents(self, docs_root):
+        """Test reload re-parses only documents that changed"""
+        loader = SmallLoader(str(docs_root))
+        original = loader.get_standard("license")
+
+        assert loader.reload() == []
+        license_path = docs_root / "docs" / "LICENSE_STANDARD.md"
+        license_path.write_text("# GPL v3.0 License Standard\n")
+        stat = license_path.stat()
+        os.utime(license_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert loader.reload() == ["license"]
+        assert loader.get_standard("license").title == "GPL v3.0 License Standard"
+        assert loader.get_standard("license").content_hash != original.content_hash
+        assert loader.stats()["parsed"] == 3
+
+
 class TestValidationRule:
     """Test ValidationRule dataclass"""
 
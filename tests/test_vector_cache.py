@@ -0,0 +1,277 @@
+"""
+Unit tests for VectorCacheManager
+
+Uses a fake DatabaseManager and pattern-miner client, so no PostgreSQL is needed.
+"""
+
+import unittest
+import asyncio
+
+import numpy as np
+
+from core.component_analyzer import (
+    VectorCacheManager, ComponentVectorCache, group_similar_components, component_signature,
+    COMPONENT_VECTOR_LOOKUP_SQL, COMPONENT_VECTOR_UPSERT_SQL, COMPONENT_VECTOR_KNN_SQL
+)
+from factories import make_component
+
+
+class FakeVectorDatabase:
+    """DatabaseManager stand-in that records statements against component_vectors"""
+
+    def __init__(self, stored_ids=(), enabled=True, neighbours=None):
+        self.enabled = enabled
+        self.pool = object() if enabled else None
+        # component_id -> (content signature, vector literal); None marks a legacy row
+        self.stored = {component_id: (None, "[1,0]") for component_id in stored_ids}
+        self.neighbours = neighbours or {}
+        self.statements = []
+
+    async def execute(self, query, *args):
+        self.statements.append((query, args))
+        if query == COMPONENT_VECTOR_UPSERT_SQL:
+            self.stored.update(zip(args[0], zip(args[5], args[3])))
+        return "OK"
+
+    async def fetch(self, query, *args):
+        self.statements.append((query, args))
+        if query == COMPONENT_VECTOR_LOOKUP_SQL:
+            return [
+                {"component_id": component_id, "vector_id": component_id,
+                 "content_signature": self.stored[component_id][0], "vector": self.stored[component_id][1]}
+                for component_id in args[0] if component_id in self.stored
+            ]
+        if query == COMPONENT_VECTOR_KNN_SQL:
+            ids, k, threshold = args
+            return [
+                {"query_id": component_id, "component_id": other, "component_name": other,
+                 "repository": "owner/other", "similarity": score}
+                for component_id in ids
+                for other, score in self.neighbours.get(component_id, [])[:k]
+                if score >= threshold
+            ]
+        return []
+
+    async def fetchrow(self, query, *args):
+        self.statements.append((query, args))
+        return {"total_vectors": len(self.stored), "repositories": 1}
+
+    def get_query_metrics(self):
+        return {"pool": {"max_size": 10, "size": 2 if self.pool else 0, "acquire_wait": {"calls": 0}}}
+
+    def queries(self, sql):
+        return [args for query, args in self.statements if query == sql]
+
+
+class FakePatternMiner:
+    def __init__(self):
+        self.requests = []
+
+    def execute_skill(self, skill_id, input_data):
+        self.requests.append(input_data["components"])
+        return {
+            "success": True,
+            "vectors": [{"vector": [0.5, 0.25]} for _ in input_data["components"]],
+        }
+
+
+class TestVectorCacheManager(unittest.TestCase):
+
+    def test_construction_does_no_io(self):
+        db = FakeVectorDatabase()
+        VectorCacheManager(db)
+        self.assertEqual(db.statements, [])
+
+    def test_batch_lookup_uses_one_query_and_one_generation_request(self):
+        db = FakeVectorDatabase(stored_ids={"comp-0", "comp-1"})
+        miner = FakePatternMiner()
+        manager = VectorCacheManager(db, miner)
+        components = [make_component(i) for i in range(5)]
+
+        vectors = asyncio.run(manager.get_or_create_vectors(components))
+
+        self.assertEqual(sorted(vectors), [f"comp-{i}" for i in range(5)])
+        self.assertEqual(len(db.queries(COMPONENT_VECTOR_LOOKUP_SQL)), 1)
+        self.assertEqual([[m["component_id"] for m in request] for request in miner.requests],
+                         [["comp-2", "comp-3", "comp-4"]])
+        upserts = db.queries(COMPONENT_VECTOR_UPSERT_SQL)
+        self.assertEqual(len(upserts), 1)
+        self.assertEqual(upserts[0][0], ["comp-2", "comp-3", "comp-4"])
+        self.assertEqual(upserts[0][3][0], "[0.5,0.25]")
+
+    def test_schema_is_created_once(self):
+        db = FakeVectorDatabase()
+        manager = VectorCacheManager(db)
+
+        async def run():
+            await manager.get_or_create_vector(make_component(0))
+            await manager.get_or_create_vector(make_component(1))
+
+        asyncio.run(run())
+        creates = [query for query, _ in db.statements if "CREATE TABLE" in query]
+        self.assertEqual(len(creates), 1)
+
+    def test_update_vectors_writes_in_one_statement(self):
+        db = FakeVectorDatabase()
+        manager = VectorCacheManager(db, FakePatternMiner())
+        components = [make_component(i) for i in range(4)]
+
+        results = asyncio.run(manager.update_vectors(components))
+
+        self.assertTrue(all(results.values()))
+        self.assertEqual(len(db.queries(COMPONENT_VECTOR_UPSERT_SQL)), 1)
+
+    def test_cache_status_reports_pool_metrics(self):
+        db = FakeVectorDatabase(stored_ids={"comp-0"})
+        status = asyncio.run(VectorCacheManager(db).cache_status())
+
+        self.assertEqual(status["status"], "healthy")
+        self.assertEqual(status["total_vectors_cached"], 1)
+        self.assertEqual(status["pool"]["size"], 2)
+
+    def test_disconnected_pool_degrades_gracefully(self):
+        db = FakeVectorDatabase(enabled=False)
+        manager = VectorCacheManager(db)
+
+        self.assertIsNone(asyncio.run(manager.get_or_create_vector(make_component(0))))
+        self.assertEqual(asyncio.run(manager.find_similar(make_component(0))), [])
+        self.assertEqual(asyncio.run(manager.cache_status())["status"], "unavailable")
+        self.assertEqual(db.statements, [])
+
+
+class TestComponentVectorCache(unittest.TestCase):
+
+    def test_lru_bounded_by_entries_and_bytes(self):
+        cache = ComponentVectorCache(max_entries=3, max_bytes=512)
+        for i in range(3):
+            cache.put(f"c{i}", "sig", [0.0] * 4)
+        cache.get("c0", "sig")  # c0 becomes most recently used
+        cache.put("c3", "sig", [0.0] * 4)
+
+        self.assertIsNone(cache.get("c1", "sig"))
+        self.assertIsNotNone(cache.get("c0", "sig"))
+
+        cache.put("big", "sig", [0.0] * 120)  # 480 bytes pushes out the oldest entry
+        self.assertEqual(cache.bytes, 512)
+        self.assertEqual(sorted(cache._entries), ["big", "c0", "c3"])
+        self.assertEqual(cache.get("big", "sig").dtype, np.float32)
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+        cache.put("huge", "sig", [0.0] * 1000)  # larger than the whole budget
+        self.assertIsNone(cache.get("huge", "sig"))
+
+    def test_changed_signature_is_a_miss(self):
+        cache = ComponentVectorCache()
+        cache.put("c0", "old", [1.0, 2.0])
+
+        self.assertIsNone(cache.get("c0", "new"))
+        self.assertEqual(len(cache), 0)
+        stats = cache.stats()
+        self.assertEqual((stats["misses"], stats["invalidations"], stats["bytes"]), (1, 1, 0))
+
+    def test_invalidate_repository(self):
+        cache = ComponentVectorCache()
+        cache.put("kept", "s1", [1.0], repository="org/a")
+        cache.put("changed", "s1", [1.0], repository="org/a")
+        cache.put("removed", "s1", [1.0], repository="org/a")
+        cache.put("other", "s1", [1.0], repository="org/b")
+
+        dropped = cache.invalidate_repository("org/a", {"kept": "s1", "changed": "s2"})
+
+        self.assertEqual(dropped, 2)
+        self.assertEqual(sorted(cache._entries), ["kept", "other"])
+
+
+class TestTieredVectorLookup(unittest.TestCase):
+
+    def test_repeat_lookups_served_from_memory(self):
+        db = FakeVectorDatabase(stored_ids={"comp-0"})
+        manager = VectorCacheManager(db, FakePatternMiner())
+        components = [make_component(0), make_component(1)]
+
+        async def run():
+            first = await manager.get_vectors(components)
+            second = await manager.get_vectors(components)
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        self.assertEqual(len(db.queries(COMPONENT_VECTOR_LOOKUP_SQL)), 1)
+        np.testing.assert_array_equal(first["comp-0"], [1.0, 0.0])
+        np.testing.assert_array_equal(second["comp-1"], [0.5, 0.25])
+        stats = asyncio.run(manager.cache_status())
+        self.assertEqual(stats["memory_cache"]["hits"], 2)
+        self.assertEqual(stats["database_cache"], {"hits": 1, "stale": 0, "generated": 1})
+
+    def test_stale_stored_vector_is_regenerated(self):
+        component = make_component(0)
+        db = FakeVectorDatabase()
+        db.stored["comp-0"] = ("outdated", "[1,0]")
+        miner = FakePatternMiner()
+
+        vector = asyncio.run(VectorCacheManager(db, miner).get_or_create_vector(component))
+
+        self.assertEqual(len(miner.requests), 1)
+        self.assertEqual(vector.vector_metadata["signature"], component_signature(component))
+        self.assertEqual(db.stored["comp-0"][0], component_signature(component))
+
+    def test_component_changes_invalidate_memory_tier(self):
+        manager = VectorCacheManager(FakeVectorDatabase(), FakePatternMiner())
+        components = [make_component(i) for i in range(3)]
+        asyncio.run(manager.get_vectors(components))
+
+        changed = components[0].model_copy(update={"description": "rewritten"})
+        dropped = manager.invalidate_components(
+            "owner/repo", {c.component_id: component_signature(c) for c in (changed, components[1])}
+        )
+
+        self.assertEqual(dropped, 2)  # comp-0 changed, comp-2 removed
+        self.assertEqual(len(manager.vector_cache), 1)
+
+
+class TestBatchedSimilarity(unittest.TestCase):
+
+    def test_all_components_share_one_knn_query(self):
+        db = FakeVectorDatabase(
+            stored_ids={"comp-0", "comp-1", "comp-2"},
+            neighbours={
+                "comp-0": [("comp-1", 0.9), ("comp-2", 0.4)],
+                "comp-1": [("comp-0", 0.9)],
+            },
+        )
+        manager = VectorCacheManager(db)
+        components = [make_component(i) for i in range(4)]
+
+        similar = asyncio.run(manager.find_similar_batch(components, top_k=5, min_similarity=0.5))
+
+        knn = db.queries(COMPONENT_VECTOR_KNN_SQL)
+        self.assertEqual(len(knn), 1)
+        self.assertEqual(sorted(knn[0][0]), ["comp-0", "comp-1", "comp-2"])
+        self.assertEqual(len(db.queries(COMPONENT_VECTOR_LOOKUP_SQL)), 1)
+        self.assertEqual([s["component_id"] for s in similar["comp-0"]], ["comp-1"])
+        self.assertEqual(similar["comp-2"], [])
+        self.assertNotIn("comp-3", similar)  # no stored vector and no pattern-miner
+
+    def test_find_similar_delegates_to_batch(self):
+        db = FakeVectorDatabase(stored_ids={"comp-0"}, neighbours={"comp-0": [("comp-9", 0.8)]})
+        similar = asyncio.run(VectorCacheManager(db).find_similar(make_component(0)))
+
+        self.assertEqual(similar[0]["similarity_score"], 0.8)
+        self.assertEqual(db.queries(COMPONENT_VECTOR_KNN_SQL)[0][0], ["comp-0"])
+
+    def test_group_similar_components(self):
+        groups = group_similar_components({
+            "a": [{"component_id": "b", "similarity_score": 0.9}],
+            "b": [{"component_id": "a", "similarity_score": 0.9},
+                  {"component_id": "c", "similarity_score": 0.7}],
+            "d": [{"component_id": "e", "similarity_score": 0.95}],
+            "f": [],
+        })
+
+        self.assertEqual([g["component_ids"] for g in groups], [["a", "b", "c"], ["d", "e"]])
+        self.assertEqual(len(groups[0]["pairs"]), 2)
+        self.assertEqual(groups[0]["max_similarity"], 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
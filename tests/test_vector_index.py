@@ -0,0 +1,197 @@
+"""
+Unit tests for pgvector index management and ANN search knobs
+
+Uses fakes for DatabaseManager and asyncpg connections, so no PostgreSQL is needed.
+"""
+
+import unittest
+import asyncio
+from contextlib import asynccontextmanager
+
+from core.database import DatabaseManager, FIND_SIMILAR_PATTERNS_SQL, to_vector_literal
+from core.vector_index import (
+    VectorIndexManager, build_index_sql, parse_index_definition, default_ivfflat_lists
+)
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, query, *args):
+        self.statements.append((" ".join(query.split()), args))
+        return "OK"
+
+    async def fetch(self, query, *args):
+        self.statements.append((" ".join(query.split()), args))
+        return []
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.statements.append(("BEGIN", ()))
+        yield
+        self.statements.append(("COMMIT", ()))
+
+
+class RecordingPool:
+    def __init__(self):
+        self.conn = RecordingConnection()
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+class FakeIndexDatabase:
+    """DatabaseManager stand-in with canned index status and search results"""
+
+    def __init__(self, indexdef=None, embedded=0, exact=None, approximate=None):
+        self.indexdef = indexdef
+        self.embedded = embedded
+        self.exact = exact or {}
+        self.approximate = approximate or {}
+        self.searches = []
+        self.pool = RecordingPool()
+
+    async def fetchrow(self, query, *args):
+        if self.indexdef is None:
+            return None
+        return {"indexdef": self.indexdef, "size_bytes": 8192}
+
+    async def fetchval(self, query, *args):
+        return self.embedded
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.pool.conn
+
+    async def find_similar_patterns(self, embedding, limit=10, threshold=0.8, **knobs):
+        self.searches.append((embedding, knobs))
+        ids = self.exact[embedding] if knobs.get("exact") else self.approximate[embedding]
+        return [{"id": pattern_id} for pattern_id in ids[:limit]]
+
+
+class TestIndexDefinitions(unittest.TestCase):
+
+    def test_build_index_sql(self):
+        self.assertEqual(
+            build_index_sql("hnsw", m=24, ef_construction=128),
+            "CREATE INDEX CONCURRENTLY idx_patterns_embedding ON patterns "
+            "USING hnsw (embedding vector_cosine_ops) WITH (m = 24, ef_construction = 128)"
+        )
+        self.assertIn("WITH (lists = 500)", build_index_sql("ivfflat", lists=500, concurrently=False))
+        with self.assertRaises(ValueError):
+            build_index_sql("btree")
+
+    def test_parse_index_definition(self):
+        parsed = parse_index_definition(
+            "CREATE INDEX idx_patterns_embedding ON public.patterns "
+            "USING hnsw (embedding vector_cosine_ops) WITH (m='16', ef_construction='64')"
+        )
+        self.assertEqual(parsed, {"method": "hnsw", "options": {"m": 16, "ef_construction": 64}})
+
+    def test_default_ivfflat_lists(self):
+        self.assertEqual(default_ivfflat_lists(500), 1)
+        self.assertEqual(default_ivfflat_lists(200_000), 200)
+        self.assertEqual(default_ivfflat_lists(4_000_000), 2000)
+
+
+class TestEnsureIndex(unittest.TestCase):
+
+    def test_matching_index_is_left_alone(self):
+        db = FakeIndexDatabase(
+            indexdef="CREATE INDEX idx_patterns_embedding ON public.patterns USING hnsw "
+                     "(embedding vector_cosine_ops) WITH (m='16', ef_construction='64')"
+        )
+        result = asyncio.run(VectorIndexManager(db).ensure_index("hnsw"))
+
+        self.assertEqual(result["action"], "unchanged")
+        self.assertEqual(db.pool.conn.statements, [])
+
+    def test_ivfflat_index_replaced_by_hnsw_concurrently(self):
+        db = FakeIndexDatabase(
+            indexdef="CREATE INDEX idx_patterns_embedding ON public.patterns USING ivfflat "
+                     "(embedding vector_cosine_ops) WITH (lists='100')",
+            embedded=1000,
+        )
+        result = asyncio.run(VectorIndexManager(db).ensure_index("hnsw", m=32))
+
+        self.assertEqual(result["action"], "replaced")
+        statements = [statement for statement, _ in db.pool.conn.statements]
+        self.assertEqual(statements[0], "DROP INDEX CONCURRENTLY IF EXISTS idx_patterns_embedding_new")
+        self.assertTrue(statements[1].startswith("CREATE INDEX CONCURRENTLY idx_patterns_embedding_new"))
+        self.assertIn("m = 32", statements[1])
+        self.assertEqual(statements[2:], [
+            "BEGIN",
+            "DROP INDEX IF EXISTS idx_patterns_embedding",
+            "ALTER INDEX idx_patterns_embedding_new RENAME TO idx_patterns_embedding",
+            "COMMIT",
+        ])
+
+
+class TestRecallMeasurement(unittest.TestCase):
+
+    def test_recall_against_exact_baseline(self):
+        db = FakeIndexDatabase(
+            exact={"q1": [1, 2, 3, 4], "q2": [5, 6, 7, 8]},
+            approximate={"q1": [1, 2, 3, 9], "q2": [5, 6, 7, 8]},
+        )
+        report = asyncio.run(VectorIndexManager(db).measure_recall(
+            queries=["q1", "q2"], k=4, ef_search_values=[40, 80]
+        ))
+
+        self.assertEqual(report["queries"], 2)
+        self.assertEqual([s["ef_search"] for s in report["settings"]], [40, 80])
+        self.assertEqual(report["settings"][0]["recall"], 0.875)
+        self.assertEqual(db.searches[0], ("q1", {"exact": True}))
+        self.assertEqual(db.searches[2], ("q1", {"ef_search": 40}))
+
+
+class TestAnnSearchKnobs(unittest.TestCase):
+
+    def make_manager(self):
+        db = DatabaseManager()
+        db.enabled = True
+        db.pool = RecordingPool()
+        db.prepare_statements = False
+        db.ef_search = None
+        db.probes = None
+        return db
+
+    def test_threshold_applied_after_index_ordered_top_k(self):
+        inner, outer = FIND_SIMILAR_PATTERNS_SQL.split(") nearest")
+        self.assertIn("LIMIT $4", inner)
+        self.assertNotIn(">= $2", inner)
+        self.assertIn(">= $2", outer)
+
+    def test_knobs_set_locally_in_one_transaction(self):
+        db = self.make_manager()
+        asyncio.run(db.find_similar_patterns([0.5, 0.25], limit=5, ef_search=120, probes=7))
+
+        statements = db.pool.conn.statements
+        self.assertEqual(statements[0][0], "BEGIN")
+        self.assertEqual(statements[1], ("SELECT set_config($1, $2, true)", ("hnsw.ef_search", "120")))
+        self.assertEqual(statements[2], ("SELECT set_config($1, $2, true)", ("ivfflat.probes", "7")))
+        self.assertEqual(statements[3][1], ("[0.5,0.25]", 0.8, None, 5))
+        self.assertEqual(statements[-1][0], "COMMIT")
+
+    def test_default_search_runs_without_transaction(self):
+        db = self.make_manager()
+        asyncio.run(db.find_similar_patterns([0.1]))
+
+        self.assertEqual(len(db.pool.conn.statements), 1)
+
+    def test_exact_search_disables_index_scan(self):
+        db = self.make_manager()
+        asyncio.run(db.find_similar_patterns([0.1], exact=True, ef_search=40))
+
+        self.assertEqual(db.pool.conn.statements[1][1], ("enable_indexscan", "off"))
+        self.assertEqual(len(db.pool.conn.statements), 4)
+
+    def test_vector_literal(self):
+        self.assertEqual(to_vector_literal([1, 0.5]), "[1.0,0.5]")
+        self.assertEqual(to_vector_literal("[1,2]"), "[1,2]")
+
+
+if __name__ == "__main__":
+    unittest.main()